@@ -42,6 +42,7 @@ Submodules
 .. toctree::
 
    bezier.curve
+   bezier.curve_collection
    bezier.curved_polygon
    bezier.triangle
 """
@@ -57,6 +58,7 @@ Submodules
 .. toctree::
 
    bezier.curve
+   bezier.curve_collection
    bezier.curved_polygon
    bezier.triangle
 """
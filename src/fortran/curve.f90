@@ -24,10 +24,11 @@ module curve
        update_candidates, projection_error, can_reduce
   public &
        CurveData, LOCATE_MISS, LOCATE_INVALID, evaluate_curve_barycentric, &
-       evaluate_multi, specialize_curve, evaluate_hodograph, subdivide_nodes, &
-       newton_refine, locate_point, elevate_nodes, get_curvature, &
-       reduce_pseudo_inverse, full_reduce, compute_length, curves_equal, &
-       subdivide_curve
+       evaluate_multi, evaluate_curves_multi, specialize_curve, &
+       evaluate_hodograph, subdivide_nodes, newton_refine, locate_point, &
+       locate_point_multi, elevate_nodes, get_curvature, &
+       reduce_pseudo_inverse, full_reduce, compute_length, &
+       compute_length_multi, curves_equal, subdivide_curve
 
   ! NOTE: This (for now) is not meant to be C-interoperable. This is mostly
   !       because the shape is encoded in ``nodes``, so it would be wasteful to
@@ -156,6 +157,52 @@ contains
          num_nodes, dimension_, nodes, num_vals, one_less, s_vals, evaluated)
   end subroutine evaluate_multi
 
+  subroutine evaluate_curves_multi( &
+       num_curves, num_nodes, dimension_, nodes, num_vals, s_vals, evaluated) &
+       bind(c, name='BEZ_evaluate_curves_multi')
+
+    ! NOTE: This is ``evaluate_multi`` for a batch of Bezier curves that all
+    !       have the same degree and dimension. The curve index is the first
+    !       (i.e. fastest varying) index so that each step of the modified
+    !       Horner's method is a contiguous update across every curve.
+
+    integer(c_int), intent(in) :: num_curves, num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(num_curves, dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_vals
+    real(c_double), intent(in) :: s_vals(num_vals)
+    real(c_double), intent(out) :: &
+         evaluated(num_curves, dimension_, num_vals)
+    ! Variables outside of signature.
+    integer(c_int) :: i, j
+    real(c_double) :: one_less(num_vals), s_pow(num_vals)
+    real(c_double) :: binom_val
+
+    one_less = 1.0_dp - s_vals
+    s_pow = 1.0_dp
+    binom_val = 1
+
+    forall (j = 1:num_vals)
+       evaluated(:, :, j) = one_less(j) * nodes(:, :, 1)
+    end forall
+
+    do i = 2, num_nodes - 1
+       s_pow = s_pow * s_vals
+       binom_val = (binom_val * (num_nodes - i + 1)) / (i - 1)
+       forall (j = 1:num_vals)
+          evaluated(:, :, j) = ( &
+               evaluated(:, :, j) + &
+               binom_val * s_pow(j) * nodes(:, :, i)) * one_less(j)
+       end forall
+    end do
+
+    forall (j = 1:num_vals)
+       evaluated(:, :, j) = ( &
+            evaluated(:, :, j) + &
+            s_pow(j) * s_vals(j) * nodes(:, :, num_nodes))
+    end forall
+
+  end subroutine evaluate_curves_multi
+
   subroutine specialize_curve_generic( &
        num_nodes, dimension_, nodes, start, end_, new_nodes)
 
@@ -550,6 +597,29 @@ contains
 
   end subroutine locate_point
 
+  subroutine locate_point_multi( &
+       num_nodes, dimension_, nodes, num_points, points, s_approx) &
+       bind(c, name='BEZ_locate_point_curve_multi')
+
+    ! NOTE: This is ``locate_point`` for each column of ``points``. The
+    !       same signals (``LOCATE_MISS`` and ``LOCATE_INVALID``) are used
+    !       for each entry of ``s_approx``.
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    integer(c_int), intent(in) :: num_points
+    real(c_double), intent(in) :: points(dimension_, num_points)
+    real(c_double), intent(out) :: s_approx(num_points)
+    ! Variables outside of signature.
+    integer(c_int) :: j
+
+    do j = 1, num_points
+       call locate_point( &
+            num_nodes, dimension_, nodes, points(:, j:j), s_approx(j))
+    end do
+
+  end subroutine locate_point_multi
+
   subroutine elevate_nodes( &
        num_nodes, dimension_, nodes, elevated) &
        bind(c, name='BEZ_elevate_nodes_curve')
@@ -854,6 +924,79 @@ contains
 
   end subroutine compute_length
 
+  subroutine compute_length_multi( &
+       num_curves, num_nodes, dimension_, nodes, rtol, lengths, error_val) &
+       bind(c, name='BEZ_compute_length_multi')
+
+    ! NOTE: This is ``compute_length`` for a batch of Bezier curves that all
+    !       have the same degree and dimension. Unlike ``compute_length``, the
+    !       relative tolerance used by ``dqagse`` is an input. If any curve
+    !       fails to meet it, ``error_val`` will be the first non-zero error
+    !       status from ``dqagse`` (but every length is still computed).
+
+    integer(c_int), intent(in) :: num_curves, num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(num_curves, dimension_, num_nodes)
+    real(c_double), intent(in) :: rtol
+    real(c_double), intent(out) :: lengths(num_curves)
+    integer(c_int), intent(out) :: error_val
+    ! Variables outside of signature.
+    real(c_double) :: first_deriv(dimension_, num_nodes - 1)
+    real(c_double) :: epsrel, abserr
+    integer(c_int) :: i, neval, curve_error
+    real(c_double) :: alist(50)
+    real(c_double) :: blist(50)
+    real(c_double) :: rlist(50)
+    real(c_double) :: elist(50)
+    integer(c_int) :: iord(50)
+    integer(c_int) :: last
+
+    error_val = 0
+    if (num_nodes == 0) then
+       error_val = -1
+       return
+    else if (num_nodes == 1) then
+       lengths = 0.0_dp
+       return
+    end if
+
+    ! NOTE: ``dqagse`` rejects (with ``ier = 6``) a relative tolerance that is
+    !       too close to machine precision when the absolute tolerance is 0.
+    epsrel = max(rtol, 50 * epsilon(rtol))
+    do i = 1, num_curves
+       first_deriv = (num_nodes - 1) * ( &
+            nodes(i, :, 2:) - nodes(i, :, :num_nodes - 1))
+       if (num_nodes == 2) then
+          lengths(i) = norm2(first_deriv)
+          cycle
+       end if
+
+       call dqagse( &
+            vec_size, 0.0_dp, 1.0_dp, 0.0_dp, epsrel, 50, lengths(i), &
+            abserr, neval, curve_error, alist, blist, rlist, &
+            elist, iord, last)
+       if (error_val == 0) then
+          error_val = curve_error
+       end if
+    end do
+
+  contains
+
+    ! Define a closure that evaluates ||B'(s)||_2 where ``s``
+    ! is the argument and ``B'(s)`` is parameterized by ``first_deriv``
+    ! (i.e. the hodograph of the current curve).
+    real(c_double) function vec_size(s_val) result(norm_)
+      real(c_double), intent(in) :: s_val
+      ! Variables outside of signature.
+      real(c_double) :: evaluated(dimension_, 1)
+
+      call evaluate_multi( &
+           num_nodes - 1, dimension_, first_deriv, 1, [s_val], evaluated)
+      norm_ = norm2(evaluated)
+
+    end function vec_size
+
+  end subroutine compute_length_multi
+
   logical(c_bool) function curves_equal(curve1, curve2) result(same)
 
     ! NOTE: This is **explicitly** not intended for C inter-op.
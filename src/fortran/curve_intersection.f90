@@ -13,7 +13,7 @@
 module curve_intersection
 
   use, intrinsic :: iso_c_binding, only: &
-       c_double, c_int, c_bool, c_f_pointer, c_loc
+       c_double, c_int, c_bool, c_ptr, c_f_pointer, c_loc
   use types, only: dp
   use status, only: &
        Status_SUCCESS, Status_BAD_MULTIPLICITY, Status_NO_CONVERGE, &
@@ -25,16 +25,20 @@ module curve_intersection
   use curve, only: &
        CurveData, LOCATE_MISS, LOCATE_INVALID, evaluate_multi, &
        specialize_curve, evaluate_hodograph, locate_point, elevate_nodes, &
-       subdivide_curve
+       subdivide_curve, subdivide_nodes, newton_refine
   implicit none
   private &
        newton_routine, MAX_INTERSECT_SUBDIVISIONS, MIN_INTERVAL_WIDTH, &
        MAX_CANDIDATES, ZERO_THRESHOLD, NEWTON_ERROR_RATIO, &
-       CANDIDATES_ODD, CANDIDATES_EVEN, &
-       POLYGON1, POLYGON2, make_candidates, prune_candidates, elevate_helper
+       CANDIDATES_ODD, CANDIDATES_EVEN, make_candidates, prune_candidates, &
+       elevate_helper, CLIP_CONVERGED_WIDTH, CLIP_MIN_REDUCTION, &
+       CLIP_MAX_NEWTON_DRIFT, CLIP_TANGENT_THRESHOLD, FAT_LINE_WIGGLE, &
+       MAX_CLIP_ITERATIONS, CLIP_ENDPOINT_NEWTON_STEPS, locate_endpoint, &
+       endpoint_intersection, refine_converged, add_clip_candidate, merge_converged, MAX_FLATTEN_SUBDIVISIONS
   public &
-       BoxIntersectionType_INTERSECTION, BoxIntersectionType_TANGENT, &
-       BoxIntersectionType_DISJOINT, Subdivide_FIRST, Subdivide_SECOND, &
+       IntersectionWorkspace, BoxIntersectionType_INTERSECTION, &
+       BoxIntersectionType_TANGENT, BoxIntersectionType_DISJOINT, &
+       Subdivide_FIRST, Subdivide_SECOND, &
        Subdivide_BOTH, Subdivide_NEITHER, LINEARIZATION_THRESHOLD, &
        INTERSECTIONS_WORKSPACE, linearization_error, segment_intersection, &
        newton_refine_intersect, bbox_intersect, parallel_lines_parameters, &
@@ -44,8 +48,13 @@ module curve_intersection
        bbox_line_intersect, check_lines, add_intersection, &
        add_from_linearized, endpoint_check, tangent_bbox_intersection, &
        add_candidates, intersect_one_round, make_same_degree, &
-       add_coincident_parameters, all_intersections, all_intersections_abi, &
-       free_curve_intersections_workspace
+       add_coincident_parameters, all_intersections_explicit, &
+       all_intersections, all_intersections_abi, &
+       free_curve_intersections_workspace, new_intersection_workspace, &
+       free_intersection_workspace, all_intersections_workspace_abi, &
+       compute_fat_line, clip_interval, add_clipped_intersection, &
+       clip_one_round, all_intersections_clipping, &
+       all_intersections_clipping_abi, flatten_curve, flatten_curves
 
   ! Interface for ``newton_iterate()``.
   abstract interface
@@ -60,6 +69,15 @@ module curve_intersection
      end subroutine newton_routine
   end interface
 
+  ! Workspace for ``all_intersections_explicit()``. Unlike the module-level
+  ! workspaces below, these are owned by the caller (e.g. one per thread)
+  ! and only ever accessed through an opaque pointer from C.
+  type :: IntersectionWorkspace
+     type(CurveData), allocatable :: candidates_odd(:, :)
+     type(CurveData), allocatable :: candidates_even(:, :)
+     real(c_double), allocatable :: intersections(:, :)
+  end type IntersectionWorkspace
+
   ! Values of BoxIntersectionType enum:
   integer(c_int), parameter :: BoxIntersectionType_INTERSECTION = 0
   integer(c_int), parameter :: BoxIntersectionType_TANGENT = 1
@@ -80,14 +98,30 @@ module curve_intersection
   ! Point under which values are considered to be "near zero".
   real(c_double), parameter :: ZERO_THRESHOLD = 0.5_dp**10
   real(c_double), parameter :: NEWTON_ERROR_RATIO = 0.5_dp**36
+  ! Parameters for ``all_intersections_clipping()``. Intervals narrower than
+  ! ``CLIP_CONVERGED_WIDTH`` are refined via Newton's method (but updates
+  ! larger than ``CLIP_MAX_NEWTON_DRIFT`` are rejected). If the sine of the
+  ! angle between the curves at the refined point is below
+  ! ``CLIP_TANGENT_THRESHOLD``, it is refined again as a double root. If
+  ! clipping doesn't shrink a pair of intervals to ``CLIP_MIN_REDUCTION`` of
+  ! their width, the wider interval is subdivided.
+  real(c_double), parameter :: CLIP_CONVERGED_WIDTH = 0.5_dp**20
+  real(c_double), parameter :: CLIP_MIN_REDUCTION = 0.8_dp
+  real(c_double), parameter :: CLIP_MAX_NEWTON_DRIFT = 0.5_dp**16
+  real(c_double), parameter :: CLIP_TANGENT_THRESHOLD = 0.5_dp**16
+  real(c_double), parameter :: FAT_LINE_WIGGLE = 0.5_dp**40
+  integer(c_int), parameter :: MAX_CLIP_ITERATIONS = 100
+  ! Number of Newton steps used to locate the endpoint of one curve on the
+  ! other (starting within a converged interval).
+  integer(c_int), parameter :: CLIP_ENDPOINT_NEWTON_STEPS = 3
+  ! Sub-curves in ``flatten_curve()`` are never subdivided past this depth.
+  integer(c_int), parameter :: MAX_FLATTEN_SUBDIVISIONS = 20
   ! Long-lived workspaces for ``all_intersections()`` and
   ! ``all_intersections_abi()``. If multiple threads are used, each of these
   ! **should** be thread-local.
   type(CurveData), allocatable :: CANDIDATES_ODD(:, :)
   type(CurveData), allocatable :: CANDIDATES_EVEN(:, :)
   real(c_double), allocatable :: INTERSECTIONS_WORKSPACE(:, :)
-  real(c_double), allocatable :: POLYGON1(:, :)
-  real(c_double), allocatable :: POLYGON2(:, :)
 
 contains
 
@@ -803,6 +837,7 @@ contains
     ! Variables outside of signature.
     real(c_double) :: s, t
     logical(c_bool) :: success, bad_parameters
+    real(c_double), allocatable :: polygon1(:, :), polygon2(:, :)
 
     status = Status_SUCCESS
     does_intersect = .FALSE.  ! Default value.
@@ -832,8 +867,8 @@ contains
 
     if (bad_parameters) then
        call convex_hull_collide( &
-            num_nodes1, curve1%nodes, POLYGON1, &
-            num_nodes2, curve2%nodes, POLYGON2, success)
+            num_nodes1, curve1%nodes, polygon1, &
+            num_nodes2, curve2%nodes, polygon2, success)
        ! In the unlikely case that we have parallel segments or segments
        ! that intersect outside of [0, 1] x [0, 1], we can still exit
        ! if the convex hulls don't intersect.
@@ -1446,6 +1481,7 @@ contains
     integer(c_int) :: accepted, i
     integer(c_int) :: num_nodes1, num_nodes2
     logical(c_bool) :: collision
+    real(c_double), allocatable :: polygon1(:, :), polygon2(:, :)
 
     accepted = 0
     ! NOTE: This **assumes** but does not check that ``candidates`` is
@@ -1458,8 +1494,8 @@ contains
        !       ``N x 2``.
        num_nodes2 = size(candidates(2, i)%nodes, 2)
        call convex_hull_collide( &
-            num_nodes1, candidates(1, i)%nodes, POLYGON1, &
-            num_nodes2, candidates(2, i)%nodes, POLYGON2, collision)
+            num_nodes1, candidates(1, i)%nodes, polygon1, &
+            num_nodes2, candidates(2, i)%nodes, polygon2, collision)
 
        if (collision) then
           accepted = accepted + 1
@@ -1756,12 +1792,19 @@ contains
 
   end subroutine add_coincident_parameters
 
-  subroutine all_intersections( &
+  subroutine all_intersections_explicit( &
        num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
-       intersections, num_intersections, coincident, status)
+       candidates_odd, candidates_even, intersections, num_intersections, &
+       coincident, status)
 
     ! NOTE: This is **explicitly** not intended for C inter-op, but
-    !       a C compatible interface is exposed as ``all_intersections_abi``.
+    !       a C compatible interface is exposed as
+    !       ``all_intersections_workspace_abi``.
+
+    ! NOTE: This only uses state passed in by the caller (the candidate
+    !       workspaces are only needed to avoid re-allocating on each
+    !       call), so it is safe to call from multiple threads as long as
+    !       each thread has its own workspaces.
 
     ! Possible error states:
     ! * Status_SUCCESS         : On success.
@@ -1775,6 +1818,8 @@ contains
     real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
     integer(c_int), intent(in) :: num_nodes_second
     real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    type(CurveData), allocatable, intent(inout) :: candidates_odd(:, :)
+    type(CurveData), allocatable, intent(inout) :: candidates_even(:, :)
     real(c_double), allocatable, intent(inout) :: intersections(:, :)
     integer(c_int), intent(out) :: num_intersections
     logical(c_bool), intent(out) :: coincident
@@ -1800,28 +1845,28 @@ contains
     ! First iteration is odd (i.e. ``index_ == 1``).
     num_candidates = 1
     call make_candidates( &
-         nodes_first, nodes_second, CANDIDATES_ODD)
+         nodes_first, nodes_second, candidates_odd)
 
     is_even = .TRUE.  ! At zero.
     do index_ = 1, MAX_INTERSECT_SUBDIVISIONS
        is_even = .NOT. is_even  ! Switch parity.
 
        if (is_even) then
-          ! Since ``index_`` is even, we READ from ``CANDIDATES_EVEN``
-          ! and WRITE to ``CANDIDATES_ODD``.
+          ! Since ``index_`` is even, we READ from ``candidates_even``
+          ! and WRITE to ``candidates_odd``.
           call intersect_one_round( &
                nodes_first, nodes_second, &
-               num_candidates, CANDIDATES_EVEN, &
+               num_candidates, candidates_even, &
                num_intersections, intersections, &
-               CANDIDATES_ODD, num_next_candidates, intersect_status)
+               candidates_odd, num_next_candidates, intersect_status)
        else
-          ! Since ``index_`` is odd, we READ from ``CANDIDATES_ODD``
-          ! and WRITE to ``CANDIDATES_EVEN``.
+          ! Since ``index_`` is odd, we READ from ``candidates_odd``
+          ! and WRITE to ``candidates_even``.
           call intersect_one_round( &
                nodes_first, nodes_second, &
-               num_candidates, CANDIDATES_ODD, &
+               num_candidates, candidates_odd, &
                num_intersections, intersections, &
-               CANDIDATES_EVEN, num_next_candidates, intersect_status)
+               candidates_even, num_next_candidates, intersect_status)
        end if
 
        ! NOTE: This only checks for two error statuses from
@@ -1838,9 +1883,9 @@ contains
        ! Bail out of there are too many candidates.
        if (num_candidates > MAX_CANDIDATES) then
           if (is_even) then
-             call prune_candidates(CANDIDATES_ODD, num_candidates)
+             call prune_candidates(candidates_odd, num_candidates)
           else
-             call prune_candidates(CANDIDATES_EVEN, num_candidates)
+             call prune_candidates(candidates_even, num_candidates)
           end if
           ! If pruning didn't fix anything, we check if the curves are
           ! coincident and "fail" if they aren't.
@@ -1876,6 +1921,39 @@ contains
     ! ``MAX_INTERSECT_SUBDIVISIONS``.
     status = Status_NO_CONVERGE
 
+  end subroutine all_intersections_explicit
+
+  subroutine all_intersections( &
+       num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       intersections, num_intersections, coincident, status)
+
+    ! NOTE: This is **explicitly** not intended for C inter-op, but
+    !       a C compatible interface is exposed as ``all_intersections_abi``.
+
+    ! NOTE: This uses the module-level ``CANDIDATES_ODD`` and
+    !       ``CANDIDATES_EVEN`` workspaces, so it is **not** safe to call
+    !       from multiple threads.
+
+    ! Possible error states:
+    ! * Status_SUCCESS         : On success.
+    ! * Status_NO_CONVERGE     : Via ``all_intersections_explicit()``.
+    ! * (N >= MAX_CANDIDATES)  : Via ``all_intersections_explicit()``.
+    ! * Status_BAD_MULTIPLICITY: Via ``all_intersections_explicit()``.
+
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    real(c_double), allocatable, intent(inout) :: intersections(:, :)
+    integer(c_int), intent(out) :: num_intersections
+    logical(c_bool), intent(out) :: coincident
+    integer(c_int), intent(out) :: status
+
+    call all_intersections_explicit( &
+         num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+         CANDIDATES_ODD, CANDIDATES_EVEN, intersections, num_intersections, &
+         coincident, status)
+
   end subroutine all_intersections
 
   subroutine all_intersections_abi( &
@@ -1949,14 +2027,977 @@ contains
        deallocate(INTERSECTIONS_WORKSPACE)
     end if
 
-    if (allocated(POLYGON1)) then
-       deallocate(POLYGON1)
+  end subroutine free_curve_intersections_workspace
+
+  subroutine new_intersection_workspace(workspace) &
+       bind(c, name='BEZ_new_intersection_workspace')
+
+    ! NOTE: The ``workspace`` is an opaque pointer to an
+    !       ``IntersectionWorkspace``. It **must** be released by the caller
+    !       via ``free_intersection_workspace()``.
+
+    type(c_ptr), intent(out) :: workspace
+    ! Variables outside of signature.
+    type(IntersectionWorkspace), pointer :: workspace_
+
+    allocate(workspace_)
+    workspace = c_loc(workspace_)
+
+  end subroutine new_intersection_workspace
+
+  subroutine free_intersection_workspace(workspace) &
+       bind(c, name='BEZ_free_intersection_workspace')
+
+    type(c_ptr), intent(in) :: workspace
+    ! Variables outside of signature.
+    type(IntersectionWorkspace), pointer :: workspace_
+
+    call c_f_pointer(workspace, workspace_)
+    ! NOTE: This also deallocates each of the allocatable components.
+    deallocate(workspace_)
+
+  end subroutine free_intersection_workspace
+
+  subroutine all_intersections_workspace_abi( &
+       workspace, num_nodes_first, nodes_first, num_nodes_second, &
+       nodes_second, intersections_size, intersections, num_intersections, &
+       coincident, status) &
+       bind(c, name='BEZ_curve_intersections_workspace')
+
+    ! NOTE: This is identical to ``all_intersections_abi()``, except the
+    !       long-lived workspaces are owned by the caller (via an opaque
+    !       pointer from ``new_intersection_workspace()``) rather than by
+    !       this module. Calls that use distinct workspaces can be made
+    !       concurrently from multiple threads.
+
+    ! Possible error states:
+    ! * Status_SUCCESS           : On success.
+    ! * Status_INSUFFICIENT_SPACE: If ``intersections_size`` is smaller than
+    !                              the number of intersections.
+    ! * Status_NO_CONVERGE       : Via ``all_intersections_explicit()``.
+    ! * (N >= MAX_CANDIDATES)    : Via ``all_intersections_explicit()``.
+    ! * Status_BAD_MULTIPLICITY  : Via ``all_intersections_explicit()``.
+
+    type(c_ptr), intent(in) :: workspace
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    integer(c_int), intent(in) :: intersections_size
+    real(c_double), intent(out) :: intersections(2, intersections_size)
+    integer(c_int), intent(out) :: num_intersections
+    logical(c_bool), intent(out) :: coincident
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    type(IntersectionWorkspace), pointer :: workspace_
+
+    call c_f_pointer(workspace, workspace_)
+    call all_intersections_explicit( &
+         num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+         workspace_%candidates_odd, workspace_%candidates_even, &
+         workspace_%intersections, num_intersections, coincident, status)
+
+    if (status /= Status_SUCCESS) then
+       return
+    end if
+
+    if (num_intersections > intersections_size) then
+       status = Status_INSUFFICIENT_SPACE
+    else if (num_intersections > 0) then
+       intersections(:, :num_intersections) = ( &
+            workspace_%intersections(:, :num_intersections))
     end if
 
-    if (allocated(POLYGON2)) then
-       deallocate(POLYGON2)
+  end subroutine all_intersections_workspace_abi
+
+  subroutine compute_fat_line( &
+       num_nodes, nodes, coeff_a, coeff_b, coeff_c, d_min, d_max)
+
+    ! NOTE: This subroutine is not part of the C ABI for this module,
+    !       but it is (for now) public, so that it can be tested.
+
+    ! Computes the (normalized) implicit form ``a x + b y + c = 0`` of the
+    ! line connecting the first and last node in ``nodes`` and the minimum
+    ! and maximum (signed) distance from that line to the control points.
+
+    ! NOTE: This assumes, but does not check, that the first and last
+    !       nodes in ``nodes`` are different.
+
+    integer(c_int), intent(in) :: num_nodes
+    real(c_double), intent(in) :: nodes(2, num_nodes)
+    real(c_double), intent(out) :: coeff_a, coeff_b, coeff_c
+    real(c_double), intent(out) :: d_min, d_max
+    ! Variables outside of signature.
+    real(c_double) :: delta(2), length, curr_dist
+    integer(c_int) :: index_
+
+    delta = nodes(:, num_nodes) - nodes(:, 1)
+    length = norm2(delta)
+    ! Normalize and rotate 90 degrees to the "left".
+    coeff_a = -delta(2) / length
+    coeff_b = delta(1) / length
+    ! c = - ax - by = (delta(2) x - delta(1) y) / L
+    coeff_c = (delta(2) * nodes(1, 1) - delta(1) * nodes(2, 1)) / length
+
+    d_min = 0.0_dp
+    d_max = 0.0_dp
+    do index_ = 2, num_nodes - 1  ! Only interior nodes.
+       curr_dist = ( &
+            coeff_a * nodes(1, index_) + coeff_b * nodes(2, index_) + &
+            coeff_c)
+       if (curr_dist < d_min) then
+          d_min = curr_dist
+       else if (curr_dist > d_max) then
+          d_max = curr_dist
+       end if
+    end do
+
+  end subroutine compute_fat_line
+
+  subroutine clip_interval( &
+       num_nodes1, nodes1, num_nodes2, nodes2, start, end_)
+
+    ! NOTE: This subroutine is not part of the C ABI for this module,
+    !       but it is (for now) public, so that it can be tested.
+
+    ! Computes the parameter range ``[start, end_]`` of the convex hull of
+    ! the distance polynomial of ``nodes2`` within the (slightly widened)
+    ! "fat line" around ``nodes1``. If the curves can't intersect, then
+    ! ``start > end_``. If the first and last node in ``nodes1`` are
+    ! identical there is no fat line, so the full interval is returned.
+
+    integer(c_int), intent(in) :: num_nodes1
+    real(c_double), intent(in) :: nodes1(2, num_nodes1)
+    integer(c_int), intent(in) :: num_nodes2
+    real(c_double), intent(in) :: nodes2(2, num_nodes2)
+    real(c_double), intent(out) :: start, end_
+    ! Variables outside of signature.
+    real(c_double) :: coeff_a, coeff_b, coeff_c, d_min, d_max, wiggle
+    real(c_double) :: boundaries(2), distances(num_nodes2)
+    real(c_double) :: denominator, lambda, s
+    integer(c_int) :: index_, start_index, end_index
+
+    if (all(nodes1(:, 1) == nodes1(:, num_nodes1))) then
+       start = 0.0_dp
+       end_ = 1.0_dp
+       return
     end if
 
-  end subroutine free_curve_intersections_workspace
+    call compute_fat_line( &
+         num_nodes1, nodes1, coeff_a, coeff_b, coeff_c, d_min, d_max)
+    wiggle = FAT_LINE_WIGGLE * max(maxval(abs(nodes1)), maxval(abs(nodes2)))
+    boundaries(1) = d_min - wiggle
+    boundaries(2) = d_max + wiggle
+    distances = coeff_a * nodes2(1, :) + coeff_b * nodes2(2, :) + coeff_c
+
+    denominator = real(num_nodes2 - 1, dp)
+    ! NOTE: These are the "unset" values, so ``start > end_`` unless
+    !       they get updated.
+    start = 1.0_dp
+    end_ = 0.0_dp
+    ! The extreme parameters of the convex hull within the fat line occur
+    ! either at control points within the fat line or where an edge of the
+    ! hull crosses one of the two boundaries. We avoid computing the hull
+    ! and use all segments connecting two control points (which includes
+    ! the hull edges).
+    do index_ = 1, num_nodes2
+       if ( &
+            boundaries(1) <= distances(index_) .AND. &
+            distances(index_) <= boundaries(2)) then
+          s = (index_ - 1) / denominator
+          start = min(start, s)
+          end_ = max(end_, s)
+       end if
+    end do
+
+    do start_index = 1, num_nodes2 - 1
+       do end_index = start_index + 1, num_nodes2
+          do index_ = 1, 2
+             ! NOTE: Segments that only touch a boundary are accounted
+             !       for by the control points above.
+             if ( &
+                  (distances(start_index) - boundaries(index_)) * &
+                  (distances(end_index) - boundaries(index_)) < 0.0_dp) then
+                lambda = ( &
+                     (boundaries(index_) - distances(start_index)) / &
+                     (distances(end_index) - distances(start_index)))
+                s = ( &
+                     (start_index - 1 + lambda * (end_index - start_index)) / &
+                     denominator)
+                start = min(start, s)
+                end_ = max(end_, s)
+             end if
+          end do
+       end do
+    end do
+
+  end subroutine clip_interval
+
+  subroutine locate_endpoint( &
+       num_nodes, nodes, point, start, end_, s, found)
+
+    ! Helper for ``endpoint_intersection``.
+
+    ! Locates the endpoint of another curve within a (converged) parameter
+    ! interval. Since the interval has converged, Newton's method is started
+    ! from its midpoint. Unlike ``full_newton()``, this is well conditioned
+    ! even if the curves are tangent at ``point``.
+
+    integer(c_int), intent(in) :: num_nodes
+    real(c_double), intent(in) :: nodes(2, num_nodes)
+    real(c_double), intent(in) :: point(2, 1)
+    real(c_double), intent(in) :: start, end_
+    real(c_double), intent(out) :: s
+    logical(c_bool), intent(out) :: found
+    ! Variables outside of signature.
+    integer(c_int) :: i
+    real(c_double) :: updated_s
+    real(c_double) :: evaluated(2, 1)
+
+    found = .FALSE.
+    s = 0.5_dp * (start + end_)
+    do i = 1, CLIP_ENDPOINT_NEWTON_STEPS
+       call newton_refine(num_nodes, 2, nodes, point, s, updated_s)
+       s = updated_s
+    end do
+    if (s < start .OR. end_ < s) then
+       return
+    end if
+
+    call evaluate_multi(num_nodes, 2, nodes, 1, [s], evaluated)
+    found = vector_close( &
+         2, evaluated(:, 1), point(:, 1), VECTOR_CLOSE_EPS)
+
+  end subroutine locate_endpoint
+
+  subroutine endpoint_intersection( &
+       num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       candidate, s, t, found)
+
+    ! Helper for ``add_clipped_intersection``.
+
+    ! If the curves meet at a shared endpoint, or the endpoint of one curve
+    ! lies on the other, the intersection is found directly rather than via
+    ! Newton's method for both parameters (which may fail there, e.g. if
+    ! the curves are tangent).
+
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    real(c_double), intent(in) :: candidate(4)
+    real(c_double), intent(out) :: s, t
+    logical(c_bool), intent(out) :: found
+    ! Variables outside of signature.
+    integer(c_int) :: index1, index2, column1, column2
+
+    found = .FALSE.
+    do index1 = 0, 1
+       s = real(index1, dp)
+       if (candidate(1) <= s .AND. s <= candidate(2)) then
+          column1 = 1 + index1 * (num_nodes_first - 1)
+          do index2 = 0, 1
+             t = real(index2, dp)
+             column2 = 1 + index2 * (num_nodes_second - 1)
+             if (candidate(3) <= t .AND. t <= candidate(4)) then
+                if (vector_close( &
+                     2, nodes_first(:, column1), nodes_second(:, column2), &
+                     VECTOR_CLOSE_EPS)) then
+                   found = .TRUE.
+                   return
+                end if
+             end if
+          end do
+
+          call locate_endpoint( &
+               num_nodes_second, nodes_second, &
+               nodes_first(:, column1:column1), &
+               candidate(3), candidate(4), t, found)
+          if (found) then
+             return
+          end if
+       end if
+    end do
+
+    do index2 = 0, 1
+       t = real(index2, dp)
+       if (candidate(3) <= t .AND. t <= candidate(4)) then
+          column2 = 1 + index2 * (num_nodes_second - 1)
+          call locate_endpoint( &
+               num_nodes_first, nodes_first, &
+               nodes_second(:, column2:column2), &
+               candidate(1), candidate(2), s, found)
+          if (found) then
+             return
+          end if
+       end if
+    end do
+
+  end subroutine endpoint_intersection
+
+  subroutine refine_converged( &
+       num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       s_mid, t_mid, s, t, status)
+
+    ! Helper for ``add_clipped_intersection``.
+
+    ! Refines the midpoint of a converged candidate pair via Newton's method.
+    ! See ``_clipping.py::refine_converged()`` for details: if
+    ! ``full_newton()`` wanders away from the midpoint, Newton's method for a
+    ! simple root is restarted there and if the curves are (nearly) tangent
+    ! at the refined point, it is refined again with the augmented system
+    ! in ``newton_double_root()``.
+
+    ! Possible error states:
+    ! * Status_SUCCESS         : On success.
+    ! * Status_BAD_MULTIPLICITY: Via ``full_newton()``.
+
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    real(c_double), intent(in) :: s_mid, t_mid
+    real(c_double), intent(out) :: s, t
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double) :: first_deriv1(2, num_nodes_first - 1)
+    real(c_double) :: first_deriv2(2, num_nodes_second - 1)
+    real(c_double) :: second_deriv1(2, num_nodes_first - 2)
+    real(c_double) :: second_deriv2(2, num_nodes_second - 2)
+    real(c_double) :: tangent1(2, 1), tangent2(2, 1)
+    real(c_double) :: point1(2, 1), point2(2, 1)
+    real(c_double) :: sin_scaled, double_s, double_t
+    logical(c_bool) :: converged
+
+    call full_newton( &
+         s_mid, num_nodes_first, nodes_first, &
+         t_mid, num_nodes_second, nodes_second, s, t, status)
+    if (status /= Status_SUCCESS) then
+       return
+    end if
+
+    ! NOTE: We somewhat replicate code in ``evaluate_hodograph()``
+    !       here. This is so we don't re-compute the nodes for the first
+    !       and second derivatives every time they are evaluated.
+    first_deriv1 = (num_nodes_first - 1) * ( &
+         nodes_first(:, 2:) - nodes_first(:, :num_nodes_first - 1))
+    first_deriv2 = (num_nodes_second - 1) * ( &
+         nodes_second(:, 2:) - nodes_second(:, :num_nodes_second - 1))
+    if (max(abs(s - s_mid), abs(t - t_mid)) > CLIP_MAX_NEWTON_DRIFT) then
+       call newton_iterate(f_simple, s_mid, t_mid, s, t, converged)
+       if (max(abs(s - s_mid), abs(t - t_mid)) > CLIP_MAX_NEWTON_DRIFT) then
+          s = s_mid
+          t = t_mid
+       end if
+    end if
+
+    call evaluate_multi( &
+         num_nodes_first - 1, 2, first_deriv1, 1, [s], tangent1)
+    call evaluate_multi( &
+         num_nodes_second - 1, 2, first_deriv2, 1, [t], tangent2)
+    call cross_product(tangent1(:, 1), tangent2(:, 1), sin_scaled)
+    if (abs(sin_scaled) > &
+         CLIP_TANGENT_THRESHOLD * norm2(tangent1) * norm2(tangent2)) then
+       return
+    end if
+
+    if (num_nodes_first > 2) then
+       second_deriv1 = (num_nodes_first - 2) * ( &
+            first_deriv1(:, 2:) - first_deriv1(:, :num_nodes_first - 2))
+    end if
+    if (num_nodes_second > 2) then
+       second_deriv2 = (num_nodes_second - 2) * ( &
+            first_deriv2(:, 2:) - first_deriv2(:, :num_nodes_second - 2))
+    end if
+    call newton_iterate(f_double, s, t, double_s, double_t, converged)
+    if (.NOT. converged) then
+       return
+    end if
+    if (max(abs(double_s - s_mid), abs(double_t - t_mid)) > &
+         CLIP_MAX_NEWTON_DRIFT) then
+       return
+    end if
+
+    call evaluate_multi( &
+         num_nodes_first, 2, nodes_first, 1, [double_s], point1)
+    call evaluate_multi( &
+         num_nodes_second, 2, nodes_second, 1, [double_t], point2)
+    if (vector_close(2, point1(:, 1), point2(:, 1), VECTOR_CLOSE_EPS)) then
+       s = double_s
+       t = double_t
+    end if
+
+  contains
+
+    ! NOTE: This is a closure around several variables in the scope above:
+    !       * ``num_nodes_first``
+    !       * ``nodes_first``
+    !       * ``first_deriv1``
+    !       * ``num_nodes_second``
+    !       * ``nodes_second``
+    !       * ``first_deriv2``
+    subroutine f_simple(s, t, jacobian, func_val)
+      real(c_double), intent(in) :: s
+      real(c_double), intent(in) :: t
+      real(c_double), intent(out) :: jacobian(2, 2)
+      real(c_double), intent(out) :: func_val(2, 1)
+
+      call newton_simple_root( &
+           s, num_nodes_first, nodes_first, first_deriv1, &
+           t, num_nodes_second, nodes_second, first_deriv2, &
+           jacobian, func_val)
+
+    end subroutine f_simple
+
+    ! NOTE: This is a closure around several variables in the scope above:
+    !       * ``num_nodes_first``
+    !       * ``nodes_first``
+    !       * ``first_deriv1``
+    !       * ``second_deriv1``
+    !       * ``num_nodes_second``
+    !       * ``nodes_second``
+    !       * ``first_deriv2``
+    !       * ``second_deriv2``
+    subroutine f_double(s, t, jacobian, func_val)
+      real(c_double), intent(in) :: s
+      real(c_double), intent(in) :: t
+      real(c_double), intent(out) :: jacobian(2, 2)
+      real(c_double), intent(out) :: func_val(2, 1)
+
+      call newton_double_root( &
+           s, num_nodes_first, nodes_first, first_deriv1, second_deriv1, &
+           t, num_nodes_second, nodes_second, first_deriv2, second_deriv2, &
+           jacobian, func_val)
+
+    end subroutine f_double
+
+  end subroutine refine_converged
+
+  subroutine add_clipped_intersection( &
+       num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       candidate, num_intersections, intersections, status)
+
+    ! Refines a converged candidate pair of parameter intervals
+    ! ``(s_start, s_end, t_start, t_end)`` and adds it as an intersection.
+
+    ! Possible error states:
+    ! * Status_SUCCESS         : On success.
+    ! * Status_BAD_MULTIPLICITY: Via ``refine_converged()``.
+
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    real(c_double), intent(in) :: candidate(4)
+    integer(c_int), intent(inout) :: num_intersections
+    real(c_double), allocatable, intent(inout) :: intersections(:, :)
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double) :: s, t, refined_s, refined_t
+    logical(c_bool) :: found, success_s, success_t
+
+    status = Status_SUCCESS
+    call endpoint_intersection( &
+         num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+         candidate, s, t, found)
+    if (.NOT. found) then
+       call refine_converged( &
+            num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+            0.5_dp * (candidate(1) + candidate(2)), &
+            0.5_dp * (candidate(3) + candidate(4)), s, t, status)
+       if (status /= Status_SUCCESS) then
+          return
+       end if
+    end if
+
+    call wiggle_interval(s, refined_s, success_s)
+    call wiggle_interval(t, refined_t, success_t)
+    if (success_s .AND. success_t) then
+       call add_intersection( &
+            refined_s, refined_t, num_intersections, intersections)
+    end if
+
+  end subroutine add_clipped_intersection
+
+  subroutine add_clip_candidate( &
+       candidates, num_candidates, s_start, s_end, t_start, t_end)
+
+    ! Helper for ``clip_one_round``.
+
+    real(c_double), allocatable, intent(inout) :: candidates(:, :)
+    integer(c_int), intent(inout) :: num_candidates
+    real(c_double), intent(in) :: s_start, s_end, t_start, t_end
+    ! Variables outside of signature.
+    integer(c_int) :: curr_size
+    real(c_double), allocatable :: candidates_swap(:, :)
+
+    num_candidates = num_candidates + 1
+    if (allocated(candidates)) then
+       curr_size = size(candidates, 2)
+       if (curr_size < num_candidates) then
+          allocate(candidates_swap(4, num_candidates))
+          candidates_swap(:, :curr_size) = candidates(:, :curr_size)
+          call move_alloc(candidates_swap, candidates)
+       end if
+    else
+       allocate(candidates(4, num_candidates))
+    end if
+
+    candidates(:, num_candidates) = [s_start, s_end, t_start, t_end]
+
+  end subroutine add_clip_candidate
+
+  subroutine merge_converged(converged, num_converged, candidate)
+
+    ! Helper for ``clip_one_round``.
+
+    ! Adds a converged candidate to ``converged``, merging it with the first
+    ! existing one that it overlaps. Near a tangent intersection, several
+    ! adjacent candidates converge together and merging them means Newton's
+    ! method is only used once for the entire cluster.
+
+    real(c_double), allocatable, intent(inout) :: converged(:, :)
+    integer(c_int), intent(inout) :: num_converged
+    real(c_double), intent(in) :: candidate(4)
+    ! Variables outside of signature.
+    integer(c_int) :: index_
+
+    do index_ = 1, num_converged
+       if ( &
+            candidate(1) <= converged(2, index_) .AND. &
+            converged(1, index_) <= candidate(2) .AND. &
+            candidate(3) <= converged(4, index_) .AND. &
+            converged(3, index_) <= candidate(4)) then
+          converged(1, index_) = min(candidate(1), converged(1, index_))
+          converged(2, index_) = max(candidate(2), converged(2, index_))
+          converged(3, index_) = min(candidate(3), converged(3, index_))
+          converged(4, index_) = max(candidate(4), converged(4, index_))
+          return
+       end if
+    end do
+
+    call add_clip_candidate( &
+         converged, num_converged, &
+         candidate(1), candidate(2), candidate(3), candidate(4))
+
+  end subroutine merge_converged
+
+  subroutine clip_one_round( &
+       num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       num_candidates, candidates, num_intersections, intersections, &
+       next_candidates, num_next_candidates, status)
+
+    ! NOTE: This is **explicitly** not intended for C inter-op.
+
+    ! Each candidate is a pair of parameter intervals
+    ! ``(s_start, s_end, t_start, t_end)`` on the two curves. The interval
+    ! on the second curve is clipped against the fat line of the first, and
+    ! vice versa. If the clipping doesn't (sufficiently) reduce the
+    ! intervals, the wider one is subdivided. Candidates that converge to a
+    ! point are merged (via ``merge_converged()``), then refined and added
+    ! to ``intersections``.
+
+    ! Possible error states:
+    ! * Status_SUCCESS         : On success.
+    ! * Status_BAD_MULTIPLICITY: Via ``add_clipped_intersection()``.
+
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    integer(c_int), intent(in) :: num_candidates
+    real(c_double), intent(in) :: candidates(4, num_candidates)
+    integer(c_int), intent(inout) :: num_intersections
+    real(c_double), allocatable, intent(inout) :: intersections(:, :)
+    real(c_double), allocatable, intent(inout) :: next_candidates(:, :)
+    integer(c_int), intent(out) :: num_next_candidates
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double) :: nodes1(2, num_nodes_first)
+    real(c_double) :: nodes2(2, num_nodes_second)
+    real(c_double) :: s_start, s_end, t_start, t_end
+    real(c_double) :: width, delta, clip_start, clip_end, midpoint
+    integer(c_int) :: index_, enum_, num_converged
+    real(c_double), allocatable :: converged(:, :)
+
+    status = Status_SUCCESS
+    num_next_candidates = 0
+    num_converged = 0
+    do index_ = 1, num_candidates
+       s_start = candidates(1, index_)
+       s_end = candidates(2, index_)
+       t_start = candidates(3, index_)
+       t_end = candidates(4, index_)
+       call specialize_curve( &
+            num_nodes_first, 2, nodes_first, s_start, s_end, nodes1)
+       call specialize_curve( &
+            num_nodes_second, 2, nodes_second, t_start, t_end, nodes2)
+       call bbox_intersect( &
+            num_nodes_first, nodes1, num_nodes_second, nodes2, enum_)
+       if (enum_ == BoxIntersectionType_DISJOINT) then
+          cycle
+       end if
+
+       width = max(s_end - s_start, t_end - t_start)
+       if (width < CLIP_CONVERGED_WIDTH) then
+          call merge_converged( &
+               converged, num_converged, candidates(:, index_))
+          cycle
+       end if
+
+       ! Clip the second curve against the fat line of the first.
+       call clip_interval( &
+            num_nodes_first, nodes1, num_nodes_second, nodes2, &
+            clip_start, clip_end)
+       if (clip_start > clip_end) then
+          cycle
+       end if
+       delta = t_end - t_start
+       t_end = t_start + clip_end * delta
+       t_start = t_start + clip_start * delta
+       call specialize_curve( &
+            num_nodes_second, 2, nodes_second, t_start, t_end, nodes2)
+
+       ! Clip the first curve against the fat line of the (clipped) second.
+       call clip_interval( &
+            num_nodes_second, nodes2, num_nodes_first, nodes1, &
+            clip_start, clip_end)
+       if (clip_start > clip_end) then
+          cycle
+       end if
+       delta = s_end - s_start
+       s_end = s_start + clip_end * delta
+       s_start = s_start + clip_start * delta
+
+       if (max(s_end - s_start, t_end - t_start) <= &
+            CLIP_MIN_REDUCTION * width) then
+          call add_clip_candidate( &
+               next_candidates, num_next_candidates, &
+               s_start, s_end, t_start, t_end)
+       else if (s_end - s_start >= t_end - t_start) then
+          midpoint = 0.5_dp * (s_start + s_end)
+          call add_clip_candidate( &
+               next_candidates, num_next_candidates, &
+               s_start, midpoint, t_start, t_end)
+          call add_clip_candidate( &
+               next_candidates, num_next_candidates, &
+               midpoint, s_end, t_start, t_end)
+       else
+          midpoint = 0.5_dp * (t_start + t_end)
+          call add_clip_candidate( &
+               next_candidates, num_next_candidates, &
+               s_start, s_end, t_start, midpoint)
+          call add_clip_candidate( &
+               next_candidates, num_next_candidates, &
+               s_start, s_end, midpoint, t_end)
+       end if
+    end do
+
+    do index_ = 1, num_converged
+       call add_clipped_intersection( &
+            num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+            converged(:, index_), num_intersections, intersections, status)
+       if (status /= Status_SUCCESS) then
+          return
+       end if
+    end do
+
+  end subroutine clip_one_round
+
+  subroutine all_intersections_clipping( &
+       num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       intersections, num_intersections, coincident, status)
+
+    ! NOTE: This is **explicitly** not intended for C inter-op, but
+    !       a C compatible interface is exposed as
+    !       ``all_intersections_clipping_abi``.
+
+    ! NOTE: This only uses local state (the candidate intervals are
+    !       allocated on each call), so it is safe to call from multiple
+    !       threads.
+
+    ! Possible error states:
+    ! * Status_SUCCESS         : On success.
+    ! * Status_NO_CONVERGE     : If the clipped intervals don't converge
+    !                            after ``MAX_CLIP_ITERATIONS``.
+    ! * (N >= MAX_CANDIDATES)  : The number of candidates if it exceeds the
+    !                            limit ``MAX_CANDIDATES`` (64 is the default)
+    !                            and the curves are not coincident.
+    ! * Status_BAD_MULTIPLICITY: Via ``clip_one_round()``.
+
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    real(c_double), allocatable, intent(inout) :: intersections(:, :)
+    integer(c_int), intent(out) :: num_intersections
+    logical(c_bool), intent(out) :: coincident
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double), allocatable :: candidates_odd(:, :)
+    real(c_double), allocatable :: candidates_even(:, :)
+    integer(c_int) :: num_candidates, num_next_candidates, index_
+    logical(c_bool) :: is_even
+
+    status = Status_SUCCESS  ! Default.
+    num_intersections = 0
+    coincident = .FALSE.
+    ! First iteration is odd (i.e. ``index_ == 1``).
+    num_candidates = 1
+    allocate(candidates_odd(4, 1))
+    candidates_odd(:, 1) = [0.0_dp, 1.0_dp, 0.0_dp, 1.0_dp]
+
+    is_even = .TRUE.  ! At zero.
+    do index_ = 1, MAX_CLIP_ITERATIONS
+       is_even = .NOT. is_even  ! Switch parity.
+
+       if (is_even) then
+          ! Since ``index_`` is even, we READ from ``candidates_even``
+          ! and WRITE to ``candidates_odd``.
+          call clip_one_round( &
+               num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+               num_candidates, candidates_even, &
+               num_intersections, intersections, &
+               candidates_odd, num_next_candidates, status)
+       else
+          ! Since ``index_`` is odd, we READ from ``candidates_odd``
+          ! and WRITE to ``candidates_even``.
+          call clip_one_round( &
+               num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+               num_candidates, candidates_odd, &
+               num_intersections, intersections, &
+               candidates_even, num_next_candidates, status)
+       end if
+
+       if (status /= Status_SUCCESS) then
+          return
+       end if
+
+       num_candidates = num_next_candidates
+       ! Bail out if there are too many candidates, unless the curves
+       ! are coincident.
+       if (num_candidates > MAX_CANDIDATES) then
+          call add_coincident_parameters( &
+               num_nodes_first, nodes_first, &
+               num_nodes_second, nodes_second, &
+               num_intersections, intersections, coincident)
+          if (.NOT. coincident) then
+             ! NOTE: This assumes that all of the status enum values are
+             !       less than ``MAX_CANDIDATES + 1``.
+             status = num_candidates
+          end if
+          return
+       end if
+
+       ! If none of the candidate pairs have been accepted, then there are
+       ! no more intersections to find.
+       if (num_candidates == 0) then
+          return
+       end if
+    end do
+
+    ! If we've reached this point, then the clipped intervals failed to
+    ! converge after ``MAX_CLIP_ITERATIONS``.
+    status = Status_NO_CONVERGE
+
+  end subroutine all_intersections_clipping
+
+  subroutine all_intersections_clipping_abi( &
+       num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+       intersections_size, intersections, num_intersections, &
+       coincident, status) &
+       bind(c, name='BEZ_curve_intersections_clipping')
+
+    ! NOTE: As with ``all_intersections_abi()``, if ``intersections`` is
+    !       not large enough, then ``status`` will be set to
+    !       ``Status_INSUFFICIENT_SPACE`` and ``num_intersections`` can be
+    !       used by the caller to re-size ``intersections``.
+
+    ! NOTE: Unlike ``all_intersections_abi()``, this does not use any
+    !       module-level workspaces, so it is safe to call from multiple
+    !       threads.
+
+    ! Possible error states:
+    ! * Status_SUCCESS           : On success.
+    ! * Status_INSUFFICIENT_SPACE: If ``intersections_size`` is smaller than
+    !                              the number of intersections.
+    ! * Status_NO_CONVERGE       : Via ``all_intersections_clipping()``.
+    ! * (N >= MAX_CANDIDATES)    : Via ``all_intersections_clipping()``.
+    ! * Status_BAD_MULTIPLICITY  : Via ``all_intersections_clipping()``.
+
+    integer(c_int), intent(in) :: num_nodes_first
+    real(c_double), intent(in) :: nodes_first(2, num_nodes_first)
+    integer(c_int), intent(in) :: num_nodes_second
+    real(c_double), intent(in) :: nodes_second(2, num_nodes_second)
+    integer(c_int), intent(in) :: intersections_size
+    real(c_double), intent(out) :: intersections(2, intersections_size)
+    integer(c_int), intent(out) :: num_intersections
+    logical(c_bool), intent(out) :: coincident
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double), allocatable :: all_intersections_(:, :)
+
+    call all_intersections_clipping( &
+         num_nodes_first, nodes_first, num_nodes_second, nodes_second, &
+         all_intersections_, num_intersections, coincident, status)
+
+    if (status /= Status_SUCCESS) then
+       return
+    end if
+
+    if (num_intersections > intersections_size) then
+       status = Status_INSUFFICIENT_SPACE
+    else if (num_intersections > 0) then
+       intersections(:, :num_intersections) = ( &
+            all_intersections_(:, :num_intersections))
+    end if
+
+  end subroutine all_intersections_clipping_abi
+
+  subroutine flatten_curve( &
+       num_nodes, dimension_, nodes, tolerance, vertices_size, &
+       s_vals, vertices, num_vertices, status) &
+       bind(c, name='BEZ_flatten_curve')
+
+    ! Approximates a curve by a polyline. Sub-curves are recursively
+    ! subdivided (depth-first, so that the vertices are in order) until the
+    ! ``linearization_error()`` is at most ``tolerance``. The vertices are
+    ! the start of the curve and the end of each accepted sub-curve.
+
+    ! NOTE: The number of vertices cannot be known beforehand. If
+    !       ``vertices_size < num_vertices``, then only the first
+    !       ``vertices_size`` vertices will be populated and the ``status``
+    !       will be set to ``Status_INSUFFICIENT_SPACE``. However, the value
+    !       of ``num_vertices`` will be accurate and the outputs should be
+    !       re-sized by the caller to accommodate.
+
+    ! Possible error states:
+    ! * Status_SUCCESS           : On success.
+    ! * Status_INSUFFICIENT_SPACE: If ``vertices_size`` is smaller than the
+    !                              number of vertices.
+
+    integer(c_int), intent(in) :: num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(dimension_, num_nodes)
+    real(c_double), intent(in) :: tolerance
+    integer(c_int), intent(in) :: vertices_size
+    real(c_double), intent(out) :: s_vals(vertices_size)
+    real(c_double), intent(out) :: vertices(dimension_, vertices_size)
+    integer(c_int), intent(out) :: num_vertices
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double) :: stack_nodes( &
+         dimension_, num_nodes, MAX_FLATTEN_SUBDIVISIONS + 1)
+    real(c_double) :: stack_start(MAX_FLATTEN_SUBDIVISIONS + 1)
+    real(c_double) :: stack_end(MAX_FLATTEN_SUBDIVISIONS + 1)
+    integer(c_int) :: stack_depth(MAX_FLATTEN_SUBDIVISIONS + 1)
+    real(c_double) :: left_nodes(dimension_, num_nodes)
+    real(c_double) :: right_nodes(dimension_, num_nodes)
+    real(c_double) :: error, midpoint
+    integer(c_int) :: top, depth
+
+    status = Status_SUCCESS
+    num_vertices = 1
+    if (vertices_size >= 1) then
+       s_vals(1) = 0.0_dp
+       vertices(:, 1) = nodes(:, 1)
+    end if
+
+    ! NOTE: The top of the stack is always the left-most sub-curve that
+    !       has not been accepted yet, so it never holds more than one
+    !       sub-curve per level of subdivision.
+    top = 1
+    stack_nodes(:, :, 1) = nodes
+    stack_start(1) = 0.0_dp
+    stack_end(1) = 1.0_dp
+    stack_depth(1) = 0
+    do while (top > 0)
+       depth = stack_depth(top)
+       ! NOTE: Lines (and points) are never subdivided.
+       error = 0.0_dp
+       if (num_nodes > 2) then
+          call linearization_error( &
+               num_nodes, dimension_, stack_nodes(:, :, top), error)
+       end if
+       if (error <= tolerance .OR. depth >= MAX_FLATTEN_SUBDIVISIONS) then
+          num_vertices = num_vertices + 1
+          if (num_vertices <= vertices_size) then
+             s_vals(num_vertices) = stack_end(top)
+             vertices(:, num_vertices) = stack_nodes(:, num_nodes, top)
+          end if
+          top = top - 1
+       else
+          call subdivide_nodes( &
+               num_nodes, dimension_, stack_nodes(:, :, top), &
+               left_nodes, right_nodes)
+          midpoint = 0.5_dp * (stack_start(top) + stack_end(top))
+          ! Push the left half and then replace the current sub-curve with
+          ! its right half.
+          stack_nodes(:, :, top + 1) = left_nodes
+          stack_start(top + 1) = stack_start(top)
+          stack_end(top + 1) = midpoint
+          stack_depth(top + 1) = depth + 1
+          stack_nodes(:, :, top) = right_nodes
+          stack_start(top) = midpoint
+          stack_depth(top) = depth + 1
+          top = top + 1
+       end if
+    end do
+
+    if (num_vertices > vertices_size) then
+       status = Status_INSUFFICIENT_SPACE
+    end if
+
+  end subroutine flatten_curve
+
+  subroutine flatten_curves( &
+       num_curves, num_nodes, dimension_, nodes, tolerance, vertices_size, &
+       s_vals, vertices, offsets, num_vertices, status) &
+       bind(c, name='BEZ_flatten_curves')
+
+    ! NOTE: This is ``flatten_curve`` for a batch of Bezier curves that all
+    !       have the same degree and dimension (with the same layout as
+    !       ``evaluate_curves_multi``). The polylines are concatenated and
+    !       the vertices of curve ``j`` are at (zero-based) indices
+    !       ``offsets(j) <= k < offsets(j + 1)``.
+
+    ! Possible error states:
+    ! * Status_SUCCESS           : On success.
+    ! * Status_INSUFFICIENT_SPACE: If ``vertices_size`` is smaller than the
+    !                              total number of vertices.
+
+    integer(c_int), intent(in) :: num_curves, num_nodes, dimension_
+    real(c_double), intent(in) :: nodes(num_curves, dimension_, num_nodes)
+    real(c_double), intent(in) :: tolerance
+    integer(c_int), intent(in) :: vertices_size
+    real(c_double), intent(out) :: s_vals(vertices_size)
+    real(c_double), intent(out) :: vertices(dimension_, vertices_size)
+    integer(c_int), intent(out) :: offsets(num_curves + 1)
+    integer(c_int), intent(out) :: num_vertices
+    integer(c_int), intent(out) :: status
+    ! Variables outside of signature.
+    real(c_double) :: curve_nodes(dimension_, num_nodes)
+    integer(c_int) :: j, first, remaining, curve_vertices, curve_status
+
+    status = Status_SUCCESS
+    num_vertices = 0
+    offsets(1) = 0
+    do j = 1, num_curves
+       ! NOTE: Once the outputs are full, the remaining curves are still
+       !       flattened (into empty outputs) so that ``num_vertices`` is
+       !       accurate.
+       first = min(num_vertices, vertices_size) + 1
+       remaining = vertices_size - first + 1
+       curve_nodes = nodes(j, :, :)
+       call flatten_curve( &
+            num_nodes, dimension_, curve_nodes, tolerance, remaining, &
+            s_vals(first:), vertices(:, first:), curve_vertices, curve_status)
+       if (curve_status /= Status_SUCCESS) then
+          status = curve_status
+       end if
+       num_vertices = num_vertices + curve_vertices
+       offsets(j + 1) = num_vertices
+    end do
+
+  end subroutine flatten_curves
 
 end module curve_intersection
@@ -25,6 +25,9 @@ void BEZ_evaluate_curve_barycentric(const int* num_nodes, const int* dimension,
 void BEZ_evaluate_multi(const int* num_nodes, const int* dimension,
     const double* nodes, const int* num_vals, const double* s_vals,
     double* evaluated);
+void BEZ_evaluate_curves_multi(const int* num_curves, const int* num_nodes,
+    const int* dimension, const double* nodes, const int* num_vals,
+    const double* s_vals, double* evaluated);
 void BEZ_specialize_curve(const int* num_nodes, const int* dimension,
     const double* nodes, const double* start, const double* end,
     double* new_nodes);
@@ -37,6 +40,9 @@ void BEZ_newton_refine_curve(const int* num_nodes, const int* dimension,
     double* updated_s);
 void BEZ_locate_point_curve(const int* num_nodes, const int* dimension,
     const double* nodes, const double* point, double* s_approx);
+void BEZ_locate_point_curve_multi(const int* num_nodes,
+    const int* dimension, const double* nodes, const int* num_points,
+    const double* points, double* s_approx);
 void BEZ_elevate_nodes_curve(const int* num_nodes, const int* dimension,
     const double* nodes, double* elevated);
 void BEZ_get_curvature(const int* num_nodes, const double* nodes,
@@ -48,6 +54,9 @@ void BEZ_full_reduce(const int* num_nodes, const int* dimension,
     bool* not_implemented);
 void BEZ_compute_length(const int* num_nodes, const int* dimension,
     const double* nodes, double* length, int* error_val);
+void BEZ_compute_length_multi(const int* num_curves, const int* num_nodes,
+    const int* dimension, const double* nodes, const double* rtol,
+    double* lengths, int* error_val);
 
 #if defined(__cplusplus)
 }
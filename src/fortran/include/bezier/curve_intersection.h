@@ -37,6 +37,25 @@ void BEZ_curve_intersections(const int* num_nodes_first,
     double* intersections, const int* num_intersections, bool* coincident,
     Status* status);
 void BEZ_free_curve_intersections_workspace(void);
+void BEZ_new_intersection_workspace(void** workspace);
+void BEZ_free_intersection_workspace(void* const* workspace);
+void BEZ_curve_intersections_workspace(void* const* workspace,
+    const int* num_nodes_first, const double* nodes_first,
+    const int* num_nodes_second, const double* nodes_second,
+    const int* intersections_size, double* intersections,
+    const int* num_intersections, bool* coincident, Status* status);
+void BEZ_curve_intersections_clipping(const int* num_nodes_first,
+    const double* nodes_first, const int* num_nodes_second,
+    const double* nodes_second, const int* intersections_size,
+    double* intersections, const int* num_intersections, bool* coincident,
+    Status* status);
+void BEZ_flatten_curve(const int* num_nodes, const int* dimension,
+    const double* nodes, const double* tolerance, const int* vertices_size,
+    double* s_vals, double* vertices, int* num_vertices, Status* status);
+void BEZ_flatten_curves(const int* num_curves, const int* num_nodes,
+    const int* dimension, const double* nodes, const double* tolerance,
+    const int* vertices_size, double* s_vals, double* vertices, int* offsets,
+    int* num_vertices, Status* status);
 
 #if defined(__cplusplus)
 }
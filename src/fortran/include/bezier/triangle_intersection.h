@@ -37,6 +37,9 @@ void BEZ_newton_refine_triangle(const int* num_nodes, const double* nodes,
 void BEZ_locate_point_triangle(const int* num_nodes, const double* nodes,
     const int* degree, const double* x_val, const double* y_val, double* s_val,
     double* t_val);
+void BEZ_locate_point_triangle_multi(const int* num_nodes,
+    const double* nodes, const int* degree, const int* num_points,
+    const double* points, double* st_vals);
 void BEZ_triangle_intersections(const int* num_nodes1, const double* nodes1,
     const int* degree1, const int* num_nodes2, const double* nodes2,
     const int* degree2, const int* segment_ends_size, int* segment_ends,
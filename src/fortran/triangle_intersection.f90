@@ -46,7 +46,8 @@ module triangle_intersection
        IntersectionClassification_COINCIDENT_UNUSED, &
        TriangleContained_NEITHER, &
        TriangleContained_FIRST, TriangleContained_SECOND, newton_refine, &
-       locate_point, classify_intersection, update_edge_end_unused, &
+       locate_point, locate_point_multi, classify_intersection, &
+       update_edge_end_unused, &
        find_corner_unused, add_st_vals, should_keep, &
        triangles_intersection_points, is_first, is_second, &
        get_next, to_front, add_segment, &
@@ -392,6 +393,31 @@ contains
 
   end subroutine locate_point
 
+  subroutine locate_point_multi( &
+       num_nodes, nodes, degree, num_points, points, st_vals) &
+       bind(c, name='BEZ_locate_point_triangle_multi')
+
+    ! NOTE: This is ``locate_point`` for each column of ``points``. The
+    !       ``s``-value of each row of ``st_vals`` is ``-1`` (``LOCATE_MISS``)
+    !       as a signal for "point is not on the triangle".
+
+    integer(c_int), intent(in) :: num_nodes
+    real(c_double), intent(in) :: nodes(2, num_nodes)
+    integer(c_int), intent(in) :: degree
+    integer(c_int), intent(in) :: num_points
+    real(c_double), intent(in) :: points(2, num_points)
+    real(c_double), intent(out) :: st_vals(num_points, 2)
+    ! Variables outside of signature.
+    integer(c_int) :: j
+
+    do j = 1, num_points
+       call locate_point( &
+            num_nodes, nodes, degree, points(1, j), points(2, j), &
+            st_vals(j, 1), st_vals(j, 2))
+    end do
+
+  end subroutine locate_point_multi
+
   logical(c_bool) function ignored_edge_corner( &
        edge_tangent, corner_tangent, num_nodes, &
        previous_edge_nodes) result(predicate)
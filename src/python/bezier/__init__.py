@@ -28,12 +28,24 @@ Plotting utilities are also provided.
 """
 
 # NOTE: ``__config__`` **must** be the first import because it (may)
-#       modify the search path used to locate shared libraries.
+#       modify the search path used to locate shared libraries. Similarly,
+#       ``_lazy`` must be imported before any module that uses the pure
+#       Python fallbacks, since importing it defers their execution.
 from bezier import __config__
+from bezier import _lazy  # noqa: F401
 from bezier._legacy import Surface
 from bezier._py_helpers import UnsupportedDegree
 from bezier.curve import Curve
+from bezier.curve import curve_lengths
+from bezier.curve import evaluate_curves
+from bezier.curve import intersect_pairs
+from bezier.curve import SamplePlan
+from bezier.curve_array import CurveArray
+from bezier.curve_collection import CurveCollection
 from bezier.curved_polygon import CurvedPolygon
+from bezier.intersection_cache import configure
+from bezier.mesh_overlay import overlay
+from bezier.triangle import intersect_triangle_pairs
 from bezier.triangle import Triangle
 
 try:
@@ -54,7 +66,16 @@ __all__ = [
     "__author__",
     "__version__",
     "Curve",
+    "CurveArray",
+    "CurveCollection",
+    "curve_lengths",
+    "configure",
     "CurvedPolygon",
+    "evaluate_curves",
+    "intersect_pairs",
+    "intersect_triangle_pairs",
+    "overlay",
+    "SamplePlan",
     "Surface",
     "Triangle",
     "UnsupportedDegree",
@@ -30,22 +30,61 @@ class Base:
         copy (bool): Flag indicating if the nodes should be copied before
             being stored. Defaults to :data:`True` since callers may
             freely mutate ``nodes`` after passing in.
+        frozen (bool): Flag indicating if the shape is frozen, i.e. if
+            the stored nodes are read-only and quantities derived from them
+            can be computed once and re-used. Defaults to :data:`False`.
+            If ``copy`` is :data:`False`, the stored nodes are a read-only
+            view of ``nodes``, so the caller **must not** modify ``nodes``
+            afterwards (the cached quantities would become stale).
 
     Raises:
         ValueError: If the ``nodes`` are not 2D.
     """
 
-    __slots__ = ("_dimension", "_nodes")
+    __slots__ = ("_dimension", "_nodes", "_frozen")
     _degree = -1
 
-    def __init__(self, nodes, copy=True):
+    def __init__(self, nodes, copy=True, frozen=False):
         nodes_np = sequence_to_array(nodes)
         dimension, _ = nodes_np.shape
         self._dimension = dimension
         if copy:
             self._nodes = nodes_np.copy(order="F")
+        elif frozen:
+            # NOTE: A view is used so that the caller's array is not made
+            #       read-only as a side effect.
+            self._nodes = nodes_np.view()
         else:
             self._nodes = nodes_np
+        self._frozen = frozen
+        if frozen:
+            self._nodes.flags.writeable = False
+
+    def _cached(self, name, compute):
+        """Get a quantity derived from the nodes of the current shape.
+
+        If the shape is frozen, the value is computed the first time it is
+        needed and stored in the slot ``name``; otherwise (since the nodes
+        may have changed) it is computed on every call.
+
+        Args:
+            name (str): The slot that stores the value.
+            compute (Callable[[numpy.ndarray], Any]): Computes the value from
+                the nodes.
+
+        Returns:
+            Any: The (possibly cached) value.
+        """
+        if not self._frozen:
+            return compute(self._nodes)
+
+        value = getattr(self, name)
+        if value is None:
+            value = compute(self._nodes)
+            if isinstance(value, np.ndarray):
+                value.flags.writeable = False
+            setattr(self, name, value)
+        return value
 
     @property
     def degree(self):
@@ -61,11 +100,31 @@ class Base:
         """
         return self._dimension
 
+    @property
+    def frozen(self):
+        """bool: Indicates if the current shape is frozen.
+
+        The nodes of a frozen shape are read-only, so quantities derived
+        from them (e.g. the bounding box) are computed once and re-used.
+        """
+        return self._frozen
+
     @property
     def nodes(self):
         """numpy.ndarray: The nodes that define the current shape."""
         return self._nodes.copy(order="F")
 
+    @property
+    def nodes_view(self):
+        """numpy.ndarray: A read-only view of the nodes of the current shape.
+
+        Unlike :attr:`nodes`, this does not copy, so it is suitable for
+        large shapes (e.g. with nodes stored in shared memory).
+        """
+        view = self._nodes.view()
+        view.flags.writeable = False
+        return view
+
     def __repr__(self):
         """Representation of current object.
 
@@ -100,7 +159,7 @@ def _lossless_to_float(array):
     return converted
 
 
-def sequence_to_array(nodes):
+def sequence_to_array(nodes, ndim=2):
     """Convert a sequence to a Fortran-ordered ``np.float64`` NumPy array.
 
     Args:
@@ -108,16 +167,116 @@ def sequence_to_array(nodes):
             shape. Must be convertible to a 2D NumPy array of floating point
             values, where the columns are the nodes and the rows correspond to
             each dimension the shape occurs in.
+        ndim (Optional[int]): The expected number of dimensions of the
+            array. Defaults to ``2``; a batch of shapes stacked along a new
+            first axis uses ``3``.
 
     Returns:
         numpy.ndarray: The converted array (or the original if already a
         float array).
 
     Raises:
-        ValueError: If the ``nodes`` are not 2D.
+        ValueError: If the ``nodes`` are not ``ndim``-dimensional.
     """
     nodes_np = np.asarray(nodes, order="F")
-    if nodes_np.ndim != 2:
-        raise ValueError("Nodes must be 2-dimensional, not", nodes_np.ndim)
+    if nodes_np.ndim != ndim:
+        raise ValueError(
+            f"Nodes must be {ndim}-dimensional, not", nodes_np.ndim
+        )
 
     return _lossless_to_float(nodes_np)
+
+
+def buffer_to_array(buffer, dimension=None):
+    """Wrap a buffer of ``np.float64`` values as nodes without copying.
+
+    Args:
+        buffer (Union[numpy.ndarray, memoryview, bytes, bytearray]): An
+            object supporting the buffer protocol. Either a 2D Fortran-ordered
+            buffer of ``np.float64`` values, or a flat buffer of such values
+            (or of raw bytes) that stores the nodes in Fortran order.
+        dimension (Optional[int]): The dimension of the ambient space.
+            Required for a flat buffer; for a 2D buffer, it is checked
+            against the number of rows (if provided).
+
+    Returns:
+        numpy.ndarray: A 2D Fortran-ordered ``np.float64`` array sharing
+        memory with ``buffer``.
+
+    Raises:
+        ValueError: If ``buffer`` is not 1D or 2D.
+        ValueError: If ``buffer`` does not contain ``np.float64`` values.
+        ValueError: If a 2D ``buffer`` is not Fortran-ordered.
+        ValueError: If ``dimension`` is not provided for a flat ``buffer``.
+        ValueError: If ``dimension`` does not match the size or shape of
+            ``buffer``.
+    """
+    nodes_np = np.asarray(memoryview(buffer))
+    if nodes_np.ndim == 1 and nodes_np.dtype.itemsize == 1:
+        # Raw bytes, e.g. from a shared memory block.
+        nodes_np = nodes_np.view(np.float64)
+    if nodes_np.dtype != np.float64:
+        raise ValueError(
+            "Buffer must contain float64 values, not", nodes_np.dtype
+        )
+
+    if nodes_np.ndim == 1:
+        if dimension is None:
+            raise ValueError("A flat buffer requires the dimension")
+        if nodes_np.size % dimension != 0:
+            raise ValueError(
+                "Buffer size is not a multiple of the dimension",
+                nodes_np.size,
+                dimension,
+            )
+        return nodes_np.reshape((dimension, -1), order="F")
+
+    if nodes_np.ndim != 2:
+        raise ValueError(
+            "Buffer must be 1- or 2-dimensional, not", nodes_np.ndim
+        )
+
+    if not nodes_np.flags.f_contiguous:
+        raise ValueError("Buffer must be Fortran-ordered")
+
+    if dimension is not None and nodes_np.shape[0] != dimension:
+        raise ValueError(
+            "Buffer does not match the dimension", nodes_np.shape, dimension
+        )
+
+    return nodes_np
+
+
+def stacked_triangles(nodes):
+    """Convert the stacked nodes of planar triangles to an array.
+
+    Args:
+        nodes (Sequence[Sequence[Sequence[numbers.Number]]]): The stacked
+            nodes of the triangles.
+
+    Returns:
+        Tuple[numpy.ndarray, int]: The nodes (as a Fortran-ordered
+        ``T x 2 x N`` array) and the degree of the triangles.
+
+    Raises:
+        ValueError: If ``nodes`` is not 3D.
+        NotImplementedError: If the triangles are not two-dimensional.
+        ValueError: If the number of nodes is not a triangular number.
+    """
+    nodes_np = np.asfortranarray(sequence_to_array(nodes, ndim=3))
+    _, dimension, num_nodes = nodes_np.shape
+    if dimension != 2:
+        raise NotImplementedError(
+            "Intersection only implemented in 2D",
+            "Triangles have dimension",
+            dimension,
+        )
+
+    # 8 * num_nodes = (2d + 3)^2 - 1 (as in ``Triangle._get_degree()``).
+    degree = int(np.round(0.5 * (np.sqrt(8.0 * num_nodes + 1.0) - 3.0)))
+    if (degree + 1) * (degree + 2) != 2 * num_nodes:
+        raise ValueError(
+            "A triangle cannot have the number of nodes", num_nodes
+        )
+
+    return nodes_np, degree
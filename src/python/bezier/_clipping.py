@@ -22,7 +22,8 @@ bounded distance from the line connecting the start and end points of a
 B |eacute| zier curve.)
 
 It has quadratic convergence. It can be used to find tangent intersections,
-which is the primary usage within ``bezier``.
+and :func:`all_intersections` uses it (falling back to subdivision when
+clipping stalls) as the :attr:`~.IntersectionStrategy.CLIPPING` strategy.
 
 .. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
    :trim:
@@ -31,12 +32,43 @@ which is the primary usage within ``bezier``.
 import numpy as np
 
 from bezier import _helpers
+from bezier import _py_curve_helpers
 from bezier import _py_geometric_intersection
+from bezier import _py_intersection_helpers
 
 
 NO_PARALLEL = "Parallel lines not supported during clipping."
 DEFAULT_S_MIN = 1.0
 DEFAULT_S_MAX = 0.0
+# Parameter intervals narrower than this are considered to have converged
+# to a point (which is then refined via Newton's method).
+_CONVERGED_WIDTH = 0.5 ** 20
+# Newton updates (from the midpoint of converged intervals) larger than this
+# are rejected in favor of the midpoint.
+_MAX_NEWTON_DRIFT = 0.5 ** 16
+# If the sine of the angle between the curves at a (refined) intersection is
+# below this, the curves are treated as tangent there, so the intersection
+# is refined again via Newton's method for double roots.
+_TANGENT_THRESHOLD = 0.5 ** 16
+# If clipping doesn't shrink a pair of intervals to at most this fraction
+# of their prior width, the wider of the two is subdivided instead.
+_MIN_REDUCTION = 0.8
+# Relative amount by which the fat line is widened to account for round-off
+# (e.g. when a sub-curve ends exactly on the fat line of the other).
+_FAT_LINE_WIGGLE = 0.5 ** 40
+# Number of Newton steps used to locate the endpoint of one curve on the
+# other (starting within a converged interval).
+_ENDPOINT_NEWTON_STEPS = 3
+_MAX_CLIP_ITERATIONS = 100
+_MAX_CANDIDATES = 64
+_TOO_MANY_TEMPLATE = (
+    "The number of candidate intersections is too high.\n"
+    "{:d} candidate pairs."
+)
+_NO_CONVERGE_TEMPLATE = (
+    "Curve intersection failed to converge to a point via clipping "
+    "after {:d} iterations."
+)
 
 
 def compute_implicit_line(nodes):
@@ -289,3 +321,526 @@ def clip_range(nodes1, nodes2):
                 polynomial[:, end_index],
             )
     return _check_parameter_range(s_min, s_max)
+
+
+def clip_interval(nodes1, nodes2):
+    r"""Reduce the parameter range where two curves can intersect.
+
+    Like :func:`clip_range`, this uses the "fat line" for ``nodes1`` and
+    the distance polynomial for ``nodes2``. However, it makes no assumption
+    about the number of intersections: the returned interval is the exact
+    parameter range of the convex hull of the distance polynomial within
+    the fat line, which may be all of :math:`\left[0, 1\right]` or empty.
+    To account for round-off, the fat line is widened slightly (relative
+    to the magnitude of the nodes).
+
+    If the first and last node in ``nodes1`` are identical there is no
+    fat line, so the full interval is returned.
+
+    Args:
+        nodes1 (numpy.ndarray): ``2 x N1`` array of nodes in a curve which
+            will define the clipping region.
+        nodes2 (numpy.ndarray): ``2 x N2`` array of nodes in a curve which
+            will be clipped.
+
+    Returns:
+        Optional[Tuple[float, float]]: The start and end parameter of the
+        clipped range, or :data:`None` if the curves can't intersect.
+    """
+    if np.all(nodes1[:, 0] == nodes1[:, -1]):
+        return 0.0, 1.0
+
+    coeff_a, coeff_b, coeff_c, d_min, d_max = compute_fat_line(nodes1)
+    wiggle = _FAT_LINE_WIGGLE * max(
+        np.max(np.abs(nodes1)), np.max(np.abs(nodes2))
+    )
+    d_min -= wiggle
+    d_max += wiggle
+    # NOTE: This assumes, but does not check, that there are two rows.
+    distances = coeff_a * nodes2[0, :] + coeff_b * nodes2[1, :] + coeff_c
+    return _hull_range(distances, d_min, d_max)
+
+
+def _hull_range(distances, d_min, d_max):
+    """Find the parameter range of a convex hull within a fat line.
+
+    .. note::
+
+       This is a helper for :func:`clip_interval`.
+
+    Args:
+        distances (numpy.ndarray): 1D array of the (signed) distances of
+            the control points of a curve from the line at the center of
+            the fat line.
+        d_min (float): The minimum distance of the fat line.
+        d_max (float): The maximum distance of the fat line.
+
+    Returns:
+        Optional[Tuple[float, float]]: The start and end parameter of the
+        clipped range, or :data:`None` if the curves can't intersect.
+    """
+    (num_nodes,) = distances.shape
+    denominator = float(num_nodes - 1)
+    s_min = DEFAULT_S_MIN
+    s_max = DEFAULT_S_MAX
+    # The extreme parameters of the convex hull within the fat line occur
+    # either at control points within the fat line or where an edge of the
+    # hull crosses one of the two boundaries. As in :func:`clip_range`, we
+    # avoid computing the hull and use all segments connecting two control
+    # points (which includes the hull edges).
+    for index in range(num_nodes):
+        if d_min <= distances[index] <= d_max:
+            s_min = min(s_min, index / denominator)
+            s_max = max(s_max, index / denominator)
+    for start_index in range(num_nodes - 1):
+        start_dist = distances[start_index]
+        for end_index in range(start_index + 1, num_nodes):
+            end_dist = distances[end_index]
+            for boundary in (d_min, d_max):
+                # NOTE: Segments that only touch a boundary are accounted
+                #       for by the control points above.
+                if (start_dist - boundary) * (end_dist - boundary) < 0.0:
+                    lambda_ = (boundary - start_dist) / (end_dist - start_dist)
+                    s = (
+                        start_index + lambda_ * (end_index - start_index)
+                    ) / denominator
+                    s_min = min(s_min, s)
+                    s_max = max(s_max, s)
+    if s_min > s_max:
+        return None
+
+    return s_min, s_max
+
+
+def locate_endpoint(nodes, point, start, end):
+    """Locate the endpoint of another curve within a parameter interval.
+
+    .. note::
+
+       This is a helper for :func:`endpoint_intersection`.
+
+    Since the interval has converged (via clipping), Newton's method is
+    started from its midpoint. Unlike :func:`.full_newton`, this is well
+    conditioned even if the curves are tangent at ``point``.
+
+    Args:
+        nodes (numpy.ndarray): Control points of a curve.
+        point (numpy.ndarray): A ``2 x 1`` array, the endpoint of another
+            curve.
+        start (float): The start of the parameter interval on the curve.
+        end (float): The end of the parameter interval on the curve.
+
+    Returns:
+        Optional[float]: The parameter of ``point`` on the curve, or
+        :data:`None` if ``point`` is not on the curve within the interval.
+    """
+    s = 0.5 * (start + end)
+    for _ in range(_ENDPOINT_NEWTON_STEPS):
+        s = _py_curve_helpers.newton_refine(nodes, point, s)
+    if not start <= s <= end:
+        return None
+
+    evaluated = _py_curve_helpers.evaluate_multi(nodes, np.asfortranarray([s]))
+    if _helpers.vector_close(evaluated[:, 0], point[:, 0]):
+        return s
+
+    return None
+
+
+def endpoint_intersection(nodes_first, nodes_second, candidate):
+    """Find an intersection at an endpoint of either curve.
+
+    .. note::
+
+       This is a helper for :func:`add_clipped_intersection`.
+
+    If the curves meet at a shared endpoint, or the endpoint of one curve
+    lies on the other, the intersection is found directly rather than via
+    Newton's method for both parameters (which may fail there, e.g. if the
+    curves are tangent).
+
+    Args:
+        nodes_first (numpy.ndarray): Control points of the first curve.
+        nodes_second (numpy.ndarray): Control points of the second curve.
+        candidate (Tuple[float, float, float, float]): The (converged)
+            parameter intervals ``(s_start, s_end, t_start, t_end)``.
+
+    Returns:
+        Optional[Tuple[float, float]]: The parameters of the intersection,
+        or :data:`None` if the candidate doesn't contain an endpoint of
+        either curve on the other.
+    """
+    s_start, s_end, t_start, t_end = candidate
+    for s, node1 in ((0.0, nodes_first[:, :1]), (1.0, nodes_first[:, -1:])):
+        if not s_start <= s <= s_end:
+            continue
+
+        for t, node2 in (
+            (0.0, nodes_second[:, :1]),
+            (1.0, nodes_second[:, -1:]),
+        ):
+            if t_start <= t <= t_end and _helpers.vector_close(
+                node1[:, 0], node2[:, 0]
+            ):
+                return s, t
+
+        t = locate_endpoint(nodes_second, node1, t_start, t_end)
+        if t is not None:
+            return s, t
+
+    for t, node2 in ((0.0, nodes_second[:, :1]), (1.0, nodes_second[:, -1:])):
+        if t_start <= t <= t_end:
+            s = locate_endpoint(nodes_first, node2, s_start, s_end)
+            if s is not None:
+                return s, t
+
+    return None
+
+
+def _within_drift(s, t, s_mid, t_mid):
+    """Check if a Newton update stays close to a converged interval.
+
+    .. note::
+
+       This is a helper for :func:`refine_converged`.
+
+    Args:
+        s (float): The refined parameter along the first curve.
+        t (float): The refined parameter along the second curve.
+        s_mid (float): The midpoint of the interval on the first curve.
+        t_mid (float): The midpoint of the interval on the second curve.
+
+    Returns:
+        bool: Indicating if ``(s, t)`` is within the allowed drift.
+    """
+    return max(abs(s - s_mid), abs(t - t_mid)) <= _MAX_NEWTON_DRIFT
+
+
+def refine_converged(nodes_first, nodes_second, s_mid, t_mid):
+    """Refine the midpoint of a converged candidate pair via Newton's method.
+
+    .. note::
+
+       This is a helper for :func:`add_clipped_intersection`.
+
+    Starts with :func:`.full_newton`. For (nearly) tangent curves this is
+    poorly conditioned and may wander away from the intervals found via
+    clipping, in which case Newton's method for a simple root is restarted
+    from the midpoint (keeping its last iterate if it stays close, even
+    though the iteration may not have detected convergence).
+
+    Near a tangent intersection, Newton's method for a simple root only
+    converges linearly, so it may stop well short of full precision. So if
+    the curves are (nearly) tangent at the refined point, it is refined
+    again with the augmented system in :class:`.NewtonDoubleRoot` (as is
+    done for tangent intersections in :func:`.full_newton`). This final
+    refinement is only kept if it converges to a point on both curves near
+    the midpoint.
+
+    Args:
+        nodes_first (numpy.ndarray): Control points of the first curve.
+        nodes_second (numpy.ndarray): Control points of the second curve.
+        s_mid (float): The midpoint of the converged interval on the first
+            curve.
+        t_mid (float): The midpoint of the converged interval on the second
+            curve.
+
+    Returns:
+        Tuple[float, float]: The refined parameters.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    s, t = _py_intersection_helpers.full_newton(
+        s_mid, nodes_first, t_mid, nodes_second
+    )
+    # NOTE: We somewhat replicate code in ``evaluate_hodograph()``
+    #       here. This is so we don't re-compute the nodes for the first
+    #       and second derivatives every time they are evaluated.
+    _, num_nodes1 = nodes_first.shape
+    first_deriv1 = (num_nodes1 - 1) * (
+        nodes_first[:, 1:] - nodes_first[:, :-1]
+    )
+    _, num_nodes2 = nodes_second.shape
+    first_deriv2 = (num_nodes2 - 1) * (
+        nodes_second[:, 1:] - nodes_second[:, :-1]
+    )
+    if not _within_drift(s, t, s_mid, t_mid):
+        evaluate_fn = _py_intersection_helpers.NewtonSimpleRoot(
+            nodes_first, first_deriv1, nodes_second, first_deriv2
+        )
+        _, s, t = _py_intersection_helpers.newton_iterate(
+            evaluate_fn, s_mid, t_mid
+        )
+        if not _within_drift(s, t, s_mid, t_mid):
+            s = s_mid
+            t = t_mid
+
+    tangent1 = _py_curve_helpers.evaluate_multi(
+        first_deriv1, np.asfortranarray([s])
+    )[:, 0]
+    tangent2 = _py_curve_helpers.evaluate_multi(
+        first_deriv2, np.asfortranarray([t])
+    )[:, 0]
+    sin_scaled = _helpers.cross_product(tangent1, tangent2)
+    if abs(sin_scaled) > _TANGENT_THRESHOLD * (
+        np.linalg.norm(tangent1, ord=2) * np.linalg.norm(tangent2, ord=2)
+    ):
+        return s, t
+
+    evaluate_fn = _py_intersection_helpers.NewtonDoubleRoot(
+        nodes_first,
+        first_deriv1,
+        (num_nodes1 - 2) * (first_deriv1[:, 1:] - first_deriv1[:, :-1]),
+        nodes_second,
+        first_deriv2,
+        (num_nodes2 - 2) * (first_deriv2[:, 1:] - first_deriv2[:, :-1]),
+    )
+    converged, double_s, double_t = _py_intersection_helpers.newton_iterate(
+        evaluate_fn, s, t
+    )
+    if not converged or not _within_drift(double_s, double_t, s_mid, t_mid):
+        return s, t
+
+    point1 = _py_curve_helpers.evaluate_multi(
+        nodes_first, np.asfortranarray([double_s])
+    )
+    point2 = _py_curve_helpers.evaluate_multi(
+        nodes_second, np.asfortranarray([double_t])
+    )
+    if _helpers.vector_close(point1[:, 0], point2[:, 0]):
+        return double_s, double_t
+
+    return s, t
+
+
+def add_clipped_intersection(
+    nodes_first, nodes_second, candidate, intersections
+):
+    """Refine a converged candidate pair and add it as an intersection.
+
+    .. note::
+
+       This is a helper for :func:`clip_one_round`.
+
+    Args:
+        nodes_first (numpy.ndarray): Control points of the first curve.
+        nodes_second (numpy.ndarray): Control points of the second curve.
+        candidate (Tuple[float, float, float, float]): The (converged)
+            parameter intervals ``(s_start, s_end, t_start, t_end)``.
+        intersections (list): A list of existing intersections.
+    """
+    endpoint = endpoint_intersection(nodes_first, nodes_second, candidate)
+    if endpoint is None:
+        s_start, s_end, t_start, t_end = candidate
+        s, t = refine_converged(
+            nodes_first,
+            nodes_second,
+            0.5 * (s_start + s_end),
+            0.5 * (t_start + t_end),
+        )
+    else:
+        s, t = endpoint
+
+    s, success_s = _helpers.wiggle_interval(s)
+    t, success_t = _helpers.wiggle_interval(t)
+    if success_s and success_t:
+        _py_geometric_intersection.add_intersection(s, t, intersections)
+
+
+def merge_converged(converged, candidate):
+    """Add a converged candidate, merging it with any that it overlaps.
+
+    .. note::
+
+       This is a helper for :func:`clip_one_round`.
+
+    Near a tangent intersection, clipping stalls and several adjacent
+    candidates (from subdivision) converge together. Merging them means
+    Newton's method is only used once for the entire cluster.
+
+    Args:
+        converged (List[Tuple[float, float, float, float]]): The converged
+            parameter intervals ``(s_start, s_end, t_start, t_end)`` found
+            so far. This will be modified in place.
+        candidate (Tuple[float, float, float, float]): The newly converged
+            parameter intervals.
+    """
+    s_start, s_end, t_start, t_end = candidate
+    for index, existing in enumerate(converged):
+        if (
+            s_start <= existing[1]
+            and existing[0] <= s_end
+            and t_start <= existing[3]
+            and existing[2] <= t_end
+        ):
+            converged[index] = (
+                min(s_start, existing[0]),
+                max(s_end, existing[1]),
+                min(t_start, existing[2]),
+                max(t_end, existing[3]),
+            )
+            return
+
+    converged.append(candidate)
+
+
+def clip_one_round(nodes_first, nodes_second, candidates, intersections):
+    """Perform one step of the clipping intersection process.
+
+    Each candidate pair of parameter intervals is first pruned via the
+    bounding boxes of the two sub-curves. Then the interval on the second
+    curve is clipped against the fat line of the first, and vice versa.
+    If the clipping doesn't (sufficiently) reduce the intervals, the wider
+    one is subdivided. Candidates that converge to a point are merged (see
+    :func:`merge_converged`), then refined and added to ``intersections``.
+
+    Args:
+        nodes_first (numpy.ndarray): Control points of the first curve.
+        nodes_second (numpy.ndarray): Control points of the second curve.
+        candidates (List[Tuple[float, float, float, float]]): The current
+            candidate parameter intervals ``(s_start, s_end, t_start, t_end)``
+            on the two curves.
+        intersections (list): A list of existing intersections.
+
+    Returns:
+        List[Tuple[float, float, float, float]]: The candidate intervals
+        for the next round.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    disjoint = _py_geometric_intersection.BoxIntersectionType.DISJOINT
+    next_candidates = []
+    converged = []
+    for candidate in candidates:
+        s_start, s_end, t_start, t_end = candidate
+        sub_first = _py_curve_helpers.specialize_curve(
+            nodes_first, s_start, s_end
+        )
+        sub_second = _py_curve_helpers.specialize_curve(
+            nodes_second, t_start, t_end
+        )
+        bbox_int = _py_geometric_intersection.bbox_intersect(
+            sub_first, sub_second
+        )
+        if bbox_int == disjoint:
+            continue
+
+        width = max(s_end - s_start, t_end - t_start)
+        if width < _CONVERGED_WIDTH:
+            merge_converged(converged, candidate)
+            continue
+
+        # Clip the second curve against the fat line of the first.
+        clipped = clip_interval(sub_first, sub_second)
+        if clipped is None:
+            continue
+
+        delta = t_end - t_start
+        t_start, t_end = (
+            t_start + clipped[0] * delta,
+            t_start + clipped[1] * delta,
+        )
+        sub_second = _py_curve_helpers.specialize_curve(
+            nodes_second, t_start, t_end
+        )
+        # Clip the first curve against the fat line of the (clipped) second.
+        clipped = clip_interval(sub_second, sub_first)
+        if clipped is None:
+            continue
+
+        delta = s_end - s_start
+        s_start, s_end = (
+            s_start + clipped[0] * delta,
+            s_start + clipped[1] * delta,
+        )
+        if max(s_end - s_start, t_end - t_start) <= _MIN_REDUCTION * width:
+            next_candidates.append((s_start, s_end, t_start, t_end))
+        elif s_end - s_start >= t_end - t_start:
+            s_mid = 0.5 * (s_start + s_end)
+            next_candidates.append((s_start, s_mid, t_start, t_end))
+            next_candidates.append((s_mid, s_end, t_start, t_end))
+        else:
+            t_mid = 0.5 * (t_start + t_end)
+            next_candidates.append((s_start, s_end, t_start, t_mid))
+            next_candidates.append((s_start, s_end, t_mid, t_end))
+
+    for candidate in converged:
+        add_clipped_intersection(
+            nodes_first, nodes_second, candidate, intersections
+        )
+
+    return next_candidates
+
+
+def all_intersections(nodes_first, nodes_second, workspace=None):
+    r"""Find the points of intersection among a pair of curves.
+
+    Uses B |eacute| zier clipping, i.e. repeatedly clips the parameter
+    intervals on each curve to the region that can intersect the "fat
+    line" around the other curve. Transversal intersections are typically
+    found after a handful of (quadratically convergent) clipping steps,
+    with far fewer candidate pairs than in
+    :func:`._py_geometric_intersection.all_intersections`. When clipping
+    stalls (e.g. near tangent intersections or when a pair of intervals
+    contains multiple intersections) the wider interval is subdivided.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    Args:
+        nodes_first (numpy.ndarray): Control points of a curve to be
+            intersected with ``nodes_second``.
+        nodes_second (numpy.ndarray): Control points of a curve to be
+            intersected with ``nodes_first``.
+        workspace (Optional[IntersectionWorkspace]): Unused. Accepted to
+            match the interface of the Fortran implementation.
+
+    Returns:
+        Tuple[numpy.ndarray, bool]: An array and a flag:
+
+        * A ``2 x N`` array of intersection parameters.
+          Each row contains a pair of values :math:`s` and :math:`t`
+          (each in :math:`\left[0, 1\right]`) such that the curves
+          intersect: :math:`B_1(s) = B_2(t)`.
+        * Flag indicating if the curves are coincident.
+
+    Raises:
+        ValueError: If the clipping iteration does not terminate
+            before exhausting the maximum number of iterations.
+        NotImplementedError: If the process picks up too many candidate
+            pairs (and the curves are not coincident).
+    """
+    # pylint: disable=unused-argument
+    candidates = [(0.0, 1.0, 0.0, 1.0)]
+    intersections = []
+    coincident = False
+    for _ in range(_MAX_CLIP_ITERATIONS):
+        candidates = clip_one_round(
+            nodes_first, nodes_second, candidates, intersections
+        )
+        if len(candidates) > _MAX_CANDIDATES:
+            params = _py_geometric_intersection.coincident_parameters(
+                nodes_first, nodes_second
+            )
+            if params is None:
+                raise NotImplementedError(
+                    _TOO_MANY_TEMPLATE.format(len(candidates))
+                )
+
+            intersections = params
+            coincident = True
+            candidates = []
+        if not candidates:
+            if intersections:
+                # NOTE: The transpose of a C-ordered array is Fortran-ordered,
+                #       i.e. this is on purpose.
+                return np.array(intersections, order="C").T, coincident
+
+            return np.empty((2, 0), order="F"), coincident
+
+    msg = _NO_CONVERGE_TEMPLATE.format(_MAX_CLIP_ITERATIONS)
+    raise ValueError(msg)
@@ -16,7 +16,7 @@
 from libcpp cimport bool as bool_t
 
 
-cdef extern from "bezier/curve.h":
+cdef extern from "bezier/curve.h" nogil:
     void evaluate_curve_barycentric "BEZ_evaluate_curve_barycentric" (
         const int* num_nodes, const int* dimension,
         const double* nodes, const int* num_vals, const double* lambda1,
@@ -25,6 +25,10 @@ cdef extern from "bezier/curve.h":
         const int* num_nodes, const int* dimension,
         const double* nodes, const int* num_vals, const double* s_vals,
         double* evaluated)
+    void evaluate_curves_multi "BEZ_evaluate_curves_multi" (
+        const int* num_curves, const int* num_nodes, const int* dimension,
+        const double* nodes, const int* num_vals, const double* s_vals,
+        double* evaluated)
     void specialize_curve "BEZ_specialize_curve" (
         const int* num_nodes, const int* dimension,
         const double* nodes, const double* start, const double* end,
@@ -42,6 +46,10 @@ cdef extern from "bezier/curve.h":
     void locate_point_curve "BEZ_locate_point_curve" (
         const int* num_nodes, const int* dimension,
         const double* nodes, const double* point, double* s_approx)
+    void locate_point_curve_multi "BEZ_locate_point_curve_multi" (
+        const int* num_nodes, const int* dimension,
+        const double* nodes, const int* num_points, const double* points,
+        double* s_approx)
     void elevate_nodes_curve "BEZ_elevate_nodes_curve" (
         const int* num_nodes, const int* dimension,
         const double* nodes, double* elevated)
@@ -58,3 +66,7 @@ cdef extern from "bezier/curve.h":
     void compute_length "BEZ_compute_length" (
         const int* num_nodes, const int* dimension,
         const double* nodes, double* length, int* error_val)
+    void compute_length_multi "BEZ_compute_length_multi" (
+        const int* num_curves, const int* num_nodes, const int* dimension,
+        const double* nodes, const double* rtol, double* lengths,
+        int* error_val)
@@ -17,6 +17,8 @@ exact same interface which calls out to a Fortran implementation. The speedup
 will be used if the extension can be built.
 """
 
+import numpy as np
+
 from bezier import _py_curve_helpers
 
 try:
@@ -25,31 +27,58 @@ except ImportError:  # pragma: NO COVER
     _speedup = None
 
 
+def _bernstein_basis(degree, s_vals):
+    """Computes the Bernstein basis functions at a set of parameters.
+
+    The basis functions are the coordinates of the "identity" curve (i.e.
+    the curve with the identity matrix as nodes), so they are computed by
+    the speedup for :func:`evaluate_multi`.
+
+    Args:
+        degree (int): The degree :math:`n` of the basis.
+        s_vals (numpy.ndarray): Parameters along the curve (as a
+            1D array).
+
+    Returns:
+        numpy.ndarray: The ``(n + 1) x K`` basis matrix (where ``K`` is the
+        number of ``s`` values).
+    """
+    return _speedup.evaluate_multi(np.eye(degree + 1, order="F"), s_vals)
+
+
 # pylint: disable=invalid-name
 if _speedup is None:  # pragma: NO COVER
     subdivide_nodes = _py_curve_helpers.subdivide_nodes
     evaluate_multi = _py_curve_helpers.evaluate_multi
+    evaluate_curves_multi = _py_curve_helpers.evaluate_curves_multi
+    bernstein_basis = _py_curve_helpers.bernstein_basis
     evaluate_multi_barycentric = _py_curve_helpers.evaluate_multi_barycentric
     compute_length = _py_curve_helpers.compute_length
+    compute_length_multi = _py_curve_helpers.compute_length_multi
     elevate_nodes = _py_curve_helpers.elevate_nodes
     specialize_curve = _py_curve_helpers.specialize_curve
     evaluate_hodograph = _py_curve_helpers.evaluate_hodograph
     get_curvature = _py_curve_helpers.get_curvature
     newton_refine = _py_curve_helpers.newton_refine
     locate_point = _py_curve_helpers.locate_point
+    locate_point_multi = _py_curve_helpers.locate_point_multi
     reduce_pseudo_inverse = _py_curve_helpers.reduce_pseudo_inverse
     full_reduce = _py_curve_helpers.full_reduce
 else:
     subdivide_nodes = _speedup.subdivide_nodes_curve
     evaluate_multi = _speedup.evaluate_multi
+    evaluate_curves_multi = _speedup.evaluate_curves_multi
+    bernstein_basis = _bernstein_basis
     evaluate_multi_barycentric = _speedup.evaluate_multi_barycentric
     compute_length = _speedup.compute_length
+    compute_length_multi = _speedup.compute_length_multi
     elevate_nodes = _speedup.elevate_nodes
     specialize_curve = _speedup.specialize_curve
     evaluate_hodograph = _speedup.evaluate_hodograph
     get_curvature = _speedup.get_curvature
     newton_refine = _speedup.newton_refine_curve
     locate_point = _speedup.locate_point_curve
+    locate_point_multi = _speedup.locate_point_curve_multi
     reduce_pseudo_inverse = _speedup.reduce_pseudo_inverse
     full_reduce = _speedup.full_reduce
 # pylint: enable=invalid-name
@@ -27,10 +27,12 @@ cdef extern from "bezier/curve_intersection.h":
     void newton_refine_curve_intersect "BEZ_newton_refine_curve_intersect" (
         const double* s, const int* num_nodes1,
         const double* nodes1, const double* t, const int* num_nodes2,
-        const double* nodes2, double* new_s, double* new_t, Status* status)
+        const double* nodes2, double* new_s, double* new_t,
+        Status* status) nogil
     void bbox_intersect "BEZ_bbox_intersect" (
         const int* num_nodes1, const double* nodes1,
-        const int* num_nodes2, const double* nodes2, BoxIntersectionType* enum_)
+        const int* num_nodes2, const double* nodes2,
+        BoxIntersectionType* enum_) nogil
     void curve_intersections "BEZ_curve_intersections" (
         const int* num_nodes_first,
         const double* nodes_first, const int* num_nodes_second,
@@ -38,3 +40,28 @@ cdef extern from "bezier/curve_intersection.h":
         double* intersections, const int* num_intersections, bool_t* coincident,
         Status* status)
     void free_curve_intersections_workspace "BEZ_free_curve_intersections_workspace" ()
+    void new_intersection_workspace "BEZ_new_intersection_workspace" (
+        void** workspace)
+    void free_intersection_workspace "BEZ_free_intersection_workspace" (
+        void* const* workspace)
+    void curve_intersections_workspace "BEZ_curve_intersections_workspace" (
+        void* const* workspace, const int* num_nodes_first,
+        const double* nodes_first, const int* num_nodes_second,
+        const double* nodes_second, const int* intersections_size,
+        double* intersections, const int* num_intersections,
+        bool_t* coincident, Status* status) nogil
+    void curve_intersections_clipping "BEZ_curve_intersections_clipping" (
+        const int* num_nodes_first,
+        const double* nodes_first, const int* num_nodes_second,
+        const double* nodes_second, const int* intersections_size,
+        double* intersections, const int* num_intersections,
+        bool_t* coincident, Status* status) nogil
+    void flatten_curve "BEZ_flatten_curve" (
+        const int* num_nodes, const int* dimension, const double* nodes,
+        const double* tolerance, const int* vertices_size, double* s_vals,
+        double* vertices, int* num_vertices, Status* status) nogil
+    void flatten_curves "BEZ_flatten_curves" (
+        const int* num_curves, const int* num_nodes, const int* dimension,
+        const double* nodes, const double* tolerance,
+        const int* vertices_size, double* s_vals, double* vertices,
+        int* offsets, int* num_vertices, Status* status) nogil
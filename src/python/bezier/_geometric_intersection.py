@@ -19,6 +19,7 @@ will be used if the extension can be built.
 
 import atexit
 
+from bezier import _clipping
 from bezier import _py_geometric_intersection
 
 try:
@@ -31,8 +32,20 @@ except ImportError:  # pragma: NO COVER
 if _speedup is None:  # pragma: NO COVER
     bbox_intersect = _py_geometric_intersection.bbox_intersect
     all_intersections = _py_geometric_intersection.all_intersections
+    all_intersections_pairs = (
+        _py_geometric_intersection.all_intersections_pairs
+    )
+    all_intersections_clipping = _clipping.all_intersections
+    IntersectionWorkspace = _py_geometric_intersection.IntersectionWorkspace
+    flatten_curve = _py_geometric_intersection.flatten_curve
+    flatten_curves = _py_geometric_intersection.flatten_curves
 else:
     bbox_intersect = _speedup.bbox_intersect
     all_intersections = _speedup.curve_intersections
+    all_intersections_pairs = _speedup.curve_intersections_pairs
+    all_intersections_clipping = _speedup.curve_intersections_clipping
+    IntersectionWorkspace = _speedup.IntersectionWorkspace
+    flatten_curve = _speedup.flatten_curve
+    flatten_curves = _speedup.flatten_curves
     atexit.register(_speedup.free_curve_intersections_workspace)
 # pylint: enable=invalid-name
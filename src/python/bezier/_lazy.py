@@ -0,0 +1,114 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Deferred loading of modules that are not needed on import.
+
+The pure Python fallbacks (e.g. ``_py_triangle_helpers``) are large and
+build many constant tables when executed, but are rarely used when the
+``_speedup`` extension is available. Registering them via
+:func:`lazy_import` lets every ``from bezier import ...`` statement bind
+the module as usual while deferring its execution until the first
+attribute access.
+"""
+
+import importlib.util
+import sys
+import threading
+import types
+
+
+_LOCK = threading.RLock()
+_LOADING = set()
+
+
+class _LazyModule(types.ModuleType):  # pylint: disable=too-few-public-methods
+    """A module that is executed on first attribute access."""
+
+    def __getattr__(self, name):
+        """Execute the module (if needed) and get an attribute.
+
+        This is only called if ``name`` is not already in the module
+        namespace. The module keeps its lazy type until execution has
+        finished, so other threads wait on the lock rather than observing
+        a partially executed module.
+
+        Args:
+            name (str): The attribute name.
+
+        Returns:
+            Any: The attribute.
+        """
+        with _LOCK:
+            module_name = self.__name__
+            # NOTE: A module that is already being executed (by this thread,
+            #       e.g. via a circular import) is **not** executed again.
+            if isinstance(self, _LazyModule) and module_name not in _LOADING:
+                _LOADING.add(module_name)
+                try:
+                    self.__spec__.loader.exec_module(self)
+                    self.__class__ = types.ModuleType
+                finally:
+                    _LOADING.discard(module_name)
+
+        # NOTE: This bypasses ``__getattr__``, so a missing attribute raises
+        #       an ``AttributeError`` rather than recursing.
+        return types.ModuleType.__getattribute__(self, name)
+
+
+def lazy_import(name):
+    """Register a module to be executed on first attribute access.
+
+    If the module has already been imported, it is returned unchanged.
+
+    Args:
+        name (str): The fully-qualified name of a ``bezier`` submodule.
+
+    Returns:
+        types.ModuleType: The (possibly not yet executed) module.
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    module = importlib.util.module_from_spec(spec)
+    module.__class__ = _LazyModule
+    sys.modules[name] = module
+    parent_name, _, child_name = name.rpartition(".")
+    setattr(sys.modules[parent_name], child_name, module)
+    return module
+
+
+def is_loaded(module):
+    """Check if a module registered via :func:`lazy_import` was executed.
+
+    Args:
+        module (types.ModuleType): The module.
+
+    Returns:
+        bool: Indicates if the module has been executed.
+    """
+    return not isinstance(module, _LazyModule)
+
+
+# NOTE: The pure Python fallbacks (and the constant tables they build) are
+#       only executed on first use, which keeps ``import bezier`` fast.
+for _name in (
+    "bezier._algebraic_intersection",
+    "bezier._clipping",
+    "bezier._py_curve_helpers",
+    "bezier._py_geometric_intersection",
+    "bezier._py_triangle_helpers",
+    "bezier._py_triangle_intersection",
+    "bezier._py_triangle_matrices",
+):
+    lazy_import(_name)
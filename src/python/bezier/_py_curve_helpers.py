@@ -27,6 +27,11 @@ _MAX_LOCATE_SUBDIVISIONS = 20
 _LOCATE_STD_CAP = 0.5 ** 20
 _FLOAT64 = np.float64  # pylint: disable=no-member
 _REDUCE_THRESHOLD = 0.5 ** 26  # sqrt(machine precision)
+_ARC_LENGTH_ORDER = 8
+_ARC_LENGTH_REL_TOL = 0.5 ** 45
+_MAX_ARC_LENGTH_SUBDIVISIONS = 20
+_MAX_ARC_LENGTH_NEWTON = 50
+_ARC_LENGTH_S_TOL = 0.5 ** 50
 # Projections onto the space of degree-elevated nodes.
 # If v --> vE is the (right) elevation map, then P = E^T (E E^T)^{-1} E
 # is the (right) projection.
@@ -180,6 +185,87 @@ def subdivide_nodes(nodes):
     return left_nodes, right_nodes
 
 
+def subdivide_nodes_multi(nodes):
+    """Subdivide each curve in a batch into two sub-curves.
+
+    All curves in the batch must have the same degree and dimension, so
+    that the nodes can be stacked into a single ``C x D x N`` array (the
+    first index is the curve). The subdivision matrices used in
+    :func:`subdivide_nodes` are then applied to every curve at once.
+
+    Args:
+        nodes (numpy.ndarray): The stacked nodes of the curves, as a
+            ``C x D x N`` array.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The stacked nodes for the
+        left and right sub-curves (each a ``C x D x N`` array).
+    """
+    _, _, num_nodes = nodes.shape
+    if num_nodes == 2:
+        left_mat = _LINEAR_SUBDIVIDE_LEFT
+        right_mat = _LINEAR_SUBDIVIDE_RIGHT
+    elif num_nodes == 3:
+        left_mat = _QUADRATIC_SUBDIVIDE_LEFT
+        right_mat = _QUADRATIC_SUBDIVIDE_RIGHT
+    elif num_nodes == 4:
+        left_mat = _CUBIC_SUBDIVIDE_LEFT
+        right_mat = _CUBIC_SUBDIVIDE_RIGHT
+    else:
+        left_mat, right_mat = make_subdivision_matrices(num_nodes - 1)
+    return np.matmul(nodes, left_mat), np.matmul(nodes, right_mat)
+
+
+@functools.lru_cache(maxsize=None)
+def level_subdivision_matrices(degree, levels):
+    """Make the matrices used to subdivide a curve several times.
+
+    Subdividing ``levels`` times splits the unit interval into
+    :math:`P = 2^k` sub-intervals of equal length (where :math:`k` is
+    ``levels``). The nodes of each sub-curve are a linear function of the
+    nodes of the curve, so the matrices are found by repeatedly subdividing
+    the "identity" curve. They are cached for each degree and number of
+    levels.
+
+    Args:
+        degree (int): The degree of the curve.
+        levels (int): The number of times to subdivide.
+
+    Returns:
+        numpy.ndarray: The (read-only) ``P x N x N`` stack of matrices, one
+        for each sub-interval (ordered from left to right).
+    """
+    num_nodes = degree + 1
+    matrices = np.eye(num_nodes, order="F")[np.newaxis, :, :]
+    for _ in range(levels):
+        left, right = subdivide_nodes_multi(matrices)
+        matrices = np.stack([left, right], axis=1).reshape(
+            (-1, num_nodes, num_nodes)
+        )
+    matrices.flags.writeable = False
+    return matrices
+
+
+def subdivide_nodes_levels(nodes, levels):
+    """Subdivide a curve into :math:`P = 2^k` sub-curves in a single pass.
+
+    This is equivalent to calling :func:`subdivide_nodes` ``levels``
+    times on every piece, but applies the cached matrices from
+    :func:`level_subdivision_matrices` in a single (stacked) matrix product.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
+        levels (int): The number of times to subdivide.
+
+    Returns:
+        numpy.ndarray: The stacked nodes of the sub-curves, as a
+        ``P x D x N`` array (ordered from left to right).
+    """
+    _, num_nodes = np.shape(nodes)
+    matrices = level_subdivision_matrices(num_nodes - 1, levels)
+    return np.matmul(nodes, matrices)
+
+
 def evaluate_multi(nodes, s_vals):
     r"""Computes multiple points along a curve.
 
@@ -259,6 +345,83 @@ def evaluate_multi_barycentric(nodes, lambda1, lambda2):
     return result
 
 
+def evaluate_curves_multi(nodes, s_vals):
+    r"""Computes multiple points along each curve in a batch.
+
+    All curves in the batch must have the same degree and dimension, so
+    that the nodes can be stacked into a single ``C x D x N`` array (the
+    first index is the curve). Each step of the modified Horner's method
+    used in :func:`evaluate_multi_barycentric` is then applied to every
+    curve at once.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    Args:
+        nodes (numpy.ndarray): The stacked nodes of the curves, as a
+            ``C x D x N`` array.
+        s_vals (numpy.ndarray): Parameters along the curves (as a
+            1D array).
+
+    Returns:
+        numpy.ndarray: The evaluated points as a ``C x D x K`` array, where
+        ``K`` is the number of ``s`` values. The slice ``[j, :, :]`` contains
+        the points on curve ``j``.
+    """
+    (num_vals,) = s_vals.shape
+    num_curves, dimension, num_nodes = nodes.shape
+    degree = num_nodes - 1
+    lambda1 = 1.0 - s_vals
+    result = np.zeros((num_curves, dimension, num_vals), order="F")
+    result += lambda1 * nodes[:, :, [0]]
+    binom_val = 1.0
+    s_pow = np.ones(num_vals)
+    for index in range(1, degree):
+        s_pow *= s_vals
+        binom_val = (binom_val * (degree - index + 1)) / index
+        result += binom_val * s_pow * nodes[:, :, [index]]
+        result *= lambda1
+    result += s_vals * s_pow * nodes[:, :, [degree]]
+    return result
+
+
+def bernstein_basis(degree, s_vals):
+    r"""Computes the Bernstein basis functions at a set of parameters.
+
+    Evaluates
+
+    .. math::
+
+       b_{j, n}(s) = \binom{n}{j} (1 - s)^{n - j} s^j
+
+    for each :math:`0 \leq j \leq n` and each value in ``s_vals``. Once
+    computed, evaluating **any** curve of degree :math:`n` at ``s_vals``
+    is a single matrix product ``nodes @ basis``.
+
+    Args:
+        degree (int): The degree :math:`n` of the basis.
+        s_vals (numpy.ndarray): Parameters along the curve (as a
+            1D array).
+
+    Returns:
+        numpy.ndarray: The ``(n + 1) x K`` basis matrix (where ``K`` is the
+        number of ``s`` values), with row ``j`` containing the values
+        of :math:`b_{j, n}` at each ``s``.
+    """
+    (num_vals,) = s_vals.shape
+    lambda1 = 1.0 - s_vals
+    basis = np.empty((degree + 1, num_vals), order="F")
+    binom_val = 1.0
+    for index in range(degree + 1):
+        basis[index, :] = (
+            binom_val * lambda1 ** (degree - index) * s_vals ** index
+        )
+        binom_val = (binom_val * (degree - index)) / (index + 1)
+    return basis
+
+
 def vec_size(nodes, s_val):
     r"""Compute :math:`\|B(s)\|_2`.
 
@@ -337,6 +500,387 @@ def compute_length(nodes):
     return length
 
 
+def hodograph_nodes(nodes):
+    r"""Compute the nodes of the hodograph :math:`B'(s)` of a curve.
+
+    .. note::
+
+        This is a helper for the arc length functions and does not have
+        a Fortran speedup.
+
+    If ``degree`` is :math:`n`, then the hodograph is the degree
+    :math:`n - 1` curve with nodes :math:`n \left(v_{j + 1} - v_j\right)`.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a curve.
+
+    Returns:
+        numpy.ndarray: The nodes of the hodograph. (For a curve with a single
+        node, this has no columns.)
+    """
+    _, num_nodes = np.shape(nodes)
+    return (num_nodes - 1) * (nodes[:, 1:] - nodes[:, :-1])
+
+
+@functools.lru_cache(maxsize=None)
+def _gauss_legendre(order):
+    """Get the Gauss-Legendre nodes and weights on :math:`[-1, 1]`.
+
+    Args:
+        order (int): The number of nodes in the quadrature rule.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: The (read-only) nodes and
+        weights.
+    """
+    gl_nodes, gl_weights = np.polynomial.legendre.leggauss(order)
+    gl_nodes.flags.writeable = False
+    gl_weights.flags.writeable = False
+    return gl_nodes, gl_weights
+
+
+def gauss_legendre_lengths(first_deriv, starts, ends):
+    r"""Approximate the length of a curve over many intervals.
+
+    .. note::
+
+        This is a helper for the arc length functions and does not have
+        a Fortran speedup.
+
+    Uses a fixed-order Gauss-Legendre rule to approximate
+
+    .. math::
+
+       \int_a^b \left\lVert B'(s) \right\rVert_2 \, ds
+
+    for each interval :math:`\left[a, b\right]`, with a single evaluation
+    of the hodograph at all of the quadrature points.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph of the curve
+            (see :func:`hodograph_nodes`).
+        starts (numpy.ndarray): The start :math:`a` of each interval (as a
+            1D array).
+        ends (numpy.ndarray): The end :math:`b` of each interval (as a
+            1D array).
+
+    Returns:
+        numpy.ndarray: The approximate length over each interval (as a 1D
+        array).
+    """
+    half_widths = 0.5 * (ends - starts)
+    _, num_deriv_nodes = first_deriv.shape
+    if num_deriv_nodes == 0:
+        return np.zeros_like(half_widths)
+
+    gl_nodes, gl_weights = _gauss_legendre(_ARC_LENGTH_ORDER)
+    midpoints = 0.5 * (starts + ends)
+    s_vals = midpoints[:, np.newaxis] + half_widths[:, np.newaxis] * gl_nodes
+    derivs = evaluate_multi(first_deriv, s_vals.ravel())
+    speeds = np.linalg.norm(derivs, ord=2, axis=0).reshape(s_vals.shape)
+    return half_widths * np.sum(speeds * gl_weights, axis=1)
+
+
+def arc_length_breakpoints(first_deriv):
+    r"""Adaptively build a table of cumulative arc length for a curve.
+
+    .. note::
+
+        This is a helper for the arc length functions and does not have
+        a Fortran speedup.
+
+    Starts with the interval :math:`\left[0, 1\right]` and bisects each
+    interval until the Gauss-Legendre approximation of its length agrees
+    with the sum of the approximations on its two halves. The intervals
+    that agree are all checked (and bisected) together.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph of the curve
+            (see :func:`hodograph_nodes`).
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The sorted breakpoints :math:`0 = s_0 < \cdots < s_m = 1`.
+        * The cumulative arc length at each breakpoint.
+    """
+    accepted = [np.zeros(0)]
+    starts = np.zeros(1)
+    ends = np.ones(1)
+    for _ in range(_MAX_ARC_LENGTH_SUBDIVISIONS):
+        midpoints = 0.5 * (starts + ends)
+        whole = gauss_legendre_lengths(first_deriv, starts, ends)
+        halves = gauss_legendre_lengths(
+            first_deriv,
+            np.concatenate([starts, midpoints]),
+            np.concatenate([midpoints, ends]),
+        )
+        num_intervals = starts.size
+        refined = halves[:num_intervals] + halves[num_intervals:]
+        done = np.abs(whole - refined) <= _ARC_LENGTH_REL_TOL * refined
+        # NOTE: Since both halves have been computed, they are kept as the
+        #       (more accurate) intervals in the table.
+        accepted.extend([starts[done], midpoints[done]])
+        starts, ends = (
+            np.concatenate([starts[~done], midpoints[~done]]),
+            np.concatenate([midpoints[~done], ends[~done]]),
+        )
+        if starts.size == 0:
+            break
+
+    # Any intervals left after the maximum number of subdivisions (e.g. near
+    # a cusp, where the speed is not smooth) are used as-is.
+    accepted.append(starts)
+    breakpoints = np.append(np.sort(np.concatenate(accepted)), 1.0)
+    lengths = gauss_legendre_lengths(
+        first_deriv, breakpoints[:-1], breakpoints[1:]
+    )
+    cumulative = np.concatenate([[0.0], np.cumsum(lengths)])
+    return breakpoints, cumulative
+
+
+def gauss_legendre_lengths_multi(first_derivs, curve_index, starts, ends):
+    r"""Approximate the lengths of many curves over many intervals.
+
+    .. note::
+
+        This is a helper for :func:`compute_length_multi` and does not have
+        a Fortran speedup.
+
+    This is the batched version of :func:`gauss_legendre_lengths`: each
+    interval :math:`\left[a, b\right]` belongs to one of the curves, and the
+    hodographs are evaluated at all of the quadrature points (for all of the
+    intervals) at once.
+
+    Args:
+        first_derivs (numpy.ndarray): The stacked nodes of the hodographs of
+            the curves, as a ``C x D x M`` array.
+        curve_index (numpy.ndarray): The curve (i.e. the index into the first
+            axis of ``first_derivs``) of each interval (as a 1D array).
+        starts (numpy.ndarray): The start :math:`a` of each interval (as a
+            1D array).
+        ends (numpy.ndarray): The end :math:`b` of each interval (as a
+            1D array).
+
+    Returns:
+        numpy.ndarray: The approximate length over each interval (as a 1D
+        array).
+    """
+    _, _, num_deriv_nodes = first_derivs.shape
+    gl_nodes, gl_weights = _gauss_legendre(_ARC_LENGTH_ORDER)
+    half_widths = 0.5 * (ends - starts)
+    midpoints = 0.5 * (starts + ends)
+    s_vals = midpoints[:, np.newaxis] + half_widths[:, np.newaxis] * gl_nodes
+    basis = bernstein_basis(num_deriv_nodes - 1, s_vals.ravel())
+    basis = basis.reshape((num_deriv_nodes,) + s_vals.shape)
+    derivs = np.einsum("kdm,mkq->kdq", first_derivs[curve_index], basis)
+    speeds = np.linalg.norm(derivs, ord=2, axis=1)
+    return half_widths * np.sum(speeds * gl_weights, axis=1)
+
+
+def compute_length_multi(nodes, rtol):
+    r"""Approximately compute the lengths of a batch of curves.
+
+    All curves in the batch must have the same degree and dimension, so
+    that the nodes can be stacked into a single ``C x D x N`` array (the
+    first index is the curve).
+
+    Rather than using QUADPACK once per curve (as in
+    :func:`compute_length`), a fixed-order Gauss-Legendre rule is applied
+    on the interval :math:`\left[0, 1\right]` for every curve at once. Each
+    interval is then compared to the sum of the rules on its two halves;
+    only the intervals where these disagree (relative to ``rtol``) are
+    bisected again, so curves that converge quickly drop out of the batch.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built. It uses QUADPACK (with ``rtol``
+       as the relative tolerance) for each curve.
+
+    Args:
+        nodes (numpy.ndarray): The stacked nodes of the curves, as a
+            ``C x D x N`` array.
+        rtol (float): The relative tolerance used to accept the length of
+            each interval.
+
+    Returns:
+        numpy.ndarray: The length of each curve (as a 1D array).
+
+    Raises:
+        ValueError: If ``nodes`` has zero columns.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    num_curves, _, num_nodes = nodes.shape
+    if num_nodes == 0:
+        raise ValueError("Curve should have at least one node.")
+
+    first_derivs = (num_nodes - 1) * (nodes[:, :, 1:] - nodes[:, :, :-1])
+    if num_nodes == 1:
+        return np.zeros(num_curves)
+
+    if num_nodes == 2:
+        return np.linalg.norm(first_derivs[:, :, 0], ord=2, axis=1)
+
+    lengths = np.zeros(num_curves)
+    curve_index = np.arange(num_curves)
+    starts = np.zeros(num_curves)
+    ends = np.ones(num_curves)
+    whole = gauss_legendre_lengths_multi(
+        first_derivs, curve_index, starts, ends
+    )
+    for _ in range(_MAX_ARC_LENGTH_SUBDIVISIONS):
+        num_intervals = starts.size
+        midpoints = 0.5 * (starts + ends)
+        halves = gauss_legendre_lengths_multi(
+            first_derivs,
+            np.concatenate([curve_index, curve_index]),
+            np.concatenate([starts, midpoints]),
+            np.concatenate([midpoints, ends]),
+        )
+        refined = halves[:num_intervals] + halves[num_intervals:]
+        done = np.abs(whole - refined) <= rtol * refined
+        lengths += np.bincount(
+            curve_index[done], weights=refined[done], minlength=num_curves
+        )
+        # NOTE: The halves of the intervals that have not converged become
+        #       the intervals (with known lengths) for the next round.
+        keep = ~done
+        curve_index = np.concatenate([curve_index[keep], curve_index[keep]])
+        starts, ends = (
+            np.concatenate([starts[keep], midpoints[keep]]),
+            np.concatenate([midpoints[keep], ends[keep]]),
+        )
+        whole = np.concatenate(
+            [halves[:num_intervals][keep], halves[num_intervals:][keep]]
+        )
+        if starts.size == 0:
+            break
+
+    # Any intervals left after the maximum number of subdivisions (e.g. near
+    # a cusp, where the speed is not smooth) are used as-is.
+    lengths += np.bincount(curve_index, weights=whole, minlength=num_curves)
+    return lengths
+
+
+def arc_length_at(first_deriv, breakpoints, cumulative, s_vals):
+    """Compute the arc length from :math:`s = 0` at many parameters.
+
+    .. note::
+
+        This is a helper for the arc length functions and does not have
+        a Fortran speedup.
+
+    Looks up the interval in the table containing each parameter and adds
+    the length within that interval to the cumulative length at its start.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph of the curve
+            (see :func:`hodograph_nodes`).
+        breakpoints (numpy.ndarray): The breakpoints from
+            :func:`arc_length_breakpoints`.
+        cumulative (numpy.ndarray): The cumulative arc length at each of
+            the ``breakpoints``.
+        s_vals (numpy.ndarray): Parameters along the curve (as a 1D array).
+
+    Returns:
+        numpy.ndarray: The arc length at each parameter (as a 1D array).
+    """
+    last_interval = breakpoints.size - 2
+    index = np.clip(
+        np.searchsorted(breakpoints, s_vals, side="right") - 1,
+        0,
+        last_interval,
+    )
+    return cumulative[index] + gauss_legendre_lengths(
+        first_deriv, breakpoints[index], s_vals
+    )
+
+
+def arc_length_inverse(first_deriv, breakpoints, cumulative, lengths):
+    """Find the parameters along a curve at many arc lengths.
+
+    .. note::
+
+        This is a helper for the arc length functions and does not have
+        a Fortran speedup.
+
+    Looks up the interval in the table containing each length and then
+    uses a safeguarded Newton's method (for all of the lengths at once)
+    within that interval. If a Newton step leaves the current bracket
+    (e.g. if the speed is zero), the bracket is bisected instead.
+
+    Args:
+        first_deriv (numpy.ndarray): The nodes of the hodograph of the curve
+            (see :func:`hodograph_nodes`).
+        breakpoints (numpy.ndarray): The breakpoints from
+            :func:`arc_length_breakpoints`.
+        cumulative (numpy.ndarray): The cumulative arc length at each of
+            the ``breakpoints``.
+        lengths (numpy.ndarray): Arc lengths along the curve (as a 1D
+            array). Assumed to be between ``0`` and the length of the curve.
+
+    Returns:
+        numpy.ndarray: The parameter :math:`s` at each arc length (as a 1D
+        array).
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    last_interval = breakpoints.size - 2
+    index = np.clip(
+        np.searchsorted(cumulative, lengths, side="left") - 1,
+        0,
+        last_interval,
+    )
+    lower = breakpoints[index]
+    upper = breakpoints[index + 1]
+    targets = lengths - cumulative[index]
+    segment_lengths = cumulative[index + 1] - cumulative[index]
+    # Start from linear interpolation within each interval.
+    fractions = np.divide(
+        targets,
+        segment_lengths,
+        out=np.zeros_like(targets),
+        where=segment_lengths > 0.0,
+    )
+    s_vals = lower + (upper - lower) * np.clip(fractions, 0.0, 1.0)
+    s_vals[targets >= segment_lengths] = upper[targets >= segment_lengths]
+    s_vals[targets <= 0.0] = lower[targets <= 0.0]
+    bracket_lower = lower.copy()
+    bracket_upper = upper.copy()
+    (active,) = np.nonzero((0.0 < targets) & (targets < segment_lengths))
+    for _ in range(_MAX_ARC_LENGTH_NEWTON):
+        if active.size == 0:
+            break
+
+        current = s_vals[active]
+        residuals = (
+            gauss_legendre_lengths(first_deriv, lower[active], current)
+            - targets[active]
+        )
+        speeds = np.linalg.norm(
+            evaluate_multi(first_deriv, current), ord=2, axis=0
+        )
+        too_far = residuals > 0.0
+        bracket_upper[active[too_far]] = current[too_far]
+        bracket_lower[active[~too_far]] = current[~too_far]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            updated = current - residuals / speeds
+        low = bracket_lower[active]
+        high = bracket_upper[active]
+        outside = ~((low < updated) & (updated < high))
+        updated[outside] = 0.5 * (low[outside] + high[outside])
+        updated[residuals == 0.0] = current[residuals == 0.0]
+        s_vals[active] = updated
+        converged = np.abs(updated - current) <= _ARC_LENGTH_S_TOL
+        active = active[~converged]
+
+    return s_vals
+
+
 def elevate_nodes(nodes):
     r"""Degree-elevate a B |eacute| zier curves.
 
@@ -795,6 +1339,113 @@ def locate_point(nodes, point):
         return s_approx
 
 
+def locate_point_multi(nodes, points):
+    r"""Locate multiple points on a curve.
+
+    Does the same subdivision as :func:`locate_point`, but for every
+    column of ``points`` at once. Each sub-curve is shared by all of the
+    points whose bounding box checks have not yet rejected it, so the
+    subdivision tree is computed only once. After the sub-curves are
+    sufficiently small, takes one Newton step for all of the remaining
+    points at once.
+
+    .. note::
+
+       This assumes, but does not check, that ``points`` is ``D x N``,
+       where ``D`` is the dimension that ``curve`` is in.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier curve.
+        points (numpy.ndarray): The points to locate (as the columns of a
+            ``D x N`` array).
+
+    Returns:
+        numpy.ndarray: 1D array of the parameter values (:math:`s`)
+        corresponding to each point, with NaN for the points that are
+        not on the ``curve``.
+
+    Raises:
+        ValueError: If, for any point, the standard deviation of the
+            remaining start / end parameters among the subdivided intervals
+            exceeds a given threshold (e.g. :math:`2^{-20}`).
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    _, num_nodes = nodes.shape
+    _, num_points = points.shape
+    # NOTE: Each (sub-curve, point) candidate is stored as an index into
+    #       the stacked sub-curves and an index into the columns of
+    #       ``points``.
+    sub_nodes = nodes[np.newaxis, :, :]
+    starts = np.zeros(1)
+    ends = np.ones(1)
+    curve_index = np.zeros(num_points, dtype=int)
+    point_index = np.arange(num_points)
+    for _ in range(_MAX_LOCATE_SUBDIVISIONS + 1):
+        lower = sub_nodes.min(axis=2)[curve_index, :]
+        upper = sub_nodes.max(axis=2)[curve_index, :]
+        candidate_points = points[:, point_index].T
+        contained = np.all(
+            (lower <= candidate_points) & (candidate_points <= upper), axis=1
+        )
+        # Only subdivide the sub-curves that still contain some point.
+        kept, curve_index = np.unique(
+            curve_index[contained], return_inverse=True
+        )
+        point_index = point_index[contained]
+        left, right = subdivide_nodes_multi(sub_nodes[kept])
+        midpoints = 0.5 * (starts[kept] + ends[kept])
+        sub_nodes = np.concatenate([left, right])
+        starts = np.concatenate([starts[kept], midpoints])
+        ends = np.concatenate([midpoints, ends[kept]])
+        curve_index = np.concatenate([curve_index, curve_index + kept.size])
+        point_index = np.concatenate([point_index, point_index])
+
+    # Compute the s-parameter (for each point) as the mean of the **start**
+    # and **end** parameters of the remaining sub-curves.
+    num_params = 2 * np.bincount(point_index, minlength=num_points)
+    found = num_params > 0
+    num_params = num_params[found]
+    start_vals = starts[curve_index]
+    end_vals = ends[curve_index]
+    params_sum = np.bincount(
+        point_index, weights=start_vals + end_vals, minlength=num_points
+    )
+    s_approx = np.empty(num_points)
+    s_approx[found] = params_sum[found] / num_params
+    centered_start = start_vals - s_approx[point_index]
+    centered_end = end_vals - s_approx[point_index]
+    variance = np.bincount(
+        point_index,
+        weights=centered_start * centered_start + centered_end * centered_end,
+        minlength=num_points,
+    )
+    std_dev = np.sqrt(variance[found] / num_params)
+    if np.any(std_dev > _LOCATE_STD_CAP):
+        raise ValueError("Parameters not close enough to one another")
+
+    # Take one Newton step (as in ``newton_refine()``) for every point.
+    s_vals = s_approx[found]
+    pt_delta = points[:, found] - evaluate_multi(nodes, s_vals)
+    first_deriv = nodes[:, 1:] - nodes[:, :-1]
+    derivative = (num_nodes - 1) * evaluate_multi(first_deriv, s_vals)
+    delta_s = np.sum(pt_delta * derivative, axis=0) / np.sum(
+        derivative * derivative, axis=0
+    )
+    # NOTE: Since each mean of the parameters must be in ``[0, 1]`` it's
+    #       "safe" to push the Newton-refined values back into the unit
+    #       interval.
+    result = np.full(num_points, np.nan)
+    result[found] = np.clip(s_vals + delta_s, 0.0, 1.0)
+    return result
+
+
 def reduce_pseudo_inverse(nodes):
     """Performs degree-reduction for a B |eacute| zier curve.
 
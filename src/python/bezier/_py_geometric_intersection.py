@@ -19,8 +19,6 @@ written in Fortran and exposed via a Cython wrapper.
    :trim:
 """
 
-import itertools
-
 import numpy as np
 
 from bezier import _py_curve_helpers
@@ -46,6 +44,11 @@ _NO_CONVERGE_TEMPLATE = (
     "subdivisions after {:d} iterations."
 )
 _MIN_INTERVAL_WIDTH = 0.5 ** 40
+_MAX_FLATTEN_SUBDIVISIONS = 20
+# The halves of each curve (0 is left, 1 is right) used by the four pairs
+# that replace a pair when both curves are subdivided.
+_COMBINED_HALVES1 = np.array([0, 0, 1, 1])
+_COMBINED_HALVES2 = np.array([0, 1, 0, 1])
 
 
 def bbox_intersect(nodes1, nodes2):
@@ -92,6 +95,48 @@ def bbox_intersect(nodes1, nodes2):
         return BoxIntersectionType.INTERSECTION
 
 
+def bbox_intersect_multi(nodes1, nodes2):
+    """Bounding box intersection predicate for a batch of pairs.
+
+    Applies :func:`bbox_intersect` to each pair of curves at once. All
+    curves on each side of the pairs must have the same degree, so that
+    the nodes can be stacked into a ``C x 2 x N`` array (the first index
+    is the pair).
+
+    Args:
+        nodes1 (numpy.ndarray): The stacked control points of the first
+            curve in each pair.
+        nodes2 (numpy.ndarray): The stacked control points of the second
+            curve in each pair.
+
+    Returns:
+        numpy.ndarray: 1D array of enums from ``BoxIntersectionType``
+        indicating the type of bounding box intersection for each pair.
+    """
+    left1, bottom1 = nodes1.min(axis=2).T
+    right1, top1 = nodes1.max(axis=2).T
+    left2, bottom2 = nodes2.min(axis=2).T
+    right2, top2 = nodes2.max(axis=2).T
+    result = np.full(
+        left1.shape, BoxIntersectionType.INTERSECTION, dtype=np.intc
+    )
+    tangent = (
+        (right2 == left1)
+        | (right1 == left2)
+        | (top2 == bottom1)
+        | (top1 == bottom2)
+    )
+    result[tangent] = BoxIntersectionType.TANGENT
+    disjoint = (
+        (right2 < left1)
+        | (right1 < left2)
+        | (top2 < bottom1)
+        | (top1 < bottom2)
+    )
+    result[disjoint] = BoxIntersectionType.DISJOINT
+    return result
+
+
 def linearization_error(nodes):
     r"""Compute the maximum error of a linear approximation.
 
@@ -242,6 +287,32 @@ def linearization_error(nodes):
     return multiplier * np.linalg.norm(worst_case, ord=2)
 
 
+def linearization_error_multi(nodes):
+    """Compute the maximum error of a linear approximation for a batch.
+
+    Applies :func:`linearization_error` to each curve in a batch at once.
+    All curves in the batch must have the same degree, so that the nodes
+    can be stacked into a ``C x D x N`` array (the first index is the
+    curve).
+
+    Args:
+        nodes (numpy.ndarray): The stacked nodes of the curves.
+
+    Returns:
+        numpy.ndarray: 1D array of the linearization error of each curve.
+    """
+    num_curves, _, num_nodes = nodes.shape
+    degree = num_nodes - 1
+    if degree == 1:
+        return np.zeros(num_curves)
+
+    second_deriv = nodes[:, :, :-2] - 2.0 * nodes[:, :, 1:-1] + nodes[:, :, 2:]
+    worst_case = np.abs(second_deriv).max(axis=2)
+    multiplier = 0.125 * degree * (degree - 1)
+    # NOTE: This is the 2-norm of each row of ``worst_case``.
+    return multiplier * np.sqrt(np.sum(worst_case * worst_case, axis=1))
+
+
 def segment_intersection(start0, end0, start1, end1):
     r"""Determine the intersection of two line segments.
 
@@ -408,6 +479,41 @@ def segment_intersection(start0, end0, start1, end1):
         return s, t, True
 
 
+def segment_intersection_multi(start0, end0, start1, end1):
+    """Determine the intersections of a batch of pairs of line segments.
+
+    Applies :func:`segment_intersection` to each pair of segments at once.
+    The start and end points of the segments are stacked along the
+    trailing axes of arrays whose first axis is the :math:`x`- and
+    :math:`y`-component (e.g. as the columns of ``2 x C`` arrays). The
+    arrays must be broadcast-compatible.
+
+    Args:
+        start0 (numpy.ndarray): The start vectors of the first segments.
+        end0 (numpy.ndarray): The end vectors of the first segments.
+        start1 (numpy.ndarray): The start vectors of the second segments.
+        end1 (numpy.ndarray): The end vectors of the second segments.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Arrays of the
+        ``s`` and ``t`` parameters of each intersection and boolean flags
+        indicating if each intersection was found (i.e. if the lines
+        aren't parallel). The parameters are NaN where the lines are
+        parallel.
+    """
+    delta0 = end0 - start0
+    delta1 = end1 - start1
+    cross_d0_d1 = _py_helpers.cross_product(delta0, delta1)
+    success = cross_d0_d1 != 0.0
+    start_delta = start1 - start0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        s = _py_helpers.cross_product(start_delta, delta1) / cross_d0_d1
+        t = _py_helpers.cross_product(start_delta, delta0) / cross_d0_d1
+    s[~success] = np.nan
+    t[~success] = np.nan
+    return s, t, success
+
+
 def parallel_lines_parameters(start0, end0, start1, end1):
     r"""Checks if two parallel lines ever meet.
 
@@ -1054,6 +1160,52 @@ def bbox_line_intersect(nodes, line_start, line_end):
     return BoxIntersectionType.DISJOINT
 
 
+def bbox_line_intersect_multi(nodes, line_start, line_end):
+    """Determine the intersections of a batch of bounding boxes and lines.
+
+    Applies :func:`bbox_line_intersect` to each pair of a curve (which
+    determines a bounding box) and a line segment at once. All curves in
+    the batch must have the same degree, so that the nodes can be stacked
+    into a ``C x 2 x N`` array (the first index is the pair).
+
+    Args:
+        nodes (numpy.ndarray): The stacked points that determine each
+            bounding box.
+        line_start (numpy.ndarray): The beginning of each line segment, as
+            the columns of a ``2 x C`` array.
+        line_end (numpy.ndarray): The end of each line segment, as the
+            columns of a ``2 x C`` array.
+
+    Returns:
+        numpy.ndarray: 1D array of enums from ``BoxIntersectionType``
+        indicating the type of bounding box intersection for each pair.
+    """
+    lower = nodes.min(axis=2).T
+    upper = nodes.max(axis=2).T
+    intersect = np.all((lower <= line_start) & (line_start <= upper), axis=0)
+    intersect |= np.all((lower <= line_end) & (line_end <= upper), axis=0)
+    # NOTE: As in ``bbox_line_intersect()``, we skip the left edge. The
+    #       bottom, right and top edges are checked at once, by stacking
+    #       them as a ``2 x 3 x C`` array.
+    (left, bottom), (right, top) = lower, upper
+    edge_start = np.array([[left, right, right], [bottom, bottom, top]])
+    edge_end = np.array([[right, right, left], [bottom, top, top]])
+    s, t, success = segment_intersection_multi(
+        edge_start,
+        edge_end,
+        line_start[:, np.newaxis, :],
+        line_end[:, np.newaxis, :],
+    )
+    intersect |= np.any(
+        success & (0.0 <= s) & (s <= 1.0) & (0.0 <= t) & (t <= 1.0), axis=0
+    )
+    return np.where(
+        intersect,
+        BoxIntersectionType.INTERSECTION,
+        BoxIntersectionType.DISJOINT,
+    ).astype(np.intc)
+
+
 def intersect_one_round(candidates, intersections):
     """Perform one step of the intersection process.
 
@@ -1069,65 +1221,62 @@ def intersect_one_round(candidates, intersections):
     track the overall linearization error for every curve
     encountered.
 
+    Since the pairs are stored in stacked arrays, the bounding box checks,
+    the subdivision and the linearization are each done for every pair at
+    once. Only the pairs that have "finished" (i.e. tangent bounding boxes
+    or two linearized curves) are handled one at a time, since these can
+    add to ``intersections``.
+
     Args:
-        candidates (Union[list, itertools.chain]): An iterable of
-            pairs of curves (or linearized curves).
+        candidates (CandidatePairs): The pairs of curves (or linearized
+            curves) in the current round.
         intersections (list): A list of already encountered
             intersections. If any intersections can be readily determined
             during this round of subdivision, then they will be added
             to this list.
 
     Returns:
-        list: Returns a list of the next round of ``candidates``.
+        CandidatePairs: The next round of ``candidates``.
     """
-    next_candidates = []
-    # NOTE: In the below we replace ``isinstance(a, B)`` with
-    #       ``a.__class__ is B``, which is a 3-3.5x speedup.
-    for first, second in candidates:
-        both_linearized = False
-        if first.__class__ is Linearization:
-            if second.__class__ is Linearization:
-                both_linearized = True
-                bbox_int = bbox_intersect(
-                    first.curve.nodes, second.curve.nodes
-                )
-            else:
-                bbox_int = bbox_line_intersect(
-                    second.nodes, first.start_node, first.end_node
-                )
-        else:
-            if second.__class__ is Linearization:
-                bbox_int = bbox_line_intersect(
-                    first.nodes, second.start_node, second.end_node
-                )
-            else:
-                bbox_int = bbox_intersect(first.nodes, second.nodes)
-        if bbox_int == BoxIntersectionType.DISJOINT:
-            continue
-
-        if bbox_int == BoxIntersectionType.TANGENT and not both_linearized:
-            # NOTE: Ignore tangent bounding boxes in the linearized case
-            #       because ``tangent_bbox_intersection()`` assumes that both
-            #       curves are not linear.
-            tangent_bbox_intersection(first, second, intersections)
-            continue
+    linearized1 = candidates.errors[:, 0] < _ERROR_VAL
+    linearized2 = candidates.errors[:, 1] < _ERROR_VAL
+    both_linearized = linearized1 & linearized2
+    bbox_int = bbox_intersect_multi(candidates.nodes1, candidates.nodes2)
+    # When exactly one curve is linearized, the segment is compared to the
+    # bounding box of the other curve.
+    only_first = linearized1 & ~linearized2
+    if only_first.any():
+        line_nodes = candidates.nodes1[only_first]
+        bbox_int[only_first] = bbox_line_intersect_multi(
+            candidates.nodes2[only_first],
+            line_nodes[:, :, 0].T,
+            line_nodes[:, :, -1].T,
+        )
+    only_second = linearized2 & ~linearized1
+    if only_second.any():
+        line_nodes = candidates.nodes2[only_second]
+        bbox_int[only_second] = bbox_line_intersect_multi(
+            candidates.nodes1[only_second],
+            line_nodes[:, :, 0].T,
+            line_nodes[:, :, -1].T,
+        )
 
-        if both_linearized:
+    accepted = bbox_int != BoxIntersectionType.DISJOINT
+    # NOTE: Ignore tangent bounding boxes in the linearized case because
+    #       ``tangent_bbox_intersection()`` assumes that both curves are
+    #       not linear.
+    tangent = (bbox_int == BoxIntersectionType.TANGENT) & ~both_linearized
+    finished = accepted & (tangent | both_linearized)
+    for index in np.flatnonzero(finished):
+        first, second = candidates.pair(index)
+        if tangent[index]:
+            tangent_bbox_intersection(first, second, intersections)
+        else:
             # If both ``first`` and ``second`` are linearizations, then
             # we can intersect them immediately.
             from_linearized(first, second, intersections)
-            continue
 
-        # If we haven't ``continue``-d, add the accepted pair.
-        # NOTE: This may be a wasted computation, e.g. if ``first``
-        #       or ``second`` occur in multiple accepted pairs (the caller
-        #       only passes one pair at a time). However, in practice
-        #       the number of such pairs will be small so this cost
-        #       will be low.
-        lin1 = map(Linearization.from_shape, first.subdivide())
-        lin2 = map(Linearization.from_shape, second.subdivide())
-        next_candidates.extend(itertools.product(lin1, lin2))
-    return next_candidates
+    return candidates.take(accepted & ~finished).subdivide()
 
 
 def prune_candidates(candidates):
@@ -1142,27 +1291,20 @@ def prune_candidates(candidates):
     if those convex hulls collide.
 
     Args:
-        candidates (List): An iterable of pairs of curves (or
-            linearized curves).
+        candidates (CandidatePairs): The pairs of curves (or linearized
+            curves).
 
     Returns:
-        List: A pruned list of curve pairs.
+        CandidatePairs: The pruned pairs.
     """
-    pruned = []
-    # NOTE: In the below we replace ``isinstance(a, B)`` with
-    #       ``a.__class__ is B``, which is a 3-3.5x speedup.
-    for first, second in candidates:
-        if first.__class__ is Linearization:
-            nodes1 = first.curve.nodes
-        else:
-            nodes1 = first.nodes
-        if second.__class__ is Linearization:
-            nodes2 = second.curve.nodes
-        else:
-            nodes2 = second.nodes
-        if convex_hull_collide(nodes1, nodes2):
-            pruned.append((first, second))
-    return pruned
+    keep = [
+        index
+        for index in range(len(candidates))
+        if convex_hull_collide(
+            candidates.nodes1[index], candidates.nodes2[index]
+        )
+    ]
+    return candidates.take(keep)
 
 
 def make_same_degree(nodes1, nodes2):
@@ -1386,7 +1528,7 @@ def check_lines(first, second):
     return True, result
 
 
-def all_intersections(nodes_first, nodes_second):
+def all_intersections(nodes_first, nodes_second, workspace=None):
     r"""Find the points of intersection among a pair of curves.
 
     .. note::
@@ -1406,6 +1548,8 @@ def all_intersections(nodes_first, nodes_second):
             intersected with ``nodes_second``.
         nodes_second (numpy.ndarray): Control points of a curve to be
             intersected with ``nodes_first``.
+        workspace (Optional[IntersectionWorkspace]): Unused. Accepted to
+            match the interface of the Fortran implementation.
 
     Returns:
         Tuple[numpy.ndarray, bool]: An array and a flag:
@@ -1424,6 +1568,7 @@ def all_intersections(nodes_first, nodes_second):
             curves or coincident curves (though there are mitigations for
             those cases in place).
     """
+    # pylint: disable=unused-argument
     curve_first = SubdividedCurve(nodes_first, nodes_first)
     curve_second = SubdividedCurve(nodes_second, nodes_second)
     candidate1 = Linearization.from_shape(curve_first)
@@ -1433,7 +1578,7 @@ def all_intersections(nodes_first, nodes_second):
     if both_linear:
         return result
 
-    candidates = [(candidate1, candidate2)]
+    candidates = CandidatePairs.from_nodes(nodes_first, nodes_second)
     intersections = []
     coincident = False
     for _ in range(_MAX_INTERSECT_SUBDIVISIONS):
@@ -1453,7 +1598,7 @@ def all_intersections(nodes_first, nodes_second):
                 coincident = True
                 # Artificially empty out candidates so that this
                 # function exits.
-                candidates = []
+                candidates = candidates.take([])
         # If none of the candidate pairs have been accepted, then there are
         # no more intersections to find.
         if not candidates:
@@ -1468,6 +1613,179 @@ def all_intersections(nodes_first, nodes_second):
     raise ValueError(msg)
 
 
+def all_intersections_pairs(
+    nodes_first, offsets_first, nodes_second, offsets_second, workspace=None
+):
+    """Find the points of intersection among many pairs of curves.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    The nodes of every first (and every second) curve are packed into a
+    single array, i.e. the nodes of the first curve in pair ``j`` are the
+    columns ``offsets_first[j]:offsets_first[j + 1]`` of ``nodes_first``.
+    Each pair is intersected via :func:`all_intersections`; a pair that
+    fails is recorded (with no intersections) rather than stopping the
+    batch.
+
+    Args:
+        nodes_first (numpy.ndarray): The packed control points of the first
+            curve in each pair (as a ``2 x M`` array).
+        offsets_first (numpy.ndarray): The offsets of each first curve in
+            ``nodes_first`` (as a 1D array with ``P + 1`` entries).
+        nodes_second (numpy.ndarray): The packed control points of the
+            second curve in each pair.
+        offsets_second (numpy.ndarray): The offsets of each second curve in
+            ``nodes_second``.
+        workspace (Optional[IntersectionWorkspace]): Unused. Accepted to
+            match the interface of the Fortran implementation.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, list]: Quadruple
+        of
+
+        * The offsets of the intersections of each pair (as a 1D array with
+          ``P + 1`` entries), i.e. the intersections of pair ``j`` are the
+          columns ``offsets[j]:offsets[j + 1]`` of the parameters.
+        * The ``s``- and ``t``-parameters of all of the intersections (as
+          a ``2 x K`` array).
+        * Flags indicating if the curves in each pair are coincident (as a
+          1D boolean array).
+        * The pairs that failed, as a list of ``(j, exception)`` pairs.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    # pylint: disable=unused-argument
+    num_pairs = len(offsets_first) - 1
+    offsets = np.zeros(num_pairs + 1, dtype=np.intc)
+    coincident = np.zeros(num_pairs, dtype=bool)
+    all_st_vals = [np.empty((2, 0), order="F")]
+    errors = []
+    for index in range(num_pairs):
+        begin, end = offsets_first[index], offsets_first[index + 1]
+        first = nodes_first[:, begin:end]
+        begin, end = offsets_second[index], offsets_second[index + 1]
+        second = nodes_second[:, begin:end]
+        try:
+            st_vals, is_coincident = all_intersections(first, second)
+        except (ValueError, NotImplementedError) as exc:
+            errors.append((index, exc))
+            st_vals = np.empty((2, 0), order="F")
+            is_coincident = False
+        all_st_vals.append(st_vals)
+        coincident[index] = is_coincident
+        offsets[index + 1] = offsets[index] + st_vals.shape[1]
+    st_vals = np.asfortranarray(np.hstack(all_st_vals))
+    return offsets, st_vals, coincident, errors
+
+
+def flatten_curve(nodes, tolerance):
+    """Approximate a curve by a polyline.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    See :func:`flatten_curves` for details on how the curve is subdivided.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a curve.
+        tolerance (float): The maximum :func:`linearization_error` allowed
+            for each segment of the polyline.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The vertices of the polyline (as the columns of a ``D x M``
+          array).
+        * The :math:`s`-value of each vertex (as a 1D array).
+    """
+    vertices, s_vals, _ = flatten_curves(nodes[np.newaxis, :, :], tolerance)
+    return vertices, s_vals
+
+
+def flatten_curves(nodes, tolerance):
+    """Approximate each curve in a batch by a polyline.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    Each curve is recursively subdivided until the
+    :func:`linearization_error` of every sub-curve is at most
+    ``tolerance`` (or until a sub-curve has been subdivided
+    ``_MAX_FLATTEN_SUBDIVISIONS`` times). The vertices of the polyline for
+    each curve are its start and the end of each accepted sub-curve. All
+    sub-curves at the same depth (from all curves in the batch) are checked
+    and subdivided at once.
+
+    Args:
+        nodes (numpy.ndarray): The stacked nodes of the curves, as a
+            ``C x D x N`` array (the first index is the curve).
+        tolerance (float): The maximum :func:`linearization_error` allowed
+            for each segment of the polylines.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * The vertices of all of the polylines (as the columns of a
+          ``D x M`` array).
+        * The :math:`s`-value of each vertex (as a 1D array).
+        * The offsets of each polyline (as a 1D array with ``C + 1``
+          entries), i.e. the vertices of curve ``j`` are the columns
+          ``offsets[j]:offsets[j + 1]``.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    num_curves, _, num_nodes = nodes.shape
+    # The start of each curve is the first vertex in its polyline.
+    curve_indices = [np.arange(num_curves)]
+    vertex_s_vals = [np.zeros(num_curves)]
+    points = [nodes[:, :, 0]]
+
+    sub_nodes = nodes
+    sub_curves = np.arange(num_curves)
+    starts = np.zeros(num_curves)
+    ends = np.ones(num_curves)
+    for depth in range(_MAX_FLATTEN_SUBDIVISIONS + 1):
+        # NOTE: Lines (and points) are never subdivided.
+        if num_nodes > 2 and depth < _MAX_FLATTEN_SUBDIVISIONS:
+            done = linearization_error_multi(sub_nodes) <= tolerance
+        else:
+            done = np.ones(sub_curves.size, dtype=bool)
+        curve_indices.append(sub_curves[done])
+        vertex_s_vals.append(ends[done])
+        points.append(sub_nodes[done, :, -1])
+        if done.all():
+            break
+
+        left_nodes, right_nodes = _py_curve_helpers.subdivide_nodes_multi(
+            sub_nodes[~done]
+        )
+        midpoints = 0.5 * (starts[~done] + ends[~done])
+        sub_nodes = np.concatenate([left_nodes, right_nodes])
+        sub_curves = np.tile(sub_curves[~done], 2)
+        starts, ends = (
+            np.concatenate([starts[~done], midpoints]),
+            np.concatenate([midpoints, ends[~done]]),
+        )
+
+    curve_indices = np.concatenate(curve_indices)
+    vertex_s_vals = np.concatenate(vertex_s_vals)
+    # Sort the vertices by curve, then by ``s``-value within each curve.
+    order = np.lexsort((vertex_s_vals, curve_indices))
+    vertices = np.asfortranarray(np.concatenate(points)[order].T)
+    offsets = np.zeros(num_curves + 1, dtype=np.intc)
+    offsets[1:] = np.cumsum(np.bincount(curve_indices, minlength=num_curves))
+    return vertices, vertex_s_vals[order], offsets
+
+
 class BoxIntersectionType:  # pylint: disable=too-few-public-methods
     """Enum representing all possible bounding box intersections.
 
@@ -1485,6 +1803,39 @@ class BoxIntersectionType:  # pylint: disable=too-few-public-methods
     """Bounding boxes do not intersect or touch."""
 
 
+class IntersectionWorkspace:
+    """Workspace for curve-curve intersection.
+
+    The Fortran implementation of :func:`all_intersections` re-uses
+    long-lived storage across calls. Passing a distinct workspace to each
+    thread makes concurrent calls safe. The pure Python implementation
+    allocates everything it needs on each call, so this only tracks a size
+    to mirror the interface of the Fortran-backed workspace.
+
+    Args:
+        size (Optional[int]): The number of intersections the workspace can
+            initially hold. Defaults to 2.
+    """
+
+    __slots__ = ("_size",)
+
+    def __init__(self, size=2):
+        self._size = size
+
+    @property
+    def size(self):
+        """int: The number of intersections the workspace can hold."""
+        return self._size
+
+    def resize(self, size):
+        """Re-allocate the workspace to hold ``size`` intersections.
+
+        Args:
+            size (int): The number of intersections to hold.
+        """
+        self._size = size
+
+
 class SubdividedCurve:  # pylint: disable=too-few-public-methods
     """A data wrapper for a B |eacute| zier curve
 
@@ -1624,3 +1975,257 @@ class Linearization:
 
             else:
                 return shape
+
+
+class CandidatePairs:
+    """The candidate pairs of sub-curves in a round of intersection.
+
+    Every sub-curve in a round of :func:`all_intersections` comes from one
+    of the same two curves, so (unlike :class:`SubdividedCurve`) the nodes
+    and parameters of all of the pairs can be stored in stacked arrays.
+    This allows :func:`intersect_one_round` to process an entire round
+    with a handful of vectorized operations.
+
+    A sub-curve is considered linearized (see :class:`Linearization`) if
+    its linearization error is below the threshold used by
+    :meth:`Linearization.from_shape`. Linearized sub-curves are not
+    subdivided any further.
+
+    Args:
+        original_nodes1 (numpy.ndarray): The control points of the first
+            original curve.
+        original_nodes2 (numpy.ndarray): The control points of the second
+            original curve.
+        nodes1 (numpy.ndarray): The control points of the first sub-curve
+            in each pair, stacked as a ``C x 2 x N1`` array.
+        nodes2 (numpy.ndarray): The control points of the second sub-curve
+            in each pair, stacked as a ``C x 2 x N2`` array.
+        params (numpy.ndarray): A ``C x 4`` array of the start and end
+            parameters of the first sub-curve, followed by those of the
+            second sub-curve.
+        errors (numpy.ndarray): A ``C x 2`` array of the linearization
+            errors of the first and second sub-curves.
+    """
+
+    __slots__ = (
+        "original_nodes1",
+        "original_nodes2",
+        "nodes1",
+        "nodes2",
+        "params",
+        "errors",
+    )
+
+    def __init__(
+        self, original_nodes1, original_nodes2, nodes1, nodes2, params, errors
+    ):
+        self.original_nodes1 = original_nodes1
+        self.original_nodes2 = original_nodes2
+        self.nodes1 = nodes1
+        self.nodes2 = nodes2
+        self.params = params
+        self.errors = errors
+
+    def __len__(self):
+        """The number of candidate pairs.
+
+        Returns:
+            int: The number of pairs.
+        """
+        return self.params.shape[0]
+
+    @classmethod
+    def from_nodes(cls, nodes1, nodes2):
+        """Create the (single) initial pair of two curves.
+
+        Args:
+            nodes1 (numpy.ndarray): The control points of the first curve.
+            nodes2 (numpy.ndarray): The control points of the second curve.
+
+        Returns:
+            CandidatePairs: The pair of the two (entire) curves.
+        """
+        stacked1 = nodes1[np.newaxis, :, :]
+        stacked2 = nodes2[np.newaxis, :, :]
+        errors = np.column_stack(
+            [
+                linearization_error_multi(stacked1),
+                linearization_error_multi(stacked2),
+            ]
+        )
+        params = np.array([[0.0, 1.0, 0.0, 1.0]])
+        return cls(nodes1, nodes2, stacked1, stacked2, params, errors)
+
+    def take(self, indices):
+        """Select a subset of the candidate pairs.
+
+        Args:
+            indices (Union[numpy.ndarray, List[int]]): The indices (or a
+                boolean mask) of the pairs to keep.
+
+        Returns:
+            CandidatePairs: The selected pairs.
+        """
+        return CandidatePairs(
+            self.original_nodes1,
+            self.original_nodes2,
+            self.nodes1[indices],
+            self.nodes2[indices],
+            self.params[indices],
+            self.errors[indices],
+        )
+
+    def pair(self, index):
+        """Get a single candidate pair.
+
+        Args:
+            index (int): The index of the pair.
+
+        Returns:
+            Tuple[Union[SubdividedCurve, Linearization], \
+            Union[SubdividedCurve, Linearization]]: The two (potentially
+            linearized) sub-curves.
+        """
+        start1, end1, start2, end2 = self.params[index, :].tolist()
+        error1, error2 = self.errors[index, :].tolist()
+        first = _make_candidate(
+            self.nodes1[index], self.original_nodes1, start1, end1, error1
+        )
+        second = _make_candidate(
+            self.nodes2[index], self.original_nodes2, start2, end2, error2
+        )
+        return first, second
+
+    def subdivide(self):
+        """Split each sub-curve that has not been linearized.
+
+        Each pair is replaced by every combination of the halves of its
+        sub-curves (or the sub-curve itself, if it is linearized). The new
+        pairs are in the same order as the pairs they came from.
+
+        Returns:
+            CandidatePairs: The pairs of the subdivided sub-curves.
+        """
+        # NOTE: There is no corresponding "enable", but the disable only
+        #       applies in this lexical scope.
+        # pylint: disable=too-many-locals
+        nodes1, params1, errors1 = _subdivide_stacked(
+            self.nodes1, self.params[:, :2], self.errors[:, 0]
+        )
+        nodes2, params2, errors2 = _subdivide_stacked(
+            self.nodes2, self.params[:, 2:], self.errors[:, 1]
+        )
+        # Combine the halves in the order (left1, left2), (left1, right2),
+        # (right1, left2), (right1, right2). A linearized sub-curve only has
+        # a "left" half (itself).
+        half1 = _COMBINED_HALVES1
+        half2 = _COMBINED_HALVES2
+        num_halves1 = np.where(self.errors[:, 0] < _ERROR_VAL, 1, 2)
+        num_halves2 = np.where(self.errors[:, 1] < _ERROR_VAL, 1, 2)
+        valid = (half1 < num_halves1[:, np.newaxis]) & (
+            half2 < num_halves2[:, np.newaxis]
+        )
+        pair_index, combination = np.nonzero(valid)
+        index1 = pair_index, half1[combination]
+        index2 = pair_index, half2[combination]
+        return CandidatePairs(
+            self.original_nodes1,
+            self.original_nodes2,
+            nodes1[index1],
+            nodes2[index2],
+            np.hstack([params1[index1], params2[index2]]),
+            np.column_stack([errors1[index1], errors2[index2]]),
+        )
+
+
+def _make_candidate(nodes, original_nodes, start, end, error):
+    """Make a (potentially linearized) curve from a candidate pair.
+
+    .. note::
+
+       This is a helper for :meth:`CandidatePairs.pair`.
+
+    Args:
+        nodes (numpy.ndarray): The control points of the sub-curve.
+        original_nodes (numpy.ndarray): The control points of the original
+            curve.
+        start (float): The start parameter of the sub-curve.
+        end (float): The end parameter of the sub-curve.
+        error (float): The linearization error of the sub-curve.
+
+    Returns:
+        Union[SubdividedCurve, Linearization]: The sub-curve (linearized if
+        ``error`` is small enough).
+    """
+    curve = SubdividedCurve(
+        np.asfortranarray(nodes), original_nodes, start=start, end=end
+    )
+    if error < _ERROR_VAL:
+        return Linearization(curve, error)
+
+    return curve
+
+
+def _subdivide_stacked(nodes, params, errors):
+    """Split each (non-linearized) sub-curve on one side of the pairs.
+
+    .. note::
+
+       This is a helper for :meth:`CandidatePairs.subdivide`.
+
+    Args:
+        nodes (numpy.ndarray): The stacked (``C x 2 x N``) control points
+            of the sub-curves.
+        params (numpy.ndarray): The ``C x 2`` start and end parameters of
+            the sub-curves.
+        errors (numpy.ndarray): The linearization errors of the sub-curves.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The nodes
+        (``C x 2 x 2 x N``), parameters (``C x 2 x 2``) and linearization
+        errors (``C x 2``) of the left and right halves of each sub-curve.
+        For a linearized sub-curve, the "left" half is the sub-curve itself
+        and the "right" half is unused (and is omitted entirely if every
+        sub-curve is linearized).
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    linearized = errors < _ERROR_VAL
+    if linearized.all():
+        return (
+            nodes[:, np.newaxis, :, :],
+            params[:, np.newaxis, :],
+            errors[:, np.newaxis],
+        )
+
+    if linearized.any():
+        # Only split the sub-curves that have not been linearized (and use
+        # the same layout as when none have).
+        split = ~linearized
+        halves, half_params, half_errors = _subdivide_stacked(
+            nodes[split], params[split], errors[split]
+        )
+        num_pairs = errors.size
+        all_halves = np.empty((num_pairs,) + halves.shape[1:])
+        all_params = np.empty((num_pairs, 2, 2))
+        all_errors = np.empty((num_pairs, 2))
+        all_halves[linearized, 0] = nodes[linearized]
+        all_params[linearized, 0] = params[linearized]
+        all_errors[linearized, 0] = errors[linearized]
+        all_halves[split] = halves
+        all_params[split] = half_params
+        all_errors[split] = half_errors
+        return all_halves, all_params, all_errors
+
+    left, right = _py_curve_helpers.subdivide_nodes_multi(nodes)
+    start, end = params.T
+    midpoint = 0.5 * (start + end)
+    half_params = np.stack(
+        [np.column_stack([start, midpoint]), np.column_stack([midpoint, end])],
+        axis=1,
+    )
+    half_errors = np.column_stack(
+        [linearization_error_multi(left), linearization_error_multi(right)]
+    )
+    return np.stack([left, right], axis=1), half_params, half_errors
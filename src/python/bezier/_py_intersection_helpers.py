@@ -916,3 +916,5 @@ class IntersectionStrategy(enum.Enum):
     """Geometric approach to intersection (via subdivision)."""
     ALGEBRAIC = 1
     """Algebraic approach to intersection (via implicitization)."""
+    CLIPPING = 2
+    """Geometric approach to intersection (via B |eacute| zier clipping)."""
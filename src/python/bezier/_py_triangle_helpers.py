@@ -27,6 +27,7 @@ from bezier import _py_intersection_helpers
 
 
 _MAX_POLY_SUBDIVISIONS = 5
+_MATRIX_CACHE_SIZE = 32
 _SIGN = np.sign  # pylint: disable=no-member
 _FLOAT64 = np.float64  # pylint: disable=no-member
 _SAME_CURVATURE = "Tangent curves have same curvature."
@@ -266,12 +267,13 @@ QUARTIC_SUBDIVIDE_D = (
     )
     / 16.0
 )
-_WEIGHTS_SUBDIVIDE0 = np.asfortranarray([1.0, 0.0, 0.0])
-_WEIGHTS_SUBDIVIDE1 = np.asfortranarray([0.5, 0.5, 0.0])
-_WEIGHTS_SUBDIVIDE2 = np.asfortranarray([0.5, 0.0, 0.5])
-_WEIGHTS_SUBDIVIDE3 = np.asfortranarray([0.0, 0.5, 0.5])
-_WEIGHTS_SUBDIVIDE4 = np.asfortranarray([0.0, 1.0, 0.0])
-_WEIGHTS_SUBDIVIDE5 = np.asfortranarray([0.0, 0.0, 1.0])
+# The barycentric weights of the corners of sub-triangles A, B, C and D.
+_SUBDIVIDE_CORNERS = (
+    ((1.0, 0.0, 0.0), (0.5, 0.5, 0.0), (0.5, 0.0, 0.5)),
+    ((0.0, 0.5, 0.5), (0.5, 0.0, 0.5), (0.5, 0.5, 0.0)),
+    ((0.5, 0.5, 0.0), (0.0, 1.0, 0.0), (0.0, 0.5, 0.5)),
+    ((0.5, 0.0, 0.5), (0.0, 0.5, 0.5), (0.0, 0.0, 1.0)),
+)
 # The Jacobian of a quadratric (in any dimension) as given by
 # dB/ds = [-2L1, 2(L1 - L2), 2L2, -2L3, 2L3, 0] * nodes
 # dB/dt = [-2L1, -2L2, 0, 2(L1 - L3), 2L2, 2L3] * nodes
@@ -1063,7 +1065,8 @@ def specialize_triangle(nodes, degree, weights_a, weights_b, weights_c):
 
     .. note::
 
-       This is used **only** as a helper for :func:`subdivide_nodes`, however
+       This is used **only** as a helper for :func:`specialization_matrix`
+       (which produces the matrices for :func:`subdivide_nodes`), however
        it may be worth adding this to :class:`Triangle` as an analogue to
        :meth:`Curve.specialize`.
 
@@ -1102,6 +1105,88 @@ def specialize_triangle(nodes, degree, weights_a, weights_b, weights_c):
     return reduced_to_matrix(nodes.shape, degree, partial_vals)
 
 
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE)
+def specialization_matrix(degree, weights_a, weights_b, weights_c):
+    """Make the matrix that specializes a triangle to a sub-triangle.
+
+    The nodes of the specialized triangle are a linear function of the
+    nodes, so the matrix is found by specializing the "identity" triangle
+    via :func:`specialize_triangle`. The matrices are memoized (in a
+    bounded cache), so the weights must be hashable.
+
+    Args:
+        degree (int): The degree of the triangle.
+        weights_a (Tuple[float, float, float]): Barycentric weights for
+            a point in the reference triangle
+        weights_b (Tuple[float, float, float]): Barycentric weights for
+            a point in the reference triangle
+        weights_c (Tuple[float, float, float]): Barycentric weights for
+            a point in the reference triangle
+
+    Returns:
+        numpy.ndarray: The (read-only) ``N x N`` specialization matrix.
+    """
+    num_nodes = ((degree + 1) * (degree + 2)) // 2
+    matrix = specialize_triangle(
+        np.eye(num_nodes, order="F"),
+        degree,
+        np.asfortranarray(weights_a),
+        np.asfortranarray(weights_b),
+        np.asfortranarray(weights_c),
+    )
+    matrix.flags.writeable = False
+    return matrix
+
+
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE)
+def subdivision_matrices(degree):
+    """Get the matrices used to subdivide a triangle.
+
+    For degrees 1 to 4, these are the stored ``SUBDIVIDE`` matrices. For
+    higher degrees, they are generated on first use via
+    :func:`specialization_matrix` and memoized (in a bounded cache).
+
+    Args:
+        degree (int): The degree of the triangle.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: The
+        matrices that produce the four sub-triangles.
+    """
+    if degree == 1:
+        return (
+            LINEAR_SUBDIVIDE_A,
+            LINEAR_SUBDIVIDE_B,
+            LINEAR_SUBDIVIDE_C,
+            LINEAR_SUBDIVIDE_D,
+        )
+    if degree == 2:
+        return (
+            QUADRATIC_SUBDIVIDE_A,
+            QUADRATIC_SUBDIVIDE_B,
+            QUADRATIC_SUBDIVIDE_C,
+            QUADRATIC_SUBDIVIDE_D,
+        )
+    if degree == 3:
+        return (
+            CUBIC_SUBDIVIDE_A,
+            CUBIC_SUBDIVIDE_B,
+            CUBIC_SUBDIVIDE_C,
+            CUBIC_SUBDIVIDE_D,
+        )
+    if degree == 4:
+        return (
+            QUARTIC_SUBDIVIDE_A,
+            QUARTIC_SUBDIVIDE_B,
+            QUARTIC_SUBDIVIDE_C,
+            QUARTIC_SUBDIVIDE_D,
+        )
+    return tuple(
+        specialization_matrix(degree, *corners)
+        for corners in _SUBDIVIDE_CORNERS
+    )
+
+
 def subdivide_nodes(nodes, degree):
     """Subdivide a triangle into four sub-triangles.
 
@@ -1122,56 +1207,10 @@ def subdivide_nodes(nodes, degree):
         Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: The
         nodes for the four sub-triangles.
     """
-    if degree == 1:
-        nodes_a = _py_helpers.matrix_product(nodes, LINEAR_SUBDIVIDE_A)
-        nodes_b = _py_helpers.matrix_product(nodes, LINEAR_SUBDIVIDE_B)
-        nodes_c = _py_helpers.matrix_product(nodes, LINEAR_SUBDIVIDE_C)
-        nodes_d = _py_helpers.matrix_product(nodes, LINEAR_SUBDIVIDE_D)
-    elif degree == 2:
-        nodes_a = _py_helpers.matrix_product(nodes, QUADRATIC_SUBDIVIDE_A)
-        nodes_b = _py_helpers.matrix_product(nodes, QUADRATIC_SUBDIVIDE_B)
-        nodes_c = _py_helpers.matrix_product(nodes, QUADRATIC_SUBDIVIDE_C)
-        nodes_d = _py_helpers.matrix_product(nodes, QUADRATIC_SUBDIVIDE_D)
-    elif degree == 3:
-        nodes_a = _py_helpers.matrix_product(nodes, CUBIC_SUBDIVIDE_A)
-        nodes_b = _py_helpers.matrix_product(nodes, CUBIC_SUBDIVIDE_B)
-        nodes_c = _py_helpers.matrix_product(nodes, CUBIC_SUBDIVIDE_C)
-        nodes_d = _py_helpers.matrix_product(nodes, CUBIC_SUBDIVIDE_D)
-    elif degree == 4:
-        nodes_a = _py_helpers.matrix_product(nodes, QUARTIC_SUBDIVIDE_A)
-        nodes_b = _py_helpers.matrix_product(nodes, QUARTIC_SUBDIVIDE_B)
-        nodes_c = _py_helpers.matrix_product(nodes, QUARTIC_SUBDIVIDE_C)
-        nodes_d = _py_helpers.matrix_product(nodes, QUARTIC_SUBDIVIDE_D)
-    else:
-        nodes_a = specialize_triangle(
-            nodes,
-            degree,
-            _WEIGHTS_SUBDIVIDE0,
-            _WEIGHTS_SUBDIVIDE1,
-            _WEIGHTS_SUBDIVIDE2,
-        )
-        nodes_b = specialize_triangle(
-            nodes,
-            degree,
-            _WEIGHTS_SUBDIVIDE3,
-            _WEIGHTS_SUBDIVIDE2,
-            _WEIGHTS_SUBDIVIDE1,
-        )
-        nodes_c = specialize_triangle(
-            nodes,
-            degree,
-            _WEIGHTS_SUBDIVIDE1,
-            _WEIGHTS_SUBDIVIDE4,
-            _WEIGHTS_SUBDIVIDE3,
-        )
-        nodes_d = specialize_triangle(
-            nodes,
-            degree,
-            _WEIGHTS_SUBDIVIDE2,
-            _WEIGHTS_SUBDIVIDE3,
-            _WEIGHTS_SUBDIVIDE5,
-        )
-    return nodes_a, nodes_b, nodes_c, nodes_d
+    return tuple(
+        _py_helpers.matrix_product(nodes, matrix)
+        for matrix in subdivision_matrices(degree)
+    )
 
 
 def jacobian_s(nodes, degree, dimension):
@@ -2794,32 +2833,9 @@ def evaluate_barycentric(nodes, degree, lambda1, lambda2, lambda3):
         numpy.ndarray: The evaluated point as a ``D x 1`` array (where ``D``
         is the ambient dimension where ``nodes`` reside).
     """
-    dimension, num_nodes = nodes.shape
-    binom_val = 1.0
-    result = np.zeros((dimension, 1), order="F")
-    index = num_nodes - 1
-    result[:, 0] += nodes[:, index]
-    # curve evaluate_multi_barycentric() takes arrays.
-    lambda1 = np.asfortranarray([lambda1])
-    lambda2 = np.asfortranarray([lambda2])
-    for k in range(degree - 1, -1, -1):
-        # We want to go from (d C (k + 1)) to (d C k).
-        binom_val = (binom_val * (k + 1)) / (degree - k)
-        index -= 1  # Step to last element in column.
-        #     k = d - 1, d - 2, ...
-        # d - k =     1,     2, ...
-        # We know column k has (d - k + 1) elements.
-        new_index = index - degree + k  # First element in column.
-        col_nodes = nodes[:, new_index : index + 1]  # noqa: E203
-        col_nodes = np.asfortranarray(col_nodes)
-        col_result = _py_curve_helpers.evaluate_multi_barycentric(
-            col_nodes, lambda1, lambda2
-        )
-        result *= lambda3
-        result += binom_val * col_result
-        # Update index for next iteration.
-        index = new_index
-    return result
+    dimension, _ = nodes.shape
+    param_vals = np.asfortranarray([[lambda1, lambda2, lambda3]])
+    return evaluate_barycentric_multi(nodes, degree, param_vals, dimension)
 
 
 def evaluate_barycentric_multi(nodes, degree, param_vals, dimension):
@@ -2843,11 +2859,30 @@ def evaluate_barycentric_multi(nodes, degree, param_vals, dimension):
         underlying triangle.
     """
     num_vals, _ = param_vals.shape
+    # curve evaluate_multi_barycentric() takes (contiguous) arrays.
+    lambda1 = np.asfortranarray(param_vals[:, 0])
+    lambda2 = np.asfortranarray(param_vals[:, 1])
+    lambda3 = param_vals[np.newaxis, :, 2]
+    binom_val = 1.0
     result = np.empty((dimension, num_vals), order="F")
-    for index, (lambda1, lambda2, lambda3) in enumerate(param_vals):
-        result[:, index] = evaluate_barycentric(
-            nodes, degree, lambda1, lambda2, lambda3
-        )[:, 0]
+    index = nodes.shape[1] - 1
+    result[:, :] = nodes[:, [index]]
+    for k in range(degree - 1, -1, -1):
+        # We want to go from (d C (k + 1)) to (d C k).
+        binom_val = (binom_val * (k + 1)) / (degree - k)
+        index -= 1  # Step to last element in column.
+        #     k = d - 1, d - 2, ...
+        # d - k =     1,     2, ...
+        # We know column k has (d - k + 1) elements.
+        new_index = index - degree + k  # First element in column.
+        col_nodes = nodes[:, new_index : index + 1]  # noqa: E203
+        col_nodes = np.asfortranarray(col_nodes)
+        result *= lambda3
+        result += binom_val * _py_curve_helpers.evaluate_multi_barycentric(
+            col_nodes, lambda1, lambda2
+        )
+        # Update index for next iteration.
+        index = new_index
     return result
 
 
@@ -2872,12 +2907,10 @@ def evaluate_cartesian_multi(nodes, degree, param_vals, dimension):
         underlying triangle.
     """
     num_vals, _ = param_vals.shape
-    result = np.empty((dimension, num_vals), order="F")
-    for index, (s, t) in enumerate(param_vals):
-        result[:, index] = evaluate_barycentric(
-            nodes, degree, 1.0 - s - t, s, t
-        )[:, 0]
-    return result
+    bary_vals = np.empty((num_vals, 3), order="F")
+    bary_vals[:, 0] = 1.0 - param_vals[:, 0] - param_vals[:, 1]
+    bary_vals[:, 1:] = param_vals
+    return evaluate_barycentric_multi(nodes, degree, bary_vals, dimension)
 
 
 def compute_edge_nodes(nodes, degree):
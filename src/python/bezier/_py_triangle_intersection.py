@@ -18,10 +18,12 @@ import itertools
 import numpy as np
 
 from bezier import _algebraic_intersection
+from bezier import _py_curve_helpers
 from bezier import _py_geometric_intersection
 from bezier import _py_helpers
 from bezier import _py_intersection_helpers
 from bezier import _py_triangle_helpers
+from bezier import _py_triangle_matrices
 
 
 MAX_LOCATE_SUBDIVISIONS = 20
@@ -43,6 +45,12 @@ BAD_SEGMENT_PARAMS = (
     "should be in [0, 1]."
 )
 SEGMENTS_SAME_EDGE = "Consecutive segments lie on the same edge."
+# NOTE: This matches the layout of the ``CurvedPolygonSegment`` struct
+#       used by ``triangle_intersection.f90``.
+SEGMENT_DTYPE = np.dtype(
+    [("start", np.double), ("end", np.double), ("edge_index", np.intc)],
+    align=True,
+)
 
 
 def newton_refine_solve(jac_both, x_val, triangle_x, y_val, triangle_y):
@@ -353,6 +361,178 @@ def locate_point(nodes, degree, x_val, y_val):
     return s, t
 
 
+def newton_refine_multi(nodes, degree, points, st_vals):
+    r"""Refine many solutions to :math:`B(s, t) = p` using Newton's method.
+
+    .. note::
+
+       This is used **only** as a helper for :func:`locate_point_multi`.
+
+    Takes one step of :func:`newton_refine` for each column of ``points``
+    (with the corresponding row of ``st_vals`` as the starting point) at
+    once.
+
+    Args:
+        nodes (numpy.ndarray): Array of nodes in a triangle.
+        degree (int): The degree of the triangle.
+        points (numpy.ndarray): The points to locate (as the columns of a
+            ``2 x N`` array).
+        st_vals (numpy.ndarray): Approximate :math:`s`- and
+            :math:`t`-values to be refined (as a ``N x 2`` array).
+
+    Returns:
+        numpy.ndarray: The refined :math:`s`- and :math:`t`-values (as a
+        ``N x 2`` array).
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    num_vals, _ = st_vals.shape
+    param_vals = np.empty((num_vals, 3), order="F")
+    param_vals[:, 0] = 1.0 - st_vals[:, 0] - st_vals[:, 1]
+    param_vals[:, 1:] = st_vals
+    triangle_vals = _py_triangle_helpers.evaluate_barycentric_multi(
+        nodes, degree, param_vals, 2
+    )
+    # NOTE: This function assumes ``dimension==2`` (i.e. since ``x, y``).
+    jac_nodes = _py_triangle_helpers.jacobian_both(nodes, degree, 2)
+    # The degree of the jacobian is one less.
+    jac_both = _py_triangle_helpers.evaluate_barycentric_multi(
+        jac_nodes, degree - 1, param_vals, 4
+    )
+    # Solve each 2 x 2 system as in ``newton_refine_solve()``.
+    a_val, b_val, c_val, d_val = jac_both
+    e_val, f_val = points - triangle_vals
+    # No refinement is needed for the points that are already solved.
+    solved = (e_val == 0.0) & (f_val == 0.0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        denom = a_val * d_val - b_val * c_val
+        delta_s = (d_val * e_val - c_val * f_val) / denom
+        delta_t = (a_val * f_val - b_val * e_val) / denom
+    result = st_vals.copy(order="F")
+    result[~solved, 0] += delta_s[~solved]
+    result[~solved, 1] += delta_t[~solved]
+    return result
+
+
+def locate_point_multi(nodes, degree, points):
+    r"""Locate multiple points on a triangle.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    Does the same subdivision as :func:`locate_point`, but for every
+    column of ``points`` at once. Each sub-triangle is shared by all of
+    the points whose bounding box checks have not yet rejected it, so the
+    subdivision tree is computed only once. After the sub-triangles are
+    sufficiently small, uses Newton's method (for all of the remaining
+    points at once) to narrow in on the pre-image of each point.
+
+    Args:
+        nodes (numpy.ndarray): Control points for B |eacute| zier triangle
+            (assumed to be two-dimensional).
+        degree (int): The degree of the triangle.
+        points (numpy.ndarray): The points to locate (as the columns of a
+            ``2 x N`` array).
+
+    Returns:
+        numpy.ndarray: The :math:`s` and :math:`t` values corresponding to
+        each point (as a ``N x 2`` array), with NaN for the points that
+        are not on the ``triangle``.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    _, num_points = points.shape
+    # NOTE: As in ``locate_point()``, we track triple the centroid (and
+    #       the signed width) of each sub-triangle. Each (sub-triangle,
+    #       point) candidate is stored as an index into the stacked
+    #       sub-triangles and an index into the columns of ``points``.
+    sub_nodes = nodes[np.newaxis, :, :]
+    centroids = np.ones((1, 2))
+    widths = np.ones(1)
+    triangle_index = np.zeros(num_points, dtype=int)
+    point_index = np.arange(num_points)
+    for _ in range(MAX_LOCATE_SUBDIVISIONS + 1):
+        lower = sub_nodes.min(axis=2)[triangle_index, :]
+        upper = sub_nodes.max(axis=2)[triangle_index, :]
+        candidate_points = points[:, point_index].T
+        contained = np.all(
+            (lower <= candidate_points) & (candidate_points <= upper), axis=1
+        )
+        # Only subdivide the sub-triangles that still contain some point.
+        kept, triangle_index = np.unique(
+            triangle_index[contained], return_inverse=True
+        )
+        point_index = point_index[contained]
+        sub_nodes = np.concatenate(
+            _py_triangle_matrices.subdivide_nodes_multi(
+                sub_nodes[kept], degree
+            )
+        )
+        width = widths[kept, np.newaxis]
+        half_width = 0.5 * width
+        centroids = np.concatenate(
+            [
+                centroids[kept] - half_width,
+                centroids[kept],
+                centroids[kept] + np.hstack([width, -half_width]),
+                centroids[kept] + np.hstack([-half_width, width]),
+            ]
+        )
+        widths = np.concatenate(
+            [half_width, -half_width, half_width, half_width]
+        ).ravel()
+        triangle_index = np.concatenate(
+            [triangle_index + offset * kept.size for offset in range(4)]
+        )
+        point_index = np.tile(point_index, 4)
+
+    # We take the average of all centroids from the candidates
+    # that may contain each point.
+    num_candidates = np.bincount(point_index, minlength=num_points)
+    found = num_candidates > 0
+    num_found = np.count_nonzero(found)
+    denom = 3.0 * num_candidates[found]
+    st_approx = np.empty((num_found, 2), order="F")
+    for column in (0, 1):
+        centroid_sum = np.bincount(
+            point_index,
+            weights=centroids[triangle_index, column],
+            minlength=num_points,
+        )
+        st_approx[:, column] = centroid_sum[found] / denom
+
+    found_points = points[:, found]
+    st_vals = newton_refine_multi(nodes, degree, found_points, st_approx)
+    # Check which solutions are "close enough" (as in ``vector_close()``)
+    # and do one more round of Newton's method for the rest.
+    param_vals = np.empty((num_found, 3), order="F")
+    param_vals[:, 0] = 1.0 - st_vals[:, 0] - st_vals[:, 1]
+    param_vals[:, 1:] = st_vals
+    actual = _py_triangle_helpers.evaluate_barycentric_multi(
+        nodes, degree, param_vals, 2
+    )
+    size_actual = np.linalg.norm(actual, ord=2, axis=0)
+    size_expected = np.linalg.norm(found_points, ord=2, axis=0)
+    upper_bound = LOCATE_EPS * np.minimum(size_actual, size_expected)
+    close = np.linalg.norm(actual - found_points, ord=2, axis=0) <= upper_bound
+    close[size_actual == 0.0] = size_expected[size_actual == 0.0] <= LOCATE_EPS
+    close[size_expected == 0.0] = (
+        size_actual[size_expected == 0.0] <= LOCATE_EPS
+    )
+    if not close.all():
+        st_vals[~close] = newton_refine_multi(
+            nodes, degree, found_points[:, ~close], st_vals[~close]
+        )
+
+    result = np.full((num_points, 2), np.nan, order="F")
+    result[found] = st_vals
+    return result
+
+
 def same_intersection(intersection1, intersection2, wiggle=0.5 ** 40):
     """Check if two intersections are close to machine precision.
 
@@ -837,6 +1017,191 @@ def geometric_intersect(nodes1, degree1, nodes2, degree2, verify):
     )
 
 
+def geometric_intersect_pairs(nodes1, degree1, nodes2, degree2, pairs):
+    r"""Find all intersections among many pairs of triangles.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    Each pair is intersected via :func:`geometric_intersect`. Rather than
+    "edge info" lists, the curved polygons for all pairs are returned as a
+    single table of segments. A pair that fails is recorded (with no
+    curved polygons) rather than stopping the batch.
+
+    Args:
+        nodes1 (numpy.ndarray): The stacked nodes of the first set of
+            triangles, as a ``T1 x 2 x N1`` array (the first index is the
+            triangle).
+        degree1 (int): The degree of each triangle in ``nodes1``.
+        nodes2 (numpy.ndarray): The stacked nodes of the second set of
+            triangles.
+        degree2 (int): The degree of each triangle in ``nodes2``.
+        pairs (numpy.ndarray): The pairs to intersect, as a ``P x 2``
+            array of indices of a triangle in ``nodes1`` and a triangle in
+            ``nodes2``.
+
+    Returns:
+        tuple: 5-tuple of
+
+        * The offsets of the curved polygons of each pair (as a 1D array
+          with ``P + 1`` entries), i.e. the curved polygons of pair ``j``
+          are ``pair_offsets[j]:pair_offsets[j + 1]``.
+        * The offsets of the segments of each curved polygon (as a 1D
+          array with ``Q + 1`` entries).
+        * The segments of every curved polygon (as a 1D array of
+          :data:`SEGMENT_DTYPE`). The ``edge_index`` is in ``0, ..., 5``,
+          with the edges of the second triangle following those of the
+          first (see :func:`ends_to_curve`).
+        * The :class:`TriangleContained` value for each pair (as a 1D
+          array).
+        * The pairs that failed, as a list of ``(j, exception)`` pairs.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    num_pairs, _ = pairs.shape
+    pair_offsets = np.zeros((num_pairs + 1,), dtype=np.intc)
+    contained = np.zeros((num_pairs,), dtype=np.intc)
+    segment_ends = [0]
+    all_segments = []
+    errors = []
+    for index in range(num_pairs):
+        first, second = pairs[index, :]
+        try:
+            edge_infos, is_contained, _ = geometric_intersect(
+                np.asfortranarray(nodes1[first, :, :]),
+                degree1,
+                np.asfortranarray(nodes2[second, :, :]),
+                degree2,
+                True,
+            )
+        except (ValueError, NotImplementedError, RuntimeError) as exc:
+            errors.append((index, exc))
+            edge_infos = []
+            is_contained = None
+        if is_contained is None:
+            for edge_info in edge_infos:
+                all_segments.extend(
+                    (start, end, edge_index)
+                    for edge_index, start, end in edge_info
+                )
+                segment_ends.append(len(all_segments))
+        elif is_contained:
+            contained[index] = TriangleContained.FIRST
+        else:
+            contained[index] = TriangleContained.SECOND
+        pair_offsets[index + 1] = len(segment_ends) - 1
+
+    polygon_offsets = np.array(segment_ends, dtype=np.intc)
+    segments = np.array(all_segments, dtype=SEGMENT_DTYPE)
+    return pair_offsets, polygon_offsets, segments, contained, errors
+
+
+def intersection_areas(  # pylint: disable=too-many-arguments
+    nodes1,
+    degree1,
+    nodes2,
+    degree2,
+    pairs,
+    pair_offsets,
+    polygon_offsets,
+    segments,
+    contained,
+):
+    r"""Compute the areas of intersections from a table of segments.
+
+    .. note::
+
+       There is also a Fortran implementation of this function, which
+       will be used if it can be built.
+
+    The inputs are those of :func:`geometric_intersect_pairs` and its
+    outputs. Each segment is specialized from the edge of the triangle it
+    belongs to and its contribution to the area (via Green's theorem, see
+    :func:`.shoelace_for_area`) is added to the area of its curved
+    polygon, so no :class:`.Curve` or :class:`.CurvedPolygon` objects are
+    created.
+
+    Args:
+        nodes1 (numpy.ndarray): The stacked nodes of the first set of
+            triangles, as a ``T1 x 2 x N1`` array.
+        degree1 (int): The degree of each triangle in ``nodes1``.
+        nodes2 (numpy.ndarray): The stacked nodes of the second set of
+            triangles.
+        degree2 (int): The degree of each triangle in ``nodes2``.
+        pairs (numpy.ndarray): The intersected pairs, as a ``P x 2`` array.
+        pair_offsets (numpy.ndarray): The offsets of the curved polygons of
+            each pair.
+        polygon_offsets (numpy.ndarray): The offsets of the segments of
+            each curved polygon.
+        segments (numpy.ndarray): The segments of every curved polygon.
+        contained (numpy.ndarray): The :class:`TriangleContained` value for
+            each pair.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The area of each curved polygon (as a 1D array with ``Q``
+          entries).
+        * The area of the intersection of each pair (as a 1D array with
+          ``P`` entries). For a pair where one triangle contains the other,
+          this is the area of the contained triangle.
+
+    Raises:
+        .UnsupportedDegree: If either degree is not 1, 2, 3 or 4.
+    """
+    # NOTE: There is no corresponding "enable", but the disable only applies
+    #       in this lexical scope.
+    # pylint: disable=too-many-locals
+    max_degree = max(degree1, degree2)
+    if max_degree > 4:
+        raise _py_helpers.UnsupportedDegree(max_degree, supported=(1, 2, 3, 4))
+
+    num_pairs, _ = pairs.shape
+    pair_areas = np.zeros((num_pairs,))
+    polygon_areas = np.zeros((polygon_offsets.size - 1,))
+    for index in range(num_pairs):
+        begin = pair_offsets[index]
+        end = pair_offsets[index + 1]
+        if contained[index] == TriangleContained.NEITHER and begin == end:
+            continue
+
+        first, second = pairs[index, :]
+        all_edge_nodes = _py_triangle_helpers.compute_edge_nodes(
+            np.asfortranarray(nodes1[first, :, :]), degree1
+        ) + _py_triangle_helpers.compute_edge_nodes(
+            np.asfortranarray(nodes2[second, :, :]), degree2
+        )
+        if contained[index] == TriangleContained.FIRST:
+            pair_areas[index] = _py_triangle_helpers.compute_area(
+                all_edge_nodes[:3]
+            )
+            continue
+
+        if contained[index] == TriangleContained.SECOND:
+            pair_areas[index] = _py_triangle_helpers.compute_area(
+                all_edge_nodes[3:]
+            )
+            continue
+
+        for polygon in range(begin, end):
+            area = 0.0
+            for segment_index in range(
+                polygon_offsets[polygon], polygon_offsets[polygon + 1]
+            ):
+                start, end_param, edge_index = segments[segment_index]
+                edge_nodes = _py_curve_helpers.specialize_curve(
+                    all_edge_nodes[edge_index], start, end_param
+                )
+                area += _py_triangle_helpers.shoelace_for_area(edge_nodes)
+            polygon_areas[polygon] = area
+            pair_areas[index] += area
+
+    return polygon_areas, pair_areas
+
+
 def algebraic_intersect(nodes1, degree1, nodes2, degree2, verify):
     r"""Find all intersections among edges of two triangles.
 
@@ -868,3 +1233,20 @@ def algebraic_intersect(nodes1, degree1, nodes2, degree2, verify):
     return generic_intersect(
         nodes1, degree1, nodes2, degree2, verify, all_intersections
     )
+
+
+class TriangleContained:  # pylint: disable=too-few-public-methods
+    """Enum representing if one triangle contains another.
+
+    .. note::
+
+       This class would be more "correct" as an ``enum.Enum``, but we keep
+       the values integers to make interfacing with Fortran easier.
+    """
+
+    NEITHER = 0
+    """Neither triangle is contained in the other."""
+    FIRST = 1
+    """The first triangle is contained in the second."""
+    SECOND = 2
+    """The second triangle is contained in the first."""
@@ -0,0 +1,157 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Pure Python helpers that apply linear maps to triangle nodes.
+
+Many transformations of a B |eacute| zier triangle (e.g. subdivision) are
+linear functions of its nodes. The helpers here apply those maps as matrix
+products, to a single triangle or to a stack of triangles at once.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+"""
+
+import functools
+
+import numpy as np
+
+from bezier import _py_triangle_helpers
+
+
+_MATRIX_CACHE_SIZE = 32
+
+
+def subdivide_nodes_multi(nodes, degree):
+    """Subdivide each triangle in a batch into four sub-triangles.
+
+    All triangles in the batch must have the same degree and dimension, so
+    that the nodes can be stacked into a single ``C x D x N`` array (the
+    first index is the triangle). Each sub-triangle is a linear function of
+    the nodes, so this applies the matrices used in
+    :func:`.subdivide_nodes` to every triangle at once.
+
+    Args:
+        nodes (numpy.ndarray): The stacked control points of the triangles,
+            as a ``C x D x N`` array.
+        degree (int): The degree of each triangle.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: The
+        stacked nodes for the four sub-triangles (each a ``C x D x N``
+        array).
+    """
+    return tuple(
+        np.matmul(nodes, matrix)
+        for matrix in _py_triangle_helpers.subdivision_matrices(degree)
+    )
+
+
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE)
+def level_subdivision_matrices(degree, levels):
+    """Make the matrices used to subdivide a triangle several times.
+
+    Subdividing ``levels`` times splits the reference triangle into
+    :math:`P = 4^k` sub-triangles (where :math:`k` is ``levels``). The
+    nodes of each sub-triangle are a linear function of the nodes of the
+    triangle, so the matrices are found by repeatedly subdividing the
+    "identity" triangle. They are memoized (in a bounded cache) for each
+    degree and number of levels.
+
+    Args:
+        degree (int): The degree of the triangle.
+        levels (int): The number of times to subdivide.
+
+    Returns:
+        numpy.ndarray: The (read-only) ``P x N x N`` stack of matrices, one
+        for each sub-triangle. The sub-triangles are ordered as in
+        :func:`.subdivide_nodes`, recursively (i.e. the first four come from
+        subdividing the first sub-triangle of the first level).
+    """
+    num_nodes = ((degree + 1) * (degree + 2)) // 2
+    matrices = np.eye(num_nodes, order="F")[np.newaxis, :, :]
+    for _ in range(levels):
+        sub_matrices = subdivide_nodes_multi(matrices, degree)
+        matrices = np.stack(sub_matrices, axis=1).reshape(
+            (-1, num_nodes, num_nodes)
+        )
+    matrices.flags.writeable = False
+    return matrices
+
+
+def subdivide_nodes_levels(nodes, degree, levels):
+    """Subdivide a triangle into :math:`P = 4^k` sub-triangles in one pass.
+
+    This is equivalent to calling :func:`.subdivide_nodes` ``levels``
+    times on every piece, but applies the cached matrices from
+    :func:`level_subdivision_matrices` in a single (stacked) matrix product.
+
+    Args:
+        nodes (numpy.ndarray): The nodes defining a B |eacute| zier triangle.
+        degree (int): The degree of the triangle.
+        levels (int): The number of times to subdivide.
+
+    Returns:
+        numpy.ndarray: The stacked nodes of the sub-triangles, as a
+        ``P x D x N`` array.
+    """
+    matrices = level_subdivision_matrices(degree, levels)
+    return np.matmul(nodes, matrices)
+
+
+@functools.lru_cache(maxsize=_MATRIX_CACHE_SIZE)
+def elevation_matrix(degree):
+    """Make the (scaled) matrix used to elevate a triangle.
+
+    Maps the node with index triple :math:`(i, j, k)` onto
+    :math:`(i + 1, j, k)`, :math:`(i, j + 1, k)` and
+    :math:`(i, j, k + 1)` with weights :math:`i + 1`, :math:`j + 1` and
+    :math:`k + 1`. The entries are integers, so the product with this
+    matrix must be divided by :math:`d + 1` to elevate.
+
+    Args:
+        degree (int): The degree of the triangle.
+
+    Returns:
+        numpy.ndarray: The (read-only) ``N x N'`` elevation matrix, where
+        :math:`N'` is the number of nodes in a degree :math:`d + 1`
+        triangle.
+    """
+    num_nodes = ((degree + 1) * (degree + 2)) // 2
+    # (d + 1)(d + 2)/2 --> (d + 2)(d + 3)/2
+    num_new = num_nodes + degree + 2
+    matrix = np.zeros((num_nodes, num_new), order="F")
+    # NOTE: We start from the index triples (i, j, k) for the current
+    #       nodes and map them onto (i + 1, j, k), etc. This index
+    #       tracking is also done in :func:`.de_casteljau_one_round`.
+    index = 0
+    # parent_i1 = index + k
+    # parent_i2 = index + k + 1
+    # parent_i3 = index + degree + 2
+    parent_i1 = 0
+    parent_i2 = 1
+    parent_i3 = degree + 2
+    for k in range(degree + 1):
+        for j in range(degree + 1 - k):
+            i = degree - j - k
+            matrix[index, parent_i1] += i + 1
+            matrix[index, parent_i2] += j + 1
+            matrix[index, parent_i3] += k + 1
+            # Update all the indices.
+            parent_i1 += 1
+            parent_i2 += 1
+            parent_i3 += 1
+            index += 1
+        # Update the indices that depend on k.
+        parent_i1 += 1
+        parent_i2 += 1
+    matrix.flags.writeable = False
+    return matrix
@@ -26,8 +26,24 @@ These are grouped in a **single** ``.pyx`` file to avoid unintended
 programming errors caused by sharing the **same** object file across
 multiple Cython-generated modules. (This is problematic if the object
 files **expect** to share some global state.)
+
+Wrappers release the GIL while the Fortran code runs, as long as the
+Fortran code only touches memory passed in by the caller. The exceptions,
+which hold the GIL throughout, are:
+
+- ``triangle_intersections()`` and ``triangle_intersections_pairs()`` (and
+  the ``triangle_workspace_sizes()`` / ``reset_triangle_workspaces()`` /
+  ``free_*_workspace()`` helpers), which
+  use long-lived module-level workspaces in the Fortran library and so are
+  **not** reentrant
+- the first call to ``compute_length()``, since QUADPACK lazily initializes
+  (``SAVE``-d) machine constants; later calls release the GIL
+- scalar helpers (``cross_product()``, ``wiggle_interval()``,
+  ``vector_close()``, ``in_interval()``) whose Fortran calls are cheaper
+  than releasing and re-acquiring the GIL
 """
 
+import threading
 import warnings
 
 from libc.stdlib cimport free
@@ -51,7 +67,15 @@ from bezier._triangle_intersection cimport TriangleContained
 cdef double EPS = 0.5**40
 cdef double LOCATE_MISS = -1.0
 cdef double LOCATE_INVALID = -2.0
-cdef double[::1, :] CURVES_WORKSPACE = np.empty((2, 2), order="F")
+# NOTE: QUADPACK (via ``d1mach``) initializes machine constants on its first
+#       call, so the first ``compute_length()`` call must hold the GIL.
+cdef bint QUADPACK_INITIALIZED = False
+# NOTE: Each thread gets its own curve-curve intersection workspace, so that
+#       ``curve_intersections()`` is safe to call from multiple threads.
+CURVES_WORKSPACES = threading.local()
+# NOTE: The number of vertices from ``flatten_curve()`` can't be known
+#       beforehand, so this is the initial guess (per curve).
+cdef int FLATTEN_START_SIZE = 64
 cdef int[::1] SEGMENT_ENDS_WORKSPACE = np.empty(3, dtype=np.intc)
 cdef dtype_t SEGMENT_DTYPE = np.dtype(
     [
@@ -63,6 +87,12 @@ cdef dtype_t SEGMENT_DTYPE = np.dtype(
 )
 cdef CurvedPolygonSegment[::1] SEGMENTS_WORKSPACE = np.empty(
     6, dtype=SEGMENT_DTYPE)
+cdef TriangleContained NEITHER_CONTAINED = (
+    bezier._triangle_intersection.TriangleContained.NEITHER)
+cdef TriangleContained FIRST_CONTAINED = (
+    bezier._triangle_intersection.TriangleContained.FIRST)
+cdef TriangleContained SECOND_CONTAINED = (
+    bezier._triangle_intersection.TriangleContained.SECOND)
 
 DQAGSE_ERR_MSGS = (
     "Maximum number of subdivisions allowed has been achieved.",
@@ -92,6 +122,14 @@ SEGMENTS_TOO_SMALL = (
 SUBDIVISION_NO_CONVERGE = (
     "Curve intersection failed to converge to approximately linear "
     "subdivisions after 20 iterations.")
+# NOTE: The ``CLIPPING_NO_CONVERGE`` error message is copied from
+#       ``_clipping.py::_NO_CONVERGE_TEMPLATE``. This assumes, but does not
+#       verify, that the Fortran subroutine
+#       ``curve_intersection.f90::all_intersections_clipping_abi()`` uses
+#       ``MAX_CLIP_ITERATIONS = 100``.
+CLIPPING_NO_CONVERGE = (
+    "Curve intersection failed to converge to a point via clipping "
+    "after 100 iterations.")
 # NOTE: The ``NEWTON_NO_CONVERGE`` error message is copied from
 #       ``_py_intersection_helpers.py::NEWTON_NO_CONVERGE``.
 NEWTON_NO_CONVERGE = """\
@@ -121,82 +159,114 @@ The failure to converge may have been caused by one of:
 ##########################
 
 def evaluate_multi_barycentric(
-        double[::1, :] nodes, double[::1] lambda1, double[::1] lambda2):
+        const double[::1, :] nodes, const double[::1] lambda1,
+        const double[::1] lambda2):
     cdef int num_nodes, dimension, num_vals
     cdef ndarray_t[double, ndim=2, mode="fortran"] evaluated
 
     dimension, num_nodes = np.shape(nodes)
     num_vals, = np.shape(lambda1)
     evaluated = np.empty((dimension, num_vals), order="F")
-    bezier._curve.evaluate_curve_barycentric(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &num_vals,
-        &lambda1[0],
-        &lambda2[0],
-        &evaluated[0, 0],
-    )
+    with nogil:
+        bezier._curve.evaluate_curve_barycentric(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &num_vals,
+            &lambda1[0],
+            &lambda2[0],
+            &evaluated[0, 0],
+        )
     return evaluated
 
 
 def evaluate_multi(
-        double[::1, :] nodes, double[::1] s_vals):
+        const double[::1, :] nodes, const double[::1] s_vals):
     cdef int num_nodes, dimension, num_vals
     cdef ndarray_t[double, ndim=2, mode="fortran"] evaluated
 
     dimension, num_nodes = np.shape(nodes)
     num_vals, = np.shape(s_vals)
     evaluated = np.empty((dimension, num_vals), order="F")
-    bezier._curve.evaluate_multi(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &num_vals,
-        &s_vals[0],
-        &evaluated[0, 0],
-    )
+    with nogil:
+        bezier._curve.evaluate_multi(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &num_vals,
+            &s_vals[0],
+            &evaluated[0, 0],
+        )
     return evaluated
 
 
-def specialize_curve(double[::1, :] nodes, double start, double end):
+def evaluate_curves_multi(nodes, const double[::1] s_vals):
+    cdef int num_curves, num_nodes, dimension, num_vals
+    cdef const double[::1, :, :] nodes_view
+    cdef ndarray_t[double, ndim=3, mode="fortran"] evaluated
+
+    num_curves, dimension, num_nodes = np.shape(nodes)
+    num_vals, = np.shape(s_vals)
+    evaluated = np.empty((num_curves, dimension, num_vals), order="F")
+    if num_curves == 0:
+        # NOTE: An empty stack of nodes is rejected as a (Fortran)
+        #       contiguous memoryview, but there is nothing to evaluate.
+        return evaluated
+
+    nodes_view = nodes
+    with nogil:
+        bezier._curve.evaluate_curves_multi(
+            &num_curves,
+            &num_nodes,
+            &dimension,
+            &nodes_view[0, 0, 0],
+            &num_vals,
+            &s_vals[0],
+            &evaluated[0, 0, 0],
+        )
+    return evaluated
+
+
+def specialize_curve(const double[::1, :] nodes, double start, double end):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] new_nodes
 
     dimension, num_nodes = np.shape(nodes)
     new_nodes = np.empty((dimension, num_nodes), order="F")
 
-    bezier._curve.specialize_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &start,
-        &end,
-        &new_nodes[0, 0],
-    )
+    with nogil:
+        bezier._curve.specialize_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &start,
+            &end,
+            &new_nodes[0, 0],
+        )
 
     return new_nodes
 
 
-def evaluate_hodograph(double s, double[::1, :] nodes):
+def evaluate_hodograph(double s, const double[::1, :] nodes):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] hodograph
 
     dimension, num_nodes = np.shape(nodes)
     hodograph = np.empty((dimension, 1), order="F")
 
-    bezier._curve.evaluate_hodograph(
-        &s,
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &hodograph[0, 0],
-    )
+    with nogil:
+        bezier._curve.evaluate_hodograph(
+            &s,
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &hodograph[0, 0],
+        )
 
     return hodograph
 
 
-def subdivide_nodes_curve(double[::1, :] nodes):
+def subdivide_nodes_curve(const double[::1, :] nodes):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] left_nodes, right_nodes
 
@@ -205,51 +275,54 @@ def subdivide_nodes_curve(double[::1, :] nodes):
     left_nodes = np.empty((dimension, num_nodes), order="F")
     right_nodes = np.empty((dimension, num_nodes), order="F")
 
-    bezier._curve.subdivide_nodes_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &left_nodes[0, 0],
-        &right_nodes[0, 0],
-    )
+    with nogil:
+        bezier._curve.subdivide_nodes_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &left_nodes[0, 0],
+            &right_nodes[0, 0],
+        )
 
     return left_nodes, right_nodes
 
 
 def newton_refine_curve(
-        double[::1, :] nodes, double[::1, :] point, double s):
+        const double[::1, :] nodes, const double[::1, :] point, double s):
     cdef int num_nodes, dimension
     cdef double updated_s
 
     dimension, num_nodes = np.shape(nodes)
     # NOTE: We don't check that ``np.shape(point) == (dimension, 1)``.
 
-    bezier._curve.newton_refine_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &point[0, 0],
-        &s,
-        &updated_s,
-    )
+    with nogil:
+        bezier._curve.newton_refine_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &point[0, 0],
+            &s,
+            &updated_s,
+        )
 
     return updated_s
 
 
-def locate_point_curve(double[::1, :] nodes, double[::1, :] point):
+def locate_point_curve(const double[::1, :] nodes, const double[::1, :] point):
     cdef int num_nodes, dimension
     cdef double s_approx
 
     dimension, num_nodes = np.shape(nodes)
     # NOTE: We don't check that ``np.shape(point) == (dimension, 1)``.
 
-    bezier._curve.locate_point_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &point[0, 0],
-        &s_approx,
-    )
+    with nogil:
+        bezier._curve.locate_point_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &point[0, 0],
+            &s_approx,
+        )
 
     if s_approx == LOCATE_MISS:
         return None
@@ -260,24 +333,55 @@ def locate_point_curve(double[::1, :] nodes, double[::1, :] point):
         return s_approx
 
 
-def elevate_nodes(double[::1, :] nodes):
+def locate_point_curve_multi(
+        const double[::1, :] nodes, const double[::1, :] points):
+    cdef int num_nodes, dimension, num_points
+    cdef ndarray_t[double, ndim=1, mode="fortran"] s_approx
+
+    dimension, num_nodes = np.shape(nodes)
+    # NOTE: We don't check that ``np.shape(points)[0] == dimension``.
+    _, num_points = np.shape(points)
+    s_approx = np.empty(num_points, order="F")
+
+    with nogil:
+        bezier._curve.locate_point_curve_multi(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &num_points,
+            &points[0, 0],
+            &s_approx[0],
+        )
+
+    if np.any(s_approx == LOCATE_INVALID):
+        raise ValueError(
+            "Parameters not close enough to one another")
+
+    s_approx[s_approx == LOCATE_MISS] = np.nan
+    return s_approx
+
+
+def elevate_nodes(const double[::1, :] nodes):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] elevated
 
     dimension, num_nodes = np.shape(nodes)
     elevated = np.empty((dimension, num_nodes + 1), order="F")
 
-    bezier._curve.elevate_nodes_curve(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &elevated[0, 0],
-    )
+    with nogil:
+        bezier._curve.elevate_nodes_curve(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &elevated[0, 0],
+        )
 
     return elevated
 
 
-def get_curvature(double[::1, :] nodes, double[::1, :] tangent_vec, double s):
+def get_curvature(
+        const double[::1, :] nodes, const double[::1, :] tangent_vec,
+        double s):
     cdef int num_nodes
     cdef double curvature
 
@@ -285,18 +389,19 @@ def get_curvature(double[::1, :] nodes, double[::1, :] tangent_vec, double s):
     _, num_nodes = np.shape(nodes)
     # NOTE: We don't check that ``np.shape(tangent_vec) == (2, 1)``.
 
-    bezier._curve.get_curvature(
-        &num_nodes,
-        &nodes[0, 0],
-        &tangent_vec[0, 0],
-        &s,
-        &curvature,
-    )
+    with nogil:
+        bezier._curve.get_curvature(
+            &num_nodes,
+            &nodes[0, 0],
+            &tangent_vec[0, 0],
+            &s,
+            &curvature,
+        )
 
     return curvature
 
 
-def reduce_pseudo_inverse(double[::1, :] nodes):
+def reduce_pseudo_inverse(const double[::1, :] nodes):
     cdef int num_nodes, dimension
     cdef bool_t not_implemented
     cdef ndarray_t[double, ndim=2, mode="fortran"] reduced
@@ -305,13 +410,14 @@ def reduce_pseudo_inverse(double[::1, :] nodes):
 
     reduced = np.empty((dimension, num_nodes - 1), order="F")
 
-    bezier._curve.reduce_pseudo_inverse(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &reduced[0, 0],
-        &not_implemented,
-    )
+    with nogil:
+        bezier._curve.reduce_pseudo_inverse(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &reduced[0, 0],
+            &not_implemented,
+        )
 
     if not_implemented:
         # NOTE: This import at runtime is expensive, but we don't mind it
@@ -322,7 +428,7 @@ def reduce_pseudo_inverse(double[::1, :] nodes):
     return reduced
 
 
-def full_reduce(double[::1, :] nodes):
+def full_reduce(const double[::1, :] nodes):
     cdef int num_nodes, dimension
     cdef int num_reduced_nodes
     cdef ndarray_t[double, ndim=2, mode="fortran"] reduced
@@ -331,14 +437,15 @@ def full_reduce(double[::1, :] nodes):
     dimension, num_nodes = np.shape(nodes)
     reduced = np.empty((dimension, num_nodes), order="F")
 
-    bezier._curve.full_reduce(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &num_reduced_nodes,
-        &reduced[0, 0],
-        &not_implemented,
-    )
+    with nogil:
+        bezier._curve.full_reduce(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &num_reduced_nodes,
+            &reduced[0, 0],
+            &not_implemented,
+        )
 
     if not_implemented:
         # NOTE: This import at runtime is expensive, but we don't mind it
@@ -355,20 +462,32 @@ def full_reduce(double[::1, :] nodes):
         return reduced[:, :num_reduced_nodes]
 
 
-def compute_length(double[::1, :] nodes):
+def compute_length(const double[::1, :] nodes):
+    global QUADPACK_INITIALIZED
     cdef int num_nodes, dimension
     cdef double length
     cdef int error_val
 
     dimension, num_nodes = np.shape(nodes)
 
-    bezier._curve.compute_length(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &length,
-        &error_val,
-    )
+    if QUADPACK_INITIALIZED:
+        with nogil:
+            bezier._curve.compute_length(
+                &num_nodes,
+                &dimension,
+                &nodes[0, 0],
+                &length,
+                &error_val,
+            )
+    else:
+        bezier._curve.compute_length(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &length,
+            &error_val,
+        )
+        QUADPACK_INITIALIZED = True
 
     if error_val == 6:
         err_msg = DQAGSE_ERR_MSGS[5]
@@ -384,12 +503,68 @@ def compute_length(double[::1, :] nodes):
 
     return length
 
+
+def compute_length_multi(nodes, double rtol):
+    global QUADPACK_INITIALIZED
+    cdef int num_curves, num_nodes, dimension
+    cdef const double[::1, :, :] nodes_view
+    cdef ndarray_t[double, ndim=1, mode="fortran"] lengths
+    cdef int error_val
+
+    num_curves, dimension, num_nodes = np.shape(nodes)
+    lengths = np.empty((num_curves,), order="F")
+    if num_curves == 0:
+        # NOTE: An empty stack of nodes is rejected as a (Fortran)
+        #       contiguous memoryview, but there is nothing to compute.
+        return lengths
+    if num_nodes == 0:
+        raise ValueError("Curve should have at least one node.")
+
+    nodes_view = nodes
+    if QUADPACK_INITIALIZED:
+        with nogil:
+            bezier._curve.compute_length_multi(
+                &num_curves,
+                &num_nodes,
+                &dimension,
+                &nodes_view[0, 0, 0],
+                &rtol,
+                &lengths[0],
+                &error_val,
+            )
+    else:
+        bezier._curve.compute_length_multi(
+            &num_curves,
+            &num_nodes,
+            &dimension,
+            &nodes_view[0, 0, 0],
+            &rtol,
+            &lengths[0],
+            &error_val,
+        )
+        QUADPACK_INITIALIZED = True
+
+    if error_val == 6:
+        err_msg = DQAGSE_ERR_MSGS[5]
+        raise ValueError(err_msg)
+    elif error_val == -1:
+        raise ValueError("Curve should have at least one node.")
+    elif error_val != 0:
+        if 0 <= error_val - 1 < len(DQAGSE_ERR_MSGS):
+            err_msg = DQAGSE_ERR_MSGS[error_val - 1]
+        else:
+            err_msg = "Unknown error: {!r}.".format(error_val)
+        warnings.warn(err_msg, UserWarning)
+
+    return lengths
+
 #######################################
 # Section: ``curve_intersection.f90`` #
 #######################################
 
 def newton_refine_curve_intersect(
-        double s, double[::1, :] nodes1, double t, double[::1, :] nodes2):
+        double s, const double[::1, :] nodes1, double t,
+        const double[::1, :] nodes2):
     cdef int num_nodes1, num_nodes2
     cdef double new_s, new_t
     cdef bezier._status.Status status
@@ -399,17 +574,18 @@ def newton_refine_curve_intersect(
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes2 = np.shape(nodes2)
 
-    bezier._curve_intersection.newton_refine_curve_intersect(
-        &s,
-        &num_nodes1,
-        &nodes1[0, 0],
-        &t,
-        &num_nodes2,
-        &nodes2[0, 0],
-        &new_s,
-        &new_t,
-        &status,
-    )
+    with nogil:
+        bezier._curve_intersection.newton_refine_curve_intersect(
+            &s,
+            &num_nodes1,
+            &nodes1[0, 0],
+            &t,
+            &num_nodes2,
+            &nodes2[0, 0],
+            &new_s,
+            &new_t,
+            &status,
+        )
 
     if status == bezier._status.Status.SINGULAR:
         raise ValueError("Jacobian is singular.")
@@ -417,7 +593,7 @@ def newton_refine_curve_intersect(
     return new_s, new_t
 
 
-def bbox_intersect(double[::1, :] nodes1, double[::1, :] nodes2):
+def bbox_intersect(const double[::1, :] nodes1, const double[::1, :] nodes2):
     cdef int num_nodes1, num_nodes2
     cdef BoxIntersectionType enum_val
 
@@ -426,70 +602,266 @@ def bbox_intersect(double[::1, :] nodes1, double[::1, :] nodes2):
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes2 = np.shape(nodes2)
 
-    bezier._curve_intersection.bbox_intersect(
-        &num_nodes1,
-        &nodes1[0, 0],
-        &num_nodes2,
-        &nodes2[0, 0],
-        &enum_val,
-    )
+    with nogil:
+        bezier._curve_intersection.bbox_intersect(
+            &num_nodes1,
+            &nodes1[0, 0],
+            &num_nodes2,
+            &nodes2[0, 0],
+            &enum_val,
+        )
 
     return enum_val
 
 
+cdef class IntersectionWorkspace:
+    """Workspace for curve-curve intersection.
+
+    Owns both the storage for the computed intersections and the
+    (Fortran-allocated) storage for the candidate pairs used during
+    subdivision. Sharing a single workspace between concurrent calls to
+    :func:`curve_intersections` is **not** safe; each thread should use its
+    own (the default workspace is thread-local).
+
+    Args:
+        size (Optional[int]): The number of intersections the workspace can
+            initially hold. Defaults to 2.
+    """
+
+    cdef void* _workspace
+    cdef double[::1, :] _intersections
+
+    def __cinit__(self, int size=2):
+        bezier._curve_intersection.new_intersection_workspace(
+            &self._workspace)
+        self._intersections = np.empty((2, size), order="F")
+
+    def __dealloc__(self):
+        if self._workspace != NULL:
+            bezier._curve_intersection.free_intersection_workspace(
+                &self._workspace)
+            self._workspace = NULL
+
+    @property
+    def size(self):
+        """int: The number of intersections the workspace can hold."""
+        return self._intersections.shape[1]
+
+    def resize(self, int size):
+        """Re-allocate the workspace to hold ``size`` intersections.
+
+        Args:
+            size (int): The number of intersections to hold.
+        """
+        self._intersections = np.empty((2, size), order="F")
+
+
+def _thread_curves_workspace():
+    try:
+        return CURVES_WORKSPACES.workspace
+    except AttributeError:
+        workspace = IntersectionWorkspace()
+        CURVES_WORKSPACES.workspace = workspace
+        return workspace
+
+
 def reset_curves_workspace(int workspace_size):
-    global CURVES_WORKSPACE
-    CURVES_WORKSPACE = np.empty((2, workspace_size), order="F")
+    _thread_curves_workspace().resize(workspace_size)
 
 
 def curves_workspace_size():
-    global CURVES_WORKSPACE
-    cdef int intersections_size
-
-    # NOTE: We don't check that there are 2 rows.
-    _, intersections_size = np.shape(CURVES_WORKSPACE)
-    return intersections_size
+    return _thread_curves_workspace().size
 
 
 def curve_intersections(
-        double[::1, :] nodes_first, double[::1, :] nodes_second,
-        bint allow_resize=True):
-    global CURVES_WORKSPACE
+        const double[::1, :] nodes_first, const double[::1, :] nodes_second,
+        bint allow_resize=True, IntersectionWorkspace workspace=None):
     cdef int num_nodes_first, num_nodes_second
     cdef int intersections_size, num_intersections
     cdef bezier._status.Status status
     cdef ndarray_t[double, ndim=2, mode="fortran"] intersections
     cdef bool_t coincident
 
+    if workspace is None:
+        workspace = _thread_curves_workspace()
+
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes_first = np.shape(nodes_first)
     _, num_nodes_second = np.shape(nodes_second)
-    # NOTE: We don't check that there are 2 rows.
-    _, intersections_size = np.shape(CURVES_WORKSPACE)
-
-    bezier._curve_intersection.curve_intersections(
-        &num_nodes_first,
-        &nodes_first[0, 0],
-        &num_nodes_second,
-        &nodes_second[0, 0],
-        &intersections_size,
-        &CURVES_WORKSPACE[0, 0],
-        &num_intersections,
-        &coincident,
-        &status,
+    intersections_size = workspace.size
+
+    # NOTE: The Fortran subroutine only touches memory owned by the
+    #       arguments and ``workspace``, so other threads can run.
+    with nogil:
+        bezier._curve_intersection.curve_intersections_workspace(
+            &workspace._workspace,
+            &num_nodes_first,
+            &nodes_first[0, 0],
+            &num_nodes_second,
+            &nodes_second[0, 0],
+            &intersections_size,
+            &workspace._intersections[0, 0],
+            &num_intersections,
+            &coincident,
+            &status,
+        )
+
+    if status == bezier._status.Status.SUCCESS:
+        intersections = np.empty((2, num_intersections), order="F")
+        intersections[:, :] = workspace._intersections[:, :num_intersections]
+        return intersections, coincident
+    elif (
+            status == bezier._status.Status.INSUFFICIENT_SPACE
+            and allow_resize):
+        workspace.resize(num_intersections)
+        return curve_intersections(
+            nodes_first, nodes_second, allow_resize=False,
+            workspace=workspace)
+    else:
+        raise _curve_intersections_error(
+            status, num_intersections, intersections_size)
+
+
+cdef object _curve_intersections_error(
+        bezier._status.Status status, int num_intersections,
+        int intersections_size):
+    if status == bezier._status.Status.NO_CONVERGE:
+        return ValueError(SUBDIVISION_NO_CONVERGE)
+    elif status == bezier._status.Status.INSUFFICIENT_SPACE:
+        msg = TOO_SMALL_TEMPLATE.format(num_intersections, intersections_size)
+        return ValueError(msg)
+    elif status == bezier._status.Status.BAD_MULTIPLICITY:
+        return NotImplementedError(NEWTON_NO_CONVERGE)
+    else:
+        # NOTE: If ``status`` isn't one of the enum values, then it is the
+        #       number of candidate intersections.
+        return NotImplementedError(TOO_MANY_TEMPLATE.format(status))
+
+
+def curve_intersections_pairs(
+        const double[::1, :] nodes_first, const int[::1] offsets_first,
+        const double[::1, :] nodes_second, const int[::1] offsets_second,
+        IntersectionWorkspace workspace=None):
+    cdef int num_pairs, index, capacity, num_found
+    cdef int num_nodes_first, num_nodes_second
+    cdef int intersections_size, num_intersections
+    cdef bezier._status.Status status
+    cdef bool_t coincident
+    cdef int[::1] offsets
+    cdef unsigned char[::1] coincident_view
+    cdef double[::1, :] st_vals
+    cdef double[::1, :] new_st_vals
+
+    if workspace is None:
+        workspace = _thread_curves_workspace()
+
+    # NOTE: We don't check that there are 2 rows or that every curve has
+    #       at least one node.
+    num_pairs = offsets_first.shape[0] - 1
+    offsets = np.zeros((num_pairs + 1,), dtype=np.intc)
+    coincident_flags = np.zeros((num_pairs,), dtype=bool)
+    coincident_view = coincident_flags.view(np.uint8)
+    capacity = 2 * num_pairs + 2
+    st_vals = np.empty((2, capacity), order="F")
+    num_found = 0
+    errors = []
+    for index in range(num_pairs):
+        num_nodes_first = offsets_first[index + 1] - offsets_first[index]
+        num_nodes_second = offsets_second[index + 1] - offsets_second[index]
+        while True:
+            intersections_size = workspace.size
+            # NOTE: Each pair only touches memory owned by the arguments
+            #       and ``workspace``, so other threads can run.
+            with nogil:
+                bezier._curve_intersection.curve_intersections_workspace(
+                    &workspace._workspace,
+                    &num_nodes_first,
+                    &nodes_first[0, offsets_first[index]],
+                    &num_nodes_second,
+                    &nodes_second[0, offsets_second[index]],
+                    &intersections_size,
+                    &workspace._intersections[0, 0],
+                    &num_intersections,
+                    &coincident,
+                    &status,
+                )
+
+            if (
+                    status != bezier._status.Status.INSUFFICIENT_SPACE
+                    or num_intersections <= intersections_size):
+                break
+            workspace.resize(num_intersections)
+
+        if status == bezier._status.Status.SUCCESS:
+            if num_found + num_intersections > capacity:
+                capacity = max(2 * capacity, num_found + num_intersections)
+                new_st_vals = np.empty((2, capacity), order="F")
+                new_st_vals[:, :num_found] = st_vals[:, :num_found]
+                st_vals = new_st_vals
+            st_vals[:, num_found:num_found + num_intersections] = (
+                workspace._intersections[:, :num_intersections])
+            num_found += num_intersections
+            coincident_view[index] = coincident
+        else:
+            errors.append((
+                index,
+                _curve_intersections_error(
+                    status, num_intersections, intersections_size),
+            ))
+        offsets[index + 1] = num_found
+
+    return (
+        np.asarray(offsets),
+        np.asarray(st_vals)[:, :num_found],
+        coincident_flags,
+        errors,
     )
 
+
+def curve_intersections_clipping(
+        const double[::1, :] nodes_first, const double[::1, :] nodes_second,
+        bint allow_resize=True, IntersectionWorkspace workspace=None):
+    cdef int num_nodes_first, num_nodes_second
+    cdef int intersections_size, num_intersections
+    cdef bezier._status.Status status
+    cdef ndarray_t[double, ndim=2, mode="fortran"] intersections
+    cdef bool_t coincident
+
+    # NOTE: The Fortran subroutine allocates its own (local) workspace, so
+    #       only the output buffer of ``workspace`` is used.
+    if workspace is None:
+        workspace = _thread_curves_workspace()
+
+    # NOTE: We don't check that there are 2 rows.
+    _, num_nodes_first = np.shape(nodes_first)
+    _, num_nodes_second = np.shape(nodes_second)
+    intersections_size = workspace.size
+
+    with nogil:
+        bezier._curve_intersection.curve_intersections_clipping(
+            &num_nodes_first,
+            &nodes_first[0, 0],
+            &num_nodes_second,
+            &nodes_second[0, 0],
+            &intersections_size,
+            &workspace._intersections[0, 0],
+            &num_intersections,
+            &coincident,
+            &status,
+        )
+
     if status == bezier._status.Status.SUCCESS:
         intersections = np.empty((2, num_intersections), order="F")
-        intersections[:, :] = CURVES_WORKSPACE[:, :num_intersections]
+        intersections[:, :] = workspace._intersections[:, :num_intersections]
         return intersections, coincident
     elif status == bezier._status.Status.NO_CONVERGE:
-        raise ValueError(SUBDIVISION_NO_CONVERGE)
+        raise ValueError(CLIPPING_NO_CONVERGE)
     elif status == bezier._status.Status.INSUFFICIENT_SPACE:
         if allow_resize:
-            reset_curves_workspace(num_intersections)
-            return curve_intersections(
-                nodes_first, nodes_second, allow_resize=False)
+            workspace.resize(num_intersections)
+            return curve_intersections_clipping(
+                nodes_first, nodes_second, allow_resize=False,
+                workspace=workspace)
         else:
             msg = TOO_SMALL_TEMPLATE.format(
                 num_intersections, intersections_size)
@@ -505,11 +877,84 @@ def curve_intersections(
 def free_curve_intersections_workspace():
     bezier._curve_intersection.free_curve_intersections_workspace()
 
+
+def flatten_curve(const double[::1, :] nodes, double tolerance):
+    cdef int num_nodes, dimension, vertices_size, num_vertices
+    cdef bezier._status.Status status
+    cdef ndarray_t[double, ndim=1, mode="fortran"] s_vals
+    cdef ndarray_t[double, ndim=2, mode="fortran"] vertices
+
+    dimension, num_nodes = np.shape(nodes)
+    vertices_size = FLATTEN_START_SIZE
+    while True:
+        s_vals = np.empty((vertices_size,), order="F")
+        vertices = np.empty((dimension, vertices_size), order="F")
+        with nogil:
+            bezier._curve_intersection.flatten_curve(
+                &num_nodes,
+                &dimension,
+                &nodes[0, 0],
+                &tolerance,
+                &vertices_size,
+                &s_vals[0],
+                &vertices[0, 0],
+                &num_vertices,
+                &status,
+            )
+
+        if status == bezier._status.Status.SUCCESS:
+            return vertices[:, :num_vertices], s_vals[:num_vertices]
+
+        # NOTE: The only other possible ``status`` is ``INSUFFICIENT_SPACE``,
+        #       in which case ``num_vertices`` is the exact size needed.
+        vertices_size = num_vertices
+
+
+def flatten_curves(const double[::1, :, :] nodes, double tolerance):
+    cdef int num_curves, num_nodes, dimension, vertices_size, num_vertices
+    cdef bezier._status.Status status
+    cdef ndarray_t[double, ndim=1, mode="fortran"] s_vals
+    cdef ndarray_t[double, ndim=2, mode="fortran"] vertices
+    cdef ndarray_t[int, ndim=1, mode="fortran"] offsets
+
+    # NOTE: We don't check that there is at least one curve.
+    num_curves, dimension, num_nodes = np.shape(nodes)
+    offsets = np.empty((num_curves + 1,), dtype=np.intc, order="F")
+    vertices_size = FLATTEN_START_SIZE * num_curves
+    while True:
+        s_vals = np.empty((vertices_size,), order="F")
+        vertices = np.empty((dimension, vertices_size), order="F")
+        with nogil:
+            bezier._curve_intersection.flatten_curves(
+                &num_curves,
+                &num_nodes,
+                &dimension,
+                &nodes[0, 0, 0],
+                &tolerance,
+                &vertices_size,
+                &s_vals[0],
+                &vertices[0, 0],
+                &offsets[0],
+                &num_vertices,
+                &status,
+            )
+
+        if status == bezier._status.Status.SUCCESS:
+            return (
+                vertices[:, :num_vertices],
+                s_vals[:num_vertices],
+                offsets,
+            )
+
+        # NOTE: The only other possible ``status`` is ``INSUFFICIENT_SPACE``,
+        #       in which case ``num_vertices`` is the exact size needed.
+        vertices_size = num_vertices
+
 ############################
 # Section: ``helpers.f90`` #
 ############################
 
-def cross_product(double[::1] vec0, double[::1] vec1):
+def cross_product(const double[::1] vec0, const double[::1] vec1):
     cdef double result
 
     bezier._helpers.cross_product(
@@ -521,21 +966,22 @@ def cross_product(double[::1] vec0, double[::1] vec1):
     return result
 
 
-def bbox(double[::1, :] nodes):
+def bbox(const double[::1, :] nodes):
     cdef int num_nodes
     cdef double left, right, bottom, top
 
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes = np.shape(nodes)
 
-    bezier._helpers.bbox(
-        &num_nodes,
-        &nodes[0, 0],
-        &left,
-        &right,
-        &bottom,
-        &top,
-    )
+    with nogil:
+        bezier._helpers.bbox(
+            &num_nodes,
+            &nodes[0, 0],
+            &left,
+            &right,
+            &bottom,
+            &top,
+        )
 
     return left, right, bottom, top
 
@@ -553,7 +999,7 @@ def wiggle_interval(double value):
     return result, success
 
 
-def contains_nd(double[::1, :] nodes, double[::1] point):
+def contains_nd(const double[::1, :] nodes, const double[::1] point):
     cdef int num_nodes, dimension
     cdef bool_t predicate
 
@@ -563,18 +1009,20 @@ def contains_nd(double[::1, :] nodes, double[::1] point):
             np.asarray(point), dimension)
         raise ValueError(msg)
 
-    bezier._helpers.contains_nd(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &point[0],
-        &predicate,
-    )
+    with nogil:
+        bezier._helpers.contains_nd(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &point[0],
+            &predicate,
+        )
 
     return predicate
 
 
-def vector_close(double[::1] vec1, double[::1] vec2, double eps=EPS):
+def vector_close(
+        const double[::1] vec1, const double[::1] vec2, double eps=EPS):
     cdef int num_values
 
     # NOTE: We don't check that ``np.shape(vec1) == np.shape(vec2)``.
@@ -596,7 +1044,7 @@ def in_interval(double value, double start, double end):
     )
 
 
-def simple_convex_hull(double[::1, :] points):
+def simple_convex_hull(const double[::1, :] points):
     cdef int num_points
     cdef int polygon_size
     cdef ndarray_t[double, ndim=2, mode="fortran"] polygon
@@ -605,17 +1053,19 @@ def simple_convex_hull(double[::1, :] points):
     _, num_points = np.shape(points)
     polygon = np.empty((2, num_points), order="F")
 
-    bezier._helpers.simple_convex_hull(
-        &num_points,
-        &points[0, 0],
-        &polygon_size,
-        &polygon[0, 0],
-    )
+    with nogil:
+        bezier._helpers.simple_convex_hull(
+            &num_points,
+            &points[0, 0],
+            &polygon_size,
+            &polygon[0, 0],
+        )
 
     return polygon[:, :polygon_size]
 
 
-def polygon_collide(double[::1, :] polygon1, double[::1, :] polygon2):
+def polygon_collide(
+        const double[::1, :] polygon1, const double[::1, :] polygon2):
     cdef int polygon_size1, polygon_size2
     cdef bool_t collision
 
@@ -623,13 +1073,14 @@ def polygon_collide(double[::1, :] polygon1, double[::1, :] polygon2):
     _, polygon_size1 = np.shape(polygon1)
     _, polygon_size2 = np.shape(polygon2)
 
-    bezier._helpers.polygon_collide(
-        &polygon_size1,
-        &polygon1[0, 0],
-        &polygon_size2,
-        &polygon2[0, 0],
-        &collision,
-    )
+    with nogil:
+        bezier._helpers.polygon_collide(
+            &polygon_size1,
+            &polygon1[0, 0],
+            &polygon_size2,
+            &polygon2[0, 0],
+            &collision,
+        )
 
     return collision
 
@@ -638,7 +1089,7 @@ def polygon_collide(double[::1, :] polygon1, double[::1, :] polygon2):
 #############################
 
 def de_casteljau_one_round(
-        double[::1, :] nodes, int degree,
+        const double[::1, :] nodes, int degree,
         double lambda1, double lambda2, double lambda3):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] new_nodes
@@ -646,22 +1097,23 @@ def de_casteljau_one_round(
     dimension, num_nodes = np.shape(nodes)
     new_nodes = np.empty((dimension, num_nodes - degree - 1), order="F")
 
-    bezier._triangle.de_casteljau_one_round(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &lambda1,
-        &lambda2,
-        &lambda3,
-        &new_nodes[0, 0],
-    )
+    with nogil:
+        bezier._triangle.de_casteljau_one_round(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &lambda1,
+            &lambda2,
+            &lambda3,
+            &new_nodes[0, 0],
+        )
 
     return new_nodes
 
 
 def evaluate_barycentric(
-        double[::1, :] nodes, int degree,
+        const double[::1, :] nodes, int degree,
         double lambda1, double lambda2, double lambda3):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] point
@@ -669,23 +1121,24 @@ def evaluate_barycentric(
     dimension, num_nodes = np.shape(nodes)
     point = np.empty((dimension, 1), order="F")
 
-    bezier._triangle.evaluate_barycentric(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &lambda1,
-        &lambda2,
-        &lambda3,
-        &point[0, 0],
-    )
+    with nogil:
+        bezier._triangle.evaluate_barycentric(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &lambda1,
+            &lambda2,
+            &lambda3,
+            &point[0, 0],
+        )
 
     return point
 
 
 def evaluate_barycentric_multi(
-        double[::1, :] nodes, int degree,
-        double[::1, :] param_vals, int dimension):
+        const double[::1, :] nodes, int degree,
+        const double[::1, :] param_vals, int dimension):
     cdef int num_nodes, num_vals
     cdef ndarray_t[double, ndim=2, mode="fortran"] evaluated
 
@@ -695,22 +1148,23 @@ def evaluate_barycentric_multi(
     num_vals, _ = np.shape(param_vals)
     evaluated = np.empty((dimension, num_vals), order="F")
 
-    bezier._triangle.evaluate_barycentric_multi(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &num_vals,
-        &param_vals[0, 0],
-        &evaluated[0, 0],
-    )
+    with nogil:
+        bezier._triangle.evaluate_barycentric_multi(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &num_vals,
+            &param_vals[0, 0],
+            &evaluated[0, 0],
+        )
 
     return evaluated
 
 
 def evaluate_cartesian_multi(
-        double[::1, :] nodes, int degree,
-        double[::1, :] param_vals, int dimension):
+        const double[::1, :] nodes, int degree,
+        const double[::1, :] param_vals, int dimension):
     cdef int num_nodes, num_vals
     cdef ndarray_t[double, ndim=2, mode="fortran"] evaluated
 
@@ -720,20 +1174,21 @@ def evaluate_cartesian_multi(
     num_vals, _ = np.shape(param_vals)
     evaluated = np.empty((dimension, num_vals), order="F")
 
-    bezier._triangle.evaluate_cartesian_multi(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &num_vals,
-        &param_vals[0, 0],
-        &evaluated[0, 0],
-    )
+    with nogil:
+        bezier._triangle.evaluate_cartesian_multi(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &num_vals,
+            &param_vals[0, 0],
+            &evaluated[0, 0],
+        )
 
     return evaluated
 
 
-def jacobian_both(double[::1, :] nodes, int degree, int dimension):
+def jacobian_both(const double[::1, :] nodes, int degree, int dimension):
     cdef int num_nodes
     cdef ndarray_t[double, ndim=2, mode="fortran"] new_nodes
 
@@ -741,18 +1196,20 @@ def jacobian_both(double[::1, :] nodes, int degree, int dimension):
     _, num_nodes = np.shape(nodes)
     new_nodes = np.empty((2 * dimension, num_nodes - degree - 1), order="F")
 
-    bezier._triangle.jacobian_both(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &new_nodes[0, 0],
-    )
+    with nogil:
+        bezier._triangle.jacobian_both(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &new_nodes[0, 0],
+        )
 
     return new_nodes
 
 
-def jacobian_det(double[::1, :] nodes, int degree, double[::1, :] st_vals):
+def jacobian_det(
+        const double[::1, :] nodes, int degree, const double[::1, :] st_vals):
     cdef int num_nodes, num_vals
     cdef ndarray_t[double, ndim=1, mode="fortran"] evaluated
 
@@ -763,42 +1220,45 @@ def jacobian_det(double[::1, :] nodes, int degree, double[::1, :] st_vals):
 
     evaluated = np.empty((num_vals,), order="F")
 
-    bezier._triangle.jacobian_det(
-        &num_nodes,
-        &nodes[0, 0],
-        &degree,
-        &num_vals,
-        &st_vals[0, 0],
-        &evaluated[0],
-    )
+    with nogil:
+        bezier._triangle.jacobian_det(
+            &num_nodes,
+            &nodes[0, 0],
+            &degree,
+            &num_vals,
+            &st_vals[0, 0],
+            &evaluated[0],
+        )
 
     return evaluated
 
 
 def specialize_triangle(
-        double[::1, :] nodes, int degree,
-        double[::1] weights_a, double[::1] weights_b, double[::1] weights_c):
+        const double[::1, :] nodes, int degree,
+        const double[::1] weights_a, const double[::1] weights_b,
+        const double[::1] weights_c):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] specialized
 
     dimension, num_nodes = np.shape(nodes)
     specialized = np.empty((dimension, num_nodes), order="F")
 
-    bezier._triangle.specialize_triangle(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &weights_a[0],
-        &weights_b[0],
-        &weights_c[0],
-        &specialized[0, 0],
-    )
+    with nogil:
+        bezier._triangle.specialize_triangle(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &weights_a[0],
+            &weights_b[0],
+            &weights_c[0],
+            &specialized[0, 0],
+        )
 
     return specialized
 
 
-def subdivide_nodes_triangle(double[::1, :] nodes, int degree):
+def subdivide_nodes_triangle(const double[::1, :] nodes, int degree):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] nodes_a
     cdef ndarray_t[double, ndim=2, mode="fortran"] nodes_b
@@ -811,21 +1271,22 @@ def subdivide_nodes_triangle(double[::1, :] nodes, int degree):
     nodes_c = np.empty((dimension, num_nodes), order="F")
     nodes_d = np.empty((dimension, num_nodes), order="F")
 
-    bezier._triangle.subdivide_nodes_triangle(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &nodes_a[0, 0],
-        &nodes_b[0, 0],
-        &nodes_c[0, 0],
-        &nodes_d[0, 0],
-    )
+    with nogil:
+        bezier._triangle.subdivide_nodes_triangle(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &nodes_a[0, 0],
+            &nodes_b[0, 0],
+            &nodes_c[0, 0],
+            &nodes_d[0, 0],
+        )
 
     return nodes_a, nodes_b, nodes_c, nodes_d
 
 
-def compute_edge_nodes(double[::1, :] nodes, int degree):
+def compute_edge_nodes(const double[::1, :] nodes, int degree):
     cdef int num_nodes, dimension
     cdef ndarray_t[double, ndim=2, mode="fortran"] nodes1
     cdef ndarray_t[double, ndim=2, mode="fortran"] nodes2
@@ -836,15 +1297,16 @@ def compute_edge_nodes(double[::1, :] nodes, int degree):
     nodes2 = np.empty((dimension, degree + 1), order="F")
     nodes3 = np.empty((dimension, degree + 1), order="F")
 
-    bezier._triangle.compute_edge_nodes(
-        &num_nodes,
-        &dimension,
-        &nodes[0, 0],
-        &degree,
-        &nodes1[0, 0],
-        &nodes2[0, 0],
-        &nodes3[0, 0],
-    )
+    with nogil:
+        bezier._triangle.compute_edge_nodes(
+            &num_nodes,
+            &dimension,
+            &nodes[0, 0],
+            &degree,
+            &nodes1[0, 0],
+            &nodes2[0, 0],
+            &nodes3[0, 0],
+        )
 
     return nodes1, nodes2, nodes3
 
@@ -883,13 +1345,14 @@ def compute_area(tuple edges):
     # Pass along the pointers to the ABI (i.e. the Fortran layer).
     # This assumes that ``unused_not_implemented`` will be ``False``
     # since we already check the supported degrees above.
-    bezier._triangle.compute_area(
-        &num_edges,
-        &sizes[0],
-        nodes_pointers,
-        &area,
-        &unused_not_implemented,
-    )
+    with nogil:
+        bezier._triangle.compute_area(
+            &num_edges,
+            &sizes[0],
+            nodes_pointers,
+            &area,
+            &unused_not_implemented,
+        )
 
     free(nodes_pointers)
 
@@ -900,7 +1363,7 @@ def compute_area(tuple edges):
 ##########################################
 
 def newton_refine_triangle(
-        double[::1, :] nodes, int degree,
+        const double[::1, :] nodes, int degree,
         double x_val, double y_val, double s, double t):
     cdef int num_nodes
     cdef double updated_s, updated_t
@@ -908,38 +1371,40 @@ def newton_refine_triangle(
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes = np.shape(nodes)
 
-    bezier._triangle_intersection.newton_refine_triangle(
-        &num_nodes,
-        &nodes[0, 0],
-        &degree,
-        &x_val,
-        &y_val,
-        &s,
-        &t,
-        &updated_s,
-        &updated_t,
-    )
+    with nogil:
+        bezier._triangle_intersection.newton_refine_triangle(
+            &num_nodes,
+            &nodes[0, 0],
+            &degree,
+            &x_val,
+            &y_val,
+            &s,
+            &t,
+            &updated_s,
+            &updated_t,
+        )
 
     return updated_s, updated_t
 
 
 def locate_point_triangle(
-        double[::1, :] nodes, int degree, double x_val, double y_val):
+        const double[::1, :] nodes, int degree, double x_val, double y_val):
     cdef int num_nodes
     cdef double s_val, t_val
 
     # NOTE: We don't check that there are 2 rows.
     _, num_nodes = np.shape(nodes)
 
-    bezier._triangle_intersection.locate_point_triangle(
-        &num_nodes,
-        &nodes[0, 0],
-        &degree,
-        &x_val,
-        &y_val,
-        &s_val,
-        &t_val,
-    )
+    with nogil:
+        bezier._triangle_intersection.locate_point_triangle(
+            &num_nodes,
+            &nodes[0, 0],
+            &degree,
+            &x_val,
+            &y_val,
+            &s_val,
+            &t_val,
+        )
 
     if s_val == LOCATE_MISS:
         return None
@@ -947,6 +1412,30 @@ def locate_point_triangle(
         return s_val, t_val
 
 
+def locate_point_triangle_multi(
+        const double[::1, :] nodes, int degree, const double[::1, :] points):
+    cdef int num_nodes, num_points
+    cdef ndarray_t[double, ndim=2, mode="fortran"] st_vals
+
+    # NOTE: We don't check that there are 2 rows.
+    _, num_nodes = np.shape(nodes)
+    _, num_points = np.shape(points)
+    st_vals = np.empty((num_points, 2), order="F")
+
+    with nogil:
+        bezier._triangle_intersection.locate_point_triangle_multi(
+            &num_nodes,
+            &nodes[0, 0],
+            &degree,
+            &num_points,
+            &points[0, 0],
+            &st_vals[0, 0],
+        )
+
+    st_vals[st_vals[:, 0] == LOCATE_MISS, :] = np.nan
+    return st_vals
+
+
 def reset_triangle_workspaces(int segment_ends_size=-1, int segments_size=-1):
     global SEGMENT_ENDS_WORKSPACE
     global SEGMENTS_WORKSPACE
@@ -968,8 +1457,8 @@ def triangle_workspace_sizes():
 
 
 def _triangle_intersections_success(
-        double[::1, :] nodes1, int degree1,
-        double[::1, :] nodes2, int degree2,
+        const double[::1, :] nodes1, int degree1,
+        const double[::1, :] nodes2, int degree2,
         int num_intersected):
     global SEGMENT_ENDS_WORKSPACE
     global SEGMENTS_WORKSPACE
@@ -1047,8 +1536,8 @@ def _triangle_intersections_success(
 
 
 def _triangle_intersections_resize(
-        double[::1, :] nodes1, int degree1,
-        double[::1, :] nodes2, int degree2,
+        const double[::1, :] nodes1, int degree1,
+        const double[::1, :] nodes2, int degree2,
         int segment_ends_size, int segments_size,
         int num_intersected, int resizes_allowed):
     global SEGMENT_ENDS_WORKSPACE
@@ -1077,8 +1566,8 @@ def _triangle_intersections_resize(
 
 
 def triangle_intersections(
-        double[::1, :] nodes1, int degree1,
-        double[::1, :] nodes2, int degree2,
+        const double[::1, :] nodes1, int degree1,
+        const double[::1, :] nodes2, int degree2,
         bint verify=True, int resizes_allowed=2):
     # NOTE: ``verify`` is unused. It is only provided as compatibility
     #       with the Python version.
@@ -1128,29 +1617,319 @@ def triangle_intersections(
             nodes1, degree1, nodes2, degree2,
             segment_ends_size, segments_size,
             num_intersected, resizes_allowed)
-    elif status == bezier._status.Status.NO_CONVERGE:
-        raise ValueError(SUBDIVISION_NO_CONVERGE)
+    else:
+        raise _triangle_intersections_error(status)
+
+
+cdef object _triangle_intersections_error(bezier._status.Status status):
+    if status == bezier._status.Status.NO_CONVERGE:
+        return ValueError(SUBDIVISION_NO_CONVERGE)
     elif status == bezier._status.Status.BAD_MULTIPLICITY:
-        raise NotImplementedError(NEWTON_NO_CONVERGE)
+        return NotImplementedError(NEWTON_NO_CONVERGE)
     elif status == bezier._status.Status.EDGE_END:
         # NOTE: This text is identical (or should be) to the exception
         #       in the Python ``classify_intersection()``.
-        raise ValueError("Intersection occurs at the end of an edge")
+        return ValueError("Intersection occurs at the end of an edge")
     elif status == bezier._status.Status.SAME_CURVATURE:
         # NOTE: This text is identical (or should be) to the exception(s)
         #       in the Python ``classify_tangent_intersection()``.
-        raise NotImplementedError("Tangent curves have same curvature.")
+        return NotImplementedError("Tangent curves have same curvature.")
     elif status == bezier._status.Status.BAD_INTERIOR:
         # NOTE: This assumes that the Fortran ``interior_combine()`` has
         #       failed to return to the start node after ``MAX_EDGES = 10``
         #       edges have been added.
-        raise RuntimeError("Unexpected number of edges")
+        return RuntimeError("Unexpected number of edges")
     elif status == bezier._status.Status.UNKNOWN:
-        raise RuntimeError("Unknown error has occured.")
+        return RuntimeError("Unknown error has occured.")
     else:
         # NOTE: If ``status`` isn't one of the enum values, then it is the
         #       number of candidate intersections.
-        raise NotImplementedError(TOO_MANY_TEMPLATE.format(status))
+        return NotImplementedError(TOO_MANY_TEMPLATE.format(status))
+
+
+def triangle_intersections_pairs(
+        const double[::1, :, :] nodes1, int degree1,
+        const double[::1, :, :] nodes2, int degree2,
+        const int[:, :] pairs):
+    global SEGMENT_ENDS_WORKSPACE
+    global SEGMENTS_WORKSPACE
+    cdef int num_pairs, index, first, second, j, k
+    cdef int num_nodes1, num_nodes2, dimension
+    cdef int segment_ends_size, segments_size, num_intersected
+    cdef int resizes_allowed, num_polygons, num_segments, num_new_segments
+    cdef int new_size
+    cdef TriangleContained contained
+    cdef bezier._status.Status status
+    cdef double[::1, :] triangle1
+    cdef double[::1, :] triangle2
+    cdef int[::1] pair_offsets
+    cdef int[::1] contained_vals
+    cdef int[::1] polygon_offsets
+    cdef CurvedPolygonSegment[::1] segments
+    cdef CurvedPolygonSegment[::1] new_segments
+
+    # NOTE: We don't check that there are 2 rows.
+    _, dimension, num_nodes1 = np.shape(nodes1)
+    _, _, num_nodes2 = np.shape(nodes2)
+    num_pairs, _ = np.shape(pairs)
+    # NOTE: The nodes of one triangle in a ``T x D x N`` stack are not
+    #       contiguous, so each is copied into a (re-used) buffer.
+    triangle1 = np.empty((dimension, num_nodes1), order="F")
+    triangle2 = np.empty((dimension, num_nodes2), order="F")
+    pair_offsets = np.zeros((num_pairs + 1,), dtype=np.intc)
+    contained_vals = np.zeros((num_pairs,), dtype=np.intc)
+    polygon_offsets = np.zeros((num_pairs + 1,), dtype=np.intc)
+    segments = np.empty((3 * num_pairs + 3,), dtype=SEGMENT_DTYPE)
+    num_polygons = 0
+    num_segments = 0
+    errors = []
+    for index in range(num_pairs):
+        first = pairs[index, 0]
+        second = pairs[index, 1]
+        for k in range(num_nodes1):
+            for j in range(dimension):
+                triangle1[j, k] = nodes1[first, j, k]
+        for k in range(num_nodes2):
+            for j in range(dimension):
+                triangle2[j, k] = nodes2[second, j, k]
+
+        resizes_allowed = 2
+        while True:
+            segment_ends_size, segments_size = triangle_workspace_sizes()
+            bezier._triangle_intersection.triangle_intersections(
+                &num_nodes1,
+                &triangle1[0, 0],
+                &degree1,
+                &num_nodes2,
+                &triangle2[0, 0],
+                &degree2,
+                &segment_ends_size,
+                &SEGMENT_ENDS_WORKSPACE[0],
+                &segments_size,
+                &SEGMENTS_WORKSPACE[0],
+                &num_intersected,
+                &contained,
+                &status,
+            )
+            if (
+                    status != bezier._status.Status.INSUFFICIENT_SPACE
+                    or resizes_allowed == 0):
+                break
+
+            resizes_allowed -= 1
+            if num_intersected > segment_ends_size:
+                reset_triangle_workspaces(segment_ends_size=num_intersected)
+            else:
+                reset_triangle_workspaces(
+                    segments_size=SEGMENT_ENDS_WORKSPACE[num_intersected - 1])
+
+        if status == bezier._status.Status.SUCCESS:
+            contained_vals[index] = contained
+            if contained != NEITHER_CONTAINED or num_intersected == 0:
+                pair_offsets[index + 1] = num_polygons
+                continue
+
+            if num_polygons + num_intersected >= polygon_offsets.shape[0]:
+                polygon_offsets = _grow_offsets(
+                    polygon_offsets, num_polygons + num_intersected + 1)
+            num_new_segments = SEGMENT_ENDS_WORKSPACE[num_intersected - 1]
+            if num_segments + num_new_segments > segments.shape[0]:
+                new_size = max(
+                    2 * segments.shape[0], num_segments + num_new_segments)
+                new_segments = np.empty((new_size,), dtype=SEGMENT_DTYPE)
+                new_segments[:num_segments] = segments[:num_segments]
+                segments = new_segments
+            for j in range(num_new_segments):
+                segments[num_segments + j].start = SEGMENTS_WORKSPACE[j].start
+                segments[num_segments + j].end = SEGMENTS_WORKSPACE[j].end
+                # NOTE: We switch from 1-based to 0-based indexing since
+                #       the data moves from Fortran to Python.
+                segments[num_segments + j].edge_index = (
+                    SEGMENTS_WORKSPACE[j].edge_index - 1)
+            for j in range(num_intersected):
+                polygon_offsets[num_polygons + j + 1] = (
+                    num_segments + SEGMENT_ENDS_WORKSPACE[j])
+            num_polygons += num_intersected
+            num_segments += num_new_segments
+        elif status == bezier._status.Status.INSUFFICIENT_SPACE:
+            if num_intersected > segment_ends_size:
+                msg = SEGMENT_ENDS_TOO_SMALL.format(
+                    num_intersected, segment_ends_size)
+            else:
+                msg = SEGMENTS_TOO_SMALL.format(
+                    SEGMENT_ENDS_WORKSPACE[num_intersected - 1], segments_size)
+            errors.append((index, ValueError(msg)))
+        else:
+            errors.append((index, _triangle_intersections_error(status)))
+        pair_offsets[index + 1] = num_polygons
+
+    return (
+        np.asarray(pair_offsets),
+        np.asarray(polygon_offsets)[:num_polygons + 1],
+        np.asarray(segments)[:num_segments],
+        np.asarray(contained_vals),
+        errors,
+    )
+
+
+cdef int[::1] _grow_offsets(int[::1] offsets, int min_size):
+    cdef int[::1] new_offsets
+
+    new_offsets = np.zeros(
+        (max(2 * offsets.shape[0], min_size),), dtype=np.intc)
+    new_offsets[:offsets.shape[0]] = offsets
+    return new_offsets
+
+
+def triangle_intersection_areas(
+        const double[::1, :, :] nodes1, int degree1,
+        const double[::1, :, :] nodes2, int degree2,
+        const int[:, :] pairs, const int[::1] pair_offsets,
+        const int[::1] polygon_offsets,
+        CurvedPolygonSegment[::1] segments,
+        const int[::1] contained):
+    cdef int max_degree, num_pairs, index, first, second, polygon, j, k
+    cdef int num_nodes1, num_nodes2, dimension, edge_index, num_edge_nodes
+    cdef int num_edges = 1
+    cdef const double* nodes_pointer
+    cdef double start, end, area, segment_area
+    cdef bool_t unused_not_implemented
+    cdef double[::1, :] triangle1
+    cdef double[::1, :] triangle2
+    cdef double[::1, :, :] edges1
+    cdef double[::1, :, :] edges2
+    cdef double[::1, :] specialized
+    cdef double[::1] polygon_areas
+    cdef double[::1] pair_areas
+
+    max_degree = max(degree1, degree2)
+    if max_degree > 4:
+        # NOTE: This import at runtime is expensive, but we don't mind it
+        #       because the exception is intended to halt the program.
+        from bezier._py_helpers import UnsupportedDegree
+        raise UnsupportedDegree(max_degree, supported=(1, 2, 3, 4))
+
+    # NOTE: We don't check that there are 2 rows.
+    _, dimension, num_nodes1 = np.shape(nodes1)
+    _, _, num_nodes2 = np.shape(nodes2)
+    num_pairs, _ = np.shape(pairs)
+    triangle1 = np.empty((dimension, num_nodes1), order="F")
+    triangle2 = np.empty((dimension, num_nodes2), order="F")
+    # NOTE: The three edges of each triangle are stored as ``edges[:, :, k]``
+    #       and each segment is specialized into the same scratch buffer.
+    edges1 = np.empty((dimension, degree1 + 1, 3), order="F")
+    edges2 = np.empty((dimension, degree2 + 1, 3), order="F")
+    specialized = np.empty((dimension, max_degree + 1), order="F")
+    polygon_areas = np.zeros((polygon_offsets.shape[0] - 1,))
+    pair_areas = np.zeros((num_pairs,))
+    for index in range(num_pairs):
+        if (
+                contained[index] == NEITHER_CONTAINED
+                and pair_offsets[index] == pair_offsets[index + 1]):
+            continue
+
+        first = pairs[index, 0]
+        second = pairs[index, 1]
+        for k in range(num_nodes1):
+            for j in range(dimension):
+                triangle1[j, k] = nodes1[first, j, k]
+        for k in range(num_nodes2):
+            for j in range(dimension):
+                triangle2[j, k] = nodes2[second, j, k]
+        bezier._triangle.compute_edge_nodes(
+            &num_nodes1,
+            &dimension,
+            &triangle1[0, 0],
+            &degree1,
+            &edges1[0, 0, 0],
+            &edges1[0, 0, 1],
+            &edges1[0, 0, 2],
+        )
+        bezier._triangle.compute_edge_nodes(
+            &num_nodes2,
+            &dimension,
+            &triangle2[0, 0],
+            &degree2,
+            &edges2[0, 0, 0],
+            &edges2[0, 0, 1],
+            &edges2[0, 0, 2],
+        )
+
+        if contained[index] == FIRST_CONTAINED:
+            pair_areas[index] = _triangle_edges_area(edges1)
+            continue
+
+        if contained[index] == SECOND_CONTAINED:
+            pair_areas[index] = _triangle_edges_area(edges2)
+            continue
+
+        for polygon in range(pair_offsets[index], pair_offsets[index + 1]):
+            area = 0.0
+            for j in range(
+                    polygon_offsets[polygon], polygon_offsets[polygon + 1]):
+                edge_index = segments[j].edge_index
+                start = segments[j].start
+                end = segments[j].end
+                if edge_index < 3:
+                    num_edge_nodes = degree1 + 1
+                    bezier._curve.specialize_curve(
+                        &num_edge_nodes,
+                        &dimension,
+                        &edges1[0, 0, edge_index],
+                        &start,
+                        &end,
+                        &specialized[0, 0],
+                    )
+                else:
+                    num_edge_nodes = degree2 + 1
+                    bezier._curve.specialize_curve(
+                        &num_edge_nodes,
+                        &dimension,
+                        &edges2[0, 0, edge_index - 3],
+                        &start,
+                        &end,
+                        &specialized[0, 0],
+                    )
+                # NOTE: Green's theorem sums over the edges, so the area
+                #       is accumulated one (specialized) edge at a time.
+                #       This assumes that ``unused_not_implemented`` will be
+                #       ``False`` since we already checked the degrees above.
+                nodes_pointer = &specialized[0, 0]
+                bezier._triangle.compute_area(
+                    &num_edges,
+                    &num_edge_nodes,
+                    &nodes_pointer,
+                    &segment_area,
+                    &unused_not_implemented,
+                )
+                area += segment_area
+            polygon_areas[polygon] = area
+            pair_areas[index] += area
+
+    return np.asarray(polygon_areas), np.asarray(pair_areas)
+
+
+cdef double _triangle_edges_area(double[::1, :, :] edges):
+    cdef int num_edges = 3
+    cdef int sizes[3]
+    cdef const double* nodes_pointers[3]
+    cdef int k
+    cdef double area
+    cdef bool_t unused_not_implemented
+
+    for k in range(num_edges):
+        sizes[k] = edges.shape[1]
+        nodes_pointers[k] = &edges[0, 0, k]
+    # NOTE: This assumes that ``unused_not_implemented`` will be ``False``
+    #       since the caller has already checked the supported degrees.
+    bezier._triangle.compute_area(
+        &num_edges,
+        &sizes[0],
+        &nodes_pointers[0],
+        &area,
+        &unused_not_implemented,
+    )
+    return area
 
 
 def free_triangle_intersections_workspace():
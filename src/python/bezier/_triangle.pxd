@@ -16,7 +16,7 @@
 from libcpp cimport bool as bool_t
 
 
-cdef extern from "bezier/triangle.h":
+cdef extern from "bezier/triangle.h" nogil:
     void de_casteljau_one_round "BEZ_de_casteljau_one_round" (
         const int* num_nodes, const int* dimension,
         const double* nodes, const int* degree, const double* lambda1,
@@ -25,6 +25,33 @@ except ImportError:  # pragma: NO COVER
     _speedup = None
 
 
+# NOTE: The Fortran subdivision uses hand-written formulas up to this
+#       degree and falls back to repeated de Casteljau above it, which is
+#       slower than a product with the (cached) subdivision matrices.
+_MAX_FORTRAN_SUBDIVIDE_DEGREE = 4
+
+
+def _subdivide_nodes(nodes, degree):
+    """Subdivide a triangle into four sub-triangles.
+
+    Uses the Fortran implementation for low degrees and the cached
+    subdivision matrices (see
+    :func:`~bezier._py_triangle_helpers.subdivision_matrices`) otherwise.
+
+    Args:
+        nodes (numpy.ndarray): Control points for a triangle.
+        degree (int): The degree of the triangle.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, numpy.ndarray]: The
+        nodes for the four sub-triangles.
+    """
+    if degree > _MAX_FORTRAN_SUBDIVIDE_DEGREE:
+        return _py_triangle_helpers.subdivide_nodes(nodes, degree)
+
+    return _speedup.subdivide_nodes_triangle(nodes, degree)
+
+
 # pylint: disable=invalid-name
 if _speedup is None:  # pragma: NO COVER
     de_casteljau_one_round = _py_triangle_helpers.de_casteljau_one_round
@@ -42,7 +69,7 @@ if _speedup is None:  # pragma: NO COVER
 else:
     de_casteljau_one_round = _speedup.de_casteljau_one_round
     specialize_triangle = _speedup.specialize_triangle
-    subdivide_nodes = _speedup.subdivide_nodes_triangle
+    subdivide_nodes = _subdivide_nodes
     jacobian_both = _speedup.jacobian_both
     jacobian_det = _speedup.jacobian_det
     evaluate_barycentric = _speedup.evaluate_barycentric
@@ -30,11 +30,15 @@ cdef extern from "bezier/triangle_intersection.h":
     void newton_refine_triangle "BEZ_newton_refine_triangle" (
         const int* num_nodes, const double* nodes,
         const int* degree, const double* x_val, const double* y_val,
-        const double* s, const double* t, double* updated_s, double* updated_t)
+        const double* s, const double* t, double* updated_s,
+        double* updated_t) nogil
     void locate_point_triangle "BEZ_locate_point_triangle" (
         const int* num_nodes, const double* nodes,
-        const int* degree, const double* x_val, const double* y_val, double* s_val,
-        double* t_val)
+        const int* degree, const double* x_val, const double* y_val,
+        double* s_val, double* t_val) nogil
+    void locate_point_triangle_multi "BEZ_locate_point_triangle_multi" (
+        const int* num_nodes, const double* nodes, const int* degree,
+        const int* num_points, const double* points, double* st_vals) nogil
     void triangle_intersections "BEZ_triangle_intersections" (
         const int* num_nodes1, const double* nodes1,
         const int* degree1, const int* num_nodes2, const double* nodes2,
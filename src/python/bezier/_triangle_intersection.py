@@ -31,10 +31,18 @@ except ImportError:  # pragma: NO COVER
 if _speedup is None:  # pragma: NO COVER
     newton_refine = _py_triangle_intersection.newton_refine
     locate_point = _py_triangle_intersection.locate_point
+    locate_point_multi = _py_triangle_intersection.locate_point_multi
     geometric_intersect = _py_triangle_intersection.geometric_intersect
+    geometric_intersect_pairs = (
+        _py_triangle_intersection.geometric_intersect_pairs
+    )
+    intersection_areas = _py_triangle_intersection.intersection_areas
 else:
     newton_refine = _speedup.newton_refine_triangle
     locate_point = _speedup.locate_point_triangle
+    locate_point_multi = _speedup.locate_point_triangle_multi
     geometric_intersect = _speedup.triangle_intersections
+    geometric_intersect_pairs = _speedup.triangle_intersections_pairs
+    intersection_areas = _speedup.triangle_intersection_areas
     atexit.register(_speedup.free_triangle_intersections_workspace)
 # pylint: enable=invalid-name
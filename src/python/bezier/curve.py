@@ -25,24 +25,52 @@ See :doc:`../../algorithms/curve-curve-intersection` for examples using the
 
 .. autoclass:: IntersectionStrategy
    :members:
+
+.. autoclass:: IntersectionWorkspace
+   :members:
 """
 
+import collections
+import functools
+
 import numpy as np
 
 from bezier import _algebraic_intersection
 from bezier import _base
 from bezier import _curve_helpers
 from bezier import _geometric_intersection
+from bezier import _helpers
 from bezier import _plot_helpers
+from bezier import _py_curve_helpers
+from bezier import _py_geometric_intersection
 from bezier import _py_intersection_helpers
 from bezier import _symbolic
+from bezier import intersection_cache
 
 
 _LOCATE_ERROR_TEMPLATE = (
     "Dimension mismatch: This curve is {:d}-dimensional, so the point should "
     "be a {:d} x 1 NumPy array. Instead the point {} has dimensions {}."
 )
+_LOCATE_MULTI_ERROR_TEMPLATE = (
+    "Dimension mismatch: This curve is {:d}-dimensional, so the points "
+    "should be a {:d} x N NumPy array. Instead the points have dimensions {}."
+)
 IntersectionStrategy = _py_intersection_helpers.IntersectionStrategy
+# pylint: disable=invalid-name
+IntersectionWorkspace = _geometric_intersection.IntersectionWorkspace
+# pylint: enable=invalid-name
+_STRATEGIES = (
+    IntersectionStrategy.GEOMETRIC,
+    IntersectionStrategy.ALGEBRAIC,
+    IntersectionStrategy.CLIPPING,
+)
+_PLOT_PLAN_CACHE_SIZE = 32
+_LENGTH_WIGGLE = 0.5 ** 26
+PairIntersections = collections.namedtuple(
+    "PairIntersections",
+    ["offsets", "s_vals", "t_vals", "coincident", "errors"],
+)
 
 
 class Curve(_base.Base):
@@ -77,6 +105,22 @@ class Curve(_base.Base):
        import make_images
        make_images.curve_constructor(curve)
 
+    A frozen curve has read-only nodes, so the quantities derived from them
+    (e.g. the length, bounding box and control polygon convex hull) are
+    computed the first time they are needed and re-used after that:
+
+    .. doctest:: curve-frozen
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 3.0],
+       ...     [0.0, 4.0],
+       ... ])
+       >>> curve = bezier.Curve(nodes, degree=1, frozen=True)
+       >>> curve.frozen
+       True
+       >>> curve.length
+       5.0
+
     Args:
         nodes (Sequence[Sequence[numbers.Number]]): The nodes in the curve.
             Must be convertible to a 2D NumPy array of floating point values,
@@ -90,21 +134,40 @@ class Curve(_base.Base):
             freely mutate ``nodes`` after passing in.
         verify (bool): Flag indicating if the degree should be verified against
             the number of nodes. Defaults to :data:`True`.
+        frozen (bool): Flag indicating if the curve should be frozen, i.e.
+            have read-only nodes and cache derived quantities. Defaults to
+            :data:`False`. If ``copy`` is :data:`False`, the caller
+            **must not** modify ``nodes`` after freezing.
     """
 
     __slots__ = (
         "_dimension",  # From base class
         "_nodes",  # From base class
+        "_frozen",  # From base class
         "_degree",  # From constructor
+        "_arc_length_table",  # Empty default
+        "_length",  # Empty default
+        "_bbox",  # Empty default
+        "_hodograph",  # Empty default
+        "_linearization_error",  # Empty default
+        "_convex_hull",  # Empty default
+        "_reduced_nodes",  # Empty default
     )
 
-    def __init__(self, nodes, degree, *, copy=True, verify=True):
-        super(Curve, self).__init__(nodes, copy=copy)
+    def __init__(self, nodes, degree, *, copy=True, verify=True, frozen=False):
+        super(Curve, self).__init__(nodes, copy=copy, frozen=frozen)
         self._degree = degree
+        self._arc_length_table = None
+        self._length = None
+        self._bbox = None
+        self._hodograph = None
+        self._linearization_error = None
+        self._convex_hull = None
+        self._reduced_nodes = None
         self._verify_degree(verify)
 
     @classmethod
-    def from_nodes(cls, nodes, copy=True):
+    def from_nodes(cls, nodes, copy=True, frozen=False):
         """Create a :class:`.Curve` from nodes.
 
         Computes the ``degree`` based on the shape of ``nodes``.
@@ -117,6 +180,9 @@ class Curve(_base.Base):
             copy (bool): Flag indicating if the nodes should be copied before
                 being stored. Defaults to :data:`True` since callers may
                 freely mutate ``nodes`` after passing in.
+            frozen (bool): Flag indicating if the curve should be frozen.
+                Defaults to :data:`False`. If the curve is frozen, the
+                ``buffer`` **must not** be modified afterwards.
 
         Returns:
             Curve: The constructed curve.
@@ -124,7 +190,49 @@ class Curve(_base.Base):
         nodes_np = _base.sequence_to_array(nodes)
         _, num_nodes = nodes_np.shape
         degree = cls._get_degree(num_nodes)
-        return cls(nodes_np, degree, copy=copy, verify=False)
+        return cls(nodes_np, degree, copy=copy, verify=False, frozen=frozen)
+
+    @classmethod
+    def from_buffer(cls, buffer, dimension=None, frozen=False):
+        """Create a :class:`.Curve` that wraps a buffer without copying.
+
+        Computes the ``degree`` based on the number of nodes in ``buffer``.
+
+        .. doctest:: curve-from-buffer
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 0.625, 1.0],
+           ...     [0.0, 0.5  , 0.5],
+           ... ])
+           >>> curve = bezier.Curve.from_buffer(nodes)
+           >>> curve
+           <Curve (degree=2, dimension=2)>
+           >>> np.shares_memory(curve.nodes_view, nodes)
+           True
+           >>> flat = memoryview(nodes.tobytes(order="F"))
+           >>> curve = bezier.Curve.from_buffer(flat, dimension=2)
+           >>> curve.nodes_view
+           array([[0.   , 0.625, 1.   ],
+                  [0.   , 0.5  , 0.5  ]])
+
+        Args:
+            buffer (Union[numpy.ndarray, memoryview, bytes, bytearray]): The
+                nodes in the curve. Either a 2D Fortran-ordered buffer of
+                ``np.float64`` values, or a flat buffer storing the nodes in
+                Fortran order (e.g. a shared memory block).
+            dimension (Optional[int]): The dimension of the ambient space.
+                Required if ``buffer`` is flat.
+            frozen (bool): Flag indicating if the curve should be frozen.
+                Defaults to :data:`False`.
+
+        Returns:
+            Curve: The constructed curve, with nodes sharing memory with
+            ``buffer``.
+        """
+        nodes_np = _base.buffer_to_array(buffer, dimension=dimension)
+        _, num_nodes = nodes_np.shape
+        degree = cls._get_degree(num_nodes)
+        return cls(nodes_np, degree, copy=False, verify=False, frozen=frozen)
 
     @staticmethod
     def _get_degree(num_nodes):
@@ -177,7 +285,91 @@ class Curve(_base.Base):
         Returns:
             float: The length of the current curve.
         """
-        return _curve_helpers.compute_length(self._nodes)
+        return self._cached("_length", _curve_helpers.compute_length)
+
+    def _get_bbox(self):
+        """Get the bounding box of the nodes of the current (planar) curve.
+
+        Returns:
+            Tuple[float, float, float, float]: The left, right, bottom and
+            top bounds for the box.
+        """
+        return self._cached("_bbox", _helpers.bbox)
+
+    def _algebraic_nodes(self):
+        """Get the nodes used to intersect the current curve algebraically.
+
+        The implicitization used by the algebraic strategy is cheaper for a
+        curve of lower degree, so a frozen curve uses its (cached) fully
+        reduced nodes. Otherwise, the nodes are used as-is, since reducing
+        them on every call costs more than it saves.
+
+        Returns:
+            numpy.ndarray: The nodes of the curve.
+        """
+        if self._frozen:
+            return self._cached("_reduced_nodes", _curve_helpers.full_reduce)
+
+        return self._nodes
+
+    def _disjoint_from(self, other):
+        """Check if the current (planar) curve can't meet another curve.
+
+        Uses the bounding boxes of the nodes and, if those overlap, the
+        convex hulls of the nodes. These are only computed once for a
+        frozen curve.
+
+        Args:
+            other (Curve): Another planar curve.
+
+        Returns:
+            bool: Flag indicating if the curves are certain to be disjoint.
+        """
+        left1, right1, bottom1, top1 = self._get_bbox()
+        left2, right2, bottom2, top2 = Curve._get_bbox(other)
+        if (
+            right2 < left1
+            or right1 < left2
+            or top2 < bottom1
+            or top1 < bottom2
+        ):
+            return True
+
+        hull1 = self._cached("_convex_hull", _helpers.simple_convex_hull)
+        hull2 = Curve._cached(
+            other, "_convex_hull", _helpers.simple_convex_hull
+        )
+        # NOTE: A hull with fewer than three vertices (e.g. for a line) has
+        #       degenerate edges, so it is not used to separate the curves.
+        if hull1.shape[1] < 3 or hull2.shape[1] < 3:
+            return False
+
+        return not _helpers.polygon_collide(hull1, hull2)
+
+    @property
+    def arc_length_table(self):
+        """ArcLengthTable: The arc length table of the curve.
+
+        If the curve is frozen, the table is built the first time it is
+        accessed and is re-used by every later call. Otherwise (since the
+        nodes may have changed) it is built on every access.
+
+        .. doctest:: curve-arc-length-table
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 1.0, 3.0],
+           ...     [0.0, 0.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2, frozen=True)
+           >>> table = curve.arc_length_table
+           >>> round(table.length, 12)
+           3.0
+           >>> table.s_at_length([0.0, 1.25, 3.0])
+           array([0. , 0.5, 1. ])
+           >>> curve.arc_length_table is table
+           True
+        """
+        return self._cached("_arc_length_table", ArcLengthTable)
 
     @property
     def __dict__(self):
@@ -193,7 +385,15 @@ class Curve(_base.Base):
         return {
             "_dimension": self._dimension,
             "_nodes": self._nodes,
+            "_frozen": self._frozen,
             "_degree": self._degree,
+            "_arc_length_table": self._arc_length_table,
+            "_length": self._length,
+            "_bbox": self._bbox,
+            "_hodograph": self._hodograph,
+            "_linearization_error": self._linearization_error,
+            "_convex_hull": self._convex_hull,
+            "_reduced_nodes": self._reduced_nodes,
         }
 
     def copy(self):
@@ -202,7 +402,13 @@ class Curve(_base.Base):
         Returns:
             .Curve: Copy of current curve.
         """
-        return Curve(self._nodes, self._degree, copy=True, verify=False)
+        return Curve(
+            self._nodes,
+            self._degree,
+            copy=True,
+            verify=False,
+            frozen=self._frozen,
+        )
 
     def evaluate(self, s):
         r"""Evaluate :math:`B(s)` along the curve.
@@ -265,15 +471,30 @@ class Curve(_base.Base):
                   [0.  , 0.5 , 1.  , 1.5 , 2.  ],
                   [0.  , 0.75, 1.5 , 2.25, 3.  ]])
 
+        If the same ``s``-values will be used for many curves, a
+        :class:`SamplePlan` can be passed instead of ``s_vals``. The plan
+        caches the Bernstein basis so evaluation is a single matrix product.
+
+        .. doctest:: curve-eval-multi
+
+           >>> plan = bezier.curve.SamplePlan(1, s_vals)
+           >>> curve.evaluate_multi(plan)
+           array([[0.  , 0.25, 0.5 , 0.75, 1.  ],
+                  [0.  , 0.5 , 1.  , 1.5 , 2.  ],
+                  [0.  , 0.75, 1.5 , 2.25, 3.  ]])
+
         Args:
-            s_vals (numpy.ndarray): Parameters along the curve (as a
-                1D array).
+            s_vals (Union[numpy.ndarray, SamplePlan]): Parameters along the
+                curve (as a 1D array) or a sample plan for the curve's degree.
 
         Returns:
             numpy.ndarray: The points on the curve. As a two dimensional
             NumPy array, with the columns corresponding to each ``s``
             value and the rows to the dimension.
         """
+        if isinstance(s_vals, SamplePlan):
+            return s_vals.evaluate(self._nodes)
+
         return _curve_helpers.evaluate_multi(self._nodes, s_vals)
 
     def evaluate_hodograph(self, s):
@@ -306,6 +527,14 @@ class Curve(_base.Base):
             numpy.ndarray: The tangent vector along the curve (as a two
             dimensional NumPy array with a single column).
         """
+        if self._frozen and self._degree > 0:
+            hodograph = self._cached(
+                "_hodograph", _py_curve_helpers.hodograph_nodes
+            )
+            return _curve_helpers.evaluate_multi(
+                hodograph, np.asfortranarray([s])
+            )
+
         return _curve_helpers.evaluate_hodograph(s, self._nodes)
 
     def plot(self, num_pts, color=None, alpha=None, ax=None):
@@ -332,14 +561,13 @@ class Curve(_base.Base):
                 self._dimension,
             )
 
-        s_vals = np.linspace(0.0, 1.0, num_pts)
-        points = self.evaluate_multi(s_vals)
+        points = _plot_plan(self._degree, num_pts).evaluate(self._nodes)
         if ax is None:
             ax = _plot_helpers.new_axis()
         ax.plot(points[0, :], points[1, :], color=color, alpha=alpha)
         return ax
 
-    def subdivide(self):
+    def subdivide(self, levels=None):
         r"""Split the curve :math:`B(s)` into a left and right half.
 
         Takes the interval :math:`\left[0, 1\right]` and splits the curve into
@@ -372,16 +600,73 @@ class Curve(_base.Base):
            import make_images
            make_images.curve_subdivide(curve, left, right)
 
+        To build a hierarchy of sub-curves, pass ``levels``. Subdividing
+        :math:`k` times produces :math:`2^k` sub-curves, which are computed
+        in a single pass (via cached matrices for each degree) and returned
+        as stacked nodes rather than as :class:`Curve` objects:
+
+        .. doctest:: curve-subdivide-levels
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 1.25, 2.0],
+           ...     [0.0, 3.0 , 1.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> pieces = curve.subdivide(levels=2)
+           >>> pieces.shape
+           (4, 2, 3)
+           >>> pieces[2]
+           array([[1.125  , 1.375  , 1.59375],
+                  [1.75   , 1.875  , 1.6875 ]])
+
+        Args:
+            levels (Optional[int]): The number of times to subdivide. If
+                not provided, the curve is subdivided once and the halves
+                are returned as :class:`Curve` objects.
+
         Returns:
-            Tuple[Curve, Curve]: The left and right sub-curves.
+            Union[Tuple[Curve, Curve], numpy.ndarray]: The left and right
+            sub-curves or, if ``levels`` is provided, the stacked nodes of
+            the :math:`P = 2^k` sub-curves as a ``P x D x N`` array (ordered
+            from left to right).
+
+        Raises:
+            ValueError: If ``levels`` is negative.
         """
+        if levels is not None:
+            if levels < 0:
+                raise ValueError(
+                    "Number of levels must be non-negative", levels
+                )
+
+            return _py_curve_helpers.subdivide_nodes_levels(
+                self._nodes, levels
+            )
+
         left_nodes, right_nodes = _curve_helpers.subdivide_nodes(self._nodes)
-        left = Curve(left_nodes, self._degree, copy=False, verify=False)
-        right = Curve(right_nodes, self._degree, copy=False, verify=False)
+        left = Curve(
+            left_nodes,
+            self._degree,
+            copy=False,
+            verify=False,
+            frozen=self._frozen,
+        )
+        right = Curve(
+            right_nodes,
+            self._degree,
+            copy=False,
+            verify=False,
+            frozen=self._frozen,
+        )
         return left, right
 
     def intersect(
-        self, other, strategy=IntersectionStrategy.GEOMETRIC, _verify=True
+        self,
+        other,
+        strategy=IntersectionStrategy.GEOMETRIC,
+        _verify=True,
+        workspace=None,
     ):
         """Find the points of intersection with another curve.
 
@@ -417,6 +702,10 @@ class Curve(_base.Base):
            import make_images
            make_images.curve_intersect(curve1, curve2, s_vals)
 
+        If the process-wide intersection cache is enabled (see
+        :func:`bezier.configure`), a result previously computed for the
+        same nodes (in either order) and ``strategy`` is re-used.
+
         Args:
             other (Curve): Other curve to intersect with.
             strategy (Optional[~bezier.curve.IntersectionStrategy]): The
@@ -425,6 +714,11 @@ class Curve(_base.Base):
                 used to verify assumptions about the input and current
                 curve. Can be disabled to speed up execution time.
                 Defaults to :data:`True`.
+            workspace (Optional[IntersectionWorkspace]): Storage re-used
+                across calls by the geometric and clipping strategies. Each
+                thread has its own default workspace, so this is only needed
+                to manage workspaces explicitly (e.g. one per worker). A
+                workspace must not be used by two calls at the same time.
 
         Returns:
             numpy.ndarray: ``2 x N`` array of ``s``- and ``t``-parameters where
@@ -448,15 +742,67 @@ class Curve(_base.Base):
                     "Intersection only implemented in 2D"
                 )
 
+        # NOTE: The cached bounding boxes / convex hulls of frozen curves
+        #       can rule out any intersections before doing any real work.
+        if (
+            strategy in _STRATEGIES
+            and (self._frozen or other.frozen)
+            and self._disjoint_from(other)
+        ):
+            return np.empty((2, 0), order="F")
+
+        cache = intersection_cache.get_cache()
+        if cache is None:
+            return self._intersect(other, strategy, workspace)
+
+        return intersection_cache.curve_intersections(
+            cache,
+            self,
+            other,
+            strategy,
+            lambda: self._intersect(other, strategy, workspace),
+        )
+
+    def _intersect(self, other, strategy, workspace):
+        """Find the points of intersection with another curve.
+
+        This is a helper for :meth:`intersect`, which does the checks on
+        the inputs and (optionally) caches the results.
+
+        Args:
+            other (Curve): Other curve to intersect with.
+            strategy (~bezier.curve.IntersectionStrategy): The intersection
+                algorithm to use.
+            workspace (Optional[IntersectionWorkspace]): Storage re-used
+                across calls by the geometric and clipping strategies.
+
+        Returns:
+            numpy.ndarray: ``2 x N`` array of ``s``- and ``t``-parameters where
+            intersections occur (possibly empty).
+
+        Raises:
+            ValueError: If ``strategy`` is not a valid
+                :class:`.IntersectionStrategy`.
+        """
         if strategy == IntersectionStrategy.GEOMETRIC:
-            all_intersections = _geometric_intersection.all_intersections
-        elif strategy == IntersectionStrategy.ALGEBRAIC:
-            all_intersections = _algebraic_intersection.all_intersections
-        else:
-            raise ValueError("Unexpected strategy.", strategy)
+            st_vals, _ = _geometric_intersection.all_intersections(
+                self._nodes, other._nodes, workspace=workspace
+            )
+            return st_vals
 
-        st_vals, _ = all_intersections(self._nodes, other._nodes)
-        return st_vals
+        if strategy == IntersectionStrategy.ALGEBRAIC:
+            st_vals, _ = _algebraic_intersection.all_intersections(
+                self._algebraic_nodes(), Curve._algebraic_nodes(other)
+            )
+            return st_vals
+
+        if strategy == IntersectionStrategy.CLIPPING:
+            st_vals, _ = _geometric_intersection.all_intersections_clipping(
+                self._nodes, other._nodes, workspace=workspace
+            )
+            return st_vals
+
+        raise ValueError("Unexpected strategy.", strategy)
 
     def elevate(self):
         r"""Return a degree-elevated version of the current curve.
@@ -733,8 +1079,115 @@ class Curve(_base.Base):
             )
             raise ValueError(msg)
 
+        if self._frozen and self._dimension == 2:
+            left, right, bottom, top = self._get_bbox()
+            x_val, y_val = point[:, 0]
+            if not (left <= x_val <= right and bottom <= y_val <= top):
+                return None
+
         return _curve_helpers.locate_point(self._nodes, point)
 
+    def locate_multi(self, points):
+        r"""Find multiple points on the current curve.
+
+        Solves for :math:`s` in :math:`B(s) = p` for each column
+        :math:`p` of ``points``. See :meth:`locate` for more details on how
+        each point is located.
+
+        .. doctest:: curve-locate-multi
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, -1.0, 1.0, -0.75 ],
+           ...     [2.0,  0.0, 1.0,  1.625],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=3)
+           >>> points = np.asfortranarray([
+           ...     [-0.09375 , 0.0, -0.75 ],
+           ...     [ 0.828125, 1.5,  1.625],
+           ... ])
+           >>> curve.locate_multi(points)
+           array([0.5, nan, 1. ])
+
+        Args:
+            points (numpy.ndarray): A ``D x N`` array of points, where
+                :math:`D` is the dimension of the curve.
+
+        Returns:
+            numpy.ndarray: 1D array of the parameter values (:math:`s`)
+            corresponding to each point, with NaN for each point that is
+            not on the ``curve``.
+
+        Raises:
+            ValueError: If the dimension of the ``points`` doesn't match the
+                dimension of the current curve.
+        """
+        if points.ndim != 2 or points.shape[0] != self._dimension:
+            points_dimensions = " x ".join(
+                str(dimension) for dimension in points.shape
+            )
+            msg = _LOCATE_MULTI_ERROR_TEMPLATE.format(
+                self._dimension, self._dimension, points_dimensions
+            )
+            raise ValueError(msg)
+
+        points = np.asfortranarray(points, dtype=np.float64)
+        return _curve_helpers.locate_point_multi(self._nodes, points)
+
+    def flatten(self, tolerance):
+        r"""Approximate the current curve by a polyline.
+
+        Rather than sampling at uniformly spaced parameters, the curve is
+        recursively subdivided until each piece is within ``tolerance``
+        of the line segment joining its endpoints. Hence nearly straight
+        parts of the curve get few vertices while tight bends get many.
+
+        .. doctest:: curve-flatten
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 1.0, 2.0],
+           ...     [0.0, 2.0, 0.0],
+           ... ])
+           >>> curve = bezier.Curve(nodes, degree=2)
+           >>> vertices, s_vals = curve.flatten(0.25)
+           >>> vertices
+           array([[0., 1., 2.],
+                  [0., 1., 0.]])
+           >>> s_vals
+           array([0. , 0.5, 1. ])
+
+        Args:
+            tolerance (float): The maximum distance allowed between the
+                curve and the polyline (measured as an upper bound on the
+                error of each linear segment).
+
+        Returns:
+            Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+            * The vertices of the polyline (as the columns of a ``D x M``
+              array). These start and end at the endpoints of the curve.
+            * The parameter :math:`s` of each vertex (as a 1D array).
+
+        Raises:
+            ValueError: If ``tolerance`` is not positive.
+        """
+        if not tolerance > 0.0:
+            raise ValueError("Tolerance must be positive", tolerance)
+
+        if self._frozen and self._degree > 0:
+            error = self._cached(
+                "_linearization_error",
+                _py_geometric_intersection.linearization_error,
+            )
+            if error <= tolerance:
+                return (
+                    self._nodes[:, [0, -1]].copy(order="F"),
+                    np.asfortranarray([0.0, 1.0]),
+                )
+
+        return _geometric_intersection.flatten_curve(self._nodes, tolerance)
+
     # Return type doc appears missing to Pylint because of the use of the
     # :class:`sympy.Matrix ...` aliases.
     # pylint: disable=missing-return-type-doc
@@ -800,3 +1253,623 @@ class Curve(_base.Base):
         return _symbolic.implicitize_curve(self._nodes, self._degree)
 
     # pylint: enable=missing-return-type-doc
+
+
+class SamplePlan:
+    r"""Cached Bernstein basis for evaluating curves on a fixed grid.
+
+    Evaluating a degree :math:`n` curve at a fixed set of parameters
+    :math:`s_1, \ldots, s_K` is a linear map of the nodes:
+
+    .. math::
+
+       \left[\begin{array}{c c c} B(s_1) & \cdots & B(s_K)
+           \end{array}\right] = V \cdot M, \quad
+           M_{jk} = \binom{n}{j} (1 - s_k)^{n - j} s_k^j.
+
+    A plan computes the basis matrix :math:`M` once (per degree and grid)
+    so that each evaluation becomes a single matrix product, rather than
+    recomputing the powers and binomial coefficients for every curve.
+
+    .. doctest:: sample-plan
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> s_vals = np.linspace(0.0, 1.0, 5)
+       >>> plan = bezier.curve.SamplePlan(2, s_vals)
+       >>> plan
+       <SamplePlan (degree=2, num_vals=5)>
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 1.0, 2.0],
+       ...     [0.0, 2.0, 0.0],
+       ... ])
+       >>> plan.evaluate(nodes)
+       array([[0.  , 0.5 , 1.  , 1.5 , 2.  ],
+              [0.  , 0.75, 1.  , 0.75, 0.  ]])
+
+    The result may differ from :meth:`Curve.evaluate_multi` in the last
+    few bits, since the sums are accumulated in a different order.
+
+    Args:
+        degree (int): The degree of the curves the plan will evaluate.
+        s_vals (numpy.ndarray): Parameters along the curves (as a
+            1D array).
+
+    Raises:
+        ValueError: If ``degree`` is negative.
+        ValueError: If ``s_vals`` is not 1D.
+    """
+
+    __slots__ = ("_degree", "_s_vals", "_basis")
+
+    def __init__(self, degree, s_vals):
+        if degree < 0:
+            raise ValueError("Degree must be non-negative", degree)
+
+        s_vals = np.array(s_vals, dtype=np.float64, order="F")
+        if s_vals.ndim != 1:
+            raise ValueError(
+                "Parameters must be 1-dimensional, not", s_vals.ndim
+            )
+
+        self._degree = degree
+        self._s_vals = s_vals
+        self._basis = _curve_helpers.bernstein_basis(degree, s_vals)
+        # Plans are shared (e.g. by ``Curve.plot()``), so they can't change.
+        self._s_vals.flags.writeable = False
+        self._basis.flags.writeable = False
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (degree={:d}, num_vals={:d})>".format(
+            self.__class__.__name__, self._degree, self._s_vals.size
+        )
+
+    @property
+    def degree(self):
+        """int: The degree of the curves the plan evaluates."""
+        return self._degree
+
+    @property
+    def s_vals(self):
+        """numpy.ndarray: The (read-only) parameters of the plan."""
+        return self._s_vals
+
+    @property
+    def basis(self):
+        """numpy.ndarray: The (read-only) cached basis matrix.
+
+        Row ``j`` holds the ``j``-th Bernstein basis function evaluated at
+        each of the :attr:`s_vals`.
+        """
+        return self._basis
+
+    def evaluate(self, nodes):
+        """Evaluate one curve or a stack of curves on the plan's grid.
+
+        Args:
+            nodes (numpy.ndarray): The nodes of a single curve (as a
+                ``D x N`` array) or the stacked nodes of many curves (as a
+                ``C x D x N`` array, where the first index is the curve).
+
+        Returns:
+            numpy.ndarray: The points on the curve(s). Either a ``D x K``
+            array or a ``C x D x K`` array, matching the layout of
+            :meth:`Curve.evaluate_multi` and :func:`evaluate_curves`.
+
+        Raises:
+            ValueError: If the number of nodes does not match the plan's
+                degree.
+            ValueError: If ``nodes`` is not 2D or 3D.
+        """
+        nodes = np.asfortranarray(nodes)
+        if nodes.ndim not in (2, 3):
+            raise ValueError(
+                "Nodes must be 2- or 3-dimensional, not", nodes.ndim
+            )
+
+        num_nodes = nodes.shape[-1]
+        expected_nodes = self._degree + 1
+        if num_nodes != expected_nodes:
+            msg = (
+                f"A degree {self._degree} plan should have "
+                f"{expected_nodes} nodes, not {num_nodes}."
+            )
+            raise ValueError(msg)
+
+        # For a Fortran-ordered stack, the reshape is a view, so the whole
+        # batch is a single ``(C D) x N`` matrix product.
+        flat_nodes = nodes.reshape((-1, num_nodes), order="F")
+        # NOTE: Transposing both factors (and the product) means NumPy
+        #       writes a Fortran-ordered result directly.
+        evaluated = np.matmul(self._basis.T, flat_nodes.T).T
+        if nodes.ndim == 2:
+            return evaluated
+
+        return evaluated.reshape(nodes.shape[:2] + (-1,), order="F")
+
+
+@functools.lru_cache(maxsize=_PLOT_PLAN_CACHE_SIZE)
+def _plot_plan(degree, num_pts):
+    """Get the plan used to plot curves of a given degree.
+
+    The plans are memoized (in a bounded cache), so repeatedly plotting
+    curves of the same degree only computes the basis once.
+
+    Args:
+        degree (int): The degree of the curves.
+        num_pts (int): Number of points to plot.
+
+    Returns:
+        SamplePlan: The plan, for ``num_pts`` equally spaced parameters.
+    """
+    return SamplePlan(degree, np.linspace(0.0, 1.0, num_pts))
+
+
+class ArcLengthTable:
+    r"""Table of cumulative arc length along a curve.
+
+    The arc length along a curve is
+
+    .. math::
+
+       L(s) = \int_0^s \left\lVert B'(r) \right\rVert_2 \, dr.
+
+    The table stores breakpoints :math:`0 = s_0 < \cdots < s_m = 1`
+    (found by adaptively bisecting until a fixed-order Gauss-Legendre rule
+    has converged on each interval) along with :math:`L(s_j)` at each
+    breakpoint. The nodes of the hodograph :math:`B'(s)` are computed once
+    and shared by every query, so that :math:`L(s)` and its inverse only
+    require a quadrature over part of a single interval.
+
+    .. doctest:: arc-length-table
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [0.0, 1.0, 3.0],
+       ...     [0.0, 0.0, 0.0],
+       ... ])
+       >>> table = bezier.curve.ArcLengthTable(nodes)
+       >>> round(table.length, 12)
+       3.0
+       >>> table.s_at_length([0.0, 1.25, 3.0])
+       array([0. , 0.5, 1. ])
+       >>> table.length_between(0.0, [0.5, 1.0])
+       array([1.25, 3.  ])
+
+    Args:
+        nodes (Sequence[Sequence[numbers.Number]]): The nodes in the curve.
+            Must be convertible to a 2D NumPy array of floating point values,
+            where the columns represent each node while the rows are the
+            dimension of the ambient space.
+
+    Raises:
+        ValueError: If ``nodes`` has zero columns.
+    """
+
+    __slots__ = ("_first_deriv", "_breakpoints", "_cumulative")
+
+    def __init__(self, nodes):
+        nodes_np = np.asfortranarray(_base.sequence_to_array(nodes))
+        _, num_nodes = nodes_np.shape
+        if num_nodes == 0:
+            raise ValueError("Curve should have at least one node.")
+
+        self._first_deriv = _py_curve_helpers.hodograph_nodes(nodes_np)
+        (
+            self._breakpoints,
+            self._cumulative,
+        ) = _py_curve_helpers.arc_length_breakpoints(self._first_deriv)
+        # Tables are cached (e.g. by ``Curve.arc_length_table``), so they
+        # can't change.
+        self._breakpoints.flags.writeable = False
+        self._cumulative.flags.writeable = False
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (num_intervals={:d})>".format(
+            self.__class__.__name__, self._breakpoints.size - 1
+        )
+
+    @property
+    def length(self):
+        """float: The length of the curve."""
+        return float(self._cumulative[-1])
+
+    @property
+    def breakpoints(self):
+        """numpy.ndarray: The (read-only) breakpoints :math:`s_j`."""
+        return self._breakpoints
+
+    @property
+    def cumulative_lengths(self):
+        """numpy.ndarray: The (read-only) arc length at each breakpoint."""
+        return self._cumulative
+
+    def s_at_length(self, lengths):
+        """Find the parameters along the curve at given arc lengths.
+
+        This is the inverse of :math:`L(s)`, so equally spaced ``lengths``
+        give equally spaced points along the curve.
+
+        Args:
+            lengths (Union[float, numpy.ndarray]): Arc length(s) from the
+                start of the curve.
+
+        Returns:
+            numpy.ndarray: The parameter :math:`s` for each length (with the
+            same shape as ``lengths``).
+
+        Raises:
+            ValueError: If any of the ``lengths`` are negative or exceed
+                the length of the curve (beyond the accuracy of
+                :attr:`Curve.length`).
+        """
+        lengths_np = np.asarray(lengths, dtype=np.float64)
+        # NOTE: Lengths computed elsewhere (e.g. :attr:`Curve.length`, via
+        #       QUADPACK) are only accurate to :math:`2^{-26}`, so lengths
+        #       within that tolerance of the endpoints are clamped to them.
+        wiggle = _LENGTH_WIGGLE * max(self.length, 1.0)
+        if np.any(lengths_np < -wiggle) or np.any(
+            lengths_np > self.length + wiggle
+        ):
+            raise ValueError(
+                "Lengths must be between 0 and the curve length",
+                self.length,
+            )
+
+        s_vals = _py_curve_helpers.arc_length_inverse(
+            self._first_deriv,
+            self._breakpoints,
+            self._cumulative,
+            np.clip(lengths_np.ravel(), 0.0, self.length),
+        )
+        return s_vals.reshape(lengths_np.shape)
+
+    def length_between(self, start, end):
+        """Compute the arc length between two parameters along the curve.
+
+        Args:
+            start (Union[float, numpy.ndarray]): The start parameter(s).
+            end (Union[float, numpy.ndarray]): The end parameter(s). Must
+                broadcast with ``start``.
+
+        Returns:
+            numpy.ndarray: The (signed) arc length from each ``start`` to
+            the corresponding ``end``.
+        """
+        start_np, end_np = np.broadcast_arrays(
+            np.asarray(start, dtype=np.float64),
+            np.asarray(end, dtype=np.float64),
+        )
+        s_vals = np.concatenate([start_np.ravel(), end_np.ravel()])
+        arc_lengths = _py_curve_helpers.arc_length_at(
+            self._first_deriv, self._breakpoints, self._cumulative, s_vals
+        )
+        num_vals = start_np.size
+        between = arc_lengths[num_vals:] - arc_lengths[:num_vals]
+        return between.reshape(start_np.shape)
+
+
+def evaluate_curves(nodes, s_vals):
+    r"""Evaluate :math:`B_j(s)` for a batch of curves at shared parameters.
+
+    All of the curves must have the same degree and dimension, so that their
+    nodes can be stacked into a single ``C x D x N`` array (where the first
+    index is the curve). This evaluates every curve at every ``s``-value in
+    a single call, rather than once per :class:`Curve`.
+
+    .. doctest:: evaluate-curves
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 1.0, 2.0],
+       ...      [0.0, 2.0, 0.0]],
+       ...     [[1.0, 1.0, 1.0],
+       ...      [0.0, 1.0, 2.0]],
+       ... ])
+       >>> s_vals = np.asfortranarray([0.0, 0.5, 1.0])
+       >>> evaluated = bezier.curve.evaluate_curves(nodes, s_vals)
+       >>> evaluated.shape
+       (2, 2, 3)
+       >>> evaluated[0, :, :]
+       array([[0., 1., 2.],
+              [0., 1., 0.]])
+       >>> evaluated[1, :, :]
+       array([[1., 1., 1.],
+              [0., 1., 2.]])
+
+    Args:
+        nodes (Sequence[Sequence[Sequence[numbers.Number]]]): The stacked
+            nodes of the curves. Must be convertible to a 3D NumPy array of
+            floating point values, where the first index is the curve, the
+            second is the dimension of the ambient space and the third is
+            the node.
+        s_vals (Union[Sequence[float], SamplePlan]): Parameters along the
+            curves (as a 1D array) or a sample plan for the curves' degree.
+
+    Returns:
+        numpy.ndarray: The points on the curves. As a three dimensional
+        NumPy array, with the first index corresponding to the curve, the
+        second to the dimension and the third to each ``s`` value.
+
+    Raises:
+        ValueError: If the ``nodes`` are not 3D.
+    """
+    nodes_np = np.asfortranarray(_base.sequence_to_array(nodes, ndim=3))
+    if isinstance(s_vals, SamplePlan):
+        return s_vals.evaluate(nodes_np)
+
+    s_vals = np.asfortranarray(s_vals, dtype=np.float64)
+    return _curve_helpers.evaluate_curves_multi(nodes_np, s_vals)
+
+
+def flatten_curves(nodes, tolerance):
+    """Approximate each curve in a batch by a polyline.
+
+    All of the curves must have the same degree and dimension, so that their
+    nodes can be stacked into a single ``C x D x N`` array (where the first
+    index is the curve). See :meth:`Curve.flatten` for how each curve is
+    flattened; this flattens every curve in a single call.
+
+    .. doctest:: flatten-curves
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 1.0, 2.0],
+       ...      [0.0, 2.0, 0.0]],
+       ...     [[0.0, 1.0, 2.0],
+       ...      [1.0, 1.0, 1.0]],
+       ... ])
+       >>> vertices, s_vals, offsets = bezier.curve.flatten_curves(
+       ...     nodes, 0.25)
+       >>> vertices
+       array([[0., 1., 2., 0., 2.],
+              [0., 1., 0., 1., 1.]])
+       >>> s_vals
+       array([0. , 0.5, 1. , 0. , 1. ])
+       >>> offsets
+       array([0, 3, 5], dtype=int32)
+
+    Args:
+        nodes (Sequence[Sequence[Sequence[numbers.Number]]]): The stacked
+            nodes of the curves. Must be convertible to a 3D NumPy array of
+            floating point values, where the first index is the curve, the
+            second is the dimension of the ambient space and the third is
+            the node.
+        tolerance (float): The maximum distance allowed between each curve
+            and its polyline.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: Triple of
+
+        * The vertices of all of the polylines, concatenated (as the
+          columns of a ``D x M`` array).
+        * The parameter :math:`s` of each vertex (as a 1D array).
+        * The offsets of each polyline (as a 1D array with ``C + 1``
+          entries), i.e. the vertices of curve ``j`` are the columns
+          ``offsets[j]:offsets[j + 1]``.
+
+    Raises:
+        ValueError: If the ``nodes`` are not 3D.
+        ValueError: If ``tolerance`` is not positive.
+    """
+    nodes_np = np.asfortranarray(_base.sequence_to_array(nodes, ndim=3))
+    if not tolerance > 0.0:
+        raise ValueError("Tolerance must be positive", tolerance)
+
+    num_curves, dimension, _ = nodes_np.shape
+    if num_curves == 0:
+        return (
+            np.empty((dimension, 0), order="F"),
+            np.empty((0,)),
+            np.zeros((1,), dtype=np.intc),
+        )
+
+    return _geometric_intersection.flatten_curves(nodes_np, tolerance)
+
+
+def curve_lengths(nodes, rtol=0.5 ** 40):
+    r"""Compute the lengths of a batch of curves.
+
+    All of the curves must have the same degree and dimension, so that their
+    nodes can be stacked into a single ``C x D x N`` array (where the first
+    index is the curve). Rather than computing :attr:`Curve.length` once per
+    curve, this integrates
+
+    .. math::
+
+       \int_0^1 \left\lVert B_j'(s) \right\rVert_2 \, ds
+
+    with a fixed-order Gauss-Legendre rule for every curve at once. Only
+    the curves (and the parts of each curve) where the rule has not met the
+    relative tolerance ``rtol`` are refined further. (When the compiled
+    speedup is available, the whole batch is instead integrated in Fortran
+    with QUADPACK, using ``rtol`` as the relative tolerance.)
+
+    .. doctest:: curve-lengths
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 0.5, 1.0],
+       ...      [0.0, 1.0, 0.0]],
+       ...     [[0.0, 3.0, 6.0],
+       ...      [0.0, 4.0, 8.0]],
+       ... ])
+       >>> lengths = bezier.curve.curve_lengths(nodes)
+       >>> round(lengths[0], 12)
+       1.478942857545
+       >>> round(lengths[1], 12)
+       10.0
+
+    Args:
+        nodes (Sequence[Sequence[Sequence[numbers.Number]]]): The stacked
+            nodes of the curves. Must be convertible to a 3D NumPy array of
+            floating point values, where the first index is the curve, the
+            second is the dimension of the ambient space and the third is
+            the node.
+        rtol (Optional[float]): The relative tolerance for the length of
+            each curve. Defaults to :math:`2^{-40}`.
+
+    Returns:
+        numpy.ndarray: The length of each curve (as a 1D array).
+
+    Raises:
+        ValueError: If the ``nodes`` are not 3D.
+        ValueError: If ``rtol`` is not positive.
+    """
+    nodes_np = np.asfortranarray(_base.sequence_to_array(nodes, ndim=3))
+    # NOTE: Written with ``not`` so that a NaN ``rtol`` is also rejected.
+    if not rtol > 0.0:  # pylint: disable=unneeded-not
+        raise ValueError("Relative tolerance must be positive", rtol)
+
+    num_curves, _, _ = nodes_np.shape
+    if num_curves == 0:
+        return np.empty((0,))
+
+    return _curve_helpers.compute_length_multi(nodes_np, rtol)
+
+
+def _pack_nodes(nodes_list):
+    """Pack the nodes of many planar curves into a single array.
+
+    Args:
+        nodes_list (Sequence[Sequence[Sequence[numbers.Number]]]): The nodes
+            of each curve.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray]: Pair of
+
+        * The nodes of every curve, concatenated (as a ``2 x M`` array).
+        * The offsets of each curve (as a 1D array with ``P + 1`` entries),
+          i.e. the nodes of curve ``j`` are the columns
+          ``offsets[j]:offsets[j + 1]``.
+
+    Raises:
+        NotImplementedError: If one of the curves is not two-dimensional.
+        ValueError: If one of the curves has no nodes.
+    """
+    all_nodes = [_base.sequence_to_array(nodes) for nodes in nodes_list]
+    shapes = np.array(
+        [nodes.shape for nodes in all_nodes], dtype=np.intc
+    ).reshape((-1, 2))
+    bad_dimension = np.flatnonzero(shapes[:, 0] != 2)
+    if bad_dimension.size > 0:
+        index = int(bad_dimension[0])
+        raise NotImplementedError(
+            "Intersection only implemented in 2D",
+            "Curve",
+            index,
+            "has dimension",
+            int(shapes[index, 0]),
+        )
+
+    no_nodes = np.flatnonzero(shapes[:, 1] == 0)
+    if no_nodes.size > 0:
+        raise ValueError("Curve", int(no_nodes[0]), "has no nodes")
+
+    offsets = np.zeros((len(all_nodes) + 1,), dtype=np.intc)
+    np.cumsum(shapes[:, 1], out=offsets[1:])
+    if all_nodes:
+        # NOTE: Concatenating C-ordered transposes (i.e. ``N x 2`` blocks)
+        #       along the rows writes a Fortran-ordered ``2 x M`` result.
+        packed = np.concatenate([nodes.T for nodes in all_nodes]).T
+    else:
+        packed = np.empty((2, 0), order="F")
+    return packed, offsets
+
+
+def intersect_pairs(nodes_list_a, nodes_list_b, workspace=None):
+    """Intersect many pairs of planar curves at once.
+
+    Pair ``j`` is made of the curves with nodes ``nodes_list_a[j]`` and
+    ``nodes_list_b[j]`` (the curves may have any degree). Rather than
+    calling :meth:`Curve.intersect` once per pair, the nodes are packed
+    into two arrays and every pair is intersected (via the geometric
+    strategy) in a single call. A pair for which the intersection fails
+    does not stop the batch; it is reported in ``errors`` instead.
+
+    .. doctest:: intersect-pairs
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes_list_a = [
+       ...     [[0.0, 0.375, 0.75 ],
+       ...      [0.0, 0.75 , 0.375]],
+       ...     [[0.0, 1.0],
+       ...      [0.0, 0.0]],
+       ... ]
+       >>> nodes_list_b = [
+       ...     [[0.5, 0.5 ],
+       ...      [0.0, 0.75]],
+       ...     [[0.0, 1.0],
+       ...      [1.0, 1.0]],
+       ... ]
+       >>> result = bezier.curve.intersect_pairs(nodes_list_a, nodes_list_b)
+       >>> result.offsets
+       array([0, 1, 1], dtype=int32)
+       >>> 3.0 * result.s_vals, 3.0 * result.t_vals
+       (array([2.]), array([2.]))
+       >>> result.coincident
+       array([False, False])
+       >>> result.errors
+       []
+
+    Args:
+        nodes_list_a (Sequence[Sequence[Sequence[numbers.Number]]]): The
+            nodes of the first curve in each pair. Each must be convertible
+            to a ``2 x N`` NumPy array of floating point values.
+        nodes_list_b (Sequence[Sequence[Sequence[numbers.Number]]]): The
+            nodes of the second curve in each pair.
+        workspace (Optional[IntersectionWorkspace]): Storage re-used across
+            pairs (and calls). See :meth:`Curve.intersect`.
+
+    Returns:
+        PairIntersections: A named tuple with fields
+
+        * ``offsets``: The offsets of the intersections of each pair (as a
+          1D array with ``P + 1`` entries), i.e. the intersections of pair
+          ``j`` are at the indices ``offsets[j]:offsets[j + 1]``.
+        * ``s_vals``: The ``s``-parameters (along the first curve) of all of
+          the intersections (as a 1D array).
+        * ``t_vals``: The ``t``-parameters (along the second curve) of all
+          of the intersections (as a 1D array).
+        * ``coincident``: Flags indicating if the curves in each pair are
+          coincident (as a 1D boolean array).
+        * ``errors``: The pairs that failed (and have no intersections), as
+          a list of ``(j, exception)`` pairs.
+
+    Raises:
+        ValueError: If the lists of nodes have different lengths.
+        NotImplementedError: If one of the curves is not two-dimensional.
+        ValueError: If one of the curves has no nodes.
+    """
+    if len(nodes_list_a) != len(nodes_list_b):
+        raise ValueError(
+            "Lists of nodes must have the same length",
+            len(nodes_list_a),
+            len(nodes_list_b),
+        )
+
+    nodes_first, offsets_first = _pack_nodes(nodes_list_a)
+    nodes_second, offsets_second = _pack_nodes(nodes_list_b)
+    (
+        offsets,
+        st_vals,
+        coincident,
+        errors,
+    ) = _geometric_intersection.all_intersections_pairs(
+        nodes_first,
+        offsets_first,
+        nodes_second,
+        offsets_second,
+        workspace=workspace,
+    )
+    return PairIntersections(
+        offsets, st_vals[0, :], st_vals[1, :], coincident, errors
+    )
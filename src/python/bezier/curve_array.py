@@ -0,0 +1,370 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Arrays of B |eacute| zier curves with contiguous storage.
+
+A list of many small :class:`.Curve` objects spends most of its memory
+(and most of its time in vectorized code) on per-object overhead: each
+curve has its own nodes array and its own slots for cached quantities. A
+:class:`CurveArray` instead stores the nodes of many curves of the same
+degree and dimension in a single ``C x D x N`` array (the layout used by
+:func:`.evaluate_curves` and :func:`.curve_lengths`), so each operation is
+a single call for the whole batch.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+import numpy as np
+
+from bezier import _base
+from bezier import _curve_helpers
+from bezier import _py_curve_helpers
+from bezier import curve as _curve_mod
+
+
+class CurveArray:
+    r"""A fixed number of curves with the same degree and dimension.
+
+    The nodes are stored in one Fortran-ordered ``C x D x N`` array, where
+    the first index is the curve. Indexing with an integer creates a
+    :class:`.Curve` (copying only the nodes of that curve) while indexing
+    with a slice (or an array of indices) creates another
+    :class:`CurveArray`.
+
+    .. doctest:: curve-array-constructor
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes = np.asfortranarray([
+       ...     [[0.0, 1.0, 2.0],
+       ...      [0.0, 2.0, 0.0]],
+       ...     [[1.0, 1.0, 1.0],
+       ...      [0.0, 1.0, 2.0]],
+       ... ])
+       >>> curves = bezier.CurveArray(nodes)
+       >>> curves
+       <CurveArray (num_curves=2, degree=2, dimension=2)>
+       >>> curves[1]
+       <Curve (degree=2, dimension=2)>
+       >>> curves.evaluate(0.5)
+       array([[1., 1.],
+              [1., 1.]])
+
+    Args:
+        nodes (Sequence[Sequence[Sequence[numbers.Number]]]): The stacked
+            nodes of the curves. Must be convertible to a 3D NumPy array of
+            floating point values, where the first index is the curve, the
+            second is the dimension of the ambient space and the third is
+            the node.
+        copy (bool): Flag indicating if the nodes should be copied before
+            being stored. Defaults to :data:`True` since callers may
+            freely mutate ``nodes`` after passing in.
+
+    Raises:
+        ValueError: If the ``nodes`` are not 3D.
+        ValueError: If the curves have no nodes.
+    """
+
+    __slots__ = ("_nodes", "_degree", "_dimension")
+
+    def __init__(self, nodes, copy=True):
+        nodes_np = _base.sequence_to_array(nodes, ndim=3)
+        _, dimension, num_nodes = nodes_np.shape
+        if num_nodes == 0:
+            raise ValueError("Curves must have at least one node")
+
+        if copy:
+            self._nodes = nodes_np.copy(order="F")
+        else:
+            self._nodes = np.asfortranarray(nodes_np)
+        self._degree = num_nodes - 1
+        self._dimension = dimension
+
+    @classmethod
+    def from_curves(cls, curves):
+        """Create an array by stacking the nodes of some curves.
+
+        .. doctest:: curve-array-from-curves
+
+           >>> curves = bezier.CurveArray.from_curves([
+           ...     bezier.Curve.from_nodes([[0.0, 1.0], [0.0, 1.0]]),
+           ...     bezier.Curve.from_nodes([[2.0, 3.0], [0.0, 1.0]]),
+           ... ])
+           >>> curves
+           <CurveArray (num_curves=2, degree=1, dimension=2)>
+
+        Args:
+            curves (Iterable[~bezier.curve.Curve]): The curves. Must all
+                have the same degree and dimension.
+
+        Returns:
+            CurveArray: The array containing each of the ``curves``.
+
+        Raises:
+            ValueError: If there are no ``curves``.
+            ValueError: If the curves do not all have the same degree and
+                dimension.
+        """
+        curves = tuple(curves)
+        if not curves:
+            raise ValueError("At least one curve is required")
+
+        first = curves[0]
+        dimension, num_nodes = first._nodes.shape
+        nodes = np.empty((len(curves), dimension, num_nodes), order="F")
+        for index, curve in enumerate(curves):
+            if curve._nodes.shape != (dimension, num_nodes):
+                raise ValueError(
+                    "Curves must have the same degree and dimension",
+                    "Curve",
+                    index,
+                    "has nodes with shape",
+                    curve._nodes.shape,
+                )
+
+            nodes[index, :, :] = curve._nodes
+
+        return cls(nodes, copy=False)
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (num_curves={:d}, degree={:d}, dimension={:d})>".format(
+            self.__class__.__name__, len(self), self._degree, self._dimension
+        )
+
+    def __len__(self):
+        """The number of curves in the array.
+
+        Returns:
+            int: The number of curves.
+        """
+        return self._nodes.shape[0]
+
+    def __getitem__(self, index):
+        """Get one curve or a sub-array of curves.
+
+        Args:
+            index (Union[int, slice, numpy.ndarray]): The index of a curve,
+                or a slice / array of indices of curves.
+
+        Returns:
+            Union[~bezier.curve.Curve, CurveArray]: The curve at ``index``
+            if ``index`` is an integer, otherwise the array of the curves
+            at ``index``.
+        """
+        nodes = self._nodes[index]
+        if nodes.ndim == 2:
+            return _curve_mod.Curve(
+                nodes, self._degree, copy=False, verify=False
+            )
+
+        return CurveArray(nodes, copy=False)
+
+    def __iter__(self):
+        """Iterate over the curves in the array.
+
+        Yields:
+            ~bezier.curve.Curve: Each curve in the array.
+        """
+        for index in range(len(self)):
+            yield self[index]
+
+    @property
+    def degree(self):
+        """int: The degree of every curve in the array."""
+        return self._degree
+
+    @property
+    def dimension(self):
+        """int: The dimension that every curve in the array lives in."""
+        return self._dimension
+
+    @property
+    def nodes(self):
+        """numpy.ndarray: The stacked nodes of the curves.
+
+        A ``C x D x N`` array, where the first index is the curve.
+        """
+        return self._nodes.copy(order="F")
+
+    @property
+    def nodes_view(self):
+        """numpy.ndarray: A read-only view of the stacked nodes.
+
+        Unlike :attr:`nodes`, this does not copy.
+        """
+        view = self._nodes.view()
+        view.flags.writeable = False
+        return view
+
+    def _transform(self, matrix):
+        """Apply the same linear map to the nodes of every curve.
+
+        Args:
+            matrix (numpy.ndarray): An ``N x M`` matrix, so that each curve
+                is mapped to ``nodes @ matrix``.
+
+        Returns:
+            CurveArray: The array of the mapped curves.
+        """
+        num_curves, dimension, num_nodes = self._nodes.shape
+        # For a Fortran-ordered stack, the reshape is a view, so the whole
+        # batch is a single ``(C D) x N`` matrix product.
+        flat_nodes = self._nodes.reshape((-1, num_nodes), order="F")
+        # NOTE: Transposing both factors (and the product) means NumPy
+        #       writes a Fortran-ordered result directly.
+        new_nodes = np.matmul(matrix.T, flat_nodes.T).T
+        new_nodes = new_nodes.reshape((num_curves, dimension, -1), order="F")
+        return CurveArray(new_nodes, copy=False)
+
+    def evaluate(self, s):
+        """Evaluate every curve at the same parameter.
+
+        Args:
+            s (float): Parameter along the curves.
+
+        Returns:
+            numpy.ndarray: The point on each curve (as a ``C x D`` array).
+        """
+        s_vals = np.asfortranarray([s])
+        return self.evaluate_multi(s_vals)[:, :, 0]
+
+    def evaluate_multi(self, s_vals):
+        """Evaluate every curve at the same parameters.
+
+        See :func:`.evaluate_curves` for details.
+
+        Args:
+            s_vals (Union[numpy.ndarray, ~bezier.curve.SamplePlan]):
+                Parameters along the curves (as a 1D array) or a sample
+                plan for the curves' degree.
+
+        Returns:
+            numpy.ndarray: The points on the curves. As a ``C x D x K``
+            array, with the first index corresponding to the curve, the
+            second to the dimension and the third to each ``s`` value.
+        """
+        if isinstance(s_vals, _curve_mod.SamplePlan):
+            return s_vals.evaluate(self._nodes)
+
+        return _curve_helpers.evaluate_curves_multi(self._nodes, s_vals)
+
+    def lengths(self, rtol=0.5 ** 40):
+        """Compute the length of every curve.
+
+        See :func:`.curve_lengths` for details.
+
+        Args:
+            rtol (Optional[float]): The relative tolerance for the length of
+                each curve. Defaults to :math:`2^{-40}`.
+
+        Returns:
+            numpy.ndarray: The length of each curve (as a 1D array).
+
+        Raises:
+            ValueError: If ``rtol`` is not positive.
+        """
+        return _curve_mod.curve_lengths(self._nodes, rtol=rtol)
+
+    def bboxes(self):
+        """Compute the bounding box of the nodes of every curve.
+
+        Returns:
+            numpy.ndarray: An ``C x 4`` array, where row ``j`` contains the
+            left, right, bottom and top bounds of curve ``j``.
+
+        Raises:
+            NotImplementedError: If the curves are not two-dimensional.
+        """
+        if self._dimension != 2:
+            raise NotImplementedError(
+                "Bounding boxes are only computed for planar (2D) curves",
+                "Curves have dimension",
+                self._dimension,
+            )
+
+        result = np.empty((len(self), 4), order="F")
+        np.min(self._nodes[:, 0, :], axis=1, out=result[:, 0])
+        np.max(self._nodes[:, 0, :], axis=1, out=result[:, 1])
+        np.min(self._nodes[:, 1, :], axis=1, out=result[:, 2])
+        np.max(self._nodes[:, 1, :], axis=1, out=result[:, 3])
+        return result
+
+    def subdivide(self):
+        r"""Split every curve into two halves.
+
+        See :meth:`.Curve.subdivide` for details.
+
+        .. doctest:: curve-array-subdivide
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> curves = bezier.CurveArray([
+           ...     [[0.0, 1.0, 2.0],
+           ...      [0.0, 2.0, 0.0]],
+           ... ])
+           >>> left, right = curves.subdivide()
+           >>> left.nodes[0]
+           array([[0. , 0.5, 1. ],
+                  [0. , 1. , 1. ]])
+           >>> right.nodes[0]
+           array([[1. , 1.5, 2. ],
+                  [1. , 1. , 0. ]])
+
+        Returns:
+            Tuple[CurveArray, CurveArray]: The left and right sub-curves
+            of every curve.
+        """
+        left_mat, right_mat = _py_curve_helpers.level_subdivision_matrices(
+            self._degree, 1
+        )
+        return self._transform(left_mat), self._transform(right_mat)
+
+    def specialize(self, start, end):
+        """Specialize every curve to the same sub-interval.
+
+        See :meth:`.Curve.specialize` for details.
+
+        Args:
+            start (float): The start point of the interval we
+                are specializing to.
+            end (float): The end point of the interval we
+                are specializing to.
+
+        Returns:
+            CurveArray: The newly-specialized curves.
+        """
+        # NOTE: Specializing is linear in the nodes, so specializing the
+        #       identity gives the matrix that specializes every curve.
+        identity = np.eye(self._degree + 1, order="F")
+        matrix = _curve_helpers.specialize_curve(identity, start, end)
+        return self._transform(matrix)
+
+    def elevate(self):
+        """Degree-elevate every curve.
+
+        See :meth:`.Curve.elevate` for details.
+
+        Returns:
+            CurveArray: The degree-elevated curves.
+        """
+        identity = np.eye(self._degree + 1, order="F")
+        matrix = _curve_helpers.elevate_nodes(identity)
+        return self._transform(matrix)
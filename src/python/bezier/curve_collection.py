@@ -0,0 +1,255 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Collections of B |eacute| zier curves with a broad-phase spatial index.
+
+Intersecting every pair in a set of :math:`N` curves requires
+:math:`N^2 / 2` calls to :meth:`.Curve.intersect`, even though most pairs
+are typically far apart. A :class:`CurveCollection` indexes the bounding
+boxes of the control points (which contain each curve) so that only pairs
+with overlapping boxes are handed to the (much more expensive) curve-curve
+intersection algorithm.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+import numpy as np
+
+from bezier import _algebraic_intersection
+from bezier import _geometric_intersection
+from bezier import _py_intersection_helpers
+
+
+IntersectionStrategy = _py_intersection_helpers.IntersectionStrategy
+
+
+class CurveCollection:
+    r"""A fixed set of planar curves with a bounding box index.
+
+    The index is a sort of the bounding boxes along the :math:`x`-axis
+    (i.e. "sweep and prune"): for each curve, only the curves whose boxes
+    begin before its box ends need to be checked for :math:`y`-overlap.
+
+    .. doctest:: curve-collection-intersect-all
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes1 = np.asfortranarray([
+       ...     [0.0, 1.0, 2.0],
+       ...     [0.0, 2.0, 0.0],
+       ... ])
+       >>> nodes2 = np.asfortranarray([
+       ...     [0.0, 2.0],
+       ...     [0.75, 0.75],
+       ... ])
+       >>> nodes3 = np.asfortranarray([
+       ...     [5.0, 6.0],
+       ...     [5.0, 6.0],
+       ... ])
+       >>> collection = bezier.CurveCollection([
+       ...     bezier.Curve(nodes1, degree=2),
+       ...     bezier.Curve(nodes2, degree=1),
+       ...     bezier.Curve(nodes3, degree=1),
+       ... ])
+       >>> collection
+       <CurveCollection (num_curves=3)>
+       >>> collection.candidate_pairs()
+       [(0, 1)]
+       >>> index1, index2, intersections = collection.intersect_all()[0]
+       >>> index1, index2
+       (0, 1)
+       >>> intersections
+       array([[0.25, 0.75],
+              [0.25, 0.75]])
+
+    Args:
+        curves (Iterable[~bezier.curve.Curve]): The curves in the collection.
+            Each must be in :math:`\mathbf{R}^2`.
+
+    Raises:
+        NotImplementedError: If one of the curves is not two-dimensional.
+    """
+
+    __slots__ = ("_curves", "_bboxes", "_order", "_sorted_left")
+
+    def __init__(self, curves):
+        self._curves = tuple(curves)
+        self._bboxes = np.empty((len(self._curves), 4), order="F")
+        for index, curve in enumerate(self._curves):
+            if curve._dimension != 2:
+                raise NotImplementedError(
+                    "Only planar (2D) curves can be indexed",
+                    "Curve",
+                    index,
+                    "has dimension",
+                    curve._dimension,
+                )
+
+            self._bboxes[index, :] = curve._get_bbox()
+
+        self._order = np.argsort(self._bboxes[:, 0], kind="stable")
+        self._sorted_left = self._bboxes[self._order, 0]
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (num_curves={:d})>".format(
+            self.__class__.__name__, len(self._curves)
+        )
+
+    def __len__(self):
+        """The number of curves in the collection.
+
+        Returns:
+            int: The number of curves.
+        """
+        return len(self._curves)
+
+    @property
+    def curves(self):
+        """Tuple[~bezier.curve.Curve, ...]: The curves in the collection."""
+        return self._curves
+
+    @property
+    def bboxes(self):
+        """numpy.ndarray: The bounding boxes of the curves.
+
+        An ``N x 4`` array, where row ``j`` contains the left, right,
+        bottom and top bounds of curve ``j``.
+        """
+        return self._bboxes.copy(order="F")
+
+    def query(self, box):
+        """Find the curves whose bounding boxes overlap a box.
+
+        Boxes that only touch (e.g. share an edge) are considered to
+        overlap, since the curves may still meet at a point.
+
+        .. doctest:: curve-collection-query
+
+           >>> collection = bezier.CurveCollection([
+           ...     bezier.Curve.from_nodes([[0.0, 1.0], [0.0, 1.0]]),
+           ...     bezier.Curve.from_nodes([[2.0, 3.0], [0.0, 1.0]]),
+           ...     bezier.Curve.from_nodes([[4.0, 5.0], [0.0, 1.0]]),
+           ... ])
+           >>> collection.query((0.5, 2.5, 0.5, 2.0))
+           [0, 1]
+
+        Args:
+            box (Tuple[float, float, float, float]): The left, right,
+                bottom and top bounds of the box to query.
+
+        Returns:
+            List[int]: The (sorted) indices of the curves whose bounding
+            boxes overlap ``box``.
+        """
+        left, right, bottom, top = box
+        # Only the curves that begin before ``box`` ends can overlap it.
+        end = np.searchsorted(self._sorted_left, right, side="right")
+        candidates = self._order[:end]
+        bboxes = self._bboxes[candidates, :]
+        overlap = (
+            (bboxes[:, 1] >= left)
+            & (bboxes[:, 2] <= top)
+            & (bboxes[:, 3] >= bottom)
+        )
+        return sorted(candidates[overlap].tolist())
+
+    def candidate_pairs(self):
+        """Find all pairs of curves with overlapping bounding boxes.
+
+        This is the "broad phase" for :meth:`intersect_all`. A pair is
+        returned exactly when ``bbox_intersect()`` would report the boxes
+        as intersecting or tangent (i.e. not disjoint).
+
+        Returns:
+            List[Tuple[int, int]]: The (sorted) pairs of indices ``(i, j)``
+            (with ``i < j``) of curves whose bounding boxes overlap.
+        """
+        pairs = []
+        num_curves = len(self._curves)
+        for position in range(num_curves):
+            index = int(self._order[position])
+            _, right, bottom, top = self._bboxes[index, :]
+            # The boxes that follow in the sweep order begin after this one
+            # does, so only those that begin before it ends can overlap.
+            begin = position + 1
+            end = np.searchsorted(self._sorted_left, right, side="right")
+            others = self._order[begin:end]
+            if others.size == 0:
+                continue
+
+            bboxes = self._bboxes[others, :]
+            overlap = (bboxes[:, 2] <= top) & (bboxes[:, 3] >= bottom)
+            for other in others[overlap].tolist():
+                pairs.append((min(index, other), max(index, other)))
+
+        pairs.sort()
+        return pairs
+
+    def intersect_all(
+        self, strategy=IntersectionStrategy.GEOMETRIC, workspace=None
+    ):
+        """Find the intersections among every pair of curves.
+
+        Only the pairs from :meth:`candidate_pairs` are intersected.
+
+        Args:
+            strategy (Optional[~bezier.curve.IntersectionStrategy]): The
+                intersection algorithm to use. Defaults to geometric.
+            workspace (Optional[~bezier.curve.IntersectionWorkspace]):
+                Storage re-used across calls by the geometric and clipping
+                strategies. See :meth:`.Curve.intersect`.
+
+        Returns:
+            List[Tuple[int, int, numpy.ndarray]]: Triples ``(i, j, st_vals)``
+            for each pair of curves (with ``i < j``) that intersect, where
+            ``st_vals`` is the ``2 x N`` array of ``s``- and ``t``-parameters
+            along curves ``i`` and ``j`` where the intersections occur.
+
+        Raises:
+            ValueError: If ``strategy`` is not a valid
+                :class:`.IntersectionStrategy`.
+        """
+        if strategy == IntersectionStrategy.GEOMETRIC:
+            all_intersections = _geometric_intersection.all_intersections
+            kwargs = {"workspace": workspace}
+        elif strategy == IntersectionStrategy.ALGEBRAIC:
+            all_intersections = _algebraic_intersection.all_intersections
+            kwargs = {}
+        elif strategy == IntersectionStrategy.CLIPPING:
+            all_intersections = (
+                _geometric_intersection.all_intersections_clipping
+            )
+            kwargs = {"workspace": workspace}
+        else:
+            raise ValueError("Unexpected strategy.", strategy)
+
+        result = []
+        for index1, index2 in self.candidate_pairs():
+            st_vals, _ = all_intersections(
+                self._curves[index1]._nodes,
+                self._curves[index2]._nodes,
+                **kwargs,
+            )
+            if st_vals.size > 0:
+                result.append((index1, index2, st_vals))
+
+        return result
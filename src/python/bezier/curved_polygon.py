@@ -25,9 +25,11 @@ boundary.
    import bezier
 """
 
+from bezier import _curve_helpers
 from bezier import _helpers
 from bezier import _plot_helpers
 from bezier import _triangle_helpers
+from bezier import curve as _curve_mod
 
 
 class CurvedPolygon:
@@ -128,18 +130,72 @@ class CurvedPolygon:
               between two B |eacute| zier triangles.
             * ``_verify`` (:class:`bool`): Indicates if the edges should be
               verified as having shared endpoints. Defaults to :data:`True`.
+            * ``_all_edge_nodes`` (:class:`tuple`): The nodes of the three
+              edges of each of two triangles being intersected. If
+              provided, no ``edges`` should be passed. Instead, each edge is
+              a segment of a triangle edge, described by a triple in
+              ``metadata``, and is only created as a :class:`.Curve` when
+              needed (e.g. by :meth:`plot`, but not by :attr:`area`). This
+              is intended to be used only by :func:`._make_intersection`.
 
             Other keyword arguments specified will be silently ignored.
     """
 
-    __slots__ = ("_edges", "_num_sides", "_metadata")
+    __slots__ = (
+        "_edge_curves",  # Empty default
+        "_num_sides",
+        "_metadata",
+        "_all_edge_nodes",  # Empty default
+    )
 
     def __init__(self, *edges, **kwargs):
-        self._edges = edges
-        self._num_sides = len(edges)
         self._metadata = kwargs.pop("metadata", None)
-        if kwargs.pop("_verify", True):
-            self._verify()
+        self._all_edge_nodes = kwargs.pop("_all_edge_nodes", None)
+        if self._all_edge_nodes is None:
+            self._edge_curves = edges
+            self._num_sides = len(edges)
+            if kwargs.pop("_verify", True):
+                self._verify()
+        else:
+            # NOTE: The edges are described by the ``metadata`` and are
+            #       created on demand, so there is nothing to verify.
+            self._edge_curves = None
+            self._num_sides = len(self._metadata)
+
+    def _get_edge_nodes(self):
+        """Get the nodes of each edge, without creating any curves.
+
+        Returns:
+            Tuple[numpy.ndarray, ...]: The nodes of each edge.
+        """
+        if self._all_edge_nodes is None:
+            return tuple(edge._nodes for edge in self._edge_curves)
+
+        return tuple(
+            _curve_helpers.specialize_curve(
+                self._all_edge_nodes[index], start, end
+            )
+            for index, start, end in self._metadata
+        )
+
+    @property
+    def _edges(self):
+        """Tuple[~bezier.curve.Curve, ...]: The boundary edges.
+
+        If the current curved polygon was created from triangle edges (via
+        the ``_all_edge_nodes`` keyword argument), the edges are created on
+        first access.
+        """
+        if self._edge_curves is None:
+            self._edge_curves = tuple(
+                _curve_mod.Curve(
+                    nodes, nodes.shape[1] - 1, copy=False, verify=False
+                )
+                for nodes in self._get_edge_nodes()
+            )
+            # NOTE: The triangle edges are no longer needed.
+            self._all_edge_nodes = None
+        return self._edge_curves
 
     @staticmethod
     def _verify_pair(prev, curr):
@@ -247,8 +303,7 @@ class CurvedPolygon:
         Returns:
             float: The area of the current curved polygon.
         """
-        edges = tuple(edge._nodes for edge in self._edges)
-        return _triangle_helpers.compute_area(edges)
+        return _triangle_helpers.compute_area(self._get_edge_nodes())
 
     def __repr__(self):
         """Representation of current object.
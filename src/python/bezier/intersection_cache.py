@@ -0,0 +1,296 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Process-wide cache of intersection results.
+
+Applications that intersect the same pairs of shapes over and over (e.g.
+a service handling many requests for the same drawing) can enable a
+size-bounded least recently used (LRU) cache of the results of
+:meth:`.Curve.intersect` and :meth:`.Triangle.intersect`. Entries are keyed
+by a hash of the bytes of the nodes, the degree of each shape and the
+intersection strategy, so two distinct objects with the same nodes share
+an entry. The cache is disabled by default.
+
+.. doctest:: intersection-cache
+   :options: +NORMALIZE_WHITESPACE
+
+   >>> bezier.configure(cache_size=128)
+   >>> nodes1 = np.asfortranarray([
+   ...     [0.0, 0.375, 0.75 ],
+   ...     [0.0, 0.75 , 0.375],
+   ... ])
+   >>> curve1 = bezier.Curve(nodes1, degree=2)
+   >>> nodes2 = np.asfortranarray([
+   ...     [0.5, 0.5 ],
+   ...     [0.0, 0.75],
+   ... ])
+   >>> curve2 = bezier.Curve(nodes2, degree=1)
+   >>> 3.0 * curve1.intersect(curve2)
+   array([[2.],
+          [2.]])
+   >>> 3.0 * curve2.intersect(curve1)
+   array([[2.],
+          [2.]])
+   >>> cache = bezier.intersection_cache.get_cache()
+   >>> cache.cache_info()
+   CacheInfo(hits=1, misses=1, evictions=0, maxsize=128, currsize=1)
+
+.. testcleanup:: intersection-cache
+
+   bezier.configure(cache_size=None)
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+import collections
+import hashlib
+import threading
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+_CACHE = None
+
+
+class IntersectionCache:
+    """A thread-safe least recently used (LRU) cache of results.
+
+    Args:
+        maxsize (int): The maximum number of results to store.
+
+    Raises:
+        ValueError: If ``maxsize`` is not positive.
+    """
+
+    __slots__ = (
+        "_maxsize",
+        "_entries",
+        "_lock",
+        "_hits",
+        "_misses",
+        "_evictions",
+    )
+
+    def __init__(self, maxsize):
+        if maxsize < 1:
+            raise ValueError("Cache size must be positive", maxsize)
+
+        self._maxsize = maxsize
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (maxsize={:d}, currsize={:d})>".format(
+            self.__class__.__name__, self._maxsize, len(self)
+        )
+
+    def __len__(self):
+        """The number of results in the cache.
+
+        Returns:
+            int: The number of results.
+        """
+        return len(self._entries)
+
+    @property
+    def maxsize(self):
+        """int: The maximum number of results to store."""
+        return self._maxsize
+
+    def get(self, key):
+        """Look up a result (and mark it as the most recently used).
+
+        Args:
+            key (Hashable): The key for the result.
+
+        Returns:
+            Optional[Any]: The result stored for ``key`` or :data:`None` if
+            there is no such result.
+        """
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+                self._entries.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        """Store a result, evicting the least recently used if needed.
+
+        Args:
+            key (Hashable): The key for the result.
+            value (Any): The result to store.
+        """
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def cache_info(self):
+        """Report statistics about the cache.
+
+        Returns:
+            CacheInfo: The number of hits, misses and evictions so far, the
+            maximum size and the current size of the cache.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self._maxsize,
+                len(self._entries),
+            )
+
+    def clear(self):
+        """Remove every result and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+def configure(cache_size=None):
+    """Configure the process-wide intersection cache.
+
+    Replaces the current cache (if any), so all stored results and
+    statistics are discarded.
+
+    Args:
+        cache_size (Optional[int]): The maximum number of intersection
+            results to store. If :data:`None` or ``0``, the cache is
+            disabled.
+
+    Raises:
+        ValueError: If ``cache_size`` is negative.
+    """
+    global _CACHE  # pylint: disable=global-statement
+
+    if cache_size is None or cache_size == 0:
+        _CACHE = None
+    else:
+        _CACHE = IntersectionCache(cache_size)
+
+
+def get_cache():
+    """Get the process-wide intersection cache.
+
+    Returns:
+        Optional[IntersectionCache]: The cache, or :data:`None` if caching
+        is disabled.
+    """
+    return _CACHE
+
+
+def shape_key(shape):
+    """Compute the part of a cache key that identifies a shape.
+
+    Args:
+        shape (Union[~bezier.curve.Curve, ~bezier.triangle.Triangle]): A
+            curve or triangle.
+
+    Returns:
+        Tuple[int, Tuple[int, int], bytes]: The degree, the shape of the
+        nodes and a digest of the bytes of the nodes.
+    """
+    nodes = shape._nodes
+    digest = hashlib.blake2b(nodes.tobytes(order="F"), digest_size=16)
+    return shape._degree, nodes.shape, digest.digest()
+
+
+def curve_intersections(cache, curve1, curve2, strategy, compute):
+    """Intersect two curves, re-using a cached result if possible.
+
+    Since the intersections of ``curve2`` with ``curve1`` are those of
+    ``curve1`` with ``curve2`` with the ``s``- and ``t``-parameters
+    swapped, both orders are stored in a single entry.
+
+    Args:
+        cache (IntersectionCache): The cache.
+        curve1 (~bezier.curve.Curve): The first curve.
+        curve2 (~bezier.curve.Curve): The second curve.
+        strategy (~bezier.curve.IntersectionStrategy): The intersection
+            strategy.
+        compute (Callable[[], numpy.ndarray]): Computes the intersections
+            of ``curve1`` and ``curve2`` (if there is no cached result).
+
+    Returns:
+        numpy.ndarray: ``2 x N`` array of ``s``- and ``t``-parameters where
+        intersections occur (possibly empty).
+    """
+    key1 = shape_key(curve1)
+    key2 = shape_key(curve2)
+    swapped = key2 < key1
+    if swapped:
+        key = ("curve", strategy, key2, key1)
+    else:
+        key = ("curve", strategy, key1, key2)
+
+    st_vals = cache.get(key)
+    if st_vals is None:
+        st_vals = compute()
+        stored = st_vals[::-1, :] if swapped else st_vals
+        stored = stored.copy(order="F")
+        stored.flags.writeable = False
+        cache.put(key, stored)
+        return st_vals
+
+    if swapped:
+        st_vals = st_vals[::-1, :]
+    return st_vals.copy(order="F")
+
+
+def triangle_intersections(cache, triangle1, triangle2, strategy, compute):
+    """Intersect two triangles, re-using a cached result if possible.
+
+    Unlike :func:`curve_intersections`, the order of the triangles is part
+    of the key.
+
+    Args:
+        cache (IntersectionCache): The cache.
+        triangle1 (~bezier.triangle.Triangle): The first triangle.
+        triangle2 (~bezier.triangle.Triangle): The second triangle.
+        strategy (~bezier.curve.IntersectionStrategy): The intersection
+            strategy.
+        compute (Callable[[], Tuple[Optional[list], Optional[bool], \
+            Tuple[numpy.ndarray, ...]]]): Computes the edge information,
+            containment flag and edge nodes describing the intersection
+            of ``triangle1`` and ``triangle2`` (if there is no cached
+            result).
+
+    Returns:
+        Tuple[Optional[list], Optional[bool], Tuple[numpy.ndarray, ...]]:
+        The (possibly cached) result of ``compute``.
+    """
+    key = ("triangle", strategy, shape_key(triangle1), shape_key(triangle2))
+    result = cache.get(key)
+    if result is None:
+        result = compute()
+        cache.put(key, result)
+    return result
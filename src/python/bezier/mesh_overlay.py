@@ -0,0 +1,392 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Overlay of two meshes of B |eacute| zier triangles.
+
+Intersecting every triangle in one mesh with every triangle in another
+requires :math:`N M` calls to :meth:`.Triangle.intersect`, even though
+each triangle typically overlaps only a handful of its neighbors in the
+other mesh (e.g. when conservatively remapping a field between meshes).
+:func:`overlay` narrows down the pairs in three stages:
+
+* A broad phase, which sorts the bounding boxes of the control points of
+  each mesh along the :math:`x`-axis (i.e. "sweep and prune") and keeps
+  the pairs with overlapping boxes.
+* A narrow phase, which keeps the pairs for which the convex hulls of the
+  control points collide. Since a triangle is contained in the convex
+  hull of its control points, no overlapping pair is discarded.
+* The intersection of the remaining pairs, all at once via
+  :func:`.intersect_triangle_pairs`.
+
+.. |eacute| unicode:: U+000E9 .. LATIN SMALL LETTER E WITH ACUTE
+   :trim:
+
+.. testsetup:: *
+
+   import numpy as np
+   import bezier
+"""
+
+import numpy as np
+
+from bezier import _base
+from bezier import _helpers
+from bezier import triangle as _triangle_mod
+
+
+class MeshOverlay:
+    """The overlap regions of two meshes.
+
+    Produced by :func:`overlay`. Each region is a curved polygon or (if one
+    triangle contains the other) a triangle, corresponding to a single pair
+    of triangles (one from each mesh). A pair may produce more than one
+    region. The regions are sorted by the pair, i.e. first by the index in
+    the first mesh and then by the index in the second mesh.
+
+    Args:
+        intersections (~bezier.triangle.TrianglePairIntersections): The
+            intersections of the candidate pairs of triangles.
+        region_pairs (numpy.ndarray): The (1D) index of the candidate pair
+            that produced each region.
+        region_offsets (numpy.ndarray): The (1D) index of each region among
+            the regions produced by the same candidate pair.
+        areas (numpy.ndarray): The (1D) area of each region.
+    """
+
+    __slots__ = (
+        "_intersections",
+        "_region_pairs",
+        "_region_offsets",
+        "_areas",
+    )
+
+    def __init__(self, intersections, region_pairs, region_offsets, areas):
+        self._intersections = intersections
+        self._region_pairs = region_pairs
+        self._region_offsets = region_offsets
+        self._areas = areas
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (num_regions={:d})>".format(
+            self.__class__.__name__, len(self)
+        )
+
+    def __len__(self):
+        """The number of overlap regions.
+
+        Returns:
+            int: The number of regions.
+        """
+        return self._region_pairs.size
+
+    @property
+    def pairs(self):
+        """numpy.ndarray: The pair of triangles that produced each region.
+
+        An ``R x 2`` array, where row ``r`` contains the index of a triangle
+        in the first mesh and the index of a triangle in the second mesh.
+        """
+        return self._intersections.pairs[self._region_pairs, :]
+
+    @property
+    def areas(self):
+        """numpy.ndarray: The (1D) area of each region."""
+        return self._areas
+
+    @property
+    def errors(self):
+        """list: The pairs that could not be intersected.
+
+        As ``(i, j, exception)`` triples, where ``i`` and ``j`` are the
+        indices of the triangles in the first and second mesh.
+        """
+        pairs = self._intersections.pairs
+        return [
+            (int(pairs[index, 0]), int(pairs[index, 1]), exc)
+            for index, exc in self._intersections.errors
+        ]
+
+    @property
+    def intersections(self):
+        """~bezier.triangle.TrianglePairIntersections: The raw intersections.
+
+        One entry for each candidate pair that survived the broad and
+        narrow phases (including those that do not overlap).
+        """
+        return self._intersections
+
+    def region(self, index):
+        """Build a single overlap region.
+
+        Args:
+            index (int): The index of the region.
+
+        Returns:
+            Union[~bezier.curved_polygon.CurvedPolygon, \
+            ~bezier.triangle.Triangle]: The region.
+        """
+        regions = self._intersections.intersection(self._region_pairs[index])
+        return regions[self._region_offsets[index]]
+
+
+def _mesh_nodes(mesh):
+    """Convert a mesh to the stacked nodes of its triangles.
+
+    Args:
+        mesh (Union[Sequence[~bezier.triangle.Triangle], \
+            Sequence[Sequence[Sequence[numbers.Number]]]]): The triangles
+            in the mesh or their stacked nodes.
+
+    Returns:
+        Tuple[numpy.ndarray, int]: The nodes (as a Fortran-ordered
+        ``T x 2 x N`` array) and the degree of the triangles.
+
+    Raises:
+        ValueError: If the triangles do not all have the same degree.
+    """
+    if isinstance(mesh, np.ndarray):
+        return _base.stacked_triangles(mesh)
+
+    mesh = tuple(mesh)
+    if not mesh:
+        # NOTE: An empty mesh has no degree, so it is treated as an empty
+        #       stack of linear triangles.
+        return np.empty((0, 2, 3), order="F"), 1
+
+    if not isinstance(mesh[0], _triangle_mod.Triangle):
+        return _base.stacked_triangles(mesh)
+
+    first = mesh[0]
+    for index, triangle in enumerate(mesh):
+        if triangle._nodes.shape != first._nodes.shape:
+            raise ValueError(
+                "Triangles must have the same degree and dimension",
+                "Triangle",
+                index,
+                "has nodes with shape",
+                triangle._nodes.shape,
+            )
+
+    return _base.stacked_triangles([triangle._nodes for triangle in mesh])
+
+
+def _bboxes(nodes):
+    """Compute the bounding box of the control points of each triangle.
+
+    Args:
+        nodes (numpy.ndarray): The stacked nodes of the triangles (as a
+            ``T x 2 x N`` array).
+
+    Returns:
+        numpy.ndarray: A ``T x 4`` array, where row ``j`` contains the
+        left, right, bottom and top bounds of triangle ``j``.
+    """
+    result = np.empty((nodes.shape[0], 4), order="F")
+    np.min(nodes[:, 0, :], axis=1, out=result[:, 0])
+    np.max(nodes[:, 0, :], axis=1, out=result[:, 1])
+    np.min(nodes[:, 1, :], axis=1, out=result[:, 2])
+    np.max(nodes[:, 1, :], axis=1, out=result[:, 3])
+    return result
+
+
+def _bbox_candidates(bboxes1, bboxes2):
+    """Find all pairs of boxes (one from each set) that overlap.
+
+    This is the "broad phase" of :func:`overlay`. The boxes in the second
+    set are sorted by their left bound so that, for each box in the first
+    set, only the boxes that begin before it ends need to be checked.
+    Boxes that only touch are considered to overlap (as in
+    :meth:`.CurveCollection.query`).
+
+    Args:
+        bboxes1 (numpy.ndarray): An ``M x 4`` array of boxes (as left,
+            right, bottom and top bounds).
+        bboxes2 (numpy.ndarray): An ``N x 4`` array of boxes.
+
+    Returns:
+        numpy.ndarray: The (sorted) ``P x 2`` array of pairs of indices
+        ``(i, j)`` of overlapping boxes in ``bboxes1`` and ``bboxes2``.
+    """
+    order = np.argsort(bboxes2[:, 0], kind="stable")
+    sorted_left = bboxes2[order, 0]
+    chunks = []
+    for index in range(bboxes1.shape[0]):
+        left, right, bottom, top = bboxes1[index, :]
+        candidates = order[: np.searchsorted(sorted_left, right, side="right")]
+        bboxes = bboxes2[candidates, :]
+        overlap = (
+            (bboxes[:, 1] >= left)
+            & (bboxes[:, 2] <= top)
+            & (bboxes[:, 3] >= bottom)
+        )
+        others = np.sort(candidates[overlap])
+        if others.size == 0:
+            continue
+
+        chunk = np.empty((others.size, 2), dtype=np.intc)
+        chunk[:, 0] = index
+        chunk[:, 1] = others
+        chunks.append(chunk)
+
+    if not chunks:
+        return np.empty((0, 2), dtype=np.intc, order="F")
+
+    return np.asfortranarray(np.concatenate(chunks))
+
+
+def _hull_candidates(nodes1, nodes2, pairs):
+    """Keep the pairs for which the convex hulls of the nodes collide.
+
+    This is the "narrow phase" of :func:`overlay`. The convex hull of the
+    control points of each triangle is computed (at most) once.
+
+    Args:
+        nodes1 (numpy.ndarray): The stacked nodes of the first set of
+            triangles (as a ``T1 x 2 x N1`` array).
+        nodes2 (numpy.ndarray): The stacked nodes of the second set of
+            triangles.
+        pairs (numpy.ndarray): A ``P x 2`` array of candidate pairs of
+            indices of a triangle in ``nodes1`` and a triangle in
+            ``nodes2``.
+
+    Returns:
+        numpy.ndarray: The rows of ``pairs`` (as a ``Q x 2`` array) for
+        which the convex hulls collide.
+    """
+    hulls1 = {}
+    hulls2 = {}
+    keep = np.zeros((pairs.shape[0],), dtype=bool)
+    for position, (index1, index2) in enumerate(pairs.tolist()):
+        hull1 = hulls1.get(index1)
+        if hull1 is None:
+            hull1 = _helpers.simple_convex_hull(
+                np.asfortranarray(nodes1[index1, :, :])
+            )
+            hulls1[index1] = hull1
+        hull2 = hulls2.get(index2)
+        if hull2 is None:
+            hull2 = _helpers.simple_convex_hull(
+                np.asfortranarray(nodes2[index2, :, :])
+            )
+            hulls2[index2] = hull2
+        keep[position] = _helpers.polygon_collide(hull1, hull2)
+
+    return np.asfortranarray(pairs[keep, :])
+
+
+def _regions(intersections):
+    """Describe the overlap regions of intersected pairs of triangles.
+
+    The areas come straight from the table of segments, so no regions are
+    built unless requested via :meth:`MeshOverlay.region`.
+
+    Args:
+        intersections (~bezier.triangle.TrianglePairIntersections): The
+            intersections of the candidate pairs of triangles.
+
+    Returns:
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]: The index of
+        the candidate pair that produced each region, the index of each
+        region among the regions of the same pair and the area of each
+        region (see :class:`MeshOverlay`).
+    """
+    pair_offsets = intersections.pair_offsets
+    contained = intersections.contained
+    polygon_areas = intersections.polygon_areas
+    pair_areas = intersections.areas
+    region_pairs = []
+    region_offsets = []
+    areas = []
+    for index in range(len(intersections)):
+        if contained[index] != 0:
+            region_pairs.append(index)
+            region_offsets.append(0)
+            areas.append(pair_areas[index])
+            continue
+
+        begin = pair_offsets[index]
+        for polygon in range(begin, pair_offsets[index + 1]):
+            region_pairs.append(index)
+            region_offsets.append(polygon - begin)
+            areas.append(polygon_areas[polygon])
+
+    return (
+        np.array(region_pairs, dtype=np.intc),
+        np.array(region_offsets, dtype=np.intc),
+        np.array(areas, dtype=np.float64),
+    )
+
+
+def overlay(mesh_a, mesh_b):
+    """Compute the overlap regions of two meshes of planar triangles.
+
+    .. doctest:: overlay
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> mesh_a = np.asfortranarray([
+       ...     [[0.0, 1.0, 0.0],
+       ...      [0.0, 0.0, 1.0]],
+       ...     [[1.0, 1.0, 0.0],
+       ...      [0.0, 1.0, 1.0]],
+       ... ])
+       >>> mesh_b = np.asfortranarray([
+       ...     [[0.5, 1.5, 0.5],
+       ...      [0.0, 0.0, 1.0]],
+       ...     [[5.0, 6.0, 5.0],
+       ...      [5.0, 5.0, 6.0]],
+       ... ])
+       >>> result = bezier.overlay(mesh_a, mesh_b)
+       >>> result
+       <MeshOverlay (num_regions=2)>
+       >>> result.pairs
+       array([[0, 0],
+              [1, 0]], dtype=int32)
+       >>> result.areas
+       array([0.125, 0.25 ])
+       >>> result.region(0)
+       <CurvedPolygon (num_sides=3)>
+
+    The sum of the areas is the area of the overlap of the two meshes
+    (assuming the triangles in each mesh do not overlap one another).
+
+    Args:
+        mesh_a (Union[Sequence[~bezier.triangle.Triangle], \
+            Sequence[Sequence[Sequence[numbers.Number]]]]): The first mesh.
+            Either a sequence of triangles or their stacked nodes (where
+            the first index is the triangle, the second is the dimension
+            and the third is the node). The triangles must be planar and
+            must all have the same degree.
+        mesh_b (Union[Sequence[~bezier.triangle.Triangle], \
+            Sequence[Sequence[Sequence[numbers.Number]]]]): The second
+            mesh.
+
+    Returns:
+        MeshOverlay: The overlap regions of the two meshes.
+
+    Raises:
+        ValueError: If the triangles in a mesh do not all have the same
+            degree.
+        NotImplementedError: If the triangles are not two-dimensional.
+    """
+    nodes1, _ = _mesh_nodes(mesh_a)
+    nodes2, _ = _mesh_nodes(mesh_b)
+    pairs = _bbox_candidates(_bboxes(nodes1), _bboxes(nodes2))
+    pairs = _hull_candidates(nodes1, nodes2, pairs)
+    intersections = _triangle_mod.intersect_triangle_pairs(
+        nodes1, nodes2, pairs
+    )
+    return MeshOverlay(intersections, *_regions(intersections))
@@ -24,17 +24,19 @@
 import numpy as np
 
 from bezier import _base
-from bezier import _curve_helpers
+from bezier import _helpers
 from bezier import _plot_helpers
 from bezier import _py_helpers
 from bezier import _py_intersection_helpers
 from bezier import _py_triangle_helpers
 from bezier import _py_triangle_intersection
+from bezier import _py_triangle_matrices
 from bezier import _symbolic
 from bezier import _triangle_helpers
 from bezier import _triangle_intersection
 from bezier import curve as _curve_mod
 from bezier import curved_polygon
+from bezier import intersection_cache
 
 
 _SIGN = np.sign  # pylint: disable=no-member
@@ -43,6 +45,10 @@ _LOCATE_ERROR_TEMPLATE = (
     "so the point should be a {:d} x 1 NumPy array. "
     "Instead the point {} has dimensions {}."
 )
+_LOCATE_MULTI_ERROR_TEMPLATE = (
+    "Dimension mismatch: This triangle is {:d}-dimensional, so the points "
+    "should be a {:d} x N NumPy array. Instead the points have dimensions {}."
+)
 _STRATEGY = _py_intersection_helpers.IntersectionStrategy
 
 
@@ -183,23 +189,30 @@ class Triangle(_base.Base):
             freely mutate ``nodes`` after passing in.
         verify (bool): Flag indicating if the degree should be verified against
             the number of nodes. Defaults to :data:`True`.
+        frozen (bool): Flag indicating if the triangle should be frozen, i.e.
+            have read-only nodes (and edges) and cache derived quantities.
+            Defaults to :data:`False`. If ``copy`` is :data:`False`, the
+            caller **must not** modify ``nodes`` after freezing.
     """
 
     __slots__ = (
         "_dimension",  # From base class
         "_nodes",  # From base class
+        "_frozen",  # From base class
         "_degree",  # From constructor
         "_edges",  # Empty default
+        "_bbox",  # Empty default
     )
 
-    def __init__(self, nodes, degree, *, copy=True, verify=True):
-        super(Triangle, self).__init__(nodes, copy=copy)
+    def __init__(self, nodes, degree, *, copy=True, verify=True, frozen=False):
+        super(Triangle, self).__init__(nodes, copy=copy, frozen=frozen)
         self._degree = degree
         self._edges = None
+        self._bbox = None
         self._verify_degree(verify)
 
     @classmethod
-    def from_nodes(cls, nodes, copy=True):
+    def from_nodes(cls, nodes, copy=True, frozen=False):
         """Create a :class:`.Triangle` from nodes.
 
         Computes the ``degree`` based on the shape of ``nodes``.
@@ -212,6 +225,9 @@ class Triangle(_base.Base):
             copy (bool): Flag indicating if the nodes should be copied before
                 being stored. Defaults to :data:`True` since callers may
                 freely mutate ``nodes`` after passing in.
+            frozen (bool): Flag indicating if the triangle should be frozen.
+                Defaults to :data:`False`. If the triangle is frozen, the
+                ``buffer`` **must not** be modified afterwards.
 
         Returns:
             Triangle: The constructed triangle.
@@ -220,7 +236,33 @@ class Triangle(_base.Base):
         _, num_nodes = nodes_np.shape
         degree = cls._get_degree(num_nodes)
         # NOTE: **Explicitly** verify because ``_get_degree`` does not.
-        return cls(nodes_np, degree, copy=copy, verify=True)
+        return cls(nodes_np, degree, copy=copy, verify=True, frozen=frozen)
+
+    @classmethod
+    def from_buffer(cls, buffer, dimension=None, frozen=False):
+        """Create a :class:`.Triangle` that wraps a buffer without copying.
+
+        Computes the ``degree`` based on the number of nodes in ``buffer``.
+
+        Args:
+            buffer (Union[numpy.ndarray, memoryview, bytes, bytearray]): The
+                nodes in the triangle. Either a 2D Fortran-ordered buffer of
+                ``np.float64`` values, or a flat buffer storing the nodes in
+                Fortran order (e.g. a shared memory block).
+            dimension (Optional[int]): The dimension of the ambient space.
+                Required if ``buffer`` is flat.
+            frozen (bool): Flag indicating if the triangle should be frozen.
+                Defaults to :data:`False`.
+
+        Returns:
+            Triangle: The constructed triangle, with nodes sharing memory
+            with ``buffer``.
+        """
+        nodes_np = _base.buffer_to_array(buffer, dimension=dimension)
+        _, num_nodes = nodes_np.shape
+        degree = cls._get_degree(num_nodes)
+        # NOTE: **Explicitly** verify because ``_get_degree`` does not.
+        return cls(nodes_np, degree, copy=False, verify=True, frozen=frozen)
 
     @staticmethod
     def _get_degree(num_nodes):
@@ -332,13 +374,25 @@ class Triangle(_base.Base):
             self._nodes, self._degree
         )
         edge1 = _curve_mod.Curve(
-            nodes1, self._degree, copy=False, verify=False
+            nodes1,
+            self._degree,
+            copy=False,
+            verify=False,
+            frozen=self._frozen,
         )
         edge2 = _curve_mod.Curve(
-            nodes2, self._degree, copy=False, verify=False
+            nodes2,
+            self._degree,
+            copy=False,
+            verify=False,
+            frozen=self._frozen,
         )
         edge3 = _curve_mod.Curve(
-            nodes3, self._degree, copy=False, verify=False
+            nodes3,
+            self._degree,
+            copy=False,
+            verify=False,
+            frozen=self._frozen,
         )
         return edge1, edge2, edge3
 
@@ -360,6 +414,37 @@ class Triangle(_base.Base):
             self._edges = self._compute_edges()
         return self._edges
 
+    def _get_bbox(self):
+        """Get the bounding box of the nodes of the current (planar) triangle.
+
+        Returns:
+            Tuple[float, float, float, float]: The left, right, bottom and
+            top bounds for the box.
+        """
+        return self._cached("_bbox", _helpers.bbox)
+
+    def _disjoint_from(self, other):
+        """Check if the current (planar) triangle can't meet another.
+
+        Uses the bounding boxes of the nodes, which are only computed once
+        for a frozen triangle.
+
+        Args:
+            other (Triangle): Another planar triangle.
+
+        Returns:
+            bool: Flag indicating if the triangles are certain to be
+            disjoint.
+        """
+        left1, right1, bottom1, top1 = self._get_bbox()
+        left2, right2, bottom2, top2 = Triangle._get_bbox(other)
+        return (
+            right2 < left1
+            or right1 < left2
+            or top2 < bottom1
+            or top1 < bottom2
+        )
+
     @property
     def edges(self):
         """The edges of the triangle.
@@ -420,6 +505,30 @@ class Triangle(_base.Base):
                 "Weights must be positive", lambda1, lambda2, lambda3
             )
 
+    @classmethod
+    def _verify_barycentric_multi(cls, param_vals):
+        """Verifies that rows of weights are all barycentric.
+
+        Checks every row of ``param_vals`` at once (rather than calling
+        :meth:`_verify_barycentric` for each row) and then uses
+        :meth:`_verify_barycentric` to raise for the first invalid row.
+
+        Args:
+            param_vals (numpy.ndarray): Array of parameter values (as a
+                ``N x 3`` array).
+
+        Raises:
+            ValueError: If some row of weights is not valid barycentric
+                coordinates, i.e. they don't sum to ``1``.
+            ValueError: If some weights are negative.
+        """
+        weights_total = np.sum(param_vals, axis=1)
+        invalid = ~np.isclose(weights_total, 1.0, atol=0.0)
+        invalid |= np.any(param_vals < 0.0, axis=1)
+        if invalid.any():
+            index = np.flatnonzero(invalid)[0]
+            cls._verify_barycentric(*param_vals[index, :])
+
     def evaluate_barycentric(self, lambda1, lambda2, lambda3, _verify=True):
         r"""Compute a point on the triangle.
 
@@ -572,8 +681,7 @@ class Triangle(_base.Base):
             if param_vals.ndim != 2:
                 raise ValueError("Parameter values must be 2D array")
 
-            for lambda1, lambda2, lambda3 in param_vals:
-                self._verify_barycentric(lambda1, lambda2, lambda3)
+            self._verify_barycentric_multi(param_vals)
         return _triangle_helpers.evaluate_barycentric_multi(
             self._nodes, self._degree, param_vals, self._dimension
         )
@@ -594,6 +702,28 @@ class Triangle(_base.Base):
         if s < 0.0 or t < 0.0 or s + t > 1.0:
             raise ValueError("Point lies outside reference triangle", s, t)
 
+    @classmethod
+    def _verify_cartesian_multi(cls, param_vals):
+        """Verifies that rows of points are all in the reference triangle.
+
+        Checks every row of ``param_vals`` at once (rather than calling
+        :meth:`_verify_cartesian` for each row) and then uses
+        :meth:`_verify_cartesian` to raise for the first invalid row.
+
+        Args:
+            param_vals (numpy.ndarray): Array of parameter values (as a
+                ``N x 2`` array).
+
+        Raises:
+            ValueError: If some point lies outside the reference triangle.
+        """
+        s_vals = param_vals[:, 0]
+        t_vals = param_vals[:, 1]
+        invalid = (s_vals < 0.0) | (t_vals < 0.0) | (s_vals + t_vals > 1.0)
+        if invalid.any():
+            index = np.flatnonzero(invalid)[0]
+            cls._verify_cartesian(*param_vals[index, :])
+
     def evaluate_cartesian(self, s, t, _verify=True):
         r"""Compute a point on the triangle.
 
@@ -694,8 +824,7 @@ class Triangle(_base.Base):
             if param_vals.ndim != 2:
                 raise ValueError("Parameter values must be 2D array")
 
-            for s, t in param_vals:
-                self._verify_cartesian(s, t)
+            self._verify_cartesian_multi(param_vals)
         return _triangle_helpers.evaluate_cartesian_multi(
             self._nodes, self._degree, param_vals, self._dimension
         )
@@ -738,7 +867,7 @@ class Triangle(_base.Base):
             )
         return ax
 
-    def subdivide(self):
+    def subdivide(self, levels=None):
         r"""Split the triangle into four sub-triangles.
 
         Does so by taking the unit triangle (i.e. the domain
@@ -776,10 +905,52 @@ class Triangle(_base.Base):
            make_images.triangle_subdivide1()
            make_images.triangle_subdivide2(triangle, sub_triangle_b)
 
+        To build a hierarchy of sub-triangles, pass ``levels``. Subdividing
+        :math:`k` times produces :math:`4^k` sub-triangles, which are
+        computed in a single pass (via cached matrices for each degree) and
+        returned as stacked nodes rather than as :class:`Triangle` objects:
+
+        .. doctest:: triangle-subdivide-levels
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0, 4.0, 0.0],
+           ...     [0.0, 0.0, 4.0],
+           ... ])
+           >>> triangle = bezier.Triangle(nodes, degree=1)
+           >>> pieces = triangle.subdivide(levels=2)
+           >>> pieces.shape
+           (16, 2, 3)
+           >>> pieces[5]
+           array([[1., 2., 1.],
+                  [1., 1., 2.]])
+
+        Args:
+            levels (Optional[int]): The number of times to subdivide. If
+                not provided, the triangle is subdivided once and the pieces
+                are returned as :class:`Triangle` objects.
+
         Returns:
-            Tuple[Triangle, Triangle, Triangle, Triangle]: The lower left,
-            central, lower right and upper left sub-triangles (in that order).
+            Union[Tuple[Triangle, ...], numpy.ndarray]: The lower left,
+            central, lower right and upper left sub-triangles (in that
+            order) or, if ``levels`` is provided, the stacked nodes of the
+            :math:`P = 4^k` sub-triangles as a ``P x D x N`` array. The
+            stacked sub-triangles are ordered recursively, i.e. the first
+            four are the sub-triangles of the lower left sub-triangle.
+
+        Raises:
+            ValueError: If ``levels`` is negative.
         """
+        if levels is not None:
+            if levels < 0:
+                raise ValueError(
+                    "Number of levels must be non-negative", levels
+                )
+
+            return _py_triangle_matrices.subdivide_nodes_levels(
+                self._nodes, self._degree, levels
+            )
+
         (
             nodes_a,
             nodes_b,
@@ -922,8 +1093,10 @@ class Triangle(_base.Base):
         return {
             "_dimension": self._dimension,
             "_nodes": self._nodes,
+            "_frozen": self._frozen,
             "_degree": self._degree,
             "_edges": self._edges,
+            "_bbox": self._bbox,
         }
 
     def locate(self, point, _verify=True):
@@ -993,13 +1166,82 @@ class Triangle(_base.Base):
                 )
                 raise ValueError(msg)
 
+        if self._frozen and self._dimension == 2:
+            left, right, bottom, top = self._get_bbox()
+            x_val, y_val = point[:, 0]
+            if not (left <= x_val <= right and bottom <= y_val <= top):
+                return None
+
         return _triangle_intersection.locate_point(
             self._nodes, self._degree, point[0, 0], point[1, 0]
         )
 
+    def locate_multi(self, points, _verify=True):
+        r"""Find multiple points on the current triangle.
+
+        Solves for :math:`s` and :math:`t` in :math:`B(s, t) = p` for each
+        column :math:`p` of ``points``. See :meth:`locate` for more details
+        on how each point is located.
+
+        .. doctest:: triangle-locate-multi
+           :options: +NORMALIZE_WHITESPACE
+
+           >>> nodes = np.asfortranarray([
+           ...     [0.0,  0.5 , 1.0, 0.25, 0.75, 0.0],
+           ...     [0.0, -0.25, 0.0, 0.5 , 0.75, 1.0],
+           ... ])
+           >>> triangle = bezier.Triangle(nodes, degree=2)
+           >>> points = np.asfortranarray([
+           ...     [0.59375, 2.0, 0.375  ],
+           ...     [0.25   , 2.0, 0.53125],
+           ... ])
+           >>> triangle.locate_multi(points)
+           array([[0.5 , 0.25],
+                  [ nan,  nan],
+                  [0.25, 0.5 ]])
+
+        Args:
+            points (numpy.ndarray): A ``D x N`` array of points, where
+                :math:`D` is the dimension of the triangle.
+            _verify (Optional[bool]): Indicates if extra caution should be
+                used to verify assumptions about the inputs. Can be
+                disabled to speed up execution time. Defaults to :data:`True`.
+
+        Returns:
+            numpy.ndarray: ``N x 2`` array of the :math:`s` and :math:`t`
+            values corresponding to each point, with a row of NaN for each
+            point that is not on the triangle.
+
+        Raises:
+            NotImplementedError: If the triangle isn't in :math:`\mathbf{R}^2`.
+            ValueError: If the dimension of the ``points`` doesn't match the
+                dimension of the current triangle.
+        """
+        if _verify:
+            if self._dimension != 2:
+                raise NotImplementedError("Only 2D triangles supported.")
+
+            if points.ndim != 2 or points.shape[0] != self._dimension:
+                points_dimensions = " x ".join(
+                    str(dimension) for dimension in points.shape
+                )
+                msg = _LOCATE_MULTI_ERROR_TEMPLATE.format(
+                    self._dimension, self._dimension, points_dimensions
+                )
+                raise ValueError(msg)
+
+        points = np.asfortranarray(points, dtype=np.float64)
+        return _triangle_intersection.locate_point_multi(
+            self._nodes, self._degree, points
+        )
+
     def intersect(self, other, strategy=_STRATEGY.GEOMETRIC, _verify=True):
         """Find the common intersection with another triangle.
 
+        If the process-wide intersection cache is enabled (see
+        :func:`bezier.configure`), a result previously computed for the
+        same nodes (in the same order) and ``strategy`` is re-used.
+
         Args:
             other (Triangle): Other triangle to intersect with.
             strategy (Optional[~bezier.curve.IntersectionStrategy]): The
@@ -1041,15 +1283,36 @@ class Triangle(_base.Base):
         else:
             raise ValueError("Unexpected strategy.", strategy)
 
-        edge_infos, contained, all_edge_nodes = do_intersect(
-            self._nodes, self._degree, other._nodes, other._degree, _verify
-        )
-        if edge_infos is None:
-            if contained:
-                return [self]
+        # NOTE: The cached bounding box of a frozen triangle can rule out
+        #       any intersections before doing any real work.
+        if (self._frozen or other.frozen) and self._disjoint_from(other):
+            return []
 
-            else:
-                return [other]
+        cache = intersection_cache.get_cache()
+        if cache is None:
+            edge_infos, contained, all_edge_nodes = do_intersect(
+                self._nodes, self._degree, other._nodes, other._degree, _verify
+            )
+        else:
+            (
+                edge_infos,
+                contained,
+                all_edge_nodes,
+            ) = intersection_cache.triangle_intersections(
+                cache,
+                self,
+                other,
+                strategy,
+                lambda: do_intersect(
+                    self._nodes,
+                    self._degree,
+                    other._nodes,
+                    other._degree,
+                    _verify,
+                ),
+            )
+        if edge_infos is None:
+            return [self] if contained else [other]
 
         else:
             return [
@@ -1057,6 +1320,65 @@ class Triangle(_base.Base):
                 for edge_info in edge_infos
             ]
 
+    def intersection_area(self, other):
+        """Compute the area of the common intersection with another triangle.
+
+        This is the sum of the areas of the intersections found by
+        :meth:`intersect` (using the geometric strategy), but it is computed
+        directly from the segments of the boundary, without creating any
+        :class:`.Curve` or :class:`.CurvedPolygon` objects.
+
+        .. doctest:: triangle-intersection-area
+
+           >>> triangle1 = bezier.Triangle.from_nodes([
+           ...     [0.0, 1.0, 0.0],
+           ...     [0.0, 0.0, 1.0],
+           ... ])
+           >>> triangle2 = bezier.Triangle.from_nodes([
+           ...     [0.5, 1.5, 0.5],
+           ...     [0.0, 0.0, 1.0],
+           ... ])
+           >>> triangle1.intersection_area(triangle2)
+           0.125
+
+        Args:
+            other (Triangle): Other triangle to intersect with.
+
+        Returns:
+            float: The area of the intersection.
+
+        Raises:
+            TypeError: If ``other`` is not a triangle.
+            NotImplementedError: If at least one of the triangles
+                isn't two-dimensional.
+            .UnsupportedDegree: If the degree of either triangle is not
+                1, 2, 3 or 4.
+        """
+        if not isinstance(other, Triangle):
+            raise TypeError(
+                "Can only intersect with another triangle", "Received", other
+            )
+
+        if self._dimension != 2 or other._dimension != 2:
+            raise NotImplementedError("Intersection only implemented in 2D")
+
+        # NOTE: Reshaping a Fortran-ordered array to a stack of one triangle
+        #       is a view, so the nodes are not copied.
+        nodes1 = self._nodes.reshape((1,) + self._nodes.shape, order="F")
+        nodes2 = other._nodes.reshape((1,) + other._nodes.shape, order="F")
+        pairs = np.zeros((1, 2), dtype=np.intc, order="F")
+        result = _triangle_intersection.geometric_intersect_pairs(
+            nodes1, self._degree, nodes2, other._degree, pairs
+        )
+        errors = result[-1]
+        if errors:
+            raise errors[0][1]
+
+        _, areas = _triangle_intersection.intersection_areas(
+            nodes1, self._degree, nodes2, other._degree, pairs, *result[:-1]
+        )
+        return float(areas[0])
+
     def elevate(self):
         r"""Return a degree-elevated version of the current triangle.
 
@@ -1116,34 +1438,9 @@ class Triangle(_base.Base):
         Returns:
             Triangle: The degree-elevated triangle.
         """
-        _, num_nodes = self._nodes.shape
-        # (d + 1)(d + 2)/2 --> (d + 2)(d + 3)/2
-        num_new = num_nodes + self._degree + 2
-        new_nodes = np.zeros((self._dimension, num_new), order="F")
-        # NOTE: We start from the index triples (i, j, k) for the current
-        #       nodes and map them onto (i + 1, j, k), etc. This index
-        #       tracking is also done in :func:`.de_casteljau_one_round`.
-        index = 0
-        # parent_i1 = index + k
-        # parent_i2 = index + k + 1
-        # parent_i3 = index + degree + 2
-        parent_i1 = 0
-        parent_i2 = 1
-        parent_i3 = self._degree + 2
-        for k in range(self._degree + 1):
-            for j in range(self._degree + 1 - k):
-                i = self._degree - j - k
-                new_nodes[:, parent_i1] += (i + 1) * self._nodes[:, index]
-                new_nodes[:, parent_i2] += (j + 1) * self._nodes[:, index]
-                new_nodes[:, parent_i3] += (k + 1) * self._nodes[:, index]
-                # Update all the indices.
-                parent_i1 += 1
-                parent_i2 += 1
-                parent_i3 += 1
-                index += 1
-            # Update the indices that depend on k.
-            parent_i1 += 1
-            parent_i2 += 1
+        new_nodes = _py_helpers.matrix_product(
+            self._nodes, _py_triangle_matrices.elevation_matrix(self._degree)
+        )
         # Hold off on division until the end, to (attempt to) avoid round-off.
         denominator = self._degree + 1.0
         new_nodes /= denominator
@@ -1225,7 +1522,8 @@ def _make_intersection(edge_info, all_edge_nodes):
 
     .. note::
 
-       This is a helper used only by :meth:`.Triangle.intersect`.
+       This is a helper used only by :meth:`.Triangle.intersect` and
+       :meth:`TrianglePairIntersections.intersection`.
 
     Args:
         edge_info (Tuple[Tuple[int, float, float], ...]): Information
@@ -1238,14 +1536,368 @@ def _make_intersection(edge_info, all_edge_nodes):
 
     Returns:
         .CurvedPolygon: The intersection corresponding to ``edge_info``.
+        The (specialized) edges are only created when first needed.
     """
-    edges = []
-    for index, start, end in edge_info:
-        nodes = all_edge_nodes[index]
-        new_nodes = _curve_helpers.specialize_curve(nodes, start, end)
-        degree = new_nodes.shape[1] - 1
-        edge = _curve_mod.Curve(new_nodes, degree, copy=False, verify=False)
-        edges.append(edge)
     return curved_polygon.CurvedPolygon(
-        *edges, metadata=edge_info, _verify=False
+        metadata=edge_info, _all_edge_nodes=all_edge_nodes
+    )
+
+
+# NOTE: The segment table (and the nodes it refers to) is stored as is,
+#       so the attributes can't be meaningfully grouped.
+# pylint: disable=too-many-instance-attributes
+class TrianglePairIntersections:
+    """The intersections of many pairs of triangles.
+
+    Produced by :func:`intersect_triangle_pairs`. The intersections are
+    stored as a table of segments (i.e. the "raw" output of the
+    intersection algorithm) and :class:`.CurvedPolygon` objects are only
+    built on request, via :meth:`intersection`.
+
+    Args:
+        nodes1 (numpy.ndarray): The stacked nodes of the first set of
+            triangles (as a ``T1 x 2 x N1`` array).
+        degree1 (int): The degree of each triangle in ``nodes1``.
+        nodes2 (numpy.ndarray): The stacked nodes of the second set of
+            triangles.
+        degree2 (int): The degree of each triangle in ``nodes2``.
+        pairs (numpy.ndarray): The intersected pairs, as a ``P x 2`` array
+            of indices of a triangle in ``nodes1`` and a triangle in
+            ``nodes2``.
+        result (Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray, \
+            numpy.ndarray, list]): The pair offsets, polygon offsets,
+            segments, containment values and errors (see
+            :func:`.geometric_intersect_pairs`).
+    """
+
+    __slots__ = (
+        "_nodes1",
+        "_degree1",
+        "_nodes2",
+        "_degree2",
+        "_pairs",
+        "_pair_offsets",
+        "_polygon_offsets",
+        "_segments",
+        "_contained",
+        "_errors",
+        "_polygon_areas",
+        "_areas",
+    )
+
+    def __init__(self, nodes1, degree1, nodes2, degree2, pairs, result):
+        self._nodes1 = nodes1
+        self._degree1 = degree1
+        self._nodes2 = nodes2
+        self._degree2 = degree2
+        self._pairs = pairs
+        (
+            self._pair_offsets,
+            self._polygon_offsets,
+            self._segments,
+            self._contained,
+            self._errors,
+        ) = result
+        self._polygon_areas = None
+        self._areas = None
+
+    def __repr__(self):
+        """Representation of current object.
+
+        Returns:
+            str: Object representation.
+        """
+        return "<{} (num_pairs={:d}, num_polygons={:d})>".format(
+            self.__class__.__name__,
+            len(self),
+            self._polygon_offsets.size - 1,
+        )
+
+    def __len__(self):
+        """The number of intersected pairs.
+
+        Returns:
+            int: The number of pairs.
+        """
+        return self._pairs.shape[0]
+
+    @property
+    def pairs(self):
+        """numpy.ndarray: The ``P x 2`` array of intersected pairs."""
+        return self._pairs
+
+    @property
+    def pair_offsets(self):
+        """numpy.ndarray: The offsets of the curved polygons of each pair.
+
+        A 1D array with ``P + 1`` entries, i.e. the curved polygons of pair
+        ``j`` are ``pair_offsets[j]:pair_offsets[j + 1]``.
+        """
+        return self._pair_offsets
+
+    @property
+    def polygon_offsets(self):
+        """numpy.ndarray: The offsets of the segments of each curved polygon.
+
+        A 1D array with ``Q + 1`` entries, i.e. the segments of curved
+        polygon ``k`` are ``segments[polygon_offsets[k]:polygon_offsets[k +
+        1]]``.
+        """
+        return self._polygon_offsets
+
+    @property
+    def segments(self):
+        """numpy.ndarray: The segments of every curved polygon.
+
+        A 1D structured array with fields ``start``, ``end`` and
+        ``edge_index``. Each segment is the part of an edge between the
+        ``start`` and ``end`` parameters, where edges ``0``, ``1`` and
+        ``2`` belong to the first triangle in the pair and edges ``3``,
+        ``4`` and ``5`` to the second.
+        """
+        return self._segments
+
+    @property
+    def contained(self):
+        """numpy.ndarray: Indicates if one triangle in a pair contains the other.
+
+        A 1D array with one value for each pair: ``0`` if neither triangle
+        contains the other, ``1`` if the first triangle is contained in the
+        second and ``2`` if the second is contained in the first. Contained
+        pairs have no curved polygons.
+        """
+        return self._contained
+
+    @property
+    def errors(self):
+        """list: The pairs that failed, as ``(j, exception)`` pairs.
+
+        Failed pairs have no curved polygons.
+        """
+        return self._errors
+
+    def _compute_areas(self):
+        """Compute (and cache) the areas of the intersections.
+
+        The areas are computed directly from the table of segments, without
+        building any curved polygons. Pairs that failed have an area of
+        ``NaN``.
+        """
+        if len(self) == 0:
+            # NOTE: The nodes may be an empty stack, which the speedup
+            #       rejects (see :func:`intersect_triangle_pairs`).
+            self._polygon_areas = np.empty((0,))
+            self._areas = np.empty((0,))
+            return
+
+        (
+            self._polygon_areas,
+            self._areas,
+        ) = _triangle_intersection.intersection_areas(
+            self._nodes1,
+            self._degree1,
+            self._nodes2,
+            self._degree2,
+            self._pairs,
+            self._pair_offsets,
+            self._polygon_offsets,
+            self._segments,
+            self._contained,
+        )
+        for index, _ in self._errors:
+            self._areas[index] = np.nan
+
+    @property
+    def polygon_areas(self):
+        """numpy.ndarray: The area of each curved polygon.
+
+        A 1D array with ``Q`` entries, one for each curved polygon (i.e.
+        indexed like :attr:`polygon_offsets`). Computed on first access.
+        """
+        if self._polygon_areas is None:
+            self._compute_areas()
+        return self._polygon_areas
+
+    @property
+    def areas(self):
+        """numpy.ndarray: The area of the intersection of each pair.
+
+        A 1D array with one value for each pair: the sum of the areas of the
+        curved polygons of the pair or (if one triangle contains the other)
+        the area of the contained triangle. Pairs that failed have an area
+        of ``NaN``. Computed on first access.
+
+        .. doctest:: triangle-pair-intersections-areas
+
+           >>> nodes_a = np.asfortranarray([
+           ...     [[0.0, 1.0, 0.0],
+           ...      [0.0, 0.0, 1.0]],
+           ... ])
+           >>> nodes_b = np.asfortranarray([
+           ...     [[0.5, 1.5, 0.5],
+           ...      [0.0, 0.0, 1.0]],
+           ...     [[0.25, 0.5 , 0.25],
+           ...      [0.25, 0.25, 0.5 ]],
+           ... ])
+           >>> result = bezier.triangle.intersect_triangle_pairs(
+           ...     nodes_a, nodes_b, [[0, 0], [0, 1]])
+           >>> result.areas
+           array([0.125  , 0.03125])
+        """
+        if self._areas is None:
+            self._compute_areas()
+        return self._areas
+
+    def intersection(self, index):
+        """Build the intersections of a single pair.
+
+        Args:
+            index (int): The index of the pair.
+
+        Returns:
+            List[Union[~bezier.curved_polygon.CurvedPolygon, \
+            ~bezier.triangle.Triangle]]: List of intersections (possibly
+            empty), as in :meth:`Triangle.intersect`.
+
+        Raises:
+            Exception: The error encountered when intersecting the pair (if
+                it failed).
+        """
+        for error_index, exc in self._errors:
+            if error_index == index:
+                raise exc
+
+        first, second = self._pairs[index, :]
+        contained = self._contained[index]
+        if contained == _py_triangle_intersection.TriangleContained.FIRST:
+            return [Triangle(self._nodes1[first, :, :], self._degree1)]
+
+        if contained == _py_triangle_intersection.TriangleContained.SECOND:
+            return [Triangle(self._nodes2[second, :, :], self._degree2)]
+
+        begin = self._pair_offsets[index]
+        end = self._pair_offsets[index + 1]
+        if begin == end:
+            return []
+
+        all_edge_nodes = _triangle_helpers.compute_edge_nodes(
+            np.asfortranarray(self._nodes1[first, :, :]), self._degree1
+        ) + _triangle_helpers.compute_edge_nodes(
+            np.asfortranarray(self._nodes2[second, :, :]), self._degree2
+        )
+        return [
+            _make_intersection(self._edge_info(polygon), all_edge_nodes)
+            for polygon in range(begin, end)
+        ]
+
+    def _edge_info(self, polygon):
+        """Convert the segments of a curved polygon to "edge info".
+
+        Args:
+            polygon (int): The index of the curved polygon.
+
+        Returns:
+            Tuple[Tuple[int, float, float], ...]: The edge index and the
+            start and end parameters of each segment (as expected by
+            :func:`_make_intersection`).
+        """
+        begin = self._polygon_offsets[polygon]
+        end = self._polygon_offsets[polygon + 1]
+        return tuple(
+            (int(segment["edge_index"]), segment["start"], segment["end"])
+            for segment in self._segments[begin:end]
+        )
+
+
+# pylint: enable=too-many-instance-attributes
+
+
+def intersect_triangle_pairs(nodes_a, nodes_b, pairs):
+    """Intersect many pairs of planar triangles at once.
+
+    The triangles are given as two stacks (e.g. the elements of two
+    meshes), each with a single degree, and the pairs as indices into the
+    stacks. Rather than calling :meth:`Triangle.intersect` once per pair,
+    every pair is intersected (via the geometric strategy) in a single
+    call. A pair for which the intersection fails does not stop the batch;
+    it is reported in :attr:`~TrianglePairIntersections.errors` instead.
+
+    .. doctest:: intersect-triangle-pairs
+       :options: +NORMALIZE_WHITESPACE
+
+       >>> nodes_a = np.asfortranarray([
+       ...     [[0.0, 1.0, 0.0],
+       ...      [0.0, 0.0, 1.0]],
+       ... ])
+       >>> nodes_b = np.asfortranarray([
+       ...     [[0.5, 1.5, 0.5],
+       ...      [0.0, 0.0, 1.0]],
+       ...     [[0.25, 0.5 , 0.25],
+       ...      [0.25, 0.25, 0.5 ]],
+       ... ])
+       >>> result = bezier.triangle.intersect_triangle_pairs(
+       ...     nodes_a, nodes_b, [[0, 0], [0, 1]])
+       >>> result
+       <TrianglePairIntersections (num_pairs=2, num_polygons=1)>
+       >>> result.pair_offsets
+       array([0, 1, 1], dtype=int32)
+       >>> result.contained
+       array([0, 2], dtype=int32)
+       >>> result.intersection(0)
+       [<CurvedPolygon (num_sides=3)>]
+
+    Args:
+        nodes_a (Sequence[Sequence[Sequence[numbers.Number]]]): The stacked
+            nodes of the first set of triangles. Must be convertible to a
+            3D NumPy array of floating point values, where the first index
+            is the triangle, the second is the dimension (which must be 2)
+            and the third is the node.
+        nodes_b (Sequence[Sequence[Sequence[numbers.Number]]]): The stacked
+            nodes of the second set of triangles.
+        pairs (Sequence[Sequence[int]]): The pairs to intersect, as a
+            ``P x 2`` array of indices of a triangle in ``nodes_a`` and a
+            triangle in ``nodes_b``.
+
+    Returns:
+        TrianglePairIntersections: The intersections of every pair.
+
+    Raises:
+        ValueError: If ``nodes_a`` or ``nodes_b`` is not 3D or does not
+            have a triangular number of nodes.
+        NotImplementedError: If the triangles are not two-dimensional.
+        ValueError: If ``pairs`` is not a ``P x 2`` array of valid indices.
+    """
+    nodes1, degree1 = _base.stacked_triangles(nodes_a)
+    nodes2, degree2 = _base.stacked_triangles(nodes_b)
+    pairs_np = np.asarray(pairs)
+    if pairs_np.shape == (0,):
+        pairs_np = pairs_np.reshape((0, 2))
+    if pairs_np.ndim != 2 or pairs_np.shape[1] != 2:
+        raise ValueError("Pairs must be a P x 2 array, not", pairs_np.shape)
+
+    if pairs_np.size != 0 and not np.issubdtype(pairs_np.dtype, np.integer):
+        raise ValueError("Pair indices must be integers, not", pairs_np.dtype)
+
+    pairs_np = np.asfortranarray(pairs_np, dtype=np.intc)
+    if np.any(pairs_np < 0) or np.any(
+        pairs_np >= np.array([nodes1.shape[0], nodes2.shape[0]])
+    ):
+        raise ValueError("Pair indices are out of range")
+
+    if pairs_np.size == 0:
+        # NOTE: The speedup rejects an empty stack of nodes (as a
+        #       non-contiguous buffer), but there is nothing to intersect.
+        result = (
+            np.zeros((1,), dtype=np.intc),
+            np.zeros((1,), dtype=np.intc),
+            np.empty((0,), dtype=_py_triangle_intersection.SEGMENT_DTYPE),
+            np.empty((0,), dtype=np.intc),
+            [],
+        )
+    else:
+        result = _triangle_intersection.geometric_intersect_pairs(
+            nodes1, degree1, nodes2, degree2, pairs_np
+        )
+    return TrianglePairIntersections(
+        nodes1, degree1, nodes2, degree2, pairs_np, result
     )
@@ -15,21 +15,23 @@ module test_curve
   use, intrinsic :: iso_c_binding, only: c_bool, c_double, c_int
   use curve, only: &
        CurveData, evaluate_curve_barycentric, evaluate_multi, &
-       specialize_curve, evaluate_hodograph, subdivide_nodes, newton_refine, &
-       LOCATE_MISS, LOCATE_INVALID, locate_point, elevate_nodes, &
+       evaluate_curves_multi, specialize_curve, evaluate_hodograph, &
+       subdivide_nodes, newton_refine, LOCATE_MISS, LOCATE_INVALID, &
+       locate_point, locate_point_multi, elevate_nodes, &
        get_curvature, reduce_pseudo_inverse, full_reduce, compute_length, &
-       curves_equal, subdivide_curve
+       compute_length_multi, curves_equal, subdivide_curve
   use types, only: dp
   use unit_test_helpers, only: &
        MACHINE_EPS, print_status, get_random_nodes, get_id_mat
   implicit none
   private &
        test_evaluate_curve_barycentric, test_evaluate_multi, &
-       test_specialize_curve, test_evaluate_hodograph, test_subdivide_nodes, &
+       test_evaluate_curves_multi, test_specialize_curve, &
+       test_evaluate_hodograph, test_subdivide_nodes, &
        subdivide_points_check, test_newton_refine, test_locate_point, &
-       test_elevate_nodes, test_get_curvature, test_reduce_pseudo_inverse, &
+       test_locate_point_multi, test_elevate_nodes, test_get_curvature, test_reduce_pseudo_inverse, &
        pseudo_inverse_helper, test_full_reduce, test_compute_length, &
-       test_curves_equal, test_subdivide_curve
+       test_compute_length_multi, test_curves_equal, test_subdivide_curve
   public curve_all_tests
 
 contains
@@ -39,16 +41,19 @@ contains
 
     call test_evaluate_curve_barycentric(success)
     call test_evaluate_multi(success)
+    call test_evaluate_curves_multi(success)
     call test_specialize_curve(success)
     call test_evaluate_hodograph(success)
     call test_subdivide_nodes(success)
     call test_newton_refine(success)
     call test_locate_point(success)
+    call test_locate_point_multi(success)
     call test_elevate_nodes(success)
     call test_get_curvature(success)
     call test_reduce_pseudo_inverse(success)
     call test_full_reduce(success)
     call test_compute_length(success)
+    call test_compute_length_multi(success)
     call test_curves_equal(success)
     call test_subdivide_curve(success)
 
@@ -134,6 +139,68 @@ contains
 
   end subroutine test_evaluate_multi
 
+  subroutine test_evaluate_curves_multi(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    real(c_double) :: nodes1(2, 2, 3)
+    real(c_double) :: s_vals1(33)
+    real(c_double) :: evaluated1(2, 2, 33), expected1(2, 33)
+    real(c_double) :: nodes2(4, 3, 5), random_nodes(12, 5), curve_nodes(3, 5)
+    real(c_double) :: s_vals2(9)
+    real(c_double) :: evaluated2(4, 3, 9), expected2(3, 9)
+    integer :: i
+    integer :: case_id
+    character(21) :: name
+
+    case_id = 1
+    name = "evaluate_curves_multi"
+
+    ! CASE 1: Two quadratic curves.
+    do i = 1, 33
+       s_vals1(i) = (i - 1) / 32.0_dp
+    end do
+    nodes1(1, :, 1) = [0.0_dp, 0.0_dp]
+    nodes1(1, :, 2) = [2.0_dp, -1.0_dp]
+    nodes1(1, :, 3) = [3.0_dp, 2.0_dp]
+    nodes1(2, :, 1) = [1.0_dp, 0.0_dp]
+    nodes1(2, :, 2) = [1.0_dp, 1.0_dp]
+    nodes1(2, :, 3) = [1.0_dp, 2.0_dp]
+    call evaluate_curves_multi( &
+         2, 3, 2, nodes1, 33, s_vals1, evaluated1)
+    ! B1(s) = [s(4 - s), 2s(2s - 1)]
+    expected1(1, :) = s_vals1 * (4.0_dp - s_vals1)
+    expected1(2, :) = 2.0_dp * s_vals1 * (2.0_dp * s_vals1 - 1.0_dp)
+    case_success = all(evaluated1(1, :, :) == expected1)
+    ! B2(s) = [1, 2s]
+    expected1(1, :) = 1.0_dp
+    expected1(2, :) = 2.0_dp * s_vals1
+    case_success = ( &
+         case_success .AND. &
+         all(evaluated1(2, :, :) == expected1))
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Each stacked curve agrees with ``evaluate_multi``.
+    call get_random_nodes(random_nodes, 10001, 28172, num_bits=8)
+    nodes2 = reshape(random_nodes, [4, 3, 5])
+    do i = 1, 9
+       s_vals2(i) = (i - 1) / 8.0_dp
+    end do
+    call evaluate_curves_multi( &
+         4, 5, 3, nodes2, 9, s_vals2, evaluated2)
+    case_success = .TRUE.
+    do i = 1, 4
+       curve_nodes = nodes2(i, :, :)
+       call evaluate_multi( &
+            5, 3, curve_nodes, 9, s_vals2, expected2)
+       case_success = ( &
+            case_success .AND. &
+            all(evaluated2(i, :, :) == expected2))
+    end do
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_evaluate_curves_multi
+
   subroutine test_specialize_curve(success)
     logical(c_bool), intent(inout) :: success
     ! Variables outside of signature.
@@ -517,6 +584,48 @@ contains
 
   end subroutine test_locate_point
 
+  subroutine test_locate_point_multi(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    real(c_double) :: nodes1(2, 3), points1(2, 4)
+    real(c_double) :: nodes2(2, 4), points2(2, 2)
+    real(c_double) :: s_vals1(4), s_vals2(2)
+    integer :: case_id
+    character(18) :: name
+
+    case_id = 1
+    name = "locate_point_multi"
+
+    ! CASE 1: Quadratic in 2D (with matches, a miss and clamped values).
+    nodes1(:, 1) = 0
+    nodes1(:, 2) = [1.0_dp, 1.0_dp]
+    nodes1(:, 3) = [2.0_dp, 0.0_dp]
+    points1(:, 1) = [0.25_dp, 0.21875_dp]
+    points1(:, 2) = [0.5_dp, 2.0_dp]
+    points1(:, 3) = [0.0_dp, 0.0_dp]
+    points1(:, 4) = [2.0_dp, 0.0_dp]
+    call locate_point_multi( &
+         3, 2, nodes1, 4, points1, s_vals1)
+
+    case_success = all(s_vals1 == [0.125_dp, LOCATE_MISS, 0.0_dp, 1.0_dp])
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Self-intersecting cubic in 2D (one point will cause failure).
+    nodes2(:, 1) = [0.0_dp, 2.0_dp]
+    nodes2(:, 2) = [-1.0_dp, 0.0_dp]
+    nodes2(:, 3) = [1.0_dp, 1.0_dp]
+    nodes2(:, 4) = [-0.75_dp, 1.625_dp]
+    points2(:, 1) = [-0.09375_dp, 0.828125_dp]
+    points2(:, 2) = [-0.25_dp, 1.375_dp]
+    call locate_point_multi( &
+         4, 2, nodes2, 2, points2, s_vals2)
+
+    case_success = all(s_vals2 == [0.5_dp, LOCATE_INVALID])
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_locate_point_multi
+
   subroutine test_elevate_nodes(success)
     logical(c_bool), intent(inout) :: success
     ! Variables outside of signature.
@@ -923,6 +1032,80 @@ contains
 
   end subroutine test_compute_length
 
+  subroutine test_compute_length_multi(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    real(c_double) :: nodes1(2, 2, 3), lengths1(2), expected
+    real(c_double) :: nodes2(3, 2, 4), random_nodes(6, 4), curve_nodes(2, 4)
+    real(c_double) :: lengths2(3), length
+    real(c_double) :: nodes3(2, 2, 2), lengths3(2)
+    integer(c_int) :: error_val, curve_error
+    integer :: i
+    integer :: case_id
+    character(20) :: name
+
+    case_id = 1
+    name = "compute_length_multi"
+
+    ! CASE 1: Two quadratic curves.
+    nodes1(1, :, 1) = 0
+    nodes1(1, :, 2) = [1.0_dp, 2.0_dp]
+    nodes1(1, :, 3) = [2.0_dp, 0.0_dp]
+    nodes1(2, :, 1) = 0
+    nodes1(2, :, 2) = [3.0_dp, 4.0_dp]
+    nodes1(2, :, 3) = [6.0_dp, 8.0_dp]
+    call compute_length_multi( &
+         2, 3, 2, nodes1, 0.5_dp**40, lengths1, error_val)
+    ! 2 INT_0^1 SQRT(16 s^2  - 16 s + 5) ds = SQRT(5) + sinh^{-1}(2)/2
+    expected = sqrt(5.0_dp) + 0.5_dp * asinh(2.0_dp)
+    case_success = ( &
+         abs(lengths1(1) - expected) <= spacing(expected) .AND. &
+         lengths1(2) == 10.0_dp .AND. &
+         error_val == 0)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Each stacked curve agrees with ``compute_length``.
+    call get_random_nodes(random_nodes, 17021, 5311, num_bits=8)
+    nodes2 = reshape(random_nodes, [3, 2, 4])
+    call compute_length_multi( &
+         3, 4, 2, nodes2, 0.5_dp**40, lengths2, error_val)
+    case_success = (error_val == 0)
+    do i = 1, 3
+       curve_nodes = nodes2(i, :, :)
+       call compute_length( &
+            4, 2, curve_nodes, length, curve_error)
+       case_success = ( &
+            case_success .AND. &
+            abs(lengths2(i) - length) <= 0.5_dp**26 * length)
+    end do
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 3: Linear curves.
+    nodes3(1, :, 1) = 0
+    nodes3(1, :, 2) = [3.0_dp, 4.0_dp]
+    nodes3(2, :, 1) = [1.0_dp, 1.0_dp]
+    nodes3(2, :, 2) = [6.0_dp, 13.0_dp]
+    call compute_length_multi( &
+         2, 2, 2, nodes3, 0.5_dp**40, lengths3, error_val)
+    case_success = ( &
+         all(lengths3 == [5.0_dp, 13.0_dp]) .AND. error_val == 0)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 4: Degree-zero "curves".
+    call compute_length_multi( &
+         2, 1, 2, nodes3(:, :, :1), 0.5_dp**40, lengths3, error_val)
+    case_success = (all(lengths3 == 0.0_dp) .AND. error_val == 0)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 5: Empty curves.
+    call compute_length_multi( &
+         2, 0, 2, nodes3(:, :, :0), 0.5_dp**40, lengths3, error_val)
+    case_success = error_val == -1
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_compute_length_multi
+
   subroutine test_curves_equal(success)
     logical(c_bool), intent(inout) :: success
     ! Variables outside of signature.
@@ -12,7 +12,7 @@
 
 module test_curve_intersection
 
-  use, intrinsic :: iso_c_binding, only: c_bool, c_double, c_int
+  use, intrinsic :: iso_c_binding, only: c_bool, c_double, c_int, c_ptr
   use status, only: &
        Status_SUCCESS, Status_BAD_MULTIPLICITY, Status_NO_CONVERGE, &
        Status_INSUFFICIENT_SPACE, Status_SINGULAR
@@ -33,7 +33,10 @@ module test_curve_intersection
        bbox_line_intersect, check_lines, add_intersection, &
        add_from_linearized, endpoint_check, tangent_bbox_intersection, &
        add_candidates, intersect_one_round, make_same_degree, &
-       add_coincident_parameters, all_intersections, all_intersections_abi
+       add_coincident_parameters, all_intersections, all_intersections_abi, &
+       new_intersection_workspace, free_intersection_workspace, &
+       all_intersections_workspace_abi, compute_fat_line, clip_interval, &
+       all_intersections_clipping_abi, flatten_curve, flatten_curves
   use types, only: dp
   use unit_test_helpers, only: print_status
   implicit none
@@ -49,7 +52,10 @@ module test_curve_intersection
        test_tangent_bbox_intersection, test_add_candidates, &
        test_intersect_one_round, test_make_same_degree, &
        test_add_coincident_parameters, test_all_intersections, &
-       test_all_intersections_abi
+       test_all_intersections_abi, test_all_intersections_workspace_abi, &
+       test_compute_fat_line, test_clip_interval, &
+       test_all_intersections_clipping_abi, test_flatten_curve, &
+       test_flatten_curves
   public curve_intersection_all_tests
 
 contains
@@ -82,6 +88,12 @@ contains
     call test_add_coincident_parameters(success)
     call test_all_intersections(success)
     call test_all_intersections_abi(success)
+    call test_all_intersections_workspace_abi(success)
+    call test_compute_fat_line(success)
+    call test_clip_interval(success)
+    call test_all_intersections_clipping_abi(success)
+    call test_flatten_curve(success)
+    call test_flatten_curves(success)
 
   end subroutine curve_intersection_all_tests
 
@@ -3386,4 +3398,428 @@ contains
 
   end subroutine test_all_intersections_abi
 
+  subroutine test_all_intersections_workspace_abi(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    type(c_ptr) :: workspace1, workspace2
+    real(c_double) :: linear1(2, 2)
+    real(c_double) :: quadratic1(2, 3)
+    real(c_double) :: cubic1(2, 4)
+    integer(c_int) :: num_intersections
+    logical(c_bool) :: coincident
+    real(c_double) :: intersections1(2, 2), intersections2(2, 3)
+    integer(c_int) :: status
+    integer :: case_id
+    character(27) :: name
+
+    case_id = 1
+    name = "all_intersections_workspace"
+
+    call new_intersection_workspace(workspace1)
+    call new_intersection_workspace(workspace2)
+
+    ! CASE 1: ``intersections`` is not large enough.
+    linear1(:, 1) = [-3.0_dp, 0.0_dp]
+    linear1(:, 2) = [5.0_dp, 0.0_dp]
+    cubic1(:, 1) = [-7.0_dp, -9.0_dp]
+    cubic1(:, 2) = [9.0_dp, 13.0_dp]
+    cubic1(:, 3) = [-7.0_dp, -13.0_dp]
+    cubic1(:, 4) = [9.0_dp, 9.0_dp]
+
+    call all_intersections_workspace_abi( &
+         workspace1, 2, linear1, 4, cubic1, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 3 .AND. &
+         .NOT. coincident .AND. &
+         status == Status_INSUFFICIENT_SPACE)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Same as CASE 1, but with large enough ``intersections``.
+    call all_intersections_workspace_abi( &
+         workspace1, 2, linear1, 4, cubic1, 3, intersections2, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 3 .AND. &
+         intersections2(1, 1) == 0.5_dp .AND. &
+         intersections2(2, 1) == 0.5_dp .AND. &
+         intersections2(1, 2) == 0.375_dp .AND. &
+         intersections2(2, 2) == 0.25_dp .AND. &
+         intersections2(1, 3) == 0.625_dp .AND. &
+         intersections2(2, 3) == 0.75_dp .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 3: A second workspace, with curves that must be subdivided.
+    quadratic1(:, 1) = [0.0_dp, 0.0_dp]
+    quadratic1(:, 2) = [2.0_dp, 4.0_dp]
+    quadratic1(:, 3) = [4.0_dp, 0.0_dp]
+    linear1(:, 1) = [0.0_dp, 1.5_dp]
+    linear1(:, 2) = [4.0_dp, 1.5_dp]
+
+    call all_intersections_workspace_abi( &
+         workspace2, 3, quadratic1, 2, linear1, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 2 .AND. &
+         all(intersections1(:, 1) == 0.25_dp) .AND. &
+         all(intersections1(:, 2) == 0.75_dp) .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    call free_intersection_workspace(workspace1)
+    call free_intersection_workspace(workspace2)
+
+  end subroutine test_all_intersections_workspace_abi
+
+  subroutine test_compute_fat_line(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    real(c_double) :: quadratic(2, 3), cubic(2, 4)
+    real(c_double) :: coeff_a, coeff_b, coeff_c, d_min, d_max
+    integer :: case_id
+    character(16) :: name
+
+    case_id = 1
+    name = "compute_fat_line"
+
+    ! CASE 1: All control points on one side of the line.
+    quadratic(:, 1) = 0
+    quadratic(:, 2) = [1.0_dp, 2.0_dp]
+    quadratic(:, 3) = [2.0_dp, 0.0_dp]
+    call compute_fat_line( &
+         3, quadratic, coeff_a, coeff_b, coeff_c, d_min, d_max)
+    case_success = ( &
+         coeff_a == 0.0_dp .AND. &
+         coeff_b == 1.0_dp .AND. &
+         coeff_c == 0.0_dp .AND. &
+         d_min == 0.0_dp .AND. &
+         d_max == 2.0_dp)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Control points on both sides of the line.
+    cubic(:, 1) = 0
+    cubic(:, 2) = [1.0_dp, 1.0_dp]
+    cubic(:, 3) = [3.0_dp, -2.0_dp]
+    cubic(:, 4) = [4.0_dp, 0.0_dp]
+    call compute_fat_line( &
+         4, cubic, coeff_a, coeff_b, coeff_c, d_min, d_max)
+    case_success = ( &
+         coeff_a == 0.0_dp .AND. &
+         coeff_b == 1.0_dp .AND. &
+         coeff_c == 0.0_dp .AND. &
+         d_min == -2.0_dp .AND. &
+         d_max == 1.0_dp)
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_compute_fat_line
+
+  subroutine test_clip_interval(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    real(c_double) :: quadratic1(2, 3), quadratic2(2, 3)
+    real(c_double) :: linear1(2, 2)
+    real(c_double) :: start, end_
+    integer :: case_id
+    character(13) :: name
+
+    case_id = 1
+    name = "clip_interval"
+
+    ! CASE 1: Line is entirely within the fat line.
+    quadratic1(:, 1) = 0
+    quadratic1(:, 2) = [1.0_dp, 2.0_dp]
+    quadratic1(:, 3) = [2.0_dp, 0.0_dp]
+    linear1(:, 1) = [0.0_dp, 0.75_dp]
+    linear1(:, 2) = [2.0_dp, 0.75_dp]
+    call clip_interval(3, quadratic1, 2, linear1, start, end_)
+    case_success = (start == 0.0_dp .AND. end_ == 1.0_dp)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Line is disjoint from the fat line.
+    linear1(2, :) = 3
+    call clip_interval(3, quadratic1, 2, linear1, start, end_)
+    case_success = (start > end_)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 3: Line crosses the boundary of the fat line.
+    linear1(:, 1) = [1.0_dp, 0.0_dp]
+    linear1(:, 2) = [1.0_dp, 4.0_dp]
+    call clip_interval(3, quadratic1, 2, linear1, start, end_)
+    case_success = ( &
+         start == 0.0_dp .AND. &
+         abs(end_ - 0.5_dp) < 0.5_dp**30)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 4: The first and last nodes are identical, so there is no
+    !         fat line.
+    quadratic2(:, 1) = 0
+    quadratic2(:, 2) = 1
+    quadratic2(:, 3) = 0
+    call clip_interval(3, quadratic2, 3, quadratic1, start, end_)
+    case_success = (start == 0.0_dp .AND. end_ == 1.0_dp)
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_clip_interval
+
+  subroutine test_all_intersections_clipping_abi(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    real(c_double) :: linear1(2, 2)
+    real(c_double) :: quadratic1(2, 3), quadratic2(2, 3)
+    real(c_double) :: cubic1(2, 4)
+    integer(c_int) :: num_intersections
+    logical(c_bool) :: coincident
+    real(c_double) :: intersections1(2, 2), intersections2(2, 3)
+    integer(c_int) :: status
+    integer :: case_id
+    character(26) :: name
+
+    case_id = 1
+    name = "all_intersections_clipping"
+
+    ! CASE 1: Quadratic and line with two intersections.
+    quadratic1(:, 1) = 0
+    quadratic1(:, 2) = [1.0_dp, 2.0_dp]
+    quadratic1(:, 3) = [2.0_dp, 0.0_dp]
+    linear1(:, 1) = [0.0_dp, 0.75_dp]
+    linear1(:, 2) = [2.0_dp, 0.75_dp]
+
+    call all_intersections_clipping_abi( &
+         3, quadratic1, 2, linear1, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 2 .AND. &
+         all(abs(minval(intersections1, 2) - 0.25_dp) < 0.5_dp**50) .AND. &
+         all(abs(maxval(intersections1, 2) - 0.75_dp) < 0.5_dp**50) .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Curves that don't intersect.
+    linear1(2, :) = 3
+    call all_intersections_clipping_abi( &
+         3, quadratic1, 2, linear1, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 0 .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 3: ``intersections`` is not large enough.
+    linear1(:, 1) = [-3.0_dp, 0.0_dp]
+    linear1(:, 2) = [5.0_dp, 0.0_dp]
+    cubic1(:, 1) = [-7.0_dp, -9.0_dp]
+    cubic1(:, 2) = [9.0_dp, 13.0_dp]
+    cubic1(:, 3) = [-7.0_dp, -13.0_dp]
+    cubic1(:, 4) = [9.0_dp, 9.0_dp]
+
+    call all_intersections_clipping_abi( &
+         2, linear1, 4, cubic1, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 3 .AND. &
+         .NOT. coincident .AND. &
+         status == Status_INSUFFICIENT_SPACE)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 4: Same as CASE 3, but with large enough ``intersections``.
+    call all_intersections_clipping_abi( &
+         2, linear1, 4, cubic1, 3, intersections2, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 3 .AND. &
+         abs(minval(intersections2(1, :)) - 0.375_dp) < 0.5_dp**50 .AND. &
+         abs(maxval(intersections2(1, :)) - 0.625_dp) < 0.5_dp**50 .AND. &
+         abs(minval(intersections2(2, :)) - 0.25_dp) < 0.5_dp**50 .AND. &
+         abs(maxval(intersections2(2, :)) - 0.75_dp) < 0.5_dp**50 .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 5: Coincident curves.
+    call all_intersections_clipping_abi( &
+         3, quadratic1, 3, quadratic1, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 2 .AND. &
+         all(intersections1(:, 1) == 0.0_dp) .AND. &
+         all(intersections1(:, 2) == 1.0_dp) .AND. &
+         coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 6: Too many candidates (tangent curves with a shared
+    !         axis of symmetry).
+    quadratic1(:, 1) = [12.0_dp, 4.0_dp]
+    quadratic1(:, 2) = [-12.0_dp, -8.0_dp]
+    quadratic1(:, 3) = [0.0_dp, 16.0_dp]
+    quadratic2(:, 1) = [6.0_dp, 1.0_dp]
+    quadratic2(:, 2) = [-6.0_dp, -2.0_dp]
+    quadratic2(:, 3) = [0.0_dp, 4.0_dp]
+
+    call all_intersections_clipping_abi( &
+         3, quadratic1, 3, quadratic2, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = (.NOT. coincident .AND. status == 89)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 7: Tangent curves that meet at an endpoint of the second curve
+    !         (Newton's method for both parameters leaves the unit interval).
+    quadratic1(:, 1) = [15.0_dp, -9.0_dp] / 16
+    quadratic1(:, 2) = [19.0_dp, 11.0_dp] / 16
+    quadratic1(:, 3) = [7.0_dp, 15.0_dp] / 16
+    quadratic2(:, 1) = [1.0_dp, 0.0_dp]
+    quadratic2(:, 2) = [1.0_dp, 1.5_dp]
+    quadratic2(:, 3) = [-0.5_dp, 1.5_dp]
+
+    call all_intersections_clipping_abi( &
+         3, quadratic1, 3, quadratic2, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 1 .AND. &
+         all(intersections1(:, 1) == [0.25_dp, 0.0_dp]) .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 8: Tangent curves that meet in the interior of both (Newton's
+    !         method for a simple root only converges linearly, so the
+    !         intersection is refined again as a double root).
+    quadratic1(:, 1) = 0
+    quadratic1(:, 2) = [4.5_dp, 9.0_dp]
+    quadratic1(:, 3) = [9.0_dp, 0.0_dp]
+    linear1(:, 1) = [3.0_dp, 4.5_dp]
+    linear1(:, 2) = [8.0_dp, 4.5_dp]
+
+    call all_intersections_clipping_abi( &
+         3, quadratic1, 2, linear1, 2, intersections1, &
+         num_intersections, coincident, status)
+    case_success = ( &
+         num_intersections == 1 .AND. &
+         intersections1(1, 1) == 0.5_dp .AND. &
+         abs(intersections1(2, 1) - 0.3_dp) <= 2 * spacing(0.3_dp) .AND. &
+         .NOT. coincident .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_all_intersections_clipping_abi
+
+  subroutine test_flatten_curve(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    real(c_double) :: linear1(2, 2), quadratic1(2, 3)
+    real(c_double) :: s_vals(5), vertices(2, 5)
+    integer(c_int) :: num_vertices, status
+    integer :: case_id
+    character(13) :: name
+
+    case_id = 1
+    name = "flatten_curve"
+
+    ! CASE 1: A line is never subdivided.
+    linear1(:, 1) = [1.0_dp, 2.0_dp]
+    linear1(:, 2) = [3.0_dp, -1.0_dp]
+    call flatten_curve( &
+         2, 2, linear1, 0.5_dp**40, 5, s_vals, vertices, num_vertices, status)
+    case_success = ( &
+         num_vertices == 2 .AND. &
+         all(s_vals(:2) == [0.0_dp, 1.0_dp]) .AND. &
+         all(vertices(:, :2) == linear1) .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Quadratic with linearization error 1, which is subdivided
+    !         once (each half has error 1/4).
+    quadratic1(:, 1) = 0
+    quadratic1(:, 2) = [1.0_dp, 2.0_dp]
+    quadratic1(:, 3) = [2.0_dp, 0.0_dp]
+    call flatten_curve( &
+         3, 2, quadratic1, 0.25_dp, 5, s_vals, vertices, num_vertices, status)
+    case_success = ( &
+         num_vertices == 3 .AND. &
+         all(s_vals(:3) == [0.0_dp, 0.5_dp, 1.0_dp]) .AND. &
+         all(vertices(1, :3) == [0.0_dp, 1.0_dp, 2.0_dp]) .AND. &
+         all(vertices(2, :3) == [0.0_dp, 1.0_dp, 0.0_dp]) .AND. &
+         status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 3: Same quadratic, subdivided twice.
+    call flatten_curve( &
+         3, 2, quadratic1, 0.0625_dp, 5, s_vals, vertices, num_vertices, &
+         status)
+    case_success = ( &
+         num_vertices == 5 .AND. &
+         all(s_vals == [0.0_dp, 0.25_dp, 0.5_dp, 0.75_dp, 1.0_dp]) .AND. &
+         all(vertices(1, :) == [0.0_dp, 0.5_dp, 1.0_dp, 1.5_dp, 2.0_dp]) &
+         .AND. &
+         all(vertices(2, :) == [0.0_dp, 0.75_dp, 1.0_dp, 0.75_dp, 0.0_dp]) &
+         .AND. status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 4: Insufficient space (but the vertices that fit are populated).
+    s_vals = -1.0_dp
+    call flatten_curve( &
+         3, 2, quadratic1, 0.25_dp, 2, s_vals, vertices, num_vertices, status)
+    case_success = ( &
+         num_vertices == 3 .AND. &
+         all(s_vals(:3) == [0.0_dp, 0.5_dp, -1.0_dp]) .AND. &
+         status == Status_INSUFFICIENT_SPACE)
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_flatten_curve
+
+  subroutine test_flatten_curves(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    real(c_double) :: nodes(2, 2, 3)
+    real(c_double) :: s_vals(5), vertices(2, 5)
+    integer(c_int) :: offsets(3), num_vertices, status
+    integer :: case_id
+    character(14) :: name
+
+    case_id = 1
+    name = "flatten_curves"
+
+    ! CASE 1: A quadratic (subdivided once) and a flat quadratic.
+    nodes(1, :, 1) = 0
+    nodes(1, :, 2) = [1.0_dp, 2.0_dp]
+    nodes(1, :, 3) = [2.0_dp, 0.0_dp]
+    nodes(2, :, 1) = [0.0_dp, 1.0_dp]
+    nodes(2, :, 2) = [1.0_dp, 1.0_dp]
+    nodes(2, :, 3) = [2.0_dp, 1.0_dp]
+    call flatten_curves( &
+         2, 3, 2, nodes, 0.25_dp, 5, s_vals, vertices, offsets, &
+         num_vertices, status)
+    case_success = ( &
+         num_vertices == 5 .AND. &
+         all(offsets == [0, 3, 5]) .AND. &
+         all(s_vals == [0.0_dp, 0.5_dp, 1.0_dp, 0.0_dp, 1.0_dp]) .AND. &
+         all(vertices(1, :) == [0.0_dp, 1.0_dp, 2.0_dp, 0.0_dp, 2.0_dp]) &
+         .AND. &
+         all(vertices(2, :) == [0.0_dp, 1.0_dp, 0.0_dp, 1.0_dp, 1.0_dp]) &
+         .AND. status == Status_SUCCESS)
+    call print_status(name, case_id, case_success, success)
+
+    ! CASE 2: Insufficient space.
+    call flatten_curves( &
+         2, 3, 2, nodes, 0.25_dp, 2, s_vals, vertices, offsets, &
+         num_vertices, status)
+    case_success = ( &
+         num_vertices == 5 .AND. &
+         all(offsets == [0, 3, 5]) .AND. &
+         status == Status_INSUFFICIENT_SPACE)
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_flatten_curves
+
 end module test_curve_intersection
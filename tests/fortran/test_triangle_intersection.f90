@@ -30,8 +30,8 @@ module test_triangle_intersection
        IntersectionClassification_COINCIDENT_UNUSED, &
        TriangleContained_NEITHER, &
        TriangleContained_FIRST, TriangleContained_SECOND, newton_refine, &
-       locate_point, classify_intersection, update_edge_end_unused, &
-       find_corner_unused, add_st_vals, should_keep, &
+       locate_point, locate_point_multi, classify_intersection, &
+       update_edge_end_unused, find_corner_unused, add_st_vals, should_keep, &
        triangles_intersection_points, is_first, is_second, &
        get_next, to_front, add_segment, &
        interior_combine, triangles_intersect, triangles_intersect_abi
@@ -39,7 +39,8 @@ module test_triangle_intersection
   use unit_test_helpers, only: print_status
   implicit none
   private &
-       test_newton_refine, test_locate_point, test_classify_intersection, &
+       test_newton_refine, test_locate_point, test_locate_point_multi, &
+       test_classify_intersection, &
        test_update_edge_end_unused, test_find_corner_unused, &
        test_add_st_vals, test_should_keep, test_triangles_intersection_points, &
        test_is_first, test_is_second, &
@@ -55,6 +56,7 @@ contains
 
     call test_newton_refine(success)
     call test_locate_point(success)
+    call test_locate_point_multi(success)
     call test_classify_intersection(success)
     call test_update_edge_end_unused(success)
     call test_find_corner_unused(success)
@@ -186,6 +188,43 @@ contains
 
   end subroutine test_locate_point
 
+  subroutine test_locate_point_multi(success)
+    logical(c_bool), intent(inout) :: success
+    ! Variables outside of signature.
+    logical :: case_success
+    integer :: case_id
+    real(c_double) :: nodes(2, 6), points(2, 3), st_vals(3, 2)
+    real(c_double) :: s_val, t_val
+    character(24) :: name
+
+    case_id = 1
+    name = "locate_point_multi (Tri)"
+
+    ! CASE 1: Agrees with ``locate_point`` for each point (including a miss).
+    nodes(:, 1) = 0
+    nodes(:, 2) = [1.0_dp, 0.0_dp]
+    nodes(:, 3) = [2.0_dp, 0.0_dp]
+    nodes(:, 4) = [2.0_dp, 1.0_dp]
+    nodes(:, 5) = 2
+    nodes(:, 6) = [0.0_dp, 2.0_dp]
+    points(:, 1) = [0.59375_dp, 0.25_dp]
+    points(:, 2) = 3
+    points(:, 3) = [0.5_dp, 1.75_dp]
+    call locate_point_multi( &
+         6, nodes, 2, 3, points, st_vals)
+    call locate_point( &
+         6, nodes, 2, points(1, 1), points(2, 1), s_val, t_val)
+    case_success = (st_vals(1, 1) == s_val .AND. st_vals(1, 2) == t_val)
+    case_success = (case_success .AND. st_vals(2, 1) == LOCATE_MISS)
+    call locate_point( &
+         6, nodes, 2, points(1, 3), points(2, 3), s_val, t_val)
+    case_success = ( &
+         case_success .AND. &
+         st_vals(3, 1) == s_val .AND. st_vals(3, 2) == t_val)
+    call print_status(name, case_id, case_success, success)
+
+  end subroutine test_locate_point_multi
+
   subroutine test_classify_intersection(success)
     logical(c_bool), intent(inout) :: success
     ! Variables outside of signature.
@@ -41,6 +41,23 @@ class TestBase(utils.NumPyTestCase):
         self.assertEqual(shape._dimension, 2)
         self.assertIs(shape._nodes, nodes)
 
+    def test_constructor_frozen(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 3.0]])
+        shape = self._make_one(nodes, frozen=True)
+        self.assertTrue(shape._frozen)
+        self.assertIsNot(shape._nodes, nodes)
+        self.assertEqual(shape._nodes, nodes)
+        self.assertFalse(shape._nodes.flags.writeable)
+        self.assertTrue(nodes.flags.writeable)
+
+    def test_constructor_frozen_without_copy(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 3.0]])
+        shape = self._make_one(nodes, copy=False, frozen=True)
+        self.assertTrue(np.shares_memory(shape._nodes, nodes))
+        self.assertFalse(shape._nodes.flags.writeable)
+        # The caller's array is left alone.
+        self.assertTrue(nodes.flags.writeable)
+
     def test_constructor_wrong_dimension(self):
         nodes = np.asfortranarray([1.0, 2.0])
         with self.assertRaises(ValueError) as exc_info:
@@ -97,14 +114,145 @@ class TestBase(utils.NumPyTestCase):
         self.assertEqual(shape.dimension, dimension)
         self.assertEqual(shape._dimension, dimension)
 
+    def test_frozen_property(self):
+        nodes = np.zeros((2, 2), order="F")
+        self.assertFalse(self._make_one(nodes).frozen)
+        self.assertTrue(self._make_one(nodes, frozen=True).frozen)
+
     def test_nodes_property(self):
         nodes = np.asfortranarray([[0.0, 1.0], [0.0, 2.0]])
         shape = self._make_one(nodes)
         self.assertEqual(shape.nodes, nodes)
         self.assertIsNot(shape.nodes, nodes)
 
+    def test_nodes_view_property(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 2.0]])
+        shape = self._make_one(nodes, copy=False)
+        view = shape.nodes_view
+        self.assertEqual(view, nodes)
+        self.assertTrue(np.shares_memory(view, nodes))
+        self.assertFalse(view.flags.writeable)
+        # The stored nodes are unchanged.
+        self.assertTrue(shape._nodes.flags.writeable)
+
     def test___repr__(self):
         nodes = np.zeros((3, 4), order="F")
         shape = self._make_one(nodes)
         expected = "<Base (degree=-1, dimension=3)>"
         self.assertEqual(repr(shape), expected)
+
+
+class Test_buffer_to_array(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(buffer, **kwargs):
+        from bezier import _base
+
+        return _base.buffer_to_array(buffer, **kwargs)
+
+    def test_array(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result, nodes)
+        self.assertTrue(np.shares_memory(result, nodes))
+        result = self._call_function_under_test(memoryview(nodes), dimension=2)
+        self.assertEqual(result, nodes)
+        self.assertTrue(np.shares_memory(result, nodes))
+
+    def test_flat(self):
+        values = np.asfortranarray([0.0, 3.0, 1.0, 4.0, 2.0, 5.0])
+        result = self._call_function_under_test(values, dimension=2)
+        expected = np.asfortranarray([[0.0, 1.0, 2.0], [3.0, 4.0, 5.0]])
+        self.assertEqual(result, expected)
+        self.assertTrue(np.shares_memory(result, values))
+
+    def test_raw_bytes(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [3.0, 4.0]])
+        buffer = bytearray(nodes.tobytes(order="F"))
+        result = self._call_function_under_test(buffer, dimension=2)
+        self.assertEqual(result, nodes)
+        # Changes to the buffer are visible in the result.
+        buffer[:8] = np.float64(-1.0).tobytes()
+        self.assertEqual(result[0, 0], -1.0)
+        result = self._call_function_under_test(bytes(buffer), dimension=2)
+        self.assertFalse(result.flags.writeable)
+
+    def test_bad_dtype(self):
+        values = np.zeros((2, 2), dtype=np.float32, order="F")
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(values)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Buffer must contain float64 values, not", values.dtype)
+        )
+
+    def test_flat_without_dimension(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(np.zeros(4))
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("A flat buffer requires the dimension",))
+
+    def test_flat_bad_size(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(np.zeros(5), dimension=2)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args,
+            ("Buffer size is not a multiple of the dimension", 5, 2),
+        )
+
+    def test_bad_ndim(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(np.zeros((1, 2, 2), order="F"))
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Buffer must be 1- or 2-dimensional, not", 3)
+        )
+
+    def test_c_order(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(np.zeros((2, 3), order="C"))
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Buffer must be Fortran-ordered",))
+
+    def test_dimension_mismatch(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(
+                np.zeros((2, 3), order="F"), dimension=3
+            )
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Buffer does not match the dimension", (2, 3), 3)
+        )
+
+
+class Test_stacked_triangles(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier import _base
+
+        return _base.stacked_triangles(nodes)
+
+    def test_it(self):
+        nodes = [[[0.0, 1.0, 0.0, 2.0, 1.0, 0.0], [0.0] * 6]]
+        nodes_np, degree = self._call_function_under_test(nodes)
+        self.assertEqual(nodes_np, np.asfortranarray(nodes))
+        self.assertEqual(degree, 2)
+
+    def test_non_planar(self):
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(np.zeros((1, 3, 3), order="F"))
+
+    def test_bad_num_nodes(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(np.zeros((1, 2, 4), order="F"))
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("A triangle cannot have the number of nodes", 4)
+        )
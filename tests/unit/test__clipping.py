@@ -11,9 +11,12 @@
 # limitations under the License.
 
 import unittest
+import unittest.mock
 
 import numpy as np
 
+from tests.unit import utils
+
 
 SPACING = np.spacing  # pylint: disable=no-member
 
@@ -204,3 +207,476 @@ class Test_clip_range(unittest.TestCase):
             self._call_function_under_test(nodes1, nodes2)
         expected_args = (_clipping.NO_PARALLEL,)
         self.assertEqual(exc_info.exception.args, expected_args)
+
+
+class Test_clip_interval(unittest.TestCase):
+    NODES1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier import _clipping
+
+        return _clipping.clip_interval(nodes1, nodes2)
+
+    def test_full_interval(self):
+        nodes2 = np.asfortranarray([[0.0, 2.0], [0.75, 0.75]])
+        clipped = self._call_function_under_test(self.NODES1, nodes2)
+        self.assertEqual(clipped, (0.0, 1.0))
+
+    @unittest.mock.patch("bezier._clipping._FAT_LINE_WIGGLE", new=0.0)
+    def test_boundary_crossings(self):
+        nodes1 = np.asfortranarray([[0.0, 2.0], [0.75, 0.75]])
+        s_min, s_max = self._call_function_under_test(nodes1, self.NODES1)
+        self.assertEqual(s_min, 0.1875)
+        self.assertEqual(s_max, 0.8125)
+
+    @unittest.mock.patch("bezier._clipping._FAT_LINE_WIGGLE", new=0.0)
+    def test_control_point_inside(self):
+        nodes2 = np.asfortranarray([[1.0, 1.0], [0.0, 4.0]])
+        s_min, s_max = self._call_function_under_test(self.NODES1, nodes2)
+        self.assertEqual(s_min, 0.0)
+        self.assertEqual(s_max, 0.5)
+
+    def test_wiggle(self):
+        from bezier import _clipping
+
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 0.0]])
+        # The first node is just outside of the (degenerate) fat line.
+        nodes2 = np.asfortranarray([[0.5, 0.5], [0.5 ** 45, 1.0]])
+        s_min, s_max = self._call_function_under_test(nodes1, nodes2)
+        self.assertEqual(s_min, 0.0)
+        self.assertLess(s_max, 0.5 ** 35)
+        with unittest.mock.patch.object(_clipping, "_FAT_LINE_WIGGLE", 0.0):
+            self.assertIsNone(self._call_function_under_test(nodes1, nodes2))
+
+    def test_disjoint(self):
+        nodes2 = np.asfortranarray([[0.0, 2.0], [3.0, 3.0]])
+        self.assertIsNone(self._call_function_under_test(self.NODES1, nodes2))
+
+    def test_no_fat_line(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 0.0], [0.0, 1.0, 0.0]])
+        clipped = self._call_function_under_test(nodes1, self.NODES1)
+        self.assertEqual(clipped, (0.0, 1.0))
+
+
+class Test__hull_range(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(distances, d_min, d_max):
+        from bezier import _clipping
+
+        return _clipping._hull_range(distances, d_min, d_max)
+
+    def test_control_points(self):
+        distances = np.asfortranarray([0.0, 1.0, 2.0])
+        result = self._call_function_under_test(distances, -1.0, 3.0)
+        self.assertEqual(result, (0.0, 1.0))
+
+    def test_crossing(self):
+        distances = np.asfortranarray([-1.0, 3.0])
+        result = self._call_function_under_test(distances, 0.0, 1.0)
+        self.assertEqual(result, (0.25, 0.5))
+
+    def test_outside(self):
+        distances = np.asfortranarray([2.0, 3.0, 2.0])
+        self.assertIsNone(self._call_function_under_test(distances, 0.0, 1.0))
+
+
+class Test_locate_endpoint(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, point, start, end):
+        from bezier import _clipping
+
+        return _clipping.locate_endpoint(nodes, point, start, end)
+
+    def test_found(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        point = np.asfortranarray([[0.5], [0.75]])
+        s = self._call_function_under_test(
+            nodes, point, 0.25, 0.25 + 0.5 ** 21
+        )
+        self.assertEqual(s, 0.25)
+
+    def test_outside_interval(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        point = np.asfortranarray([[0.5], [0.75]])
+        s = self._call_function_under_test(nodes, point, 0.5, 0.5 + 0.5 ** 21)
+        self.assertIsNone(s)
+
+    def test_not_on_curve(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        point = np.asfortranarray([[1.0], [1.0 + 0.5 ** 21]])
+        s = self._call_function_under_test(nodes, point, 0.5, 0.5 + 0.5 ** 21)
+        self.assertIsNone(s)
+
+
+class Test_endpoint_intersection(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes_first, nodes_second, candidate):
+        from bezier import _clipping
+
+        return _clipping.endpoint_intersection(
+            nodes_first, nodes_second, candidate
+        )
+
+    def test_shared_endpoint(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[2.0, 3.0, 4.0], [0.0, -1.0, 0.0]])
+        candidate = (1.0 - 0.5 ** 21, 1.0, 0.0, 0.5 ** 21)
+        result = self._call_function_under_test(nodes1, nodes2, candidate)
+        self.assertEqual(result, (1.0, 0.0))
+
+    def test_first_endpoint(self):
+        nodes1 = np.asfortranarray([[1.0, 1.0], [-1.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        candidate = (1.0 - 0.5 ** 21, 1.0, 0.5 - 0.5 ** 22, 0.5 + 0.5 ** 22)
+        result = self._call_function_under_test(nodes1, nodes2, candidate)
+        self.assertEqual(result, (1.0, 0.5))
+
+    def test_second_endpoint(self):
+        # NOTE: The curves are tangent where the second curve starts.
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[1.0, 2.0], [1.0, 1.0]])
+        candidate = (0.5 - 0.5 ** 22, 0.5 + 0.5 ** 22, 0.0, 0.5 ** 21)
+        result = self._call_function_under_test(nodes1, nodes2, candidate)
+        self.assertEqual(result, (0.5, 0.0))
+
+    def test_interior(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        candidate = (0.5 - 0.5 ** 20, 0.5, 0.5, 0.5 + 0.5 ** 20)
+        self.assertIsNone(
+            self._call_function_under_test(nodes1, nodes2, candidate)
+        )
+
+
+class Test_refine_converged(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes_first, nodes_second, s_mid, t_mid):
+        from bezier import _clipping
+
+        return _clipping.refine_converged(
+            nodes_first, nodes_second, s_mid, t_mid
+        )
+
+    def test_transversal(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        result = self._call_function_under_test(
+            nodes1, nodes2, 0.5 - 0.5 ** 21, 0.5 + 0.5 ** 21
+        )
+        self.assertEqual(result, (0.5, 0.5))
+
+    def test_tangent(self):
+        # NOTE: Newton's method for a simple root only converges linearly
+        #       here, so it stops ~1e-11 away from the tangent intersection.
+        nodes1 = np.asfortranarray([[0.0, 4.5, 9.0], [0.0, 9.0, 0.0]])
+        nodes2 = np.asfortranarray([[3.0, 8.0], [4.5, 4.5]])
+        s, t = self._call_function_under_test(
+            nodes1, nodes2, 0.5 + 0.5 ** 21, 0.3 - 0.5 ** 21
+        )
+        self.assertEqual(s, 0.5)
+        self.assertLessEqual(abs(t - 0.3), SPACING(0.3))
+
+    @unittest.mock.patch(
+        "bezier._py_intersection_helpers.full_newton",
+        return_value=(0.75, 0.75),
+    )
+    def test_newton_drift(self, full_newton):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        s_mid = 0.5 - 0.5 ** 21
+        t_mid = 0.5 + 0.5 ** 21
+        result = self._call_function_under_test(nodes1, nodes2, s_mid, t_mid)
+        # Newton's method (for a simple root) is restarted at the midpoint.
+        self.assertEqual(result, (0.5, 0.5))
+        full_newton.assert_called_once_with(s_mid, nodes1, t_mid, nodes2)
+
+    @unittest.mock.patch(
+        "bezier._py_intersection_helpers.newton_iterate",
+        return_value=(True, 0.75, 0.75),
+    )
+    def test_restart_drift(self, newton_iterate):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0], [1.0, 1.0]])
+        with unittest.mock.patch(
+            "bezier._py_intersection_helpers.full_newton",
+            return_value=(0.75, 0.75),
+        ):
+            result = self._call_function_under_test(nodes1, nodes2, 0.5, 0.5)
+        # Neither Newton's method for a simple root nor a double root
+        # stays close to the midpoint.
+        self.assertEqual(result, (0.5, 0.5))
+        self.assertEqual(newton_iterate.call_count, 2)
+
+    @unittest.mock.patch(
+        "bezier._py_intersection_helpers.newton_iterate",
+        return_value=(True, 0.5, 0.5 + 0.5 ** 20),
+    )
+    def test_double_root_not_on_curves(self, newton_iterate):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0], [1.0, 1.0]])
+        with unittest.mock.patch(
+            "bezier._py_intersection_helpers.full_newton",
+            return_value=(0.5, 0.5),
+        ):
+            result = self._call_function_under_test(nodes1, nodes2, 0.5, 0.5)
+        # The (mocked) double root refinement is rejected since it is not
+        # on both curves.
+        self.assertEqual(result, (0.5, 0.5))
+        newton_iterate.assert_called_once()
+
+
+class Test_add_clipped_intersection(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(
+        nodes_first, nodes_second, candidate, intersections
+    ):
+        from bezier import _clipping
+
+        return _clipping.add_clipped_intersection(
+            nodes_first, nodes_second, candidate, intersections
+        )
+
+    def test_shared_endpoint(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[2.0, 3.0, 4.0], [0.0, -1.0, 0.0]])
+        candidate = (1.0 - 0.5 ** 21, 1.0, 0.0, 0.5 ** 21)
+        intersections = []
+        self.assertIsNone(
+            self._call_function_under_test(
+                nodes1, nodes2, candidate, intersections
+            )
+        )
+        self.assertEqual(intersections, [(1.0, 0.0)])
+
+    def test_newton(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        candidate = (0.5 - 0.5 ** 20, 0.5, 0.5, 0.5 + 0.5 ** 20)
+        intersections = []
+        self._call_function_under_test(
+            nodes1, nodes2, candidate, intersections
+        )
+        self.assertEqual(intersections, [(0.5, 0.5)])
+
+    def test_endpoint_tangent(self):
+        # NOTE: Newton's method (for both parameters) wanders slightly
+        #       outside of the unit interval for this tangency.
+        nodes1 = (
+            np.asfortranarray([[15.0, 19.0, 7.0], [-9.0, 11.0, 15.0]]) / 16.0
+        )
+        nodes2 = np.asfortranarray([[1.0, 1.0, -0.5], [0.0, 1.5, 1.5]])
+        candidate = (0.25 - 0.5 ** 22, 0.25 + 0.5 ** 22, 0.0, 0.5 ** 21)
+        intersections = []
+        self._call_function_under_test(
+            nodes1, nodes2, candidate, intersections
+        )
+        self.assertEqual(intersections, [(0.25, 0.0)])
+
+    @unittest.mock.patch(
+        "bezier._py_intersection_helpers.full_newton",
+        return_value=(0.75, 0.75),
+    )
+    def test_newton_drift(self, full_newton):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        candidate = (0.25, 0.5, 0.5, 0.75)
+        intersections = []
+        self._call_function_under_test(
+            nodes1, nodes2, candidate, intersections
+        )
+        self.assertEqual(intersections, [(0.375, 0.625)])
+        full_newton.assert_called_once_with(0.375, nodes1, 0.625, nodes2)
+
+
+class Test_merge_converged(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(converged, candidate):
+        from bezier import _clipping
+
+        return _clipping.merge_converged(converged, candidate)
+
+    def test_disjoint(self):
+        converged = [(0.0, 0.25, 0.0, 0.25)]
+        self.assertIsNone(
+            self._call_function_under_test(converged, (0.5, 0.75, 0.0, 0.25))
+        )
+        self.assertEqual(
+            converged, [(0.0, 0.25, 0.0, 0.25), (0.5, 0.75, 0.0, 0.25)]
+        )
+
+    def test_overlapping(self):
+        converged = [(0.0, 0.25, 0.5, 0.75), (0.5, 0.75, 0.0, 0.25)]
+        self._call_function_under_test(converged, (0.625, 1.0, 0.25, 0.5))
+        self.assertEqual(
+            converged, [(0.0, 0.25, 0.5, 0.75), (0.5, 1.0, 0.0, 0.5)]
+        )
+
+
+class Test_clip_one_round(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(
+        nodes_first, nodes_second, candidates, intersections
+    ):
+        from bezier import _clipping
+
+        return _clipping.clip_one_round(
+            nodes_first, nodes_second, candidates, intersections
+        )
+
+    def test_disjoint(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        candidates = [(0.0, 0.25, 0.0, 0.25)]
+        intersections = []
+        next_candidates = self._call_function_under_test(
+            nodes1, nodes2, candidates, intersections
+        )
+        self.assertEqual(next_candidates, [])
+        self.assertEqual(intersections, [])
+
+    def test_converged(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        delta = 0.5 ** 22
+        candidates = [
+            (0.5 - delta, 0.5, 0.5 - delta, 0.5),
+            (0.5, 0.5 + delta, 0.5, 0.5 + delta),
+        ]
+        intersections = []
+        next_candidates = self._call_function_under_test(
+            nodes1, nodes2, candidates, intersections
+        )
+        self.assertEqual(next_candidates, [])
+        self.assertEqual(intersections, [(0.5, 0.5)])
+
+    @unittest.mock.patch("bezier._clipping._FAT_LINE_WIGGLE", new=0.0)
+    def test_clipped(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[1.0, 1.0], [0.0, 4.0]])
+        intersections = []
+        next_candidates = self._call_function_under_test(
+            nodes1, nodes2, [(0.0, 1.0, 0.0, 1.0)], intersections
+        )
+        self.assertEqual(next_candidates, [(0.5, 0.5, 0.0, 0.5)])
+        self.assertEqual(intersections, [])
+
+    @unittest.mock.patch("bezier._clipping._FAT_LINE_WIGGLE", new=0.0)
+    def test_subdivided(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0], [0.75, 0.75]])
+        intersections = []
+        next_candidates = self._call_function_under_test(
+            nodes1, nodes2, [(0.0, 1.0, 0.0, 1.0)], intersections
+        )
+        self.assertEqual(
+            next_candidates,
+            [(0.1875, 0.8125, 0.0, 0.5), (0.1875, 0.8125, 0.5, 1.0)],
+        )
+        self.assertEqual(intersections, [])
+
+
+class Test_all_intersections(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes_first, nodes_second, **kwargs):
+        from bezier import _clipping
+
+        return _clipping.all_intersections(nodes_first, nodes_second, **kwargs)
+
+    def _check_intersections(self, expected, intersections, num_ulps):
+        # NOTE: The order of the intersections is not guaranteed.
+        order = np.argsort(intersections[0, :])
+        self.assertEqual(intersections.shape, expected.shape)
+        for index, value in np.ndenumerate(intersections[:, order]):
+            utils.almost(self, expected[index], value, num_ulps)
+
+    def test_no_intersections(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0], [1.5, 1.5]])
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2
+        )
+        self.assertEqual(intersections.shape, (2, 0))
+        self.assertFalse(coincident)
+
+    def test_quadratic_and_line(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0], [0.75, 0.75]])
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2
+        )
+        expected = np.asfortranarray([[0.25, 0.75], [0.25, 0.75]])
+        self._check_intersections(expected, intersections, 1)
+        self.assertFalse(coincident)
+
+    def test_three_intersections(self):
+        nodes1 = np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray(
+            [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+        )
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2
+        )
+        expected = np.asfortranarray([[0.375, 0.5, 0.625], [0.25, 0.5, 0.75]])
+        self._check_intersections(expected, intersections, 2)
+        self.assertFalse(coincident)
+
+    def test_tangent(self):
+        nodes1 = np.asfortranarray([[0.0, 1.5, 3.0], [0.0, 3.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 3.0], [1.5, 1.5]])
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2
+        )
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertEqual(intersections, expected)
+        self.assertFalse(coincident)
+
+    def test_tangent_at_endpoint(self):
+        nodes1 = (
+            np.asfortranarray([[15.0, 19.0, 7.0], [-9.0, 11.0, 15.0]]) / 16.0
+        )
+        nodes2 = np.asfortranarray([[1.0, 1.0, -0.5], [0.0, 1.5, 1.5]])
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2
+        )
+        expected = np.asfortranarray([[0.25], [0.0]])
+        self.assertEqual(intersections, expected)
+        self.assertFalse(coincident)
+
+    def test_coincident(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        intersections, coincident = self._call_function_under_test(
+            nodes, nodes
+        )
+        expected = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        self.assertEqual(intersections, expected)
+        self.assertTrue(coincident)
+
+    def test_too_many_candidates(self):
+        from bezier import _clipping
+
+        nodes1 = np.asfortranarray([[12.0, -12.0, 0.0], [4.0, -8.0, 16.0]])
+        nodes2 = np.asfortranarray([[6.0, -6.0, 0.0], [1.0, -2.0, 4.0]])
+        with self.assertRaises(NotImplementedError) as exc_info:
+            self._call_function_under_test(nodes1, nodes2)
+        expected = (_clipping._TOO_MANY_TEMPLATE.format(89),)
+        self.assertEqual(exc_info.exception.args, expected)
+
+
+class Test_all_intersections_no_converge(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes_first, nodes_second):
+        from bezier import _clipping
+
+        return _clipping.all_intersections(nodes_first, nodes_second)
+
+    @unittest.mock.patch("bezier._clipping._MAX_CLIP_ITERATIONS", new=2)
+    def test_it(self):
+        from bezier import _clipping
+
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0], [0.75, 0.75]])
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(nodes1, nodes2)
+        expected = (_clipping._NO_CONVERGE_TEMPLATE.format(2),)
+        self.assertEqual(exc_info.exception.args, expected)
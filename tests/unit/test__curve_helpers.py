@@ -10,6 +10,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import numpy as np
+
 from tests.unit import test__py_curve_helpers
 from tests.unit import utils
 
@@ -45,6 +47,26 @@ class Test_speedup_evaluate_multi(test__py_curve_helpers.Test_evaluate_multi):
         return _speedup.evaluate_multi(nodes, s_vals)
 
 
+@utils.needs_speedup
+class Test_speedup_evaluate_curves_multi(
+    test__py_curve_helpers.Test_evaluate_curves_multi
+):
+    @staticmethod
+    def _call_function_under_test(nodes, s_vals):
+        from bezier import _speedup
+
+        return _speedup.evaluate_curves_multi(nodes, s_vals)
+
+
+@utils.needs_speedup
+class Test__bernstein_basis(test__py_curve_helpers.Test_bernstein_basis):
+    @staticmethod
+    def _call_function_under_test(degree, s_vals):
+        from bezier import _curve_helpers
+
+        return _curve_helpers._bernstein_basis(degree, s_vals)
+
+
 @utils.needs_speedup
 class Test_speedup_compute_length(test__py_curve_helpers.Test_compute_length):
     @staticmethod
@@ -63,6 +85,35 @@ class Test_speedup_compute_length(test__py_curve_helpers.Test_compute_length):
         # or absence of SciPy is irrelevant.
         pass
 
+    def test_concurrent(self):
+        import concurrent.futures
+
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        expected = self._call_function_under_test(nodes)
+        # NOTE: The GIL is released during the Fortran call (after the
+        #       first call initializes QUADPACK), so these run in parallel.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            lengths = list(
+                executor.map(self._call_function_under_test, [nodes] * 16)
+            )
+        self.assertEqual(lengths, [expected] * 16)
+
+
+@utils.needs_speedup
+class Test_speedup_compute_length_multi(
+    test__py_curve_helpers.Test_compute_length_multi
+):
+    @staticmethod
+    def _call_function_under_test(nodes, rtol=0.5 ** 40):
+        from bezier import _speedup
+
+        return _speedup.compute_length_multi(nodes, rtol)
+
+    def test_empty_batch(self):
+        nodes = np.empty((0, 2, 3), order="F")
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result.shape, (0,))
+
 
 @utils.needs_speedup
 class Test_speedup_elevate_nodes(test__py_curve_helpers.Test_elevate_nodes):
@@ -122,6 +173,17 @@ class Test_speedup_locate_point(test__py_curve_helpers.Test_locate_point):
         return _speedup.locate_point_curve(nodes, point)
 
 
+@utils.needs_speedup
+class Test_speedup_locate_point_multi(
+    test__py_curve_helpers.Test_locate_point_multi
+):
+    @staticmethod
+    def _call_function_under_test(nodes, points):
+        from bezier import _speedup
+
+        return _speedup.locate_point_curve_multi(nodes, points)
+
+
 @utils.needs_speedup
 class Test_speedup_reduce_pseudo_inverse(
     test__py_curve_helpers.Test_reduce_pseudo_inverse
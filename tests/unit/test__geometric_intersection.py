@@ -15,6 +15,7 @@ import unittest
 
 import numpy as np
 
+from tests.unit import test__clipping
 from tests.unit import test__py_geometric_intersection
 from tests.unit import utils
 
@@ -89,6 +90,182 @@ class Test_speedup_all_intersections(
         # Make sure the workspace was **not** resized.
         self.assertEqual(self.curves_workspace_size(), 2)
 
+    def test_explicit_workspace(self):
+        from bezier import _speedup
+
+        nodes1 = np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray(
+            [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+        )
+        self.reset_curves_workspace(2)
+        workspace = _speedup.IntersectionWorkspace(size=1)
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2, workspace=workspace
+        )
+        expected = np.asfortranarray([[0.5, 0.375, 0.625], [0.5, 0.25, 0.75]])
+        self.assertEqual(intersections, expected)
+        self.assertFalse(coincident)
+        # Only the explicit workspace is resized.
+        self.assertEqual(workspace.size, 3)
+        self.assertEqual(self.curves_workspace_size(), 2)
+
+    def test_concurrent(self):
+        import concurrent.futures
+
+        nodes1 = np.asfortranarray([[0.0, 2.0, 4.0], [0.0, 4.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0, 4.0], [3.0, -1.0, 3.0]])
+        serial, _ = self._call_function_under_test(nodes1, nodes2)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self._call_function_under_test, nodes1, nodes2)
+                for _ in range(32)
+            ]
+            for future in futures:
+                intersections, coincident = future.result()
+                self.assertEqual(intersections, serial)
+                self.assertFalse(coincident)
+
+
+@utils.needs_speedup
+class Test_speedup_curve_intersections_pairs(
+    test__py_geometric_intersection.Test_all_intersections_pairs
+):
+    @staticmethod
+    def _call_function_under_test(
+        nodes_list_first, nodes_list_second, **kwargs
+    ):
+        from bezier import _speedup
+
+        return _speedup.curve_intersections_pairs(
+            *test__py_geometric_intersection._pack_pairs(
+                nodes_list_first, nodes_list_second
+            ),
+            **kwargs,
+        )
+
+    def test_workspace_resize(self):
+        from bezier import _speedup
+
+        nodes_list_first = [
+            np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]]),
+            np.asfortranarray([[0.0, 2.0, 4.0], [0.0, 4.0, 0.0]]),
+        ]
+        nodes_list_second = [
+            np.asfortranarray(
+                [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+            ),
+            np.asfortranarray([[0.0, 4.0], [1.5, 1.5]]),
+        ]
+        # NOTE: The first pair intersects 3 times, so a workspace of
+        #       1 is not large enough.
+        workspace = _speedup.IntersectionWorkspace(size=1)
+        offsets, st_vals, coincident, errors = self._call_function_under_test(
+            nodes_list_first, nodes_list_second, workspace=workspace
+        )
+        self.assertEqual(offsets.tolist(), [0, 3, 5])
+        expected = np.asfortranarray(
+            [[0.5, 0.375, 0.625, 0.25, 0.75], [0.5, 0.25, 0.75, 0.25, 0.75]]
+        )
+        self.assertEqual(st_vals, expected)
+        self.assertEqual(coincident.tolist(), [False, False])
+        self.assertEqual(errors, [])
+        self.assertEqual(workspace.size, 3)
+
+    def test_many_intersections(self):
+        # NOTE: More intersections than the initial output capacity (of
+        #       ``2 P + 2``) forces the output to grow.
+        nodes1 = np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray(
+            [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+        )
+        offsets, st_vals, _, errors = self._call_function_under_test(
+            [nodes1] * 5, [nodes2] * 5
+        )
+        self.assertEqual(offsets.tolist(), [0, 3, 6, 9, 12, 15])
+        expected = np.asfortranarray([[0.5, 0.375, 0.625], [0.5, 0.25, 0.75]])
+        self.assertEqual(st_vals, np.asfortranarray(np.tile(expected, 5)))
+        self.assertEqual(errors, [])
+
+
+@utils.needs_speedup
+class Test_speedup_curve_intersections_clipping(
+    test__clipping.Test_all_intersections
+):
+    @staticmethod
+    def _call_function_under_test(nodes_first, nodes_second, **kwargs):
+        from bezier import _speedup
+
+        return _speedup.curve_intersections_clipping(
+            nodes_first, nodes_second, **kwargs
+        )
+
+    def test_workspace_resize(self):
+        from bezier import _speedup
+
+        nodes1 = np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray(
+            [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+        )
+        workspace = _speedup.IntersectionWorkspace(size=2)
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2, workspace=workspace
+        )
+        self.assertEqual(intersections.shape, (2, 3))
+        self.assertFalse(coincident)
+        self.assertEqual(workspace.size, 3)
+
+    def test_workspace_too_small(self):
+        from bezier import _speedup
+
+        nodes1 = np.asfortranarray([[-3.0, 5.0], [0.0, 0.0]])
+        nodes2 = np.asfortranarray(
+            [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+        )
+        workspace = _speedup.IntersectionWorkspace(size=2)
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(
+                nodes1, nodes2, allow_resize=False, workspace=workspace
+            )
+        exc_args = exc_info.exception.args
+        expected = _speedup.TOO_SMALL_TEMPLATE.format(3, 2)
+        self.assertEqual(exc_args, (expected,))
+        self.assertEqual(workspace.size, 2)
+
+
+@utils.needs_speedup
+class Test_speedup_flatten_curve(
+    test__py_geometric_intersection.Test_flatten_curve
+):
+    @staticmethod
+    def _call_function_under_test(nodes, tolerance):
+        from bezier import _speedup
+
+        return _speedup.flatten_curve(nodes, tolerance)
+
+    def test_resize(self):
+        # NOTE: This needs more than the initial guess of 64 vertices.
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        vertices, s_vals = self._call_function_under_test(nodes, 0.5 ** 20)
+        self.assertEqual(vertices.shape, (2, 1025))
+        self.assertEqual(s_vals, np.linspace(0.0, 1.0, 1025))
+
+
+@utils.needs_speedup
+class Test_speedup_flatten_curves(
+    test__py_geometric_intersection.Test_flatten_curves
+):
+    @staticmethod
+    def _call_function_under_test(nodes, tolerance):
+        from bezier import _speedup
+
+        return _speedup.flatten_curves(nodes, tolerance)
+
+    @staticmethod
+    def _flatten_curve(nodes, tolerance):
+        from bezier import _speedup
+
+        return _speedup.flatten_curve(nodes, tolerance)
+
 
 @utils.needs_speedup
 class Test_reset_curves_workspace(unittest.TestCase):
@@ -106,7 +283,6 @@ class Test_reset_curves_workspace(unittest.TestCase):
         self.assertIsNone(return_value)
         self.assertEqual(_speedup.curves_workspace_size(), size)
 
-    @unittest.expectedFailure
     def test_threadsafe(self):
         from bezier import _speedup
 
@@ -123,16 +299,40 @@ class Test_reset_curves_workspace(unittest.TestCase):
         thread2.start()
         thread1.join()
         thread2.join()
-        # This check demonstrates the **broken-ness** of the implementation.
-        # The sizes for each thread should be the sizes actually **set** in
-        # the given thread and the workspace in the main thread should be
-        # unchanged (i.e. should have ``size_main``). What we'll actually
-        # observe is ``(size2, size1, size2)``.
-        expected = (size1, size2, size_main)
+        # Each thread has its own workspace, so the second thread observes
+        # the default size (rather than ``size1``) and the workspace in the
+        # main thread is unchanged.
+        expected = (size1, 2, size_main)
         actual = (worker.size1, worker.size2, _speedup.curves_workspace_size())
         self.assertEqual(actual, expected)
 
 
+@utils.needs_speedup
+class TestIntersectionWorkspace(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from bezier import _speedup
+
+        return _speedup.IntersectionWorkspace
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        workspace = self._make_one()
+        self.assertEqual(workspace.size, 2)
+
+    def test_constructor_explicit(self):
+        workspace = self._make_one(size=5)
+        self.assertEqual(workspace.size, 5)
+
+    def test_resize(self):
+        workspace = self._make_one()
+        self.assertIsNone(workspace.resize(4))
+        self.assertEqual(workspace.size, 4)
+
+
 @utils.needs_speedup
 class Test_curves_workspace_size(unittest.TestCase):
     @staticmethod
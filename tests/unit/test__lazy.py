@@ -0,0 +1,153 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import subprocess
+import sys
+import threading
+import unittest
+import unittest.mock
+
+import bezier
+from tests.unit import utils
+
+
+_IMPORT_SCRIPT = """\
+import json
+import sys
+import time
+
+import numpy
+
+start = time.perf_counter()
+import bezier
+duration = time.perf_counter() - start
+
+from bezier import _lazy
+
+loaded = {
+    name: _lazy.is_loaded(module)
+    for name, module in sys.modules.items()
+    if name.startswith("bezier.")
+}
+print(json.dumps({"duration": duration, "loaded": loaded}))
+"""
+
+
+class Test_lazy_import(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(name):
+        from bezier import _lazy
+
+        return _lazy.lazy_import(name)
+
+    def test_already_imported(self):
+        from bezier import _py_helpers
+
+        module = self._call_function_under_test("bezier._py_helpers")
+        self.assertIs(module, _py_helpers)
+
+    @unittest.mock.patch.dict(sys.modules)
+    @unittest.mock.patch.object(bezier, "_clipping", new=None)
+    def test_deferred(self):
+        from bezier import _lazy
+
+        del sys.modules["bezier._clipping"]
+        module = self._call_function_under_test("bezier._clipping")
+        self.assertIs(sys.modules["bezier._clipping"], module)
+        self.assertIs(bezier._clipping, module)
+        self.assertFalse(_lazy.is_loaded(module))
+        self.assertEqual(module.__name__, "bezier._clipping")
+        self.assertFalse(_lazy.is_loaded(module))
+        # Accessing a module attribute executes the module.
+        self.assertTrue(callable(module.clip_range))
+        self.assertTrue(_lazy.is_loaded(module))
+
+    @unittest.mock.patch.dict(sys.modules)
+    @unittest.mock.patch.object(bezier, "_clipping", new=None)
+    def test_failure(self):
+        from bezier import _lazy
+
+        del sys.modules["bezier._clipping"]
+        module = self._call_function_under_test("bezier._clipping")
+        loader = unittest.mock.Mock(spec=["exec_module"])
+        loader.exec_module.side_effect = RuntimeError("Failed")
+        with unittest.mock.patch.object(module.__spec__, "loader", new=loader):
+            with self.assertRaises(RuntimeError):
+                getattr(module, "clip_range")
+
+        loader.exec_module.assert_called_once_with(module)
+        self.assertFalse(_lazy.is_loaded(module))
+
+    @unittest.mock.patch.dict(sys.modules)
+    @unittest.mock.patch.object(bezier, "_clipping", new=None)
+    def test_concurrent(self):
+        from bezier import _lazy
+
+        del sys.modules["bezier._clipping"]
+        module = self._call_function_under_test("bezier._clipping")
+        started = threading.Event()
+        release = threading.Event()
+
+        def exec_module(module):
+            started.set()
+            release.wait()
+            module.clip_range = unittest.mock.sentinel.clip_range
+
+        loader = unittest.mock.Mock(spec=["exec_module"])
+        loader.exec_module.side_effect = exec_module
+        results = []
+
+        def get_attr():
+            results.append(getattr(module, "clip_range"))
+
+        threads = [threading.Thread(target=get_attr) for _ in range(2)]
+        with unittest.mock.patch.object(module.__spec__, "loader", new=loader):
+            threads[0].start()
+            started.wait()
+            # The second thread must wait for the module to be executed
+            # rather than seeing a partially executed module.
+            threads[1].start()
+            release.set()
+            for thread in threads:
+                thread.join()
+
+        loader.exec_module.assert_called_once_with(module)
+        self.assertEqual(results, [unittest.mock.sentinel.clip_range] * 2)
+        self.assertTrue(_lazy.is_loaded(module))
+
+
+@utils.needs_speedup
+class Test_import_bezier(unittest.TestCase):
+    def test_fallbacks_not_executed(self):
+        # NOTE: This guards the cost of ``import bezier`` by making sure the
+        #       large pure Python fallback modules are only executed on
+        #       first use. It runs in a fresh interpreter since the modules
+        #       have already been executed in this one.
+        output = subprocess.check_output(
+            (sys.executable, "-c", _IMPORT_SCRIPT)
+        )
+        info = json.loads(output.decode("utf-8"))
+        self.assertGreater(info["duration"], 0.0)
+        loaded = info["loaded"]
+        for name in (
+            "bezier._algebraic_intersection",
+            "bezier._clipping",
+            "bezier._py_curve_helpers",
+            "bezier._py_geometric_intersection",
+            "bezier._py_triangle_helpers",
+            "bezier._py_triangle_intersection",
+            "bezier._py_triangle_matrices",
+        ):
+            self.assertFalse(loaded[name], msg=name)
+        self.assertTrue(loaded["bezier.curve"])
+        self.assertTrue(loaded["bezier.triangle"])
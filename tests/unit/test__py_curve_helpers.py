@@ -169,6 +169,68 @@ class Test_subdivide_nodes(utils.NumPyTestCase):
         self._points_check(nodes)
 
 
+class Test_level_subdivision_matrices(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree, levels):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.level_subdivision_matrices(degree, levels)
+
+    def test_zero_levels(self):
+        matrices = self._call_function_under_test(2, 0)
+        self.assertEqual(matrices.shape, (1, 3, 3))
+        self.assertEqual(matrices[0], np.eye(3, order="F"))
+
+    def test_one_level(self):
+        from bezier import _py_curve_helpers
+
+        matrices = self._call_function_under_test(3, 1)
+        left, right = _py_curve_helpers.make_subdivision_matrices(3)
+        self.assertEqual(matrices.shape, (2, 4, 4))
+        self.assertEqual(np.asfortranarray(matrices[0]), left)
+        self.assertEqual(np.asfortranarray(matrices[1]), right)
+
+    def test_cached(self):
+        matrices = self._call_function_under_test(1, 3)
+        self.assertEqual(matrices.shape, (8, 2, 2))
+        self.assertFalse(matrices.flags.writeable)
+        self.assertIs(self._call_function_under_test(1, 3), matrices)
+
+
+class Test_subdivide_nodes_levels(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, levels):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.subdivide_nodes_levels(nodes, levels)
+
+    def test_linear(self):
+        nodes = np.asfortranarray([[0.0, 8.0], [1.0, 5.0]])
+        result = self._call_function_under_test(nodes, 3)
+        self.assertEqual(result.shape, (8, 2, 2))
+        for index in range(8):
+            expected = np.asfortranarray(
+                [[index, index + 1.0], [1.0 + 0.5 * index, 1.5 + 0.5 * index]]
+            )
+            self.assertEqual(np.asfortranarray(result[index]), expected)
+
+    def test_matches_repeated(self):
+        from bezier import _py_curve_helpers
+
+        # Use a fixed seed so the test is deterministic and round
+        # the nodes to 8 bits of precision to avoid round-off.
+        nodes = utils.get_random_nodes(shape=(3, 5), seed=2718, num_bits=8)
+        result = self._call_function_under_test(nodes, 2)
+        self.assertEqual(result.shape, (4, 3, 5))
+        index = 0
+        for half in _py_curve_helpers.subdivide_nodes(nodes):
+            for quarter in _py_curve_helpers.subdivide_nodes(half):
+                self.assertTrue(
+                    np.allclose(result[index], quarter, atol=0.0, rtol=1e-14)
+                )
+                index += 1
+
+
 class Test_evaluate_multi_barycentric(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(nodes, lambda1, lambda2):
@@ -343,6 +405,88 @@ class Test_evaluate_multi(utils.NumPyTestCase):
         self.assertEqual(expected, binomial_coefficients)
 
 
+class Test_evaluate_curves_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, s_vals):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.evaluate_curves_multi(nodes, s_vals)
+
+    def test_linear(self):
+        num_vals = 129
+        s_vals = np.linspace(0.0, 1.0, num_vals)
+        # B1(s) = [s + 1, 1 - 2 s], B2(s) = [3 s - 7, 2]
+        nodes = np.asfortranarray(
+            [[[1.0, 2.0], [1.0, -1.0]], [[-7.0, -4.0], [2.0, 2.0]]]
+        )
+        result = self._call_function_under_test(nodes, s_vals)
+        expected = np.empty((2, 2, num_vals), order="F")
+        expected[0, 0, :] = 1.0 + s_vals
+        expected[0, 1, :] = 1.0 - 2.0 * s_vals
+        expected[1, 0, :] = -7.0 + 3.0 * s_vals
+        expected[1, 1, :] = 2.0
+        self.assertEqual(result, expected)
+
+    def test_matches_evaluate_multi(self):
+        from bezier import _py_curve_helpers
+
+        s_vals = np.linspace(0.0, 1.0, 17)
+        nodes = utils.get_random_nodes(shape=(5, 3, 6), seed=2712, num_bits=8)
+        result = self._call_function_under_test(nodes, s_vals)
+        self.assertEqual(result.shape, (5, 3, 17))
+        for index in range(5):
+            expected = _py_curve_helpers.evaluate_multi(
+                np.asfortranarray(nodes[index, :, :]), s_vals
+            )
+            self.assertEqual(np.asfortranarray(result[index, :, :]), expected)
+
+    def test_degree_zero(self):
+        s_vals = np.asfortranarray([0.0, 0.5, 1.0])
+        nodes = np.asfortranarray([[[2.0], [3.0]]])
+        result = self._call_function_under_test(nodes, s_vals)
+        expected = np.asfortranarray([[[2.0, 2.0, 2.0], [3.0, 3.0, 3.0]]])
+        self.assertEqual(result, expected)
+
+    def test_empty_batch(self):
+        s_vals = np.asfortranarray([0.0, 0.5, 1.0])
+        nodes = np.empty((0, 2, 3), order="F")
+        result = self._call_function_under_test(nodes, s_vals)
+        self.assertEqual(result.shape, (0, 2, 3))
+
+
+class Test_bernstein_basis(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree, s_vals):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.bernstein_basis(degree, s_vals)
+
+    def test_degree_zero(self):
+        s_vals = np.asfortranarray([0.0, 0.5, 1.0])
+        basis = self._call_function_under_test(0, s_vals)
+        expected = np.asfortranarray([[1.0, 1.0, 1.0]])
+        self.assertEqual(basis, expected)
+
+    def test_cubic(self):
+        s_vals = np.asfortranarray([0.0, 0.5, 1.0])
+        basis = self._call_function_under_test(3, s_vals)
+        expected = np.asfortranarray(
+            [
+                [1.0, 0.125, 0.0],
+                [0.0, 0.375, 0.0],
+                [0.0, 0.375, 0.0],
+                [0.0, 0.125, 1.0],
+            ]
+        )
+        self.assertEqual(basis, expected)
+
+    def test_partition_of_unity(self):
+        s_vals = np.linspace(0.0, 1.0, 33)
+        basis = self._call_function_under_test(7, s_vals)
+        self.assertEqual(basis.shape, (8, 33))
+        self.assertTrue(np.allclose(np.sum(basis, axis=0), 1.0))
+
+
 class Test_vec_size(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(nodes, s_val):
@@ -414,6 +558,239 @@ class Test_compute_length(unittest.TestCase):
         self.assertAlmostEqual(length, expected, delta=local_eps)
 
 
+class Test_hodograph_nodes(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.hodograph_nodes(nodes)
+
+    def test_quadratic(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 2.0, 1.0]])
+        result = self._call_function_under_test(nodes)
+        expected = np.asfortranarray([[2.0, 4.0], [4.0, -2.0]])
+        self.assertEqual(np.asfortranarray(result), expected)
+
+    def test_degree_zero(self):
+        nodes = np.asfortranarray([[1.0], [2.0]])
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result.shape, (2, 0))
+
+
+class Test_gauss_legendre_lengths(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(first_deriv, starts, ends):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.gauss_legendre_lengths(
+            first_deriv, starts, ends
+        )
+
+    def test_polynomial_speed(self):
+        # B(s) = [2 s + s^2, 0], so B'(s) = [2 + 2 s, 0] and the rule is
+        # exact.
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        starts = np.asfortranarray([0.0, 0.0, 0.5])
+        ends = np.asfortranarray([1.0, 0.5, 1.0])
+        result = self._call_function_under_test(first_deriv, starts, ends)
+        expected = [3.0, 1.25, 1.75]
+        self.assertTrue(np.allclose(result, expected, atol=0.0, rtol=1e-15))
+
+    def test_degree_zero(self):
+        first_deriv = np.empty((2, 0), order="F")
+        starts = np.asfortranarray([0.0, 0.25])
+        ends = np.asfortranarray([1.0, 0.5])
+        result = self._call_function_under_test(first_deriv, starts, ends)
+        self.assertEqual(result.tolist(), [0.0, 0.0])
+
+
+class Test_arc_length_breakpoints(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(first_deriv):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.arc_length_breakpoints(first_deriv)
+
+    def test_polynomial_speed(self):
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        breakpoints, cumulative = self._call_function_under_test(first_deriv)
+        self.assertEqual(breakpoints.tolist(), [0.0, 0.5, 1.0])
+        expected = [0.0, 1.25, 3.0]
+        self.assertTrue(
+            np.allclose(cumulative, expected, atol=0.0, rtol=1e-15)
+        )
+
+    def test_matches_compute_length(self):
+        from bezier import _py_curve_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, -1.0, 0.5], [0.0, 2.0, 2.0, -1.0]]
+        )
+        first_deriv = _py_curve_helpers.hodograph_nodes(nodes)
+        breakpoints, cumulative = self._call_function_under_test(first_deriv)
+        self.assertGreater(breakpoints.size, 3)
+        self.assertTrue(np.all(np.diff(breakpoints) > 0.0))
+        self.assertTrue(np.all(np.diff(cumulative) > 0.0))
+        expected = _py_curve_helpers.compute_length(nodes)
+        self.assertAlmostEqual(cumulative[-1], expected, delta=1e-13)
+
+    def test_cusp(self):
+        from bezier import _py_curve_helpers
+
+        # B'(1/2) = 0, so the speed is not smooth.
+        nodes = np.asfortranarray(
+            [[0.0, 2.0, -1.0, 1.0], [0.0, 1.0, 1.0, 0.0]]
+        )
+        first_deriv = _py_curve_helpers.hodograph_nodes(nodes)
+        breakpoints, cumulative = self._call_function_under_test(first_deriv)
+        self.assertEqual(breakpoints[0], 0.0)
+        self.assertEqual(breakpoints[-1], 1.0)
+        expected = _py_curve_helpers.compute_length(nodes)
+        self.assertAlmostEqual(cumulative[-1], expected, delta=1e-10)
+
+
+class Test_gauss_legendre_lengths_multi(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(first_derivs, curve_index, starts, ends):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.gauss_legendre_lengths_multi(
+            first_derivs, curve_index, starts, ends
+        )
+
+    def test_polynomial_speed(self):
+        # B_0'(s) = [2 + 2 s, 0] and B_1'(s) = [0, 3], so the rule is exact.
+        first_derivs = np.asfortranarray(
+            [[[2.0, 4.0], [0.0, 0.0]], [[0.0, 0.0], [3.0, 3.0]]]
+        )
+        curve_index = np.asfortranarray([0, 1, 0, 1])
+        starts = np.asfortranarray([0.0, 0.0, 0.5, 0.25])
+        ends = np.asfortranarray([1.0, 1.0, 1.0, 0.5])
+        result = self._call_function_under_test(
+            first_derivs, curve_index, starts, ends
+        )
+        expected = [3.0, 3.0, 1.75, 0.75]
+        self.assertTrue(np.allclose(result, expected, atol=0.0, rtol=1e-15))
+
+
+class Test_compute_length_multi(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, rtol=0.5 ** 40):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.compute_length_multi(nodes, rtol)
+
+    def test_linear(self):
+        nodes = np.asfortranarray(
+            [[[0.0, 3.0], [0.0, 4.0]], [[1.0, 1.0], [1.0, -1.0]]]
+        )
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result.tolist(), [5.0, 2.0])
+
+    def test_matches_compute_length(self):
+        from bezier import _py_curve_helpers
+
+        nodes = np.asfortranarray(
+            [
+                [[0.0, 1.0, -1.0, 0.5], [0.0, 2.0, 2.0, -1.0]],
+                [[0.0, 1.0, 2.0, 3.0], [0.0, 0.0, 0.0, 0.0]],
+                # B'(1/2) = 0, so the speed is not smooth.
+                [[0.0, 2.0, -1.0, 1.0], [0.0, 1.0, 1.0, 0.0]],
+                [[1.0, 1.0, 1.0, 1.0], [2.0, 2.0, 2.0, 2.0]],
+            ]
+        )
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result.shape, (4,))
+        for index in range(4):
+            expected = _py_curve_helpers.compute_length(nodes[index])
+            self.assertAlmostEqual(result[index], expected, delta=1e-10)
+        self.assertAlmostEqual(result[1], 3.0, delta=1e-14)
+        self.assertEqual(result[3], 0.0)
+
+    def test_loose_tolerance(self):
+        nodes = np.asfortranarray(
+            [[[0.0, 1.0, -1.0, 0.5], [0.0, 2.0, 2.0, -1.0]]]
+        )
+        loose = self._call_function_under_test(nodes, rtol=0.5 ** 10)
+        tight = self._call_function_under_test(nodes)
+        self.assertAlmostEqual(loose[0], tight[0], delta=0.5 ** 10)
+
+    def test_degree_zero(self):
+        nodes = np.asfortranarray([[[1.0], [2.0]], [[3.0], [4.0]]])
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result.tolist(), [0.0, 0.0])
+
+    def test_without_nodes(self):
+        nodes = np.empty((1, 2, 0), order="F")
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(nodes)
+
+
+class Test_arc_length_at(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(
+        first_deriv, breakpoints, cumulative, s_vals
+    ):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.arc_length_at(
+            first_deriv, breakpoints, cumulative, s_vals
+        )
+
+    def test_it(self):
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        breakpoints = np.asfortranarray([0.0, 0.5, 1.0])
+        cumulative = np.asfortranarray([0.0, 1.25, 3.0])
+        s_vals = np.asfortranarray([0.0, 0.25, 0.5, 0.75, 1.0])
+        result = self._call_function_under_test(
+            first_deriv, breakpoints, cumulative, s_vals
+        )
+        expected = [0.0, 0.5625, 1.25, 2.0625, 3.0]
+        self.assertTrue(np.allclose(result, expected, atol=0.0, rtol=1e-15))
+
+
+class Test_arc_length_inverse(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(
+        first_deriv, breakpoints, cumulative, lengths
+    ):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.arc_length_inverse(
+            first_deriv, breakpoints, cumulative, lengths
+        )
+
+    def test_it(self):
+        first_deriv = np.asfortranarray([[2.0, 4.0], [0.0, 0.0]])
+        breakpoints = np.asfortranarray([0.0, 0.5, 1.0])
+        cumulative = np.asfortranarray([0.0, 1.25, 3.0])
+        lengths = np.asfortranarray([0.0, 0.5625, 1.25, 2.0625, 3.0])
+        result = self._call_function_under_test(
+            first_deriv, breakpoints, cumulative, lengths
+        )
+        expected = [0.0, 0.25, 0.5, 0.75, 1.0]
+        self.assertEqual(result[[0, 2, 4]].tolist(), expected[::2])
+        self.assertTrue(np.allclose(result, expected, atol=1e-15, rtol=0.0))
+
+    def test_zero_speed(self):
+        from bezier import _py_curve_helpers
+
+        # B'(s) = [6 s^2, 0], so the speed is zero at the start (and the
+        # first Newton step from s = 0 would divide by zero).
+        nodes = np.asfortranarray([[0.0, 0.0, 0.0, 2.0], [0.0, 0.0, 0.0, 0.0]])
+        first_deriv = _py_curve_helpers.hodograph_nodes(nodes)
+        breakpoints, cumulative = _py_curve_helpers.arc_length_breakpoints(
+            first_deriv
+        )
+        lengths = np.asfortranarray([0.25, 1.0, 1.75])
+        result = self._call_function_under_test(
+            first_deriv, breakpoints, cumulative, lengths
+        )
+        # L(s) = 2 s^3
+        expected = np.cbrt(0.5 * lengths)
+        self.assertTrue(np.allclose(result, expected, atol=1e-15, rtol=0.0))
+
+
 class Test_elevate_nodes(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(nodes):
@@ -648,6 +1025,69 @@ class Test_locate_point(unittest.TestCase):
         self.assertEqual(result, 1.0)
 
 
+class Test_locate_point_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, points):
+        from bezier import _py_curve_helpers
+
+        return _py_curve_helpers.locate_point_multi(nodes, points)
+
+    def test_it(self):
+        nodes = np.asfortranarray(
+            [[0.0, 3.0, 1.0], [0.0, 0.0, 1.0], [0.0, -1.0, 3.0]]
+        )
+        # C(1/8) = p1, C(3/4) = p2
+        points = (
+            np.asfortranarray([[43.0, 108.0], [1.0, 36.0], [-11.0, 84.0]]) / 64
+        )
+        result = self._call_function_under_test(nodes, points)
+        self.assertEqual(result, np.asfortranarray([0.125, 0.75]))
+
+    def test_no_match(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        points = np.asfortranarray([[0.5, 0.5], [2.0, -1.0]])
+        result = self._call_function_under_test(nodes, points)
+        self.assertTrue(np.all(np.isnan(result)))
+
+    def test_mixed(self):
+        # The points are: a match, a miss and two that Newton's method
+        # pushes slightly outside of ``[0, 1]``.
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        points = np.asfortranarray(
+            [[0.25, 0.5, 0.0, 2.0], [0.21875, 2.0, 0.0, 0.0]]
+        )
+        result = self._call_function_under_test(nodes, points)
+        self.assertEqual(
+            result[[0, 2, 3]], np.asfortranarray([0.125, 0.0, 1.0])
+        )
+        self.assertTrue(np.isnan(result[1]))
+
+    def test_matches_locate_point(self):
+        from bezier import _py_curve_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 3.0, 4.0], [0.0, 2.0, -1.0, 1.0]]
+        )
+        s_vals = np.linspace(0.0, 1.0, 17)
+        points = _py_curve_helpers.evaluate_multi(nodes, s_vals)
+        result = self._call_function_under_test(nodes, points)
+        expected = np.asfortranarray(
+            [
+                _py_curve_helpers.locate_point(nodes, points[:, [index]])
+                for index in range(17)
+            ]
+        )
+        self.assertEqual(result, expected)
+
+    def test_failure_on_invalid(self):
+        nodes = np.asfortranarray(
+            [[0.0, -1.0, 1.0, -0.75], [2.0, 0.0, 1.0, 1.625]]
+        )
+        points = np.asfortranarray([[-0.09375, -0.25], [0.828125, 1.375]])
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(nodes, points)
+
+
 class Test_reduce_pseudo_inverse(utils.NumPyTestCase):
     EPS = 0.5 ** 52
 
@@ -72,6 +72,45 @@ class Test_bbox_intersect(unittest.TestCase):
         self.assertEqual(result, expected)
 
 
+class Test_bbox_intersect_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2):
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.bbox_intersect_multi(nodes1, nodes2)
+
+    def test_it(self):
+        from bezier import _py_geometric_intersection
+
+        box_type = _py_geometric_intersection.BoxIntersectionType
+        shifts = [
+            [0.5, 0.5],
+            [100.0, 100.0],
+            [1.0, 2.0],
+            [1.0, 0.0],
+            [1.0 + SPACING(1.0), 0.0],
+        ]
+        nodes1 = np.stack([UNIT_SQUARE] * len(shifts))
+        nodes2 = nodes1 + np.array(shifts)[:, :, np.newaxis]
+        result = self._call_function_under_test(nodes1, nodes2)
+        expected = np.asarray(
+            [
+                box_type.INTERSECTION,
+                box_type.DISJOINT,
+                box_type.DISJOINT,
+                box_type.TANGENT,
+                box_type.DISJOINT,
+            ],
+            dtype=np.intc,
+        )
+        self.assertEqual(result, expected)
+        for index, shift in enumerate(shifts):
+            expected_one = _py_geometric_intersection.bbox_intersect(
+                UNIT_SQUARE, UNIT_SQUARE + np.asfortranarray([shift]).T
+            )
+            self.assertEqual(result[index], expected_one)
+
+
 class Test_linearization_error(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(nodes):
@@ -184,6 +223,40 @@ class Test_linearization_error(unittest.TestCase):
         self.assertEqual(error_val, expected)
 
 
+class Test_linearization_error_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.linearization_error_multi(nodes)
+
+    def test_linear(self):
+        nodes = np.asfortranarray([[[0.0, 1.0], [0.0, 2.0]]] * 3)
+        errors = self._call_function_under_test(nodes)
+        self.assertEqual(errors, np.zeros(3))
+
+    def test_matches_linearization_error(self):
+        from bezier import _py_geometric_intersection
+
+        for num_nodes in (3, 4, 6):
+            nodes = np.stack(
+                [
+                    utils.get_random_nodes(
+                        shape=(2, num_nodes), seed=seed, num_bits=8
+                    )
+                    for seed in (1, 22, 333, 4444)
+                ]
+            )
+            errors = self._call_function_under_test(nodes)
+            expected = np.asarray(
+                [
+                    _py_geometric_intersection.linearization_error(curve)
+                    for curve in nodes
+                ]
+            )
+            self.assertEqual(errors, expected)
+
+
 class Test_segment_intersection(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(start0, end0, start1, end1):
@@ -232,6 +305,32 @@ class Test_segment_intersection(unittest.TestCase):
         self.assertFalse(success)
 
 
+class Test_segment_intersection_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(start0, end0, start1, end1):
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.segment_intersection_multi(
+            start0, end0, start1, end1
+        )
+
+    def test_it(self):
+        # NOTE: The first pair of segments intersect at ``s = 1/4`` and
+        #       ``t = 3/4``, the second pair is parallel.
+        start0 = np.asfortranarray([[0.0, 0.0], [0.0, 0.0]])
+        end0 = np.asfortranarray([[2.0, 1.0], [2.0, 1.0]])
+        start1 = np.asfortranarray([[-1.0, 0.0], [2.0, 1.0]])
+        end1 = np.asfortranarray([[1.0, 1.0], [0.0, 2.0]])
+        s_vals, t_vals, success = self._call_function_under_test(
+            start0, end0, start1, end1
+        )
+        self.assertEqual(success, np.asarray([True, False]))
+        self.assertEqual(s_vals[0], 0.25)
+        self.assertEqual(t_vals[0], 0.75)
+        self.assertTrue(np.isnan(s_vals[1]))
+        self.assertTrue(np.isnan(t_vals[1]))
+
+
 class Test_parallel_lines_parameters(utils.NumPyTestCase):
     @staticmethod
     def _call_function_under_test(start0, end0, start1, end1):
@@ -846,6 +945,52 @@ class Test_bbox_line_intersect(utils.NumPyTestCase):
         self.assertEqual(result, expected)
 
 
+class Test_bbox_line_intersect_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, line_start, line_end):
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.bbox_line_intersect_multi(
+            nodes, line_start, line_end
+        )
+
+    def test_it(self):
+        from bezier import _py_geometric_intersection
+
+        # NOTE: These are the segments from ``Test_bbox_line_intersect``,
+        #       along with a segment that ends on the left edge and one
+        #       that passes through the bottom right corner.
+        line_start = np.asfortranarray(
+            [
+                [0.5, -1.0, 0.5, -0.5, -0.25, 2.0, -1.0, 1.5],
+                [0.5, 0.5, -0.5, 0.5, 0.5, 2.0, 0.5, -0.5],
+            ]
+        )
+        line_end = np.asfortranarray(
+            [
+                [0.5, 0.5, 0.5, 1.5, 0.5, 2.0, 0.0, 0.5],
+                [1.5, 0.5, 1.5, 0.5, 1.25, 5.0, 0.5, 0.5],
+            ]
+        )
+        _, num_lines = line_start.shape
+        nodes = np.stack([UNIT_SQUARE] * num_lines)
+        result = self._call_function_under_test(nodes, line_start, line_end)
+        expected = np.asarray(
+            [
+                _py_geometric_intersection.bbox_line_intersect(
+                    UNIT_SQUARE, line_start[:, index], line_end[:, index]
+                )
+                for index in range(num_lines)
+            ],
+            dtype=np.intc,
+        )
+        self.assertEqual(result, expected)
+        box_type = _py_geometric_intersection.BoxIntersectionType
+        self.assertEqual(result[5], box_type.DISJOINT)
+        self.assertEqual(result[6], box_type.INTERSECTION)
+        self.assertEqual(result[7], box_type.INTERSECTION)
+
+
 class Test_intersect_one_round(utils.NumPyTestCase):
     # NOTE: QUADRATIC1 is a specialization of [0, 0], [1/2, 1], [1, 1]
     #       onto the interval [1/4, 1].
@@ -864,43 +1009,25 @@ class Test_intersect_one_round(utils.NumPyTestCase):
             candidates, intersections
         )
 
-    def _curves_compare(self, curve1, curve2):
-        from bezier import _py_geometric_intersection
-
-        if isinstance(curve1, _py_geometric_intersection.Linearization):
-            self.assertIsInstance(
-                curve2, _py_geometric_intersection.Linearization
+    def _candidates_compare(self, actual, expected):
+        self.assertEqual(len(actual), len(expected))
+        for index, (first, second) in enumerate(expected):
+            self.assertEqual(
+                np.asfortranarray(actual.nodes1[index]), first.nodes
             )
-            # We just check identity, since we assume a ``Linearization``
-            # can't be subdivided.
-            self.assertIs(curve1, curve2)
-        else:
-            self.assertIsInstance(
-                curve1, _py_geometric_intersection.SubdividedCurve
+            self.assertEqual(
+                np.asfortranarray(actual.nodes2[index]), second.nodes
             )
-            self.assertIsInstance(
-                curve2, _py_geometric_intersection.SubdividedCurve
+            self.assertEqual(
+                tuple(actual.params[index]),
+                (first.start, first.end, second.start, second.end),
             )
-            self.assertIs(curve1.original_nodes, curve2.original_nodes)
-            self.assertEqual(curve1.start, curve2.start)
-            self.assertEqual(curve1.end, curve2.end)
-            self.assertEqual(curve1.nodes, curve2.nodes)
-
-    def _candidates_compare(self, actual, expected):
-        self.assertEqual(len(actual), len(expected))
-        for first, second in zip(actual, expected):
-            self.assertEqual(len(first), 2)
-            self.assertEqual(len(second), 2)
-            self._curves_compare(first[0], second[0])
-            self._curves_compare(first[1], second[1])
 
     def test_simple(self):
-        curve1 = subdivided_curve(self.QUADRATIC1)
-        curve2 = subdivided_curve(self.QUADRATIC2)
-        candidates = [(curve1, curve2)]
+        candidates = candidate_pairs(self.QUADRATIC1, self.QUADRATIC2)
         next_candidates = self._call_function_under_test(candidates, [])
-        left1, right1 = curve1.subdivide()
-        left2, right2 = curve2.subdivide()
+        left1, right1 = subdivided_curve(self.QUADRATIC1).subdivide()
+        left2, right2 = subdivided_curve(self.QUADRATIC2).subdivide()
         expected = [
             (left1, left2),
             (left1, right2),
@@ -910,82 +1037,116 @@ class Test_intersect_one_round(utils.NumPyTestCase):
         self._candidates_compare(next_candidates, expected)
 
     def test_first_linearized(self):
-        curve1 = subdivided_curve(self.LINE1)
-        lin1 = make_linearization(curve1, error=0.0)
-        curve2 = subdivided_curve(self.QUADRATIC2)
+        candidates = candidate_pairs(self.LINE1, self.QUADRATIC2)
         intersections = []
         next_candidates = self._call_function_under_test(
-            [(lin1, curve2)], intersections
+            candidates, intersections
         )
         self.assertEqual(intersections, [])
-        left2, right2 = curve2.subdivide()
-        expected = [(lin1, left2), (lin1, right2)]
+        curve1 = subdivided_curve(self.LINE1)
+        left2, right2 = subdivided_curve(self.QUADRATIC2).subdivide()
+        expected = [(curve1, left2), (curve1, right2)]
         self._candidates_compare(next_candidates, expected)
+        self.assertEqual(
+            np.asfortranarray(next_candidates.errors[:, 0]), np.zeros(2)
+        )
 
     def test_second_linearized(self):
-        curve1 = subdivided_curve(self.QUADRATIC1)
-        curve2 = subdivided_curve(self.LINE2)
-        lin2 = make_linearization(curve2, error=0.0)
+        candidates = candidate_pairs(self.QUADRATIC1, self.LINE2)
         intersections = []
         next_candidates = self._call_function_under_test(
-            [(curve1, lin2)], intersections
+            candidates, intersections
         )
         self.assertEqual(intersections, [])
-        left1, right1 = curve1.subdivide()
-        expected = [(left1, lin2), (right1, lin2)]
+        left1, right1 = subdivided_curve(self.QUADRATIC1).subdivide()
+        curve2 = subdivided_curve(self.LINE2)
+        expected = [(left1, curve2), (right1, curve2)]
         self._candidates_compare(next_candidates, expected)
+        self.assertEqual(
+            np.asfortranarray(next_candidates.errors[:, 1]), np.zeros(2)
+        )
 
     def test_both_linearized(self):
-        curve1 = subdivided_curve(self.LINE1)
-        lin1 = make_linearization(curve1, error=0.0)
-        curve2 = subdivided_curve(self.LINE2)
-        lin2 = make_linearization(curve2, error=0.0)
+        candidates = candidate_pairs(self.LINE1, self.LINE2)
         intersections = []
         next_candidates = self._call_function_under_test(
-            [(lin1, lin2)], intersections
+            candidates, intersections
         )
-        self.assertEqual(next_candidates, [])
+        self.assertEqual(len(next_candidates), 0)
         self.assertEqual(intersections, [(0.5, 0.5)])
 
     def test_failure_due_to_unhandled_lines(self):
         from bezier import _py_geometric_intersection
 
-        curve1 = subdivided_curve(self.LINE1)
-        lin1 = make_linearization(curve1, error=0.0)
         nodes2 = np.asfortranarray([[0.5, 4.5], [0.5, 4.5]])
-        curve2 = subdivided_curve(nodes2)
-        lin2 = make_linearization(curve2, error=0.0)
+        candidates = candidate_pairs(self.LINE1, nodes2)
         intersections = []
         with self.assertRaises(ValueError) as exc_info:
-            self._call_function_under_test([(lin1, lin2)], intersections)
+            self._call_function_under_test(candidates, intersections)
         expected_args = (_py_geometric_intersection._UNHANDLED_LINES,)
         self.assertEqual(exc_info.exception.args, expected_args)
         self.assertEqual(intersections, [])
 
     def test_disjoint_bboxes(self):
-        curve1 = subdivided_curve(self.QUADRATIC1)
         nodes2 = np.asfortranarray([[1.0, 0.0], [1.25, 2.0]])
-        curve2 = subdivided_curve(nodes2)
-        lin2 = make_linearization(curve2, error=0.0)
+        candidates = candidate_pairs(self.QUADRATIC1, nodes2)
         intersections = []
         next_candidates = self._call_function_under_test(
-            [(curve1, lin2)], intersections
+            candidates, intersections
         )
-        self.assertEqual(next_candidates, [])
+        self.assertEqual(len(next_candidates), 0)
         self.assertEqual(intersections, [])
 
     def test_tangent_bboxes(self):
         nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
-        curve1 = subdivided_curve(nodes1)
         nodes2 = np.asfortranarray([[1.0, 1.5, 2.0], [0.0, 0.5, -0.25]])
-        curve2 = subdivided_curve(nodes2)
+        candidates = candidate_pairs(nodes1, nodes2)
         intersections = []
         next_candidates = self._call_function_under_test(
-            [(curve1, curve2)], intersections
+            candidates, intersections
         )
-        self.assertEqual(next_candidates, [])
+        self.assertEqual(len(next_candidates), 0)
         self.assertEqual(intersections, [(1.0, 0.0)])
 
+    def test_mixed_round(self):
+        from bezier import _py_geometric_intersection
+
+        # NOTE: The pairs are (in order) subdivided, tangent, disjoint and
+        #       then subdivided again, so the order of the subdivided
+        #       pairs must be preserved.
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]])
+        tangent = np.asfortranarray([[1.0, 1.5, 2.0], [0.0, 0.5, -0.25]])
+        disjoint = tangent + 5.0
+        stacked1 = np.stack([nodes1] * 4)
+        stacked2 = np.stack([self.QUADRATIC2, tangent, disjoint, nodes1])
+        params = np.asarray([[0.0, 1.0, 0.0, 1.0]] * 4)
+        errors = np.column_stack(
+            [
+                _py_geometric_intersection.linearization_error_multi(stacked1),
+                _py_geometric_intersection.linearization_error_multi(stacked2),
+            ]
+        )
+        candidates = _py_geometric_intersection.CandidatePairs(
+            nodes1, nodes1, stacked1, stacked2, params, errors
+        )
+        intersections = []
+        next_candidates = self._call_function_under_test(
+            candidates, intersections
+        )
+        self.assertEqual(intersections, [(1.0, 0.0)])
+        self.assertEqual(len(next_candidates), 8)
+        left1, right1 = subdivided_curve(nodes1).subdivide()
+        right2 = subdivided_curve(self.QUADRATIC2).subdivide()[1]
+        self.assertEqual(
+            np.asfortranarray(next_candidates.nodes2[1]), right2.nodes
+        )
+        self.assertEqual(
+            np.asfortranarray(next_candidates.nodes2[4]), left1.nodes
+        )
+        self.assertEqual(
+            np.asfortranarray(next_candidates.nodes1[7]), right1.nodes
+        )
+
 
 class Test_prune_candidates(unittest.TestCase):
     @staticmethod
@@ -996,23 +1157,24 @@ class Test_prune_candidates(unittest.TestCase):
 
     def test_curved(self):
         nodes1 = np.asfortranarray([[0.0, 2.0, 2.0], [0.0, 0.0, 2.0]])
-        curve1 = subdivided_curve(nodes1)
         nodes2 = np.asfortranarray([[0.0, 0.0, 2.0], [1.0, 3.0, 3.0]])
-        curve2 = subdivided_curve(nodes2)
-        candidates = [(curve1, curve2)]
+        candidates = candidate_pairs(nodes1, nodes2)
         pruned = self._call_function_under_test(candidates)
-        self.assertEqual(pruned, [])
+        self.assertEqual(len(pruned), 0)
 
     def test_linear(self):
         nodes1 = np.asfortranarray([[0.0, 4.0], [0.0, 4.0]])
-        curve1 = subdivided_curve(nodes1)
-        lin1 = make_linearization(curve1, error=0.0)
         nodes2 = np.asfortranarray([[2.0, 6.0], [1.0, 1.0]])
-        curve2 = subdivided_curve(nodes2)
-        lin2 = make_linearization(curve2, error=0.0)
-        candidates = [(lin1, lin2)]
+        candidates = candidate_pairs(nodes1, nodes2)
+        pruned = self._call_function_under_test(candidates)
+        self.assertEqual(len(pruned), 0)
+
+    def test_kept(self):
+        nodes1 = np.asfortranarray([[0.0, 4.0], [0.0, 4.0]])
+        nodes2 = np.asfortranarray([[0.0, 4.0], [4.0, 0.0]])
+        candidates = candidate_pairs(nodes1, nodes2)
         pruned = self._call_function_under_test(candidates)
-        self.assertEqual(pruned, [])
+        self.assertEqual(len(pruned), 1)
 
 
 class Test_make_same_degree(utils.NumPyTestCase):
@@ -1318,6 +1480,19 @@ class Test_all_intersections(utils.NumPyTestCase):
             nodes_first, nodes_second, **kwargs
         )
 
+    def test_with_workspace(self):
+        from bezier import _geometric_intersection
+
+        nodes1 = np.asfortranarray([[0.0, 2.0, 4.0], [0.0, 4.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 4.0], [1.5, 1.5]])
+        workspace = _geometric_intersection.IntersectionWorkspace()
+        intersections, coincident = self._call_function_under_test(
+            nodes1, nodes2, workspace=workspace
+        )
+        expected = np.asfortranarray([[0.25, 0.75], [0.25, 0.75]])
+        self.assertEqual(intersections, expected)
+        self.assertFalse(coincident)
+
     def test_no_intersections(self):
         nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
         nodes2 = np.asfortranarray([[3.0, 4.0], [3.0, 3.0]])
@@ -1486,6 +1661,209 @@ class Test_all_intersections(utils.NumPyTestCase):
         self.assertEqual(exc_info.exception.args, expected)
 
 
+class Test_all_intersections_pairs(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(
+        nodes_list_first, nodes_list_second, **kwargs
+    ):
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.all_intersections_pairs(
+            *_pack_pairs(nodes_list_first, nodes_list_second), **kwargs
+        )
+
+    def test_it(self):
+        nodes_list_first = [
+            np.asfortranarray([[0.0, 2.0, 4.0], [0.0, 4.0, 0.0]]),
+            np.asfortranarray([[0.0, 1.0], [0.0, 1.0]]),
+            np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 0.25, 0.0]]),
+        ]
+        nodes_list_second = [
+            np.asfortranarray([[0.0, 4.0], [1.5, 1.5]]),
+            np.asfortranarray([[3.0, 4.0], [3.0, 3.0]]),
+            np.asfortranarray([[0.5, 0.75, 1.0], [0.125, 0.125, 0.0]]),
+        ]
+        offsets, st_vals, coincident, errors = self._call_function_under_test(
+            nodes_list_first, nodes_list_second
+        )
+        self.assertEqual(offsets.tolist(), [0, 2, 2, 4])
+        expected = np.asfortranarray(
+            [[0.25, 0.75, 0.5, 1.0], [0.25, 0.75, 0.0, 1.0]]
+        )
+        self.assertEqual(st_vals, expected)
+        self.assertEqual(coincident.tolist(), [False, False, True])
+        self.assertEqual(errors, [])
+
+    def test_failures(self):
+        nodes_list_first = [
+            np.asfortranarray([[12.0, -4.0, -4.0], [4.0, -4.0, 4.0]]),
+            np.asfortranarray([[0.0, 2.0, 4.0], [0.0, 4.0, 0.0]]),
+            16384.0 * np.asfortranarray([[0.0, 4.5, 9.0], [0.0, 9.0, 0.0]]),
+        ]
+        nodes_list_second = [
+            np.asfortranarray([[6.0, -2.0, -2.0], [1.0, -1.0, 1.0]]),
+            np.asfortranarray([[0.0, 4.0], [1.5, 1.5]]),
+            16384.0 * np.asfortranarray([[0.0, 6.0], [8.0, 0.0]]),
+        ]
+        offsets, st_vals, coincident, errors = self._call_function_under_test(
+            nodes_list_first, nodes_list_second
+        )
+        # The failed pairs have no intersections.
+        self.assertEqual(offsets.tolist(), [0, 0, 2, 2])
+        expected = np.asfortranarray([[0.25, 0.75], [0.25, 0.75]])
+        self.assertEqual(st_vals, expected)
+        self.assertEqual(coincident.tolist(), [False, False, False])
+        self.assertEqual([index for index, _ in errors], [0, 2])
+        self.assertIsInstance(errors[0][1], NotImplementedError)
+        self.assertIsInstance(errors[1][1], ValueError)
+
+    def test_empty(self):
+        empty = np.empty((2, 0), order="F")
+        offsets = np.zeros((1,), dtype=np.intc)
+        result = self._call_function_under_test([], [])
+        self.assertEqual(result[0], offsets)
+        self.assertEqual(result[1], empty)
+        self.assertEqual(result[2].shape, (0,))
+        self.assertEqual(result[3], [])
+
+
+def _pack_pairs(nodes_list_first, nodes_list_second):
+    result = []
+    for nodes_list in (nodes_list_first, nodes_list_second):
+        sizes = [nodes.shape[1] for nodes in nodes_list]
+        offsets = np.zeros((len(sizes) + 1,), dtype=np.intc)
+        offsets[1:] = np.cumsum(sizes)
+        packed = np.empty((2, offsets[-1]), order="F")
+        for begin, end, nodes in zip(offsets[:-1], offsets[1:], nodes_list):
+            packed[:, begin:end] = nodes
+        result.extend((packed, offsets))
+    return result
+
+
+class Test_flatten_curve(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, tolerance):
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.flatten_curve(nodes, tolerance)
+
+    def test_line(self):
+        nodes = np.asfortranarray([[1.0, 3.0], [2.0, -1.0]])
+        vertices, s_vals = self._call_function_under_test(nodes, 0.5 ** 40)
+        self.assertEqual(vertices, nodes)
+        self.assertEqual(s_vals, np.asfortranarray([0.0, 1.0]))
+
+    def test_point(self):
+        nodes = np.asfortranarray([[1.0], [2.0]])
+        vertices, s_vals = self._call_function_under_test(nodes, 0.5 ** 40)
+        self.assertEqual(vertices, np.asfortranarray([[1.0, 1.0], [2.0, 2.0]]))
+        self.assertEqual(s_vals, np.asfortranarray([0.0, 1.0]))
+
+    def test_quadratic(self):
+        # NOTE: The linearization error of this curve is 1 and each
+        #       subdivision reduces it by a factor of 4.
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        vertices, s_vals = self._call_function_under_test(nodes, 0.25)
+        expected = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        self.assertEqual(vertices, expected)
+        self.assertEqual(s_vals, np.asfortranarray([0.0, 0.5, 1.0]))
+
+        vertices, s_vals = self._call_function_under_test(nodes, 0.0625)
+        expected = np.asfortranarray(
+            [[0.0, 0.5, 1.0, 1.5, 2.0], [0.0, 0.75, 1.0, 0.75, 0.0]]
+        )
+        self.assertEqual(vertices, expected)
+        self.assertEqual(
+            s_vals, np.asfortranarray([0.0, 0.25, 0.5, 0.75, 1.0])
+        )
+
+    def test_adaptive(self):
+        # B(s) = [s, s^3]; the bend is near s = 1, so more vertices are
+        # placed there.
+        nodes = (
+            np.asfortranarray([[0.0, 1.0, 2.0, 3.0], [0.0, 0.0, 0.0, 3.0]])
+            / 3.0
+        )
+        vertices, s_vals = self._call_function_under_test(nodes, 0.5 ** 10)
+        self.assertTrue(np.all(np.diff(s_vals) > 0.0))
+        self.assertEqual(s_vals[0], 0.0)
+        self.assertEqual(s_vals[-1], 1.0)
+        widths = np.diff(s_vals)
+        self.assertGreater(widths[0], widths[-1])
+        # The vertices are on the curve.
+        self.assertTrue(np.allclose(vertices[1, :], s_vals ** 3))
+
+
+class Test_flatten_curves(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, tolerance):
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.flatten_curves(nodes, tolerance)
+
+    def test_it(self):
+        nodes = np.asfortranarray(
+            [
+                [[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]],
+                [[0.0, 1.0, 2.0], [1.0, 1.0, 1.0]],
+            ]
+        )
+        vertices, s_vals, offsets = self._call_function_under_test(nodes, 0.25)
+        expected = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 0.0, 2.0], [0.0, 1.0, 0.0, 1.0, 1.0]]
+        )
+        self.assertEqual(vertices, expected)
+        self.assertEqual(s_vals, np.asfortranarray([0.0, 0.5, 1.0, 0.0, 1.0]))
+        self.assertEqual(offsets.tolist(), [0, 3, 5])
+
+    @staticmethod
+    def _flatten_curve(nodes, tolerance):
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.flatten_curve(nodes, tolerance)
+
+    def test_matches_flatten_curve(self):
+        nodes = utils.get_random_nodes(shape=(4, 2, 4), seed=1293, num_bits=8)
+        vertices, s_vals, offsets = self._call_function_under_test(
+            nodes, 0.5 ** 8
+        )
+        for index in range(4):
+            start, end = offsets[index], offsets[index + 1]
+            curve_nodes = np.asfortranarray(nodes[index, :, :])
+            expected_vertices, expected_s = self._flatten_curve(
+                curve_nodes, 0.5 ** 8
+            )
+            self.assertEqual(
+                np.asfortranarray(vertices[:, start:end]), expected_vertices
+            )
+            self.assertEqual(np.asfortranarray(s_vals[start:end]), expected_s)
+
+
+class TestIntersectionWorkspace(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.IntersectionWorkspace
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor_defaults(self):
+        workspace = self._make_one()
+        self.assertEqual(workspace.size, 2)
+
+    def test_constructor_explicit(self):
+        workspace = self._make_one(size=5)
+        self.assertEqual(workspace.size, 5)
+
+    def test_resize(self):
+        workspace = self._make_one()
+        self.assertIsNone(workspace.resize(4))
+        self.assertEqual(workspace.size, 4)
+
+
 class TestSubdividedCurve(utils.NumPyTestCase):
     @staticmethod
     def _get_target_class():
@@ -1660,6 +2038,179 @@ class TestLinearization(utils.NumPyTestCase):
         self.assertEqual(new_shape.error, error)
 
 
+class TestCandidatePairs(utils.NumPyTestCase):
+    NODES1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+    NODES2 = np.asfortranarray([[0.0, 2.0], [1.0, 1.0]])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import _py_geometric_intersection
+
+        return _py_geometric_intersection.CandidatePairs
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        stacked1 = self.NODES1[np.newaxis, :, :]
+        stacked2 = self.NODES2[np.newaxis, :, :]
+        params = np.asarray([[0.0, 1.0, 0.0, 1.0]])
+        errors = np.asarray([[1.0, 0.0]])
+        candidates = self._make_one(
+            self.NODES1, self.NODES2, stacked1, stacked2, params, errors
+        )
+        self.assertIs(candidates.original_nodes1, self.NODES1)
+        self.assertIs(candidates.original_nodes2, self.NODES2)
+        self.assertIs(candidates.nodes1, stacked1)
+        self.assertIs(candidates.nodes2, stacked2)
+        self.assertIs(candidates.params, params)
+        self.assertIs(candidates.errors, errors)
+        self.assertEqual(len(candidates), 1)
+
+    def test_from_nodes(self):
+        klass = self._get_target_class()
+        candidates = klass.from_nodes(self.NODES1, self.NODES2)
+        self.assertEqual(len(candidates), 1)
+        self.assertEqual(np.asfortranarray(candidates.nodes1[0]), self.NODES1)
+        self.assertEqual(np.asfortranarray(candidates.nodes2[0]), self.NODES2)
+        self.assertEqual(
+            np.asfortranarray(candidates.params),
+            np.asfortranarray([[0.0, 1.0, 0.0, 1.0]]),
+        )
+        self.assertEqual(
+            np.asfortranarray(candidates.errors),
+            np.asfortranarray([[1.0, 0.0]]),
+        )
+
+    def test_take(self):
+        klass = self._get_target_class()
+        candidates = klass.from_nodes(self.NODES1, self.NODES2).subdivide()
+        subset = candidates.take([1])
+        self.assertEqual(len(subset), 1)
+        self.assertIs(subset.original_nodes1, self.NODES1)
+        self.assertEqual(
+            np.asfortranarray(subset.nodes1[0]),
+            np.asfortranarray(candidates.nodes1[1]),
+        )
+        self.assertEqual(
+            np.asfortranarray(subset.params[0]),
+            np.asfortranarray(candidates.params[1]),
+        )
+        self.assertEqual(len(candidates.take([])), 0)
+
+    def test_pair(self):
+        from bezier import _py_geometric_intersection
+
+        klass = self._get_target_class()
+        candidates = klass.from_nodes(self.NODES1, self.NODES2).subdivide()
+        first, second = candidates.pair(1)
+        self.assertIsInstance(
+            first, _py_geometric_intersection.SubdividedCurve
+        )
+        self.assertEqual(first.nodes, np.asfortranarray(candidates.nodes1[1]))
+        self.assertTrue(first.nodes.flags.f_contiguous)
+        self.assertIs(first.original_nodes, self.NODES1)
+        self.assertEqual((first.start, first.end), (0.5, 1.0))
+        self.assertIsInstance(second, _py_geometric_intersection.Linearization)
+        self.assertEqual(second.error, 0.0)
+        self.assertEqual(np.asfortranarray(second.curve.nodes), self.NODES2)
+        self.assertIs(second.curve.original_nodes, self.NODES2)
+        self.assertEqual((second.curve.start, second.curve.end), (0.0, 1.0))
+
+    def test_subdivide(self):
+        klass = self._get_target_class()
+        candidates = klass.from_nodes(self.NODES1, self.NODES2)
+        new_candidates = candidates.subdivide()
+        self.assertEqual(len(new_candidates), 2)
+        left, right = subdivided_curve(self.NODES1).subdivide()
+        self.assertEqual(
+            np.asfortranarray(new_candidates.nodes1[0]), left.nodes
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.nodes1[1]), right.nodes
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.nodes2[0]), self.NODES2
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.nodes2[1]), self.NODES2
+        )
+        expected_params = np.asfortranarray(
+            [[0.0, 0.5, 0.0, 1.0], [0.5, 1.0, 0.0, 1.0]]
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.params), expected_params
+        )
+        expected_errors = np.asfortranarray([[0.25, 0.0], [0.25, 0.0]])
+        self.assertEqual(
+            np.asfortranarray(new_candidates.errors), expected_errors
+        )
+
+    def test_subdivide_mixed(self):
+        from bezier import _py_geometric_intersection
+
+        # NOTE: The first pair has a linearized first curve, the second
+        #       pair does not.
+        nodes1 = np.stack([self.NODES1, self.NODES1])
+        nodes2 = np.stack([self.NODES1, self.NODES1])
+        params = np.asarray([[0.0, 1.0, 0.0, 1.0], [0.0, 1.0, 0.0, 1.0]])
+        errors = np.asarray([[0.0, 1.0], [1.0, 1.0]])
+        candidates = self._make_one(
+            self.NODES1, self.NODES1, nodes1, nodes2, params, errors
+        )
+        new_candidates = candidates.subdivide()
+        self.assertEqual(len(new_candidates), 6)
+        expected_params = np.asfortranarray(
+            [
+                [0.0, 1.0, 0.0, 0.5],
+                [0.0, 1.0, 0.5, 1.0],
+                [0.0, 0.5, 0.0, 0.5],
+                [0.0, 0.5, 0.5, 1.0],
+                [0.5, 1.0, 0.0, 0.5],
+                [0.5, 1.0, 0.5, 1.0],
+            ]
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.params), expected_params
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.errors[:2, 0]), np.zeros(2)
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.errors[2:, 0]), np.full(4, 0.25)
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.nodes1[0]), self.NODES1
+        )
+        left, _ = _py_geometric_intersection.SubdividedCurve(
+            self.NODES1, self.NODES1
+        ).subdivide()
+        self.assertEqual(
+            np.asfortranarray(new_candidates.nodes1[2]), left.nodes
+        )
+
+    def test_subdivide_all_linearized(self):
+        candidates = self._make_one(
+            self.NODES2,
+            self.NODES2,
+            self.NODES2[np.newaxis, :, :],
+            self.NODES2[np.newaxis, :, :],
+            np.asarray([[0.25, 0.5, 0.0, 1.0]]),
+            np.zeros((1, 2)),
+        )
+        new_candidates = candidates.subdivide()
+        self.assertEqual(len(new_candidates), 1)
+        self.assertEqual(
+            np.asfortranarray(new_candidates.params),
+            np.asfortranarray(candidates.params),
+        )
+        self.assertEqual(
+            np.asfortranarray(new_candidates.nodes1),
+            np.asfortranarray(candidates.nodes1),
+        )
+
+
 def subdivided_curve(nodes, **kwargs):
     from bezier import _py_geometric_intersection
 
@@ -1674,3 +2225,9 @@ def make_linearization(curve, error=None):
     if error is None:
         error = _py_geometric_intersection.linearization_error(curve.nodes)
     return _py_geometric_intersection.Linearization(curve, error)
+
+
+def candidate_pairs(nodes1, nodes2):
+    from bezier import _py_geometric_intersection
+
+    return _py_geometric_intersection.CandidatePairs.from_nodes(nodes1, nodes2)
@@ -420,6 +420,67 @@ class Test_specialize_triangle(utils.NumPyTestCase):
         )
 
 
+class Test_specialization_matrix(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree, weights_a, weights_b, weights_c):
+        from bezier import _py_triangle_helpers
+
+        return _py_triangle_helpers.specialization_matrix(
+            degree, weights_a, weights_b, weights_c
+        )
+
+    def test_matches_stored(self):
+        from bezier import _py_triangle_helpers
+
+        # The generated matrices agree with the stored ones.
+        corners = _py_triangle_helpers._SUBDIVIDE_CORNERS
+        for degree in (1, 2, 3, 4):
+            stored = _py_triangle_helpers.subdivision_matrices(degree)
+            for matrix, weights in zip(stored, corners):
+                generated = self._call_function_under_test(degree, *weights)
+                self.assertEqual(generated, matrix)
+                self.assertFalse(generated.flags.writeable)
+                self.assertIs(
+                    self._call_function_under_test(degree, *weights),
+                    generated,
+                )
+
+
+class Test_subdivision_matrices(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier import _py_triangle_helpers
+
+        return _py_triangle_helpers.subdivision_matrices(degree)
+
+    def test_stored(self):
+        from bezier import _py_triangle_helpers
+
+        matrices = self._call_function_under_test(1)
+        self.assertEqual(len(matrices), 4)
+        self.assertIs(matrices[0], _py_triangle_helpers.LINEAR_SUBDIVIDE_A)
+        self.assertIs(matrices[3], _py_triangle_helpers.LINEAR_SUBDIVIDE_D)
+        matrices = self._call_function_under_test(4)
+        self.assertIs(matrices[1], _py_triangle_helpers.QUARTIC_SUBDIVIDE_B)
+        self.assertIs(matrices[2], _py_triangle_helpers.QUARTIC_SUBDIVIDE_C)
+
+    def test_generated(self):
+        from bezier import _py_triangle_helpers
+
+        matrices = self._call_function_under_test(6)
+        self.assertEqual(len(matrices), 4)
+        id_mat = np.eye(28, order="F")
+        for matrix, corners in zip(
+            matrices, _py_triangle_helpers._SUBDIVIDE_CORNERS
+        ):
+            self.assertFalse(matrix.flags.writeable)
+            expected = _py_triangle_helpers.specialize_triangle(
+                id_mat, 6, *(np.asfortranarray(weights) for weights in corners)
+            )
+            self.assertEqual(matrix, expected)
+        self.assertIs(self._call_function_under_test(6), matrices)
+
+
 class Test_subdivide_nodes(utils.NumPyTestCase):
 
     REF_TRIANGLE = utils.ref_triangle_uniform_nodes(5)
@@ -2155,6 +2216,36 @@ class Test_evaluate_barycentric_multi(utils.NumPyTestCase):
         result = self._call_function_under_test(nodes, 1, param_vals, 2)
         self.assertEqual(result, expected)
 
+    def test_matches_evaluate_barycentric(self):
+        from bezier import _py_triangle_helpers
+
+        nodes = np.asfortranarray(
+            [
+                [0.0, 1.0, 2.0, 3.0, 0.0, 1.5, 3.0, 0.0, 1.5, 0.0],
+                [0.0, 0.0, 0.0, 0.0, 1.5, 1.5, 1.5, 3.0, 3.0, 4.5],
+                [0.0, 2.0, -1.0, 4.0, 1.0, 0.5, 3.0, -2.0, 1.0, 2.0],
+            ]
+        )
+        param_vals = np.asfortranarray(
+            [
+                [1.0, 0.0, 0.0],
+                [0.25, 0.5, 0.25],
+                [0.125, 0.125, 0.75],
+                [0.0, 0.375, 0.625],
+                [0.5, 0.5, 0.5],
+            ]
+        )
+        result = self._call_function_under_test(nodes, 3, param_vals, 3)
+        expected = np.asfortranarray(
+            np.hstack(
+                [
+                    _py_triangle_helpers.evaluate_barycentric(nodes, 3, *row)
+                    for row in param_vals
+                ]
+            )
+        )
+        self.assertEqual(result, expected)
+
 
 class Test_evaluate_cartesian_multi(utils.NumPyTestCase):
     @staticmethod
@@ -92,6 +92,33 @@ class Test_newton_refine(unittest.TestCase):
         self.assertEqual(new_t, t)
 
 
+class Test_newton_refine_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, degree, points, st_vals):
+        from bezier import _py_triangle_intersection
+
+        return _py_triangle_intersection.newton_refine_multi(
+            nodes, degree, points, st_vals
+        )
+
+    def test_it(self):
+        nodes = np.asfortranarray(
+            [
+                [0.0, 0.5, 1.0, 0.0, 0.5, -0.25],
+                [0.0, -0.25, 0.0, 0.5, 0.5, 0.875],
+            ]
+        )
+        # See ``Test_newton_refine.test_improvement``; the second point is
+        # already solved, so it is left unchanged.
+        points = np.asfortranarray([[0.484375, 0.5], [0.1796875, -0.125]])
+        st_vals = np.asfortranarray([[0.25, 0.5], [0.5, 0.0]])
+        result = self._call_function_under_test(nodes, 2, points, st_vals)
+        expected = np.asfortranarray(
+            [[247.0 / 512.0, 31.0 / 128.0], [0.5, 0.0]]
+        )
+        self.assertEqual(result, expected)
+
+
 class Test_update_locate_candidates(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(
@@ -209,6 +236,62 @@ class Test_locate_point(unittest.TestCase):
         )
 
 
+class Test_locate_point_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, degree, points):
+        from bezier import _py_triangle_intersection
+
+        return _py_triangle_intersection.locate_point_multi(
+            nodes, degree, points
+        )
+
+    def test_it(self):
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        points = np.asfortranarray([[0.25, -0.125, 0.5], [0.625, 0.25, 0.0]])
+        result = self._call_function_under_test(nodes, 1, points)
+        self.assertEqual(
+            np.asfortranarray(result[0, :]), np.asfortranarray([0.25, 0.625])
+        )
+        self.assertTrue(np.all(np.isnan(result[1, :])))
+        self.assertEqual(
+            np.asfortranarray(result[2, :]), np.asfortranarray([0.5, 0.0])
+        )
+
+    @staticmethod
+    def _locate_point(nodes, degree, x_val, y_val):
+        from bezier import _py_triangle_intersection
+
+        return _py_triangle_intersection.locate_point(
+            nodes, degree, x_val, y_val
+        )
+
+    def test_matches_locate_point(self):
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 2.0, 2.0, 0.0], [0.0, 0.0, 0.0, 1.0, 2.0, 2.0]]
+        )
+        points = np.asfortranarray(
+            [[0.59375, 1.0, 3.0, 0.5], [0.25, 1.0, 3.0, 1.75]]
+        )
+        result = self._call_function_under_test(nodes, 2, points)
+        for index in range(4):
+            expected = self._locate_point(
+                nodes, 2, points[0, index], points[1, index]
+            )
+            if expected is None:
+                self.assertTrue(np.all(np.isnan(result[index, :])))
+            else:
+                self.assertEqual(
+                    np.asfortranarray(result[index, :]),
+                    np.asfortranarray(expected),
+                )
+
+    def test_no_points(self):
+        nodes = UNIT_TRIANGLE.copy(order="F")
+        points = np.empty((2, 0), order="F")
+        result = self._call_function_under_test(nodes, 1, points)
+        self.assertEqual(result.shape, (0, 2))
+
+
 class Test_same_intersection(unittest.TestCase):
     @staticmethod
     def _call_function_under_test(intersection1, intersection2, **kwargs):
@@ -942,6 +1025,198 @@ class Test_geometric_intersect(utils.NumPyTestCase):
         self._check_triple_root_err(exc_info.exception)
 
 
+class Test_geometric_intersect_pairs(utils.NumPyTestCase):
+    NODES1 = np.asfortranarray(
+        [
+            [[0.0, 5.0, 0.0], [0.0, 0.0, 5.0]],
+            [[0.0, 8.0, 0.0], [0.0, 0.0, 8.0]],
+            [[2.0, 3.0, 2.0], [1.0, 1.0, 2.0]],
+        ]
+    )
+    NODES2 = np.asfortranarray(
+        [
+            [[2.0, 3.0, 2.0], [1.0, 1.0, 2.0]],
+            [[4.0, -4.0, 4.0], [5.0, 5.0, -3.0]],
+            [[10.0, 11.0, 10.0], [10.0, 10.0, 11.0]],
+            [[0.0, 5.0, 0.0], [0.0, 0.0, 5.0]],
+        ]
+    )
+
+    @staticmethod
+    def _call_function_under_test(nodes1, degree1, nodes2, degree2, pairs):
+        from bezier import _py_triangle_intersection
+
+        return _py_triangle_intersection.geometric_intersect_pairs(
+            nodes1, degree1, nodes2, degree2, pairs
+        )
+
+    @staticmethod
+    def _intersect_one(nodes1, degree1, nodes2, degree2):
+        from bezier import _py_triangle_intersection
+
+        return _py_triangle_intersection.geometric_intersect(
+            nodes1, degree1, nodes2, degree2, True
+        )
+
+    def test_it(self):
+        pairs = np.asfortranarray([[0, 0], [1, 1], [0, 2], [2, 3], [1, 1]])
+        pairs = pairs.astype(np.intc, order="F")
+        result = self._call_function_under_test(
+            self.NODES1, 1, self.NODES2, 1, pairs
+        )
+        pair_offsets, polygon_offsets, segments, contained, errors = result
+        self.assertEqual(pair_offsets.tolist(), [0, 0, 1, 1, 1, 2])
+        self.assertEqual(polygon_offsets.tolist(), [0, 6, 12])
+        self.assertEqual(contained.tolist(), [2, 0, 0, 1, 0])
+        self.assertEqual(errors, [])
+        edge_infos, _, _ = self._intersect_one(
+            np.asfortranarray(self.NODES1[1, :, :]),
+            1,
+            np.asfortranarray(self.NODES2[1, :, :]),
+            1,
+        )
+        expected = [
+            (start, end, edge_index)
+            for edge_index, start, end in edge_infos[0]
+        ]
+        self.assertEqual(segments.tolist(), expected + expected)
+        self.assertEqual(segments.dtype.names, ("start", "end", "edge_index"))
+
+    def test_failure(self):
+        nodes1 = np.asfortranarray(
+            [
+                [
+                    [12.0, -4.0, -4.0, 12.0, 0.0, 10.0],
+                    [4.0, -4.0, 4.0, 14.0, 10.0, 20.0],
+                ]
+            ]
+        )
+        nodes2 = np.asfortranarray(
+            [
+                [
+                    [6.0, -2.0, -2.0, 6.0, 1.0, 5.0],
+                    [1.0, -1.0, 1.0, 8.0, 6.0, 12.0],
+                ],
+                [
+                    [6.0, -2.0, -2.0, 6.0, 1.0, 5.0],
+                    [31.0, 29.0, 31.0, 38.0, 36.0, 42.0],
+                ],
+            ]
+        )
+        pairs = np.asfortranarray([[0, 0], [0, 1]]).astype(np.intc, order="F")
+        result = self._call_function_under_test(nodes1, 2, nodes2, 2, pairs)
+        pair_offsets, polygon_offsets, segments, contained, errors = result
+        self.assertEqual(pair_offsets.tolist(), [0, 0, 0])
+        self.assertEqual(polygon_offsets.tolist(), [0])
+        self.assertEqual(segments.shape, (0,))
+        self.assertEqual(contained.tolist(), [0, 0])
+        self.assertEqual(len(errors), 1)
+        index, exc = errors[0]
+        self.assertEqual(index, 0)
+        self.assertIsInstance(exc, NotImplementedError)
+
+    def test_no_pairs(self):
+        pairs = np.empty((0, 2), dtype=np.intc, order="F")
+        result = self._call_function_under_test(
+            self.NODES1, 1, self.NODES2, 1, pairs
+        )
+        pair_offsets, polygon_offsets, segments, contained, errors = result
+        self.assertEqual(pair_offsets.tolist(), [0])
+        self.assertEqual(polygon_offsets.tolist(), [0])
+        self.assertEqual(segments.shape, (0,))
+        self.assertEqual(contained.shape, (0,))
+        self.assertEqual(errors, [])
+
+
+class Test_intersection_areas(utils.NumPyTestCase):
+    NODES1 = np.asfortranarray(
+        [
+            [[-8.0, 8.0, 0.0], [0.0, 0.0, 8.0]],
+            [[0.0, 5.0, 0.0], [0.0, 0.0, 5.0]],
+            [[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        ]
+    )
+    NODES2 = np.asfortranarray(
+        [
+            [
+                [4.0, 0.0, -4.0, 2.0, -2.0, 0.0],
+                [3.0, -5.0, 3.0, -3.0, -3.0, -9.0],
+            ],
+            [[2.0, 2.5, 3.0, 2.0, 2.5, 2.0], [1.0, 1.0, 1.0, 1.5, 1.5, 2.0]],
+            [[0.0, 0.5, 1.0, 0.0, 0.5, 0.0], [0.0, 0.0, 0.0, 0.5, 0.5, 1.0]],
+        ]
+    )
+
+    @staticmethod
+    def _call_function_under_test(*args):
+        from bezier import _py_triangle_intersection
+
+        return _py_triangle_intersection.intersection_areas(*args)
+
+    @staticmethod
+    def _intersect_pairs(nodes1, degree1, nodes2, degree2, pairs):
+        from bezier import _py_triangle_intersection
+
+        return _py_triangle_intersection.geometric_intersect_pairs(
+            nodes1, degree1, nodes2, degree2, pairs
+        )
+
+    def _areas(self, pairs):
+        pairs = np.asfortranarray(pairs).astype(np.intc, order="F")
+        result = self._intersect_pairs(self.NODES1, 1, self.NODES2, 2, pairs)
+        self.assertEqual(result[-1], [])
+        return self._call_function_under_test(
+            self.NODES1, 1, self.NODES2, 2, pairs, *result[:-1]
+        )
+
+    def test_curved_polygons(self):
+        polygon_areas, pair_areas = self._areas([[0, 0], [0, 0]])
+        expected = np.asfortranarray([7.0, 7.0, 7.0, 7.0]) / 6.0
+        self.assertTrue(np.allclose(polygon_areas, expected))
+        expected = np.asfortranarray([7.0, 7.0]) / 3.0
+        self.assertTrue(np.allclose(pair_areas, expected))
+
+    def test_contained(self):
+        # NOTE: The second pair is the same triangle (with the second
+        #       represented by the degree-elevated nodes), which is treated
+        #       as contained.
+        polygon_areas, pair_areas = self._areas([[1, 1], [2, 2]])
+        self.assertEqual(polygon_areas.shape, (0,))
+        self.assertEqual(pair_areas.tolist(), [0.5, 0.5])
+
+    def test_disjoint(self):
+        polygon_areas, pair_areas = self._areas([[2, 1]])
+        self.assertEqual(polygon_areas.shape, (0,))
+        self.assertEqual(pair_areas.tolist(), [0.0])
+
+    def test_unsupported_degree(self):
+        from bezier import _py_helpers
+        from bezier import _py_triangle_intersection
+
+        nodes1 = np.zeros((1, 2, 21), order="F")
+        pairs = np.zeros((1, 2), dtype=np.intc, order="F")
+        pair_offsets = np.zeros((2,), dtype=np.intc)
+        polygon_offsets = np.zeros((1,), dtype=np.intc)
+        segments = np.empty(
+            (0,), dtype=_py_triangle_intersection.SEGMENT_DTYPE
+        )
+        contained = np.zeros((1,), dtype=np.intc)
+        with self.assertRaises(_py_helpers.UnsupportedDegree) as exc_info:
+            self._call_function_under_test(
+                nodes1,
+                5,
+                self.NODES2,
+                2,
+                pairs,
+                pair_offsets,
+                polygon_offsets,
+                segments,
+                contained,
+            )
+
+        self.assertEqual(exc_info.exception.degree, 5)
+
+
 class Test_algebraic_intersect(Test_geometric_intersect):
     BAD_BOUNDARY_ARGS = ("Coincident curves not currently supported",)
     BAD_BOUNDARY_TYPE = RuntimeError
@@ -0,0 +1,156 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class Test_subdivide_nodes_multi(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import _py_triangle_matrices
+
+        return _py_triangle_matrices.subdivide_nodes_multi(nodes, degree)
+
+    def _helper(self, degree):
+        from bezier import _py_triangle_helpers
+
+        num_nodes = ((degree + 1) * (degree + 2)) // 2
+        # Use non-trivial but exactly representable nodes.
+        nodes1 = np.asfortranarray(
+            np.arange(2 * num_nodes, dtype=float).reshape(2, num_nodes) / 8
+        )
+        nodes2 = np.asfortranarray(nodes1[:, ::-1] ** 2)
+        stacked = np.stack([nodes1, nodes2])
+        result = self._call_function_under_test(stacked, degree)
+        self.assertEqual(len(result), 4)
+        for index, nodes in enumerate((nodes1, nodes2)):
+            expected = _py_triangle_helpers.subdivide_nodes(nodes, degree)
+            for sub_nodes, expected_nodes in zip(result, expected):
+                self.assertEqual(sub_nodes.shape, (2, 2, num_nodes))
+                self.assertTrue(
+                    np.allclose(sub_nodes[index], expected_nodes, atol=0.0)
+                )
+
+    def test_linear(self):
+        self._helper(1)
+
+    def test_quadratic(self):
+        self._helper(2)
+
+    def test_cubic(self):
+        self._helper(3)
+
+    def test_quartic(self):
+        self._helper(4)
+
+    def test_on_the_fly(self):
+        self._helper(5)
+
+
+class Test_level_subdivision_matrices(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree, levels):
+        from bezier import _py_triangle_matrices
+
+        return _py_triangle_matrices.level_subdivision_matrices(degree, levels)
+
+    def test_zero_levels(self):
+        matrices = self._call_function_under_test(1, 0)
+        self.assertEqual(matrices.shape, (1, 3, 3))
+        self.assertEqual(matrices[0], np.eye(3, order="F"))
+
+    def test_one_level(self):
+        from bezier import _py_triangle_helpers
+
+        matrices = self._call_function_under_test(2, 1)
+        self.assertEqual(matrices.shape, (4, 6, 6))
+        expected = (
+            _py_triangle_helpers.QUADRATIC_SUBDIVIDE_A,
+            _py_triangle_helpers.QUADRATIC_SUBDIVIDE_B,
+            _py_triangle_helpers.QUADRATIC_SUBDIVIDE_C,
+            _py_triangle_helpers.QUADRATIC_SUBDIVIDE_D,
+        )
+        for matrix, expected_matrix in zip(matrices, expected):
+            self.assertEqual(np.asfortranarray(matrix), expected_matrix)
+
+    def test_cached(self):
+        matrices = self._call_function_under_test(1, 2)
+        self.assertEqual(matrices.shape, (16, 3, 3))
+        self.assertFalse(matrices.flags.writeable)
+        self.assertIs(self._call_function_under_test(1, 2), matrices)
+
+
+class Test_subdivide_nodes_levels(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, degree, levels):
+        from bezier import _py_triangle_matrices
+
+        return _py_triangle_matrices.subdivide_nodes_levels(
+            nodes, degree, levels
+        )
+
+    def _helper(self, degree):
+        from bezier import _py_triangle_helpers
+
+        num_nodes = ((degree + 1) * (degree + 2)) // 2
+        # Use non-trivial but exactly representable nodes.
+        nodes = np.asfortranarray(
+            np.arange(2 * num_nodes, dtype=float).reshape(2, num_nodes) / 8
+        )
+        result = self._call_function_under_test(nodes, degree, 2)
+        self.assertEqual(result.shape, (16, 2, num_nodes))
+        index = 0
+        for sub_nodes in _py_triangle_helpers.subdivide_nodes(nodes, degree):
+            for expected in _py_triangle_helpers.subdivide_nodes(
+                sub_nodes, degree
+            ):
+                self.assertTrue(np.allclose(result[index], expected, atol=0.0))
+                index += 1
+
+    def test_linear(self):
+        self._helper(1)
+
+    def test_cubic(self):
+        self._helper(3)
+
+    def test_on_the_fly(self):
+        self._helper(5)
+
+
+class Test_elevation_matrix(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree):
+        from bezier import _py_triangle_matrices
+
+        return _py_triangle_matrices.elevation_matrix(degree)
+
+    def test_linear(self):
+        matrix = self._call_function_under_test(1)
+        expected = np.asfortranarray(
+            [
+                [2.0, 1.0, 0.0, 1.0, 0.0, 0.0],
+                [0.0, 1.0, 2.0, 0.0, 1.0, 0.0],
+                [0.0, 0.0, 0.0, 1.0, 1.0, 2.0],
+            ]
+        )
+        self.assertEqual(matrix, expected)
+        self.assertFalse(matrix.flags.writeable)
+        self.assertIs(self._call_function_under_test(1), matrix)
+
+    def test_partition_of_unity(self):
+        # Each column sums to the number of contributions, scaled by
+        # ``degree + 1``, so the elevated triangle has the same corners.
+        matrix = self._call_function_under_test(7)
+        self.assertEqual(matrix.shape, (36, 45))
+        self.assertTrue(np.all(matrix.sum(axis=0) == 8.0))
@@ -10,6 +10,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import unittest.mock
+
+import numpy as np
+
 from tests.unit import test__py_triangle_helpers
 from tests.unit import utils
 
@@ -158,3 +162,39 @@ class Test_speedup_compute_area(test__py_triangle_helpers.Test_compute_area):
         from bezier import _speedup
 
         return _speedup.compute_area(edges)
+
+
+@utils.needs_speedup
+class Test__subdivide_nodes(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, degree):
+        from bezier import _triangle_helpers
+
+        return _triangle_helpers._subdivide_nodes(nodes, degree)
+
+    def test_fortran(self):
+        from bezier import _speedup
+
+        nodes = utils.get_random_nodes(shape=(2, 6), seed=101, num_bits=8)
+        with unittest.mock.patch.object(
+            _speedup,
+            "subdivide_nodes_triangle",
+            wraps=_speedup.subdivide_nodes_triangle,
+        ) as fortran:
+            result = self._call_function_under_test(nodes, 2)
+        fortran.assert_called_once_with(nodes, 2)
+        self.assertEqual(len(result), 4)
+
+    def test_cached_matrices(self):
+        from bezier import _py_triangle_helpers
+        from bezier import _speedup
+
+        nodes = utils.get_random_nodes(shape=(2, 28), seed=202, num_bits=8)
+        result = self._call_function_under_test(nodes, 6)
+        expected = _speedup.subdivide_nodes_triangle(nodes, 6)
+        matrices = _py_triangle_helpers.subdivision_matrices(6)
+        for sub_nodes, expected_nodes, matrix in zip(
+            result, expected, matrices
+        ):
+            self.assertEqual(sub_nodes, np.asfortranarray(nodes.dot(matrix)))
+            self.assertTrue(np.allclose(sub_nodes, expected_nodes, atol=0.0))
@@ -42,6 +42,23 @@ class Test_speedup_locate_point(
         return _speedup.locate_point_triangle(nodes, degree, x_val, y_val)
 
 
+@utils.needs_speedup
+class Test_speedup_locate_point_multi(
+    test__py_triangle_intersection.Test_locate_point_multi
+):
+    @staticmethod
+    def _call_function_under_test(nodes, degree, points):
+        from bezier import _speedup
+
+        return _speedup.locate_point_triangle_multi(nodes, degree, points)
+
+    @staticmethod
+    def _locate_point(nodes, degree, x_val, y_val):
+        from bezier import _speedup
+
+        return _speedup.locate_point_triangle(nodes, degree, x_val, y_val)
+
+
 @utils.needs_speedup
 class Test_speedup_geometric_intersect(
     test__py_triangle_intersection.Test_geometric_intersect
@@ -103,6 +120,52 @@ class Test_speedup_geometric_intersect(
         self.assertEqual(triangle_workspace_sizes(), sizes)
 
 
+@utils.needs_speedup
+class Test_speedup_geometric_intersect_pairs(
+    test__py_triangle_intersection.Test_geometric_intersect_pairs
+):
+    @staticmethod
+    def _call_function_under_test(nodes1, degree1, nodes2, degree2, pairs):
+        from bezier import _speedup
+
+        return _speedup.triangle_intersections_pairs(
+            nodes1, degree1, nodes2, degree2, pairs
+        )
+
+    @staticmethod
+    def _intersect_one(nodes1, degree1, nodes2, degree2):
+        from bezier import _speedup
+
+        return _speedup.triangle_intersections(
+            nodes1, degree1, nodes2, degree2
+        )
+
+    def test_resize(self):
+        reset_triangle_workspaces(segment_ends_size=1, segments_size=1)
+        self.test_it()
+        # Make sure the sizes were resized from (1, 1).
+        self.assertEqual(triangle_workspace_sizes(), (1, 6))
+
+
+@utils.needs_speedup
+class Test_speedup_intersection_areas(
+    test__py_triangle_intersection.Test_intersection_areas
+):
+    @staticmethod
+    def _call_function_under_test(*args):
+        from bezier import _speedup
+
+        return _speedup.triangle_intersection_areas(*args)
+
+    @staticmethod
+    def _intersect_pairs(nodes1, degree1, nodes2, degree2, pairs):
+        from bezier import _speedup
+
+        return _speedup.triangle_intersections_pairs(
+            nodes1, degree1, nodes2, degree2, pairs
+        )
+
+
 @utils.needs_speedup
 class Test_speedup__type_info(unittest.TestCase):
     @staticmethod
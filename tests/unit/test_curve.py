@@ -80,6 +80,30 @@ class TestCurve(utils.NumPyTestCase):
         self.assertEqual(curve._dimension, 2)
         self.assertTrue(np.all(curve._nodes == nodes))
 
+    def test_from_buffer_factory(self):
+        nodes = np.asfortranarray([[1.0, 1.0, 2.0], [2.0, 3.0, 4.0]])
+        klass = self._get_target_class()
+        curve = klass.from_buffer(nodes)
+        self.assertIsInstance(curve, klass)
+        self.assertEqual(curve._degree, 2)
+        self.assertEqual(curve._dimension, 2)
+        self.assertFalse(curve.frozen)
+        self.assertTrue(np.shares_memory(curve._nodes, nodes))
+
+    def test_from_buffer_factory_flat_frozen(self):
+        nodes = np.asfortranarray([[1.0, 1.0], [2.0, 3.0], [0.0, 0.0]])
+        buffer = memoryview(bytearray(nodes.tobytes(order="F")))
+        klass = self._get_target_class()
+        curve = klass.from_buffer(buffer, dimension=3, frozen=True)
+        self.assertEqual(curve._degree, 1)
+        self.assertEqual(curve._dimension, 3)
+        self.assertEqual(curve._nodes, nodes)
+        self.assertTrue(curve.frozen)
+        self.assertFalse(curve._nodes.flags.writeable)
+        # The buffer itself is still writable.
+        buffer[:8] = np.float64(-1.0).tobytes()
+        self.assertEqual(curve._nodes[0, 0], -1.0)
+
     def test__get_degree(self):
         klass = self._get_target_class()
         self.assertEqual(0, klass._get_degree(1))
@@ -90,10 +114,126 @@ class TestCurve(utils.NumPyTestCase):
         curve = self._make_one(nodes, 1)
         self.assertEqual(curve.length, 5.0)
 
+    def test_length_property_frozen(self):
+        nodes = np.asfortranarray([[0.0, 3.0], [0.0, 4.0]])
+        curve = self._make_one(nodes, 1, frozen=True)
+        self.assertIsNone(curve._length)
+        self.assertEqual(curve.length, 5.0)
+        self.assertEqual(curve._length, 5.0)
+        # The cached value is re-used.
+        curve._length = 7.0
+        self.assertEqual(curve.length, 7.0)
+
+    def test_length_property_not_cached(self):
+        nodes = np.asfortranarray([[0.0, 3.0], [0.0, 4.0]])
+        curve = self._make_one(nodes, 1)
+        self.assertEqual(curve.length, 5.0)
+        self.assertIsNone(curve._length)
+
+    def test_from_nodes_factory_frozen(self):
+        nodes = np.asfortranarray([[1.0, 1.0], [2.0, 3.0]])
+        klass = self._get_target_class()
+        curve = klass.from_nodes(nodes, frozen=True)
+        self.assertTrue(curve.frozen)
+        self.assertFalse(curve._nodes.flags.writeable)
+        self.assertEqual(curve._nodes, nodes)
+
+    def test__get_bbox(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [2.0, -1.0, 0.5]])
+        curve = self._make_one(nodes, 2)
+        self.assertEqual(curve._get_bbox(), (0.0, 3.0, -1.0, 2.0))
+        self.assertIsNone(curve._bbox)
+        frozen = self._make_one(nodes, 2, frozen=True)
+        self.assertEqual(frozen._get_bbox(), (0.0, 3.0, -1.0, 2.0))
+        self.assertEqual(frozen._bbox, (0.0, 3.0, -1.0, 2.0))
+
+    def test__disjoint_from_bbox(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[3.0, 4.0], [0.0, 1.0]])
+        curve1 = self._make_one(nodes1, 2, frozen=True)
+        curve2 = self._make_one(nodes2, 1, frozen=True)
+        self.assertTrue(curve1._disjoint_from(curve2))
+        self.assertTrue(curve2._disjoint_from(curve1))
+        # Only the bounding boxes were needed.
+        self.assertIsNone(curve1._convex_hull)
+
+    def test__disjoint_from_convex_hull(self):
+        # The bounding boxes overlap, but the hulls do not.
+        nodes1 = np.asfortranarray([[0.0, 0.0, 1.0], [0.0, 1.0, 0.0]])
+        nodes2 = np.asfortranarray([[1.0, 1.0, 0.75], [1.0, 0.75, 1.0]])
+        curve1 = self._make_one(nodes1, 2, frozen=True)
+        curve2 = self._make_one(nodes2, 2, frozen=True)
+        self.assertTrue(curve1._disjoint_from(curve2))
+        self.assertEqual(curve1._convex_hull.shape, (2, 3))
+        self.assertFalse(curve1._convex_hull.flags.writeable)
+
+    def test__disjoint_from_overlap(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, -1.0, 1.0]])
+        curve1 = self._make_one(nodes1, 2, frozen=True)
+        curve2 = self._make_one(nodes2, 2)
+        self.assertFalse(curve1._disjoint_from(curve2))
+
+    def test__disjoint_from_line(self):
+        # A line has a degenerate hull, so only the boxes are used.
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[1.0, 1.0, 0.75], [0.0, 0.25, 0.0]])
+        curve1 = self._make_one(nodes1, 1, frozen=True)
+        curve2 = self._make_one(nodes2, 2, frozen=True)
+        self.assertFalse(curve1._disjoint_from(curve2))
+
+    def test_arc_length_table_property(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 0.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        table = curve.arc_length_table
+        self.assertAlmostEqual(table.length, 3.0, delta=1e-15)
+        # The table is not cached, since the nodes may change.
+        self.assertIsNone(curve._arc_length_table)
+        curve._nodes[0, 2] = 5.0
+        self.assertAlmostEqual(curve.arc_length_table.length, 5.0, delta=1e-15)
+
+    def test_arc_length_table_property_frozen(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 0.0, 0.0]])
+        curve = self._make_one(nodes, 2, frozen=True)
+        self.assertIsNone(curve._arc_length_table)
+        table = curve.arc_length_table
+        self.assertAlmostEqual(table.length, 3.0, delta=1e-15)
+        # The table is cached.
+        self.assertIs(curve._arc_length_table, table)
+        self.assertIs(curve.arc_length_table, table)
+
+    def test_arc_length_table_full_length(self):
+        # NOTE: For this curve, the QUADPACK length differs from the length
+        #       in the arc length table by more than a few ULPs.
+        nodes = np.asfortranarray(
+            [[0.0, 5.0, -6.0, -5.0], [-6.0, 3.0, 5.0, 8.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        table = curve.arc_length_table
+        s_vals = table.s_at_length([0.0, curve.length])
+        self.assertEqual(s_vals[0], 0.0)
+        self.assertAlmostEqual(s_vals[1], 1.0, delta=1e-11)
+        # Lengths just past the end (within the accuracy of QUADPACK)
+        # are clamped to the end of the curve.
+        s_vals = table.s_at_length(table.length * (1.0 + 0.5 ** 30))
+        self.assertEqual(s_vals, 1.0)
+
     def test___dict___property(self):
         curve = self._make_one(self.ZEROS, 1, copy=False)
         props_dict = curve.__dict__
-        expected = {"_nodes": self.ZEROS, "_dimension": 2, "_degree": 1}
+        expected = {
+            "_nodes": self.ZEROS,
+            "_dimension": 2,
+            "_frozen": False,
+            "_degree": 1,
+            "_arc_length_table": None,
+            "_length": None,
+            "_bbox": None,
+            "_hodograph": None,
+            "_linearization_error": None,
+            "_convex_hull": None,
+            "_reduced_nodes": None,
+        }
         self.assertEqual(props_dict, expected)
         # Check that modifying ``props_dict`` won't modify ``curve``.
         expected["_dimension"] = 47
@@ -109,6 +249,14 @@ class TestCurve(utils.NumPyTestCase):
         self.assertTrue(np.all(curve._nodes == new_curve._nodes))
         self.assertIsNot(curve._nodes, new_curve._nodes)
 
+    def test_copy_frozen(self):
+        nodes = np.asfortranarray([[2.0, 3.5, 4.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2, frozen=True)
+        new_curve = curve.copy()
+        self.assertTrue(new_curve._frozen)
+        self.assertFalse(new_curve._nodes.flags.writeable)
+        self.assertEqual(new_curve._nodes, nodes)
+
     def test_evaluate(self):
         s = 0.25
         nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 0.5, 1.25]])
@@ -130,6 +278,18 @@ class TestCurve(utils.NumPyTestCase):
         result = curve.evaluate_multi(s_vals)
         self.assertEqual(expected, result)
 
+    def test_evaluate_multi_sample_plan(self):
+        from bezier import curve
+
+        s_vals = np.asfortranarray([0.0, 0.25, 0.75, 1.0])
+        plan = curve.SamplePlan(2, s_vals)
+        nodes = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 4.0, 0.0]])
+        curve_obj = self._make_one(nodes, 2)
+        result = curve_obj.evaluate_multi(plan)
+        expected = curve_obj.evaluate_multi(s_vals)
+        self.assertTrue(result.flags.f_contiguous)
+        self.assertTrue(np.allclose(result, expected, atol=0.0, rtol=1e-15))
+
     def test_evaluate_hodograph(self):
         s = 0.25
         nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 0.5, 1.25]])
@@ -138,6 +298,14 @@ class TestCurve(utils.NumPyTestCase):
         result = curve.evaluate_hodograph(s)
         self.assertEqual(expected, result)
 
+    def test_evaluate_hodograph_frozen(self):
+        nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 0.5, 1.25]])
+        curve = self._make_one(nodes, 2, frozen=True)
+        expected = np.asfortranarray([[1.0], [1.125]])
+        self.assertEqual(curve.evaluate_hodograph(0.25), expected)
+        hodograph = np.asfortranarray([[1.0, 1.0], [1.0, 1.5]])
+        self.assertEqual(curve._hodograph, hodograph)
+
     def test_plot_wrong_dimension(self):
         nodes = np.asfortranarray([[0.0, 1.0], [0.0, 3.0], [0.0, 4.0]])
         curve = self._make_one(nodes, 1)
@@ -195,6 +363,36 @@ class TestCurve(utils.NumPyTestCase):
         expected_r = np.asfortranarray([[2.0, 4.0], [3.5, 6.0]])
         self.assertEqual(right._nodes, expected_r)
 
+    def test_subdivide_frozen(self):
+        nodes = np.asfortranarray([[0.0, 4.0], [1.0, 6.0]])
+        curve = self._make_one(nodes, 1, frozen=True)
+        left, right = curve.subdivide()
+        self.assertTrue(left._frozen)
+        self.assertFalse(left._nodes.flags.writeable)
+        self.assertTrue(right._frozen)
+        self.assertFalse(right._nodes.flags.writeable)
+
+    def test_subdivide_levels(self):
+        nodes = np.asfortranarray([[0.0, 4.0], [1.0, 6.0]])
+        curve = self._make_one(nodes, 1)
+        pieces = curve.subdivide(levels=2)
+        self.assertEqual(pieces.shape, (4, 2, 2))
+        expected = np.asfortranarray([[2.0, 3.0], [3.5, 4.75]])
+        self.assertEqual(np.asfortranarray(pieces[2]), expected)
+        # Zero levels gives back the nodes.
+        pieces = curve.subdivide(levels=0)
+        self.assertEqual(np.asfortranarray(pieces[0]), nodes)
+
+    def test_subdivide_levels_negative(self):
+        curve = self._make_one(self.ZEROS, 1)
+        with self.assertRaises(ValueError) as exc_info:
+            curve.subdivide(levels=-1)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Number of levels must be non-negative", -1)
+        )
+
     def test_intersect_bad_strategy(self):
         curve = self._make_one(self.ZEROS, 1)
         strategy = unittest.mock.sentinel.bad_strategy
@@ -215,6 +413,18 @@ class TestCurve(utils.NumPyTestCase):
         expected = np.asfortranarray([[0.5], [0.5]])
         self.assertEqual(intersections, expected)
 
+    def test_intersect_clipping(self):
+        from bezier import _py_intersection_helpers
+
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        curve1 = self._make_one(nodes1, 1)
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        curve2 = self._make_one(nodes2, 1)
+        strategy = _py_intersection_helpers.IntersectionStrategy.CLIPPING
+        intersections = curve1.intersect(curve2, strategy=strategy)
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertEqual(intersections, expected)
+
     def test_intersect_empty(self):
         nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
         curve1 = self._make_one(nodes1, 1)
@@ -223,6 +433,73 @@ class TestCurve(utils.NumPyTestCase):
         result = curve1.intersect(curve2)
         self.assertEqual(result.shape, (2, 0))
 
+    def test_intersect_frozen_disjoint(self):
+        from bezier import _py_intersection_helpers
+
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        curve1 = self._make_one(nodes1, 1, frozen=True)
+        nodes2 = np.asfortranarray([[3.0, 2.0], [0.0, 1.0]])
+        curve2 = self._make_one(nodes2, 1)
+        strategies = _py_intersection_helpers.IntersectionStrategy
+        patch = unittest.mock.patch(
+            "bezier._geometric_intersection.all_intersections"
+        )
+        with patch as all_intersections:
+            for strategy in strategies:
+                result = curve1.intersect(curve2, strategy=strategy)
+                self.assertEqual(result.shape, (2, 0))
+                result = curve2.intersect(curve1, strategy=strategy)
+                self.assertEqual(result.shape, (2, 0))
+        all_intersections.assert_not_called()
+        self.assertEqual(curve1._bbox, (0.0, 1.0, 0.0, 1.0))
+        self.assertIsNone(curve2._bbox)
+
+    def test_intersect_frozen_bad_strategy(self):
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        curve1 = self._make_one(nodes1, 1, frozen=True)
+        nodes2 = np.asfortranarray([[3.0, 2.0], [0.0, 1.0]])
+        curve2 = self._make_one(nodes2, 1, frozen=True)
+        strategy = unittest.mock.sentinel.bad_strategy
+        with self.assertRaises(ValueError):
+            curve1.intersect(curve2, strategy=strategy)
+
+    def test_intersect_frozen_algebraic(self):
+        from bezier import _py_intersection_helpers
+
+        # A degree-elevated line, which reduces to ``[0, 0], [1, 1]``.
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 0.5, 1.0]])
+        curve1 = self._make_one(nodes1, 2, frozen=True)
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        curve2 = self._make_one(nodes2, 1, frozen=True)
+        strategy = _py_intersection_helpers.IntersectionStrategy.ALGEBRAIC
+        intersections = curve1.intersect(curve2, strategy=strategy)
+        expected = np.asfortranarray([[0.5], [0.5]])
+        self.assertEqual(intersections, expected)
+        reduced = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        self.assertEqual(curve1._reduced_nodes, reduced)
+        self.assertFalse(curve1._reduced_nodes.flags.writeable)
+
+    @unittest.mock.patch(
+        "bezier._algebraic_intersection.all_intersections",
+        return_value=(np.empty((2, 0), order="F"), False),
+    )
+    def test_intersect_algebraic_not_frozen(self, all_intersections):
+        from bezier import _py_intersection_helpers
+
+        # A degree-elevated line, which is **not** reduced.
+        nodes1 = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, 0.5, 1.0]])
+        curve1 = self._make_one(nodes1, 2)
+        nodes2 = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        curve2 = self._make_one(nodes2, 1)
+        strategy = _py_intersection_helpers.IntersectionStrategy.ALGEBRAIC
+        intersections = curve1.intersect(curve2, strategy=strategy)
+        self.assertEqual(intersections.shape, (2, 0))
+        all_intersections.assert_called_once_with(curve1._nodes, curve2._nodes)
+        self.assertIsNone(curve1._reduced_nodes)
+
+    def test_intersect_frozen(self):
+        self._intersect_helper(frozen=True)
+
     def test_intersect_at_boundary(self):
         nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, -0.25, 0.0]])
         curve = self._make_one(nodes, 2)
@@ -232,7 +509,7 @@ class TestCurve(utils.NumPyTestCase):
         expected = np.asfortranarray([[1.0], [0.0]])
         self.assertEqual(result, expected)
 
-    def _intersect_helper(self, **kwargs):
+    def _intersect_helper(self, frozen=False, **kwargs):
         # NOTE: ``nodes1`` is a specialization of [0, 0], [1/2, 1], [1, 1]
         #       onto the interval [1/4, 1] and ``nodes`` is a specialization
         #       of [0, 1], [1/2, 1], [1, 0] onto the interval [0, 3/4].
@@ -240,11 +517,11 @@ class TestCurve(utils.NumPyTestCase):
         nodes_left = np.asfortranarray(
             [[0.25, 0.625, 1.0], [0.4375, 1.0, 1.0]]
         )
-        left = self._make_one(nodes_left, 2)
+        left = self._make_one(nodes_left, 2, frozen=frozen)
         nodes_right = np.asfortranarray(
             [[0.0, 0.375, 0.75], [1.0, 1.0, 0.4375]]
         )
-        right = self._make_one(nodes_right, 2)
+        right = self._make_one(nodes_right, 2, frozen=frozen)
         result = left.intersect(right, **kwargs)
         expected = np.asfortranarray([[1.0], [2.0]]) / 3.0
         self.assertTrue(
@@ -257,6 +534,28 @@ class TestCurve(utils.NumPyTestCase):
     def test_intersect_no_verify(self):
         self._intersect_helper(_verify=False)
 
+    def test_intersect_workspace(self):
+        from bezier import curve
+
+        self._intersect_helper(workspace=curve.IntersectionWorkspace())
+
+    def test_intersect_cached(self):
+        from bezier import _geometric_intersection
+        from bezier import intersection_cache
+
+        intersection_cache.configure(cache_size=4)
+        self.addCleanup(intersection_cache.configure, cache_size=None)
+        patch = unittest.mock.patch(
+            "bezier._geometric_intersection.all_intersections",
+            wraps=_geometric_intersection.all_intersections,
+        )
+        with patch as all_intersections:
+            self._intersect_helper()
+            self._intersect_helper()
+        all_intersections.assert_called_once()
+        info = intersection_cache.get_cache().cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
     def test_intersect_non_curve(self):
         nodes = np.asfortranarray([[0.0, 0.5, 1.0], [0.0, -0.25, 0.0]])
         curve = self._make_one(nodes, 2)
@@ -323,6 +622,84 @@ class TestCurve(utils.NumPyTestCase):
         result = curve.locate(point)
         self.assertEqual(result, s_val)
 
+    def test_locate_frozen(self):
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 5.0], [0.0, 1.0, -1.0, 1.0]]
+        )
+        curve = self._make_one(nodes, 3, frozen=True)
+        point = curve.evaluate(0.75)
+        self.assertEqual(curve.locate(point), 0.75)
+        patch = unittest.mock.patch("bezier._curve_helpers.locate_point")
+        with patch as locate_point:
+            outside = np.asfortranarray([[6.0], [0.0]])
+            self.assertIsNone(curve.locate(outside))
+        locate_point.assert_not_called()
+
+    def test_locate_multi_wrong_shape(self):
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        curve = self._make_one(nodes, 1)
+        points = np.asfortranarray([[0.0, 1.0, 2.0]])
+        with self.assertRaises(ValueError):
+            curve.locate_multi(points)
+        with self.assertRaises(ValueError):
+            curve.locate_multi(np.asfortranarray([0.0, 1.0]))
+
+    def test_flatten(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        vertices, s_vals = curve.flatten(0.0625)
+        expected = np.asfortranarray(
+            [[0.0, 0.5, 1.0, 1.5, 2.0], [0.0, 0.75, 1.0, 0.75, 0.0]]
+        )
+        self.assertEqual(vertices, expected)
+        self.assertEqual(
+            s_vals, np.asfortranarray([0.0, 0.25, 0.5, 0.75, 1.0])
+        )
+
+    def test_flatten_frozen(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        curve = self._make_one(nodes, 2, frozen=True)
+        vertices, s_vals = curve.flatten(0.0625)
+        self.assertEqual(vertices.shape, (2, 5))
+        self.assertEqual(curve._linearization_error, 1.0)
+        # Within the (cached) linearization error, only the endpoints are
+        # needed.
+        vertices, s_vals = curve.flatten(1.0)
+        expected = np.asfortranarray([[0.0, 2.0], [0.0, 0.0]])
+        self.assertEqual(vertices, expected)
+        self.assertTrue(vertices.flags.writeable)
+        self.assertEqual(s_vals, np.asfortranarray([0.0, 1.0]))
+
+    def test_flatten_bad_tolerance(self):
+        curve = self._make_one(self.ZEROS, 1)
+        with self.assertRaises(ValueError) as exc_info:
+            curve.flatten(-1.0)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Tolerance must be positive", -1.0))
+        with self.assertRaises(ValueError):
+            curve.flatten(np.nan)
+
+    def test_locate_multi(self):
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 5.0], [0.0, 1.0, -1.0, 1.0]]
+        )
+        curve = self._make_one(nodes, 3)
+        s_vals = np.asfortranarray([0.75, 0.25, 0.0])
+        points = curve.evaluate_multi(s_vals)
+        points = np.asfortranarray(np.hstack([points, [[0.0], [2.0]]]))
+        result = curve.locate_multi(points)
+        self.assertEqual(result[:3], s_vals)
+        self.assertTrue(np.isnan(result[3]))
+
+    def test_locate_multi_c_order(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        curve = self._make_one(nodes, 2)
+        points = np.ascontiguousarray([[0.5, 1.0], [0.375, 0.5]])
+        self.assertFalse(points.flags.f_contiguous)
+        result = curve.locate_multi(points)
+        self.assertEqual(result, np.asfortranarray([0.25, 0.5]))
+
     @unittest.skipIf(sympy is None, "SymPy not installed")
     def test_to_symbolic(self):
         nodes = np.asfortranarray([[3, 3, 4, 6], [3, 3, 3, 0]])
@@ -368,3 +745,450 @@ class TestCurve(utils.NumPyTestCase):
                 1,
             ),
         )
+
+
+class Test_evaluate_curves(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, s_vals):
+        from bezier import curve
+
+        return curve.evaluate_curves(nodes, s_vals)
+
+    def test_it(self):
+        nodes = [
+            [[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]],
+            [[1.0, 1.0, 1.0], [0.0, 1.0, 2.0]],
+        ]
+        s_vals = np.asfortranarray([0.0, 0.5, 1.0])
+        result = self._call_function_under_test(nodes, s_vals)
+        expected = np.asfortranarray(
+            [
+                [[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]],
+                [[1.0, 1.0, 1.0], [0.0, 1.0, 2.0]],
+            ]
+        )
+        self.assertEqual(result, expected)
+
+    def test_s_vals_list(self):
+        nodes = np.asfortranarray([[[0.0, 4.0], [2.0, 0.0]]])
+        result = self._call_function_under_test(nodes, [0.25, 1])
+        expected = np.asfortranarray([[[1.0, 4.0], [1.5, 0.0]]])
+        self.assertEqual(result, expected)
+
+    def test_sample_plan(self):
+        from bezier import curve
+
+        nodes = np.asfortranarray(
+            [[[0.0, 1.0], [0.0, 2.0]], [[4.0, 2.0], [1.0, 1.0]]]
+        )
+        plan = curve.SamplePlan(1, [0.0, 0.5, 1.0])
+        result = self._call_function_under_test(nodes, plan)
+        expected = np.asfortranarray(
+            [
+                [[0.0, 0.5, 1.0], [0.0, 1.0, 2.0]],
+                [[4.0, 3.0, 2.0], [1.0, 1.0, 1.0]],
+            ]
+        )
+        self.assertEqual(result, expected)
+
+    def test_wrong_dimension(self):
+        nodes = np.zeros((2, 2), order="F")
+        s_vals = np.asfortranarray([0.5])
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(nodes, s_vals)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Nodes must be 3-dimensional, not", 2))
+
+
+class Test_flatten_curves(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, tolerance):
+        from bezier import curve
+
+        return curve.flatten_curves(nodes, tolerance)
+
+    def test_it(self):
+        nodes = [
+            [[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]],
+            [[0.0, 1.0, 2.0], [1.0, 1.0, 1.0]],
+        ]
+        vertices, s_vals, offsets = self._call_function_under_test(nodes, 0.25)
+        expected = np.asfortranarray(
+            [[0.0, 1.0, 2.0, 0.0, 2.0], [0.0, 1.0, 0.0, 1.0, 1.0]]
+        )
+        self.assertEqual(vertices, expected)
+        self.assertEqual(s_vals, np.asfortranarray([0.0, 0.5, 1.0, 0.0, 1.0]))
+        self.assertEqual(offsets.tolist(), [0, 3, 5])
+
+    def test_no_curves(self):
+        nodes = np.empty((0, 3, 4), order="F")
+        vertices, s_vals, offsets = self._call_function_under_test(nodes, 0.25)
+        self.assertEqual(vertices.shape, (3, 0))
+        self.assertEqual(s_vals.shape, (0,))
+        self.assertEqual(offsets.tolist(), [0])
+
+    def test_bad_tolerance(self):
+        nodes = np.zeros((1, 2, 3), order="F")
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(nodes, 0.0)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Tolerance must be positive", 0.0))
+
+    def test_wrong_dimension(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(np.zeros((2, 3), order="F"), 0.25)
+
+
+class Test_curve_lengths(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes, **kwargs):
+        from bezier import curve
+
+        return curve.curve_lengths(nodes, **kwargs)
+
+    def test_it(self):
+        from bezier import curve
+
+        nodes = [
+            [[0.0, 0.5, 1.0], [0.0, 1.0, 0.0]],
+            [[0.0, 3.0, 6.0], [0.0, 4.0, 8.0]],
+        ]
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result.shape, (2,))
+        expected = curve.Curve.from_nodes(nodes[0]).length
+        self.assertAlmostEqual(result[0], expected, delta=1e-10)
+        self.assertAlmostEqual(result[1], 10.0, delta=1e-14)
+
+    def test_no_curves(self):
+        nodes = np.empty((0, 2, 3), order="F")
+        result = self._call_function_under_test(nodes)
+        self.assertEqual(result.shape, (0,))
+
+    def test_bad_rtol(self):
+        nodes = np.zeros((1, 2, 3), order="F")
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(nodes, rtol=-1.0)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Relative tolerance must be positive", -1.0)
+        )
+
+    def test_nan_rtol(self):
+        nodes = np.zeros((1, 2, 3), order="F")
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(nodes, rtol=np.nan)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args[0], "Relative tolerance must be positive")
+        self.assertTrue(np.isnan(exc_args[1]))
+
+    def test_wrong_dimension(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(np.zeros((2, 3), order="F"))
+
+
+class Test_intersect_pairs(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes_list_a, nodes_list_b, **kwargs):
+        from bezier import curve
+
+        return curve.intersect_pairs(nodes_list_a, nodes_list_b, **kwargs)
+
+    def test_it(self):
+        from bezier import curve
+
+        nodes_list_a = [
+            [[0.0, 2.0, 4.0], [0.0, 4.0, 0.0]],
+            np.asfortranarray([[0.0, 1.0], [0.0, 1.0]]),
+        ]
+        nodes_list_b = [
+            [[0.0, 4.0], [1.5, 1.5]],
+            np.asfortranarray([[3.0, 4.0], [3.0, 3.0]]),
+        ]
+        result = self._call_function_under_test(nodes_list_a, nodes_list_b)
+        self.assertIsInstance(result, curve.PairIntersections)
+        self.assertEqual(result.offsets.tolist(), [0, 2, 2])
+        self.assertEqual(result.s_vals.tolist(), [0.25, 0.75])
+        self.assertEqual(result.t_vals.tolist(), [0.25, 0.75])
+        self.assertEqual(result.coincident.tolist(), [False, False])
+        self.assertEqual(result.errors, [])
+
+    def test_with_workspace(self):
+        from bezier import curve
+
+        workspace = curve.IntersectionWorkspace()
+        nodes1 = [[-3.0, 5.0], [0.0, 0.0]]
+        nodes2 = [[-7.0, 9.0, -7.0, 9.0], [-9.0, 13.0, -13.0, 9.0]]
+        result = self._call_function_under_test(
+            [nodes1], [nodes2], workspace=workspace
+        )
+        self.assertEqual(result.offsets.tolist(), [0, 3])
+        self.assertEqual(result.s_vals.tolist(), [0.5, 0.375, 0.625])
+
+    def test_errors(self):
+        nodes_list_a = [[[12.0, -4.0, -4.0], [4.0, -4.0, 4.0]]]
+        nodes_list_b = [[[6.0, -2.0, -2.0], [1.0, -1.0, 1.0]]]
+        result = self._call_function_under_test(nodes_list_a, nodes_list_b)
+        self.assertEqual(result.offsets.tolist(), [0, 0])
+        self.assertEqual(result.s_vals.shape, (0,))
+        self.assertEqual(len(result.errors), 1)
+        index, exc = result.errors[0]
+        self.assertEqual(index, 0)
+        self.assertIsInstance(exc, NotImplementedError)
+
+    def test_no_pairs(self):
+        result = self._call_function_under_test([], [])
+        self.assertEqual(result.offsets.tolist(), [0])
+        self.assertEqual(result.s_vals.shape, (0,))
+        self.assertEqual(result.coincident.shape, (0,))
+
+    def test_length_mismatch(self):
+        nodes = [[0.0, 1.0], [0.0, 1.0]]
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test([nodes], [])
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Lists of nodes must have the same length", 1, 0)
+        )
+
+    def test_non_planar(self):
+        nodes1 = [[0.0, 1.0], [0.0, 1.0]]
+        nodes2 = [[0.0, 1.0], [0.0, 1.0], [0.0, 1.0]]
+        with self.assertRaises(NotImplementedError) as exc_info:
+            self._call_function_under_test([nodes1], [nodes2])
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args,
+            (
+                "Intersection only implemented in 2D",
+                "Curve",
+                0,
+                "has dimension",
+                3,
+            ),
+        )
+
+    def test_no_nodes(self):
+        nodes = [[0.0, 1.0], [0.0, 1.0]]
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(
+                [nodes, np.empty((2, 0), order="F")], [nodes, nodes]
+            )
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Curve", 1, "has no nodes"))
+
+
+class TestSamplePlan(utils.NumPyTestCase):
+    @staticmethod
+    def _get_target_class():
+        from bezier import curve
+
+        return curve.SamplePlan
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        s_vals = [0.0, 0.5, 1.0]
+        plan = self._make_one(1, s_vals)
+        self.assertEqual(plan.degree, 1)
+        self.assertEqual(plan.s_vals, np.asfortranarray(s_vals))
+        expected = np.asfortranarray([[1.0, 0.5, 0.0], [0.0, 0.5, 1.0]])
+        self.assertEqual(plan.basis, expected)
+        # Plans are shared, so the cached arrays are read-only.
+        self.assertFalse(plan.s_vals.flags.writeable)
+        self.assertFalse(plan.basis.flags.writeable)
+
+    def test_constructor_negative_degree(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(-1, [0.5])
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Degree must be non-negative", -1))
+
+    def test_constructor_wrong_dimension(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(2, [[0.5]])
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Parameters must be 1-dimensional, not", 2)
+        )
+
+    def test___repr__(self):
+        plan = self._make_one(3, np.linspace(0.0, 1.0, 64))
+        self.assertEqual(repr(plan), "<SamplePlan (degree=3, num_vals=64)>")
+
+    def test_evaluate(self):
+        plan = self._make_one(2, [0.0, 0.5, 1.0])
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        result = plan.evaluate(nodes)
+        expected = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        self.assertEqual(result, expected)
+
+    def test_evaluate_stacked(self):
+        from bezier import _py_curve_helpers
+
+        s_vals = np.linspace(0.0, 1.0, 9)
+        plan = self._make_one(4, s_vals)
+        nodes = utils.get_random_nodes(shape=(3, 2, 5), seed=1019, num_bits=8)
+        result = plan.evaluate(nodes)
+        self.assertEqual(result.shape, (3, 2, 9))
+        self.assertTrue(result.flags.f_contiguous)
+        expected = _py_curve_helpers.evaluate_curves_multi(nodes, s_vals)
+        self.assertTrue(np.allclose(result, expected, atol=0.0, rtol=1e-14))
+
+    def test_evaluate_degree_mismatch(self):
+        plan = self._make_one(2, [0.5])
+        nodes = np.asfortranarray([[0.0, 1.0], [1.0, 0.0]])
+        with self.assertRaises(ValueError) as exc_info:
+            plan.evaluate(nodes)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("A degree 2 plan should have 3 nodes, not 2.",)
+        )
+
+    def test_evaluate_wrong_dimension(self):
+        plan = self._make_one(0, [0.5])
+        with self.assertRaises(ValueError) as exc_info:
+            plan.evaluate(np.zeros((1,), order="F"))
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Nodes must be 2- or 3-dimensional, not", 1)
+        )
+
+
+class Test__plot_plan(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(degree, num_pts):
+        from bezier import curve
+
+        return curve._plot_plan(degree, num_pts)
+
+    def test_it(self):
+        plan = self._call_function_under_test(2, 5)
+        self.assertEqual(plan.degree, 2)
+        self.assertEqual(plan.s_vals, np.linspace(0.0, 1.0, 5))
+
+    def test_cached(self):
+        plan = self._call_function_under_test(3, 16)
+        self.assertIs(self._call_function_under_test(3, 16), plan)
+        self.assertIsNot(self._call_function_under_test(3, 17), plan)
+
+    def test_bounded(self):
+        from bezier import curve
+
+        plan = self._call_function_under_test(1, 2)
+        # Filling the cache with other plans evicts the oldest one.
+        for num_pts in range(3, 3 + curve._PLOT_PLAN_CACHE_SIZE):
+            self._call_function_under_test(1, num_pts)
+        self.assertIsNot(self._call_function_under_test(1, 2), plan)
+
+
+class TestArcLengthTable(utils.NumPyTestCase):
+    # B(s) = [2 s + s^2, 0], so L(s) = 2 s + s^2.
+    QUADRATIC = np.asfortranarray([[0.0, 1.0, 3.0], [0.0, 0.0, 0.0]])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import curve
+
+        return curve.ArcLengthTable
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        table = self._make_one(self.QUADRATIC)
+        self.assertAlmostEqual(table.length, 3.0, delta=1e-15)
+        self.assertEqual(table.breakpoints[0], 0.0)
+        self.assertEqual(table.breakpoints[-1], 1.0)
+        self.assertEqual(table.cumulative_lengths[0], 0.0)
+        self.assertEqual(table.cumulative_lengths[-1], table.length)
+        # Tables are cached, so the arrays are read-only.
+        self.assertFalse(table.breakpoints.flags.writeable)
+        self.assertFalse(table.cumulative_lengths.flags.writeable)
+
+    def test_constructor_no_nodes(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(np.empty((2, 0), order="F"))
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Curve should have at least one node.",))
+
+    def test_constructor_matches_length(self):
+        from bezier import _py_curve_helpers
+
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, -1.0, 0.5], [0.0, 2.0, 2.0, -1.0]]
+        )
+        table = self._make_one(nodes)
+        expected = _py_curve_helpers.compute_length(nodes)
+        self.assertAlmostEqual(table.length, expected, delta=1e-13)
+
+    def test___repr__(self):
+        table = self._make_one(self.QUADRATIC)
+        self.assertEqual(repr(table), "<ArcLengthTable (num_intervals=2)>")
+
+    def test_s_at_length(self):
+        table = self._make_one(self.QUADRATIC)
+        lengths = np.asfortranarray([[0.0, 1.25], [3.0, 0.5625]])
+        s_vals = table.s_at_length(lengths)
+        expected = np.asfortranarray([[0.0, 0.5], [1.0, 0.25]])
+        self.assertEqual(s_vals.shape, (2, 2))
+        self.assertTrue(np.allclose(s_vals, expected, atol=1e-15, rtol=0.0))
+        # The endpoints are exact.
+        self.assertEqual(s_vals[0, 0], 0.0)
+        self.assertEqual(s_vals[1, 0], 1.0)
+
+    def test_s_at_length_equally_spaced(self):
+        nodes = np.asfortranarray(
+            [[0.0, 1.0, -1.0, 0.5], [0.0, 2.0, 2.0, -1.0]]
+        )
+        table = self._make_one(nodes)
+        lengths = np.linspace(0.0, table.length, 17)
+        s_vals = table.s_at_length(lengths)
+        self.assertTrue(np.all(np.diff(s_vals) > 0.0))
+        round_trip = table.length_between(0.0, s_vals)
+        self.assertTrue(np.allclose(round_trip, lengths, atol=1e-13))
+
+    def test_s_at_length_round_off(self):
+        table = self._make_one(self.QUADRATIC)
+        # The exact length may be slightly more than the computed one.
+        s_vals = table.s_at_length([np.nextafter(table.length, 4.0)])
+        self.assertEqual(s_vals, np.asfortranarray([1.0]))
+
+    def test_s_at_length_out_of_range(self):
+        table = self._make_one(self.QUADRATIC)
+        with self.assertRaises(ValueError):
+            table.s_at_length([-0.5])
+        with self.assertRaises(ValueError):
+            table.s_at_length(3.5)
+
+    def test_s_at_length_zero_length(self):
+        nodes = np.asfortranarray([[1.0, 1.0], [2.0, 2.0]])
+        table = self._make_one(nodes)
+        self.assertEqual(table.length, 0.0)
+        self.assertEqual(table.s_at_length([0.0]), np.asfortranarray([0.0]))
+
+    def test_length_between(self):
+        table = self._make_one(self.QUADRATIC)
+        result = table.length_between([0.0, 0.25, 1.0], [0.5, 0.5, 0.0])
+        expected = np.asfortranarray([1.25, 0.6875, -3.0])
+        self.assertTrue(np.allclose(result, expected, atol=1e-15, rtol=0.0))
+
+    def test_length_between_scalar(self):
+        table = self._make_one(self.QUADRATIC)
+        result = table.length_between(0.0, 1.0)
+        self.assertEqual(result.shape, ())
+        self.assertAlmostEqual(float(result), 3.0, delta=1e-15)
@@ -0,0 +1,246 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class TestCurveArray(utils.NumPyTestCase):
+    NODES = np.asfortranarray(
+        [
+            [[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]],
+            [[1.0, 1.0, 1.0], [0.0, 1.0, 2.0]],
+            [[0.0, 3.0, 6.0], [0.0, 4.0, 8.0]],
+        ]
+    )
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import curve_array
+
+        return curve_array.CurveArray
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _curve_nodes(self, index):
+        return np.asfortranarray(self.NODES[index, :, :])
+
+    def test_constructor(self):
+        curves = self._make_one(self.NODES)
+        self.assertEqual(len(curves), 3)
+        self.assertEqual(curves.degree, 2)
+        self.assertEqual(curves.dimension, 2)
+        self.assertIsNot(curves._nodes, self.NODES)
+        self.assertEqual(curves._nodes, self.NODES)
+
+    def test_constructor_no_copy(self):
+        curves = self._make_one(self.NODES, copy=False)
+        self.assertIs(curves._nodes, self.NODES)
+
+    def test_constructor_wrong_dimension(self):
+        with self.assertRaises(ValueError):
+            self._make_one(self.NODES[0, :, :])
+
+    def test_constructor_no_nodes(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(np.empty((2, 2, 0), order="F"))
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Curves must have at least one node",))
+
+    def test_from_curves(self):
+        import bezier
+
+        klass = self._get_target_class()
+        curves = klass.from_curves(
+            bezier.Curve(self._curve_nodes(index), degree=2)
+            for index in range(3)
+        )
+        self.assertIsInstance(curves, klass)
+        self.assertEqual(curves._nodes, self.NODES)
+
+    def test_from_curves_empty(self):
+        klass = self._get_target_class()
+        with self.assertRaises(ValueError) as exc_info:
+            klass.from_curves([])
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("At least one curve is required",))
+
+    def test_from_curves_mismatch(self):
+        import bezier
+
+        klass = self._get_target_class()
+        curve1 = bezier.Curve(self._curve_nodes(0), degree=2)
+        curve2 = bezier.Curve.from_nodes([[0.0, 1.0], [0.0, 1.0]])
+        with self.assertRaises(ValueError) as exc_info:
+            klass.from_curves([curve1, curve2])
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args,
+            (
+                "Curves must have the same degree and dimension",
+                "Curve",
+                1,
+                "has nodes with shape",
+                (2, 2),
+            ),
+        )
+
+    def test___repr__(self):
+        curves = self._make_one(self.NODES)
+        self.assertEqual(
+            repr(curves), "<CurveArray (num_curves=3, degree=2, dimension=2)>"
+        )
+
+    def test___getitem___integer(self):
+        import bezier
+
+        curves = self._make_one(self.NODES)
+        curve = curves[1]
+        self.assertIsInstance(curve, bezier.Curve)
+        self.assertEqual(curve.degree, 2)
+        self.assertEqual(curve._nodes, self._curve_nodes(1))
+        self.assertEqual(curves[-1]._nodes, self._curve_nodes(2))
+
+    def test___getitem___slice(self):
+        klass = self._get_target_class()
+        curves = self._make_one(self.NODES)
+        sub_array = curves[::2]
+        self.assertIsInstance(sub_array, klass)
+        self.assertEqual(len(sub_array), 2)
+        self.assertEqual(
+            sub_array._nodes, np.asfortranarray(self.NODES[::2, :, :])
+        )
+        sub_array = curves[np.asarray([2, 0])]
+        self.assertEqual(
+            sub_array._nodes, np.asfortranarray(self.NODES[[2, 0], :, :])
+        )
+
+    def test___iter__(self):
+        curves = self._make_one(self.NODES)
+        all_nodes = [curve._nodes for curve in curves]
+        self.assertEqual(len(all_nodes), 3)
+        for index, nodes in enumerate(all_nodes):
+            self.assertEqual(nodes, self._curve_nodes(index))
+
+    def test_nodes(self):
+        curves = self._make_one(self.NODES)
+        nodes = curves.nodes
+        self.assertEqual(nodes, self.NODES)
+        self.assertIsNot(nodes, curves._nodes)
+
+    def test_nodes_view(self):
+        curves = self._make_one(self.NODES)
+        view = curves.nodes_view
+        self.assertIs(view.base, curves._nodes)
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(curves._nodes.flags.writeable)
+
+    def test_evaluate(self):
+        curves = self._make_one(self.NODES)
+        result = curves.evaluate(0.5)
+        expected = np.asfortranarray([[1.0, 1.0], [1.0, 1.0], [3.0, 4.0]])
+        self.assertEqual(np.asfortranarray(result), expected)
+
+    def test_evaluate_multi(self):
+        import bezier
+
+        curves = self._make_one(self.NODES)
+        s_vals = np.asfortranarray([0.0, 0.25, 1.0])
+        result = curves.evaluate_multi(s_vals)
+        self.assertEqual(result.shape, (3, 2, 3))
+        for index in range(3):
+            curve = bezier.Curve(self._curve_nodes(index), degree=2)
+            self.assertEqual(
+                np.asfortranarray(result[index, :, :]),
+                curve.evaluate_multi(s_vals),
+            )
+
+    def test_evaluate_multi_plan(self):
+        import bezier
+
+        curves = self._make_one(self.NODES)
+        plan = bezier.SamplePlan(2, [0.0, 0.5, 1.0])
+        result = curves.evaluate_multi(plan)
+        expected = plan.evaluate(self.NODES)
+        self.assertEqual(result, expected)
+
+    def test_lengths(self):
+        curves = self._make_one(self.NODES)
+        lengths = curves.lengths()
+        self.assertEqual(lengths.shape, (3,))
+        self.assertAlmostEqual(lengths[1], 2.0, places=12)
+        self.assertAlmostEqual(lengths[2], 10.0, places=12)
+
+    def test_bboxes(self):
+        curves = self._make_one(self.NODES)
+        expected = np.asfortranarray(
+            [[0.0, 2.0, 0.0, 2.0], [1.0, 1.0, 0.0, 2.0], [0.0, 6.0, 0.0, 8.0]]
+        )
+        self.assertEqual(curves.bboxes(), expected)
+
+    def test_bboxes_non_planar(self):
+        curves = self._make_one(np.zeros((2, 3, 2), order="F"))
+        with self.assertRaises(NotImplementedError):
+            curves.bboxes()
+
+    def test_subdivide(self):
+        import bezier
+
+        klass = self._get_target_class()
+        curves = self._make_one(self.NODES)
+        left, right = curves.subdivide()
+        self.assertIsInstance(left, klass)
+        self.assertIsInstance(right, klass)
+        for index in range(3):
+            curve = bezier.Curve(self._curve_nodes(index), degree=2)
+            expected_left, expected_right = curve.subdivide()
+            self.assertEqual(left[index]._nodes, expected_left._nodes)
+            self.assertEqual(right[index]._nodes, expected_right._nodes)
+
+    def test_specialize(self):
+        import bezier
+
+        curves = self._make_one(self.NODES)
+        result = curves.specialize(-0.25, 0.75)
+        self.assertTrue(result._nodes.flags.f_contiguous)
+        for index in range(3):
+            curve = bezier.Curve(self._curve_nodes(index), degree=2)
+            expected = curve.specialize(-0.25, 0.75)
+            self.assertTrue(np.allclose(result[index]._nodes, expected._nodes))
+
+    def test_elevate(self):
+        import bezier
+
+        curves = self._make_one(self.NODES)
+        result = curves.elevate()
+        self.assertEqual(result.degree, 3)
+        self.assertEqual(result._nodes.shape, (3, 2, 4))
+        for index in range(3):
+            curve = bezier.Curve(self._curve_nodes(index), degree=2)
+            expected = curve.elevate()
+            self.assertTrue(np.allclose(result[index]._nodes, expected._nodes))
+
+
+class Test_top_level(unittest.TestCase):
+    def test_export(self):
+        import bezier
+        from bezier import curve_array
+
+        self.assertIs(bezier.CurveArray, curve_array.CurveArray)
@@ -0,0 +1,177 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import itertools
+import unittest.mock
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class TestCurveCollection(utils.NumPyTestCase):
+    NODES1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+    NODES2 = np.asfortranarray([[0.0, 2.0], [0.75, 0.75]])
+    NODES3 = np.asfortranarray([[5.0, 6.0], [5.0, 6.0]])
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import curve_collection
+
+        return curve_collection.CurveCollection
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def _make_curves(self):
+        import bezier
+
+        return [
+            bezier.Curve(self.NODES1, 2),
+            bezier.Curve(self.NODES2, 1),
+            bezier.Curve(self.NODES3, 1),
+        ]
+
+    def test_constructor(self):
+        curves = self._make_curves()
+        collection = self._make_one(iter(curves))
+        self.assertEqual(collection.curves, tuple(curves))
+        self.assertEqual(len(collection), 3)
+        expected = np.asfortranarray(
+            [
+                [0.0, 2.0, 0.0, 2.0],
+                [0.0, 2.0, 0.75, 0.75],
+                [5.0, 6.0, 5.0, 6.0],
+            ]
+        )
+        self.assertEqual(collection.bboxes, expected)
+
+    def test_constructor_wrong_dimension(self):
+        import bezier
+
+        nodes = np.asfortranarray([[0.0, 1.0], [0.0, 1.0], [0.0, 1.0]])
+        curves = [bezier.Curve(self.NODES1, 2), bezier.Curve(nodes, 1)]
+        with self.assertRaises(NotImplementedError) as exc_info:
+            self._make_one(curves)
+
+        exc_args = exc_info.exception.args
+        expected = (
+            "Only planar (2D) curves can be indexed",
+            "Curve",
+            1,
+            "has dimension",
+            3,
+        )
+        self.assertEqual(exc_args, expected)
+
+    def test___repr__(self):
+        collection = self._make_one(self._make_curves())
+        self.assertEqual(repr(collection), "<CurveCollection (num_curves=3)>")
+
+    def test_bboxes_copy(self):
+        collection = self._make_one(self._make_curves())
+        bboxes = collection.bboxes
+        bboxes[:, :] = 0.0
+        self.assertEqual(collection.bboxes[2, 0], 5.0)
+
+    def test_query(self):
+        collection = self._make_one(self._make_curves())
+        self.assertEqual(collection.query((1.0, 5.5, 0.25, 0.75)), [0, 1])
+        self.assertEqual(collection.query((5.5, 7.0, 5.5, 7.0)), [2])
+        self.assertEqual(collection.query((3.0, 4.0, 0.0, 10.0)), [])
+
+    def test_query_touching(self):
+        collection = self._make_one(self._make_curves())
+        self.assertEqual(collection.query((2.0, 5.0, 2.0, 5.0)), [0, 2])
+
+    def test_query_empty(self):
+        collection = self._make_one([])
+        self.assertEqual(collection.query((0.0, 1.0, 0.0, 1.0)), [])
+
+    def test_candidate_pairs(self):
+        collection = self._make_one(self._make_curves())
+        self.assertEqual(collection.candidate_pairs(), [(0, 1)])
+
+    def test_candidate_pairs_matches_brute_force(self):
+        import bezier
+
+        nodes = utils.get_random_nodes(shape=(2, 40), seed=3377, num_bits=4)
+        curves = [
+            bezier.Curve(np.asfortranarray(segment), 1)
+            for segment in np.hsplit(nodes, 20)
+        ]
+        collection = self._make_one(curves)
+        bboxes = collection.bboxes
+        expected = [
+            (index1, index2)
+            for index1, index2 in itertools.combinations(range(20), 2)
+            if (
+                bboxes[index1, 0] <= bboxes[index2, 1]
+                and bboxes[index2, 0] <= bboxes[index1, 1]
+                and bboxes[index1, 2] <= bboxes[index2, 3]
+                and bboxes[index2, 2] <= bboxes[index1, 3]
+            )
+        ]
+        self.assertNotEqual(expected, [])
+        self.assertEqual(collection.candidate_pairs(), expected)
+
+    def test_intersect_all(self):
+        collection = self._make_one(self._make_curves())
+        result = collection.intersect_all()
+        self.assertEqual(len(result), 1)
+        index1, index2, st_vals = result[0]
+        self.assertEqual((index1, index2), (0, 1))
+        expected = np.asfortranarray([[0.25, 0.75], [0.25, 0.75]])
+        self.assertEqual(st_vals, expected)
+
+    def test_intersect_all_skips_misses(self):
+        import bezier
+
+        # The bounding boxes overlap, but the curves do not intersect.
+        nodes1 = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 2.0, 0.0]])
+        nodes2 = np.asfortranarray([[0.0, 2.0], [1.5, 1.5]])
+        curves = [bezier.Curve(nodes1, 2), bezier.Curve(nodes2, 1)]
+        collection = self._make_one(curves)
+        self.assertEqual(collection.candidate_pairs(), [(0, 1)])
+        self.assertEqual(collection.intersect_all(), [])
+
+    def test_intersect_all_algebraic(self):
+        from bezier import curve_collection
+
+        strategy = curve_collection.IntersectionStrategy.ALGEBRAIC
+        collection = self._make_one(self._make_curves())
+        result = collection.intersect_all(strategy=strategy)
+        self.assertEqual(len(result), 1)
+        index1, index2, st_vals = result[0]
+        self.assertEqual((index1, index2), (0, 1))
+        self.assertTrue(np.allclose(st_vals, [[0.25, 0.75], [0.25, 0.75]]))
+
+    def test_intersect_all_clipping(self):
+        from bezier import curve_collection
+
+        strategy = curve_collection.IntersectionStrategy.CLIPPING
+        collection = self._make_one(self._make_curves())
+        result = collection.intersect_all(strategy=strategy)
+        self.assertEqual(len(result), 1)
+        index1, index2, st_vals = result[0]
+        self.assertEqual((index1, index2), (0, 1))
+        self.assertTrue(np.allclose(st_vals, [[0.25, 0.75], [0.25, 0.75]]))
+
+    def test_intersect_all_bad_strategy(self):
+        collection = self._make_one(self._make_curves())
+        strategy = unittest.mock.sentinel.bad_strategy
+        with self.assertRaises(ValueError) as exc_info:
+            collection.intersect_all(strategy=strategy)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Unexpected strategy.", strategy))
@@ -114,6 +114,63 @@ class TestCurvedPolygon(utils.NumPyTestCase):
         curved_poly = self._make_default()
         self.assertEqual(curved_poly.area, 2.0 / 3.0)
 
+    def _make_lazy(self):
+        klass = self._get_target_class()
+        edge_info = ((0, 0.0, 1.0), (1, 0.0, 1.0))
+        return klass(
+            metadata=edge_info, _all_edge_nodes=(self.NODES0, self.NODES1)
+        )
+
+    def test_constructor_lazy(self):
+        curved_poly = self._make_lazy()
+        self.assertEqual(curved_poly.num_sides, 2)
+        self.assertEqual(curved_poly._metadata, ((0, 0.0, 1.0), (1, 0.0, 1.0)))
+        self.assertIsNone(curved_poly._edge_curves)
+        self.assertEqual(repr(curved_poly), "<CurvedPolygon (num_sides=2)>")
+
+    def test__edges_lazy(self):
+        import bezier
+
+        klass = self._get_target_class()
+        edge_info = ((0, 0.5, 1.0), (1, 0.0, 1.0), (0, 0.0, 0.5))
+        curved_poly = klass(
+            metadata=edge_info, _all_edge_nodes=(self.NODES0, self.NODES1)
+        )
+        edges = curved_poly._edges
+        self.assertIs(curved_poly._edges, edges)
+        self.assertIsNone(curved_poly._all_edge_nodes)
+        self.assertEqual(len(edges), 3)
+        for edge in edges:
+            self.assertIsInstance(edge, bezier.Curve)
+            self.assertEqual(edge.degree, 2)
+        expected = np.asfortranarray([[0.5, 0.75, 1.0], [-0.5, -0.5, 0.0]])
+        self.assertEqual(edges[0]._nodes, expected)
+        self.assertEqual(edges[1]._nodes, self.NODES1)
+        expected = np.asfortranarray([[0.0, 0.25, 0.5], [0.0, -0.5, -0.5]])
+        self.assertEqual(edges[2]._nodes, expected)
+        # The materialized edges are re-used for the area.
+        self.assertEqual(curved_poly.area, 2.0 / 3.0)
+
+    def test_area_lazy(self):
+        curved_poly = self._make_lazy()
+        self.assertEqual(curved_poly.area, 2.0 / 3.0)
+        # Computing the area does not create the edges.
+        self.assertIsNone(curved_poly._edge_curves)
+
+    @unittest.mock.patch("bezier._plot_helpers.new_axis")
+    @unittest.mock.patch("bezier._plot_helpers.add_patch")
+    def test_plot_lazy(self, add_patch_mock, new_axis_mock):
+        ax = unittest.mock.Mock(spec=[])
+        new_axis_mock.return_value = ax
+        curved_poly = self._make_lazy()
+        pts_per_edge = 16
+        result = curved_poly.plot(pts_per_edge)
+        self.assertIs(result, ax)
+        self.assertIsNotNone(curved_poly._edge_curves)
+        add_patch_mock.assert_called_once_with(
+            ax, None, pts_per_edge, *curved_poly._edge_curves
+        )
+
     def test___repr__(self):
         curved_poly = self._make_default()
         self.assertEqual(repr(curved_poly), "<CurvedPolygon (num_sides=2)>")
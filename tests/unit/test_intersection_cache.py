@@ -0,0 +1,263 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+import unittest.mock
+
+import numpy as np
+
+from tests.unit import utils
+
+
+class TestIntersectionCache(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from bezier import intersection_cache
+
+        return intersection_cache.IntersectionCache
+
+    def _make_one(self, *args, **kwargs):
+        klass = self._get_target_class()
+        return klass(*args, **kwargs)
+
+    def test_constructor(self):
+        cache = self._make_one(3)
+        self.assertEqual(cache.maxsize, 3)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(tuple(cache.cache_info()), (0, 0, 0, 3, 0))
+
+    def test_constructor_bad_size(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._make_one(0)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(exc_args, ("Cache size must be positive", 0))
+
+    def test___repr__(self):
+        cache = self._make_one(3)
+        cache.put("a", 1)
+        self.assertEqual(
+            repr(cache), "<IntersectionCache (maxsize=3, currsize=1)>"
+        )
+
+    def test_get_and_put(self):
+        cache = self._make_one(3)
+        self.assertIsNone(cache.get("a"))
+        cache.put("a", 1)
+        self.assertEqual(cache.get("a"), 1)
+        info = cache.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.currsize, 1)
+
+    def test_eviction(self):
+        cache = self._make_one(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        # Using "a" makes "b" the least recently used.
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        info = cache.cache_info()
+        self.assertEqual(info.evictions, 1)
+        self.assertEqual(info.currsize, 2)
+
+    def test_clear(self):
+        cache = self._make_one(2)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(tuple(cache.cache_info()), (0, 0, 0, 2, 0))
+
+
+class Test_configure(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(**kwargs):
+        from bezier import intersection_cache
+
+        return intersection_cache.configure(**kwargs)
+
+    def tearDown(self):
+        self._call_function_under_test(cache_size=None)
+
+    def test_enable(self):
+        from bezier import intersection_cache
+
+        self._call_function_under_test(cache_size=5)
+        cache = intersection_cache.get_cache()
+        self.assertIsInstance(cache, intersection_cache.IntersectionCache)
+        self.assertEqual(cache.maxsize, 5)
+        # Re-configuring replaces the cache.
+        self._call_function_under_test(cache_size=5)
+        self.assertIsNot(intersection_cache.get_cache(), cache)
+
+    def test_disable(self):
+        from bezier import intersection_cache
+
+        self._call_function_under_test(cache_size=5)
+        self._call_function_under_test(cache_size=0)
+        self.assertIsNone(intersection_cache.get_cache())
+        self._call_function_under_test(cache_size=5)
+        self._call_function_under_test()
+        self.assertIsNone(intersection_cache.get_cache())
+
+    def test_negative(self):
+        with self.assertRaises(ValueError):
+            self._call_function_under_test(cache_size=-1)
+
+    def test_top_level(self):
+        import bezier
+        from bezier import intersection_cache
+
+        self.assertIs(bezier.configure, intersection_cache.configure)
+
+
+class Test_shape_key(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(shape):
+        from bezier import intersection_cache
+
+        return intersection_cache.shape_key(shape)
+
+    def test_it(self):
+        import bezier
+
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0], [0.0, 1.0, 0.0]])
+        curve1 = bezier.Curve(nodes, degree=2)
+        curve2 = bezier.Curve(nodes, degree=2, frozen=True)
+        key = self._call_function_under_test(curve1)
+        self.assertEqual(key[:2], (2, (2, 3)))
+        self.assertEqual(self._call_function_under_test(curve2), key)
+        # The nodes are hashed in (Fortran) memory order.
+        transposed = bezier.Curve(np.asfortranarray(nodes.T).T, degree=2)
+        self.assertEqual(self._call_function_under_test(transposed), key)
+        nodes[1, 1] = 2.0
+        curve3 = bezier.Curve(nodes, degree=2)
+        self.assertNotEqual(self._call_function_under_test(curve3), key)
+
+
+class Test_curve_intersections(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(cache, curve1, curve2, strategy, compute):
+        from bezier import intersection_cache
+
+        return intersection_cache.curve_intersections(
+            cache, curve1, curve2, strategy, compute
+        )
+
+    @staticmethod
+    def _make_curves():
+        import bezier
+
+        nodes1 = np.asfortranarray([[0.0, 1.0], [0.0, 1.0]])
+        nodes2 = np.asfortranarray([[0.0, 1.0, 2.0], [1.0, 0.0, 1.0]])
+        return (
+            bezier.Curve(nodes1, degree=1),
+            bezier.Curve(nodes2, degree=2),
+        )
+
+    def test_symmetric(self):
+        from bezier import intersection_cache
+
+        cache = intersection_cache.IntersectionCache(4)
+        curve1, curve2 = self._make_curves()
+        strategy = unittest.mock.sentinel.strategy
+        st_vals = np.asfortranarray([[0.25, 0.5], [0.75, 0.125]])
+        compute = unittest.mock.Mock(return_value=st_vals)
+        result1 = self._call_function_under_test(
+            cache, curve1, curve2, strategy, compute
+        )
+        self.assertIs(result1, st_vals)
+        compute.assert_called_once_with()
+        # Both orders are served by the same entry.
+        result2 = self._call_function_under_test(
+            cache, curve1, curve2, strategy, compute
+        )
+        self.assertEqual(result2, st_vals)
+        self.assertIsNot(result2, st_vals)
+        self.assertTrue(result2.flags.writeable)
+        result3 = self._call_function_under_test(
+            cache, curve2, curve1, strategy, compute
+        )
+        self.assertEqual(result3, np.asfortranarray(st_vals[::-1, :]))
+        compute.assert_called_once_with()
+        self.assertEqual(tuple(cache.cache_info()), (2, 1, 0, 4, 1))
+
+    def test_reversed_first(self):
+        from bezier import intersection_cache
+
+        cache = intersection_cache.IntersectionCache(4)
+        curve1, curve2 = self._make_curves()
+        strategy = unittest.mock.sentinel.strategy
+        st_vals = np.asfortranarray([[0.25], [0.75]])
+        compute = unittest.mock.Mock(return_value=st_vals)
+        self._call_function_under_test(
+            cache, curve2, curve1, strategy, compute
+        )
+        result = self._call_function_under_test(
+            cache, curve1, curve2, unittest.mock.sentinel.strategy, None
+        )
+        self.assertEqual(result, np.asfortranarray([[0.75], [0.25]]))
+
+    def test_strategy_in_key(self):
+        from bezier import intersection_cache
+
+        cache = intersection_cache.IntersectionCache(4)
+        curve1, curve2 = self._make_curves()
+        compute = unittest.mock.Mock(return_value=np.empty((2, 0)))
+        self._call_function_under_test(
+            cache, curve1, curve2, unittest.mock.sentinel.first, compute
+        )
+        self._call_function_under_test(
+            cache, curve1, curve2, unittest.mock.sentinel.second, compute
+        )
+        self.assertEqual(compute.call_count, 2)
+        self.assertEqual(len(cache), 2)
+
+
+class Test_triangle_intersections(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(
+        cache, triangle1, triangle2, strategy, compute
+    ):
+        from bezier import intersection_cache
+
+        return intersection_cache.triangle_intersections(
+            cache, triangle1, triangle2, strategy, compute
+        )
+
+    def test_it(self):
+        import bezier
+        from bezier import intersection_cache
+
+        cache = intersection_cache.IntersectionCache(4)
+        nodes1 = np.asfortranarray([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        triangle1 = bezier.Triangle(nodes1, degree=1)
+        nodes2 = np.asfortranarray([[0.5, 0.5, -0.5], [0.0, 1.0, 1.0]])
+        triangle2 = bezier.Triangle(nodes2, degree=1)
+        strategy = unittest.mock.sentinel.strategy
+        value = ([], None, ())
+        compute = unittest.mock.Mock(return_value=value)
+        for _ in range(2):
+            result = self._call_function_under_test(
+                cache, triangle1, triangle2, strategy, compute
+            )
+            self.assertIs(result, value)
+        compute.assert_called_once_with()
+        # The order of the triangles is part of the key.
+        self._call_function_under_test(
+            cache, triangle2, triangle1, strategy, compute
+        )
+        self.assertEqual(compute.call_count, 2)
@@ -0,0 +1,342 @@
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import numpy as np
+
+from tests.unit import utils
+
+
+# Two triangles splitting the unit square along ``x + y = 1``.
+UNIT_SQUARE = np.asfortranarray(
+    [
+        [[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]],
+        [[1.0, 1.0, 0.0], [0.0, 1.0, 1.0]],
+    ]
+)
+# Two triangles splitting ``[1/2, 3/2] x [0, 1]`` along ``x = y + 1/2``.
+SHIFTED_SQUARE = np.asfortranarray(
+    [
+        [[0.5, 1.5, 1.5], [0.0, 0.0, 1.0]],
+        [[0.5, 1.5, 0.5], [0.0, 1.0, 1.0]],
+    ]
+)
+# A pair of quadratic triangles with an unsupported intersection.
+FAILURE_NODES1 = np.asfortranarray(
+    [
+        [
+            [12.0, -4.0, -4.0, 12.0, 0.0, 10.0],
+            [4.0, -4.0, 4.0, 14.0, 10.0, 20.0],
+        ]
+    ]
+)
+FAILURE_NODES2 = np.asfortranarray(
+    [
+        [
+            [6.0, -2.0, -2.0, 6.0, 1.0, 5.0],
+            [1.0, -1.0, 1.0, 8.0, 6.0, 12.0],
+        ]
+    ]
+)
+
+
+class TestMeshOverlay(utils.NumPyTestCase):
+    @staticmethod
+    def _overlay(mesh_a, mesh_b):
+        from bezier import mesh_overlay
+
+        return mesh_overlay.overlay(mesh_a, mesh_b)
+
+    def test___repr__(self):
+        result = self._overlay(UNIT_SQUARE, SHIFTED_SQUARE)
+        self.assertEqual(repr(result), "<MeshOverlay (num_regions=4)>")
+
+    def test_pairs(self):
+        result = self._overlay(UNIT_SQUARE, SHIFTED_SQUARE)
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result.pairs.dtype, np.intc)
+        self.assertEqual(
+            result.pairs.tolist(), [[0, 0], [0, 1], [1, 0], [1, 1]]
+        )
+
+    def test_areas(self):
+        result = self._overlay(UNIT_SQUARE, SHIFTED_SQUARE)
+        expected = np.asfortranarray([0.0625, 0.0625, 0.0625, 0.3125])
+        self.assertTrue(np.allclose(result.areas, expected))
+
+    def test_errors(self):
+        result = self._overlay(FAILURE_NODES1, FAILURE_NODES2)
+        self.assertEqual(len(result), 0)
+        self.assertEqual(result.areas.shape, (0,))
+        errors = result.errors
+        self.assertEqual(len(errors), 1)
+        index1, index2, exc = errors[0]
+        self.assertEqual((index1, index2), (0, 0))
+        self.assertIsInstance(exc, NotImplementedError)
+
+    def test_intersections(self):
+        from bezier import triangle
+
+        result = self._overlay(UNIT_SQUARE, SHIFTED_SQUARE)
+        intersections = result.intersections
+        self.assertIsInstance(
+            intersections, triangle.TrianglePairIntersections
+        )
+        self.assertEqual(len(intersections), 4)
+
+    def test_region(self):
+        import bezier
+
+        result = self._overlay(UNIT_SQUARE, SHIFTED_SQUARE)
+        for index in range(len(result)):
+            region = result.region(index)
+            self.assertIsInstance(region, bezier.CurvedPolygon)
+            self.assertAlmostEqual(
+                region.area, result.areas[index], delta=1e-14
+            )
+
+    def test_region_contained(self):
+        import bezier
+
+        nodes = np.asfortranarray([[[0.25, 0.5, 0.25], [0.25, 0.25, 0.5]]])
+        result = self._overlay(UNIT_SQUARE, nodes)
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result.pairs.tolist(), [[0, 0]])
+        region = result.region(0)
+        self.assertIsInstance(region, bezier.Triangle)
+        self.assertEqual(region._nodes, np.asfortranarray(nodes[0, :, :]))
+        self.assertEqual(result.areas.tolist(), [0.03125])
+
+
+class Test__mesh_nodes(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(mesh):
+        from bezier import mesh_overlay
+
+        return mesh_overlay._mesh_nodes(mesh)
+
+    def test_array(self):
+        nodes, degree = self._call_function_under_test(UNIT_SQUARE)
+        self.assertEqual(nodes, UNIT_SQUARE)
+        self.assertEqual(degree, 1)
+
+    def test_nested_sequence(self):
+        nodes, degree = self._call_function_under_test(UNIT_SQUARE.tolist())
+        self.assertEqual(nodes, UNIT_SQUARE)
+        self.assertEqual(degree, 1)
+
+    def test_triangles(self):
+        import bezier
+
+        mesh = [
+            bezier.Triangle(UNIT_SQUARE[index, :, :], degree=1)
+            for index in range(2)
+        ]
+        nodes, degree = self._call_function_under_test(iter(mesh))
+        self.assertEqual(nodes, UNIT_SQUARE)
+        self.assertEqual(degree, 1)
+
+    def test_empty_sequence(self):
+        nodes, degree = self._call_function_under_test([])
+        self.assertEqual(nodes.shape, (0, 2, 3))
+        self.assertTrue(nodes.flags.f_contiguous)
+        self.assertEqual(degree, 1)
+
+    def test_triangles_mismatch(self):
+        import bezier
+
+        mesh = [
+            bezier.Triangle(UNIT_SQUARE[0, :, :], degree=1),
+            bezier.Triangle(FAILURE_NODES1[0, :, :], degree=2),
+        ]
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(mesh)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args,
+            (
+                "Triangles must have the same degree and dimension",
+                "Triangle",
+                1,
+                "has nodes with shape",
+                (2, 6),
+            ),
+        )
+
+
+class Test__bboxes(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(nodes):
+        from bezier import mesh_overlay
+
+        return mesh_overlay._bboxes(nodes)
+
+    def test_it(self):
+        result = self._call_function_under_test(SHIFTED_SQUARE)
+        expected = np.asfortranarray(
+            [[0.5, 1.5, 0.0, 1.0], [0.5, 1.5, 0.0, 1.0]]
+        )
+        self.assertEqual(result, expected)
+
+
+class Test__bbox_candidates(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(bboxes1, bboxes2):
+        from bezier import mesh_overlay
+
+        return mesh_overlay._bbox_candidates(bboxes1, bboxes2)
+
+    def test_it(self):
+        bboxes1 = np.asfortranarray(
+            [[0.0, 1.0, 0.0, 1.0], [2.0, 3.0, 0.0, 1.0], [0.0, 1.0, 5.0, 6.0]]
+        )
+        bboxes2 = np.asfortranarray(
+            [
+                [2.5, 4.0, 0.5, 2.0],
+                [0.5, 2.0, 0.5, 0.75],
+                # Touches the first box at a corner.
+                [1.0, 2.0, 1.0, 2.0],
+                [10.0, 11.0, 0.0, 1.0],
+            ]
+        )
+        result = self._call_function_under_test(bboxes1, bboxes2)
+        self.assertEqual(result.dtype, np.intc)
+        self.assertTrue(result.flags.f_contiguous)
+        self.assertEqual(
+            result.tolist(), [[0, 1], [0, 2], [1, 0], [1, 1], [1, 2]]
+        )
+
+    def test_disjoint(self):
+        bboxes1 = np.asfortranarray([[0.0, 1.0, 0.0, 1.0]])
+        bboxes2 = np.asfortranarray([[0.0, 1.0, 2.0, 3.0]])
+        result = self._call_function_under_test(bboxes1, bboxes2)
+        self.assertEqual(result.shape, (0, 2))
+        self.assertEqual(result.dtype, np.intc)
+
+
+class Test__hull_candidates(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(nodes1, nodes2, pairs):
+        from bezier import mesh_overlay
+
+        return mesh_overlay._hull_candidates(nodes1, nodes2, pairs)
+
+    def test_it(self):
+        nodes2 = np.asfortranarray(
+            [
+                # The bounding box overlaps the first triangle in
+                # ``UNIT_SQUARE`` but the convex hull does not.
+                [[1.0, 0.625, 1.0], [1.0, 1.0, 0.625]],
+                [[0.25, 0.5, 0.25], [0.25, 0.25, 0.5]],
+            ]
+        )
+        pairs = np.asfortranarray([[0, 0], [0, 1], [1, 0], [1, 1]])
+        pairs = pairs.astype(np.intc, order="F")
+        result = self._call_function_under_test(UNIT_SQUARE, nodes2, pairs)
+        self.assertEqual(result.dtype, np.intc)
+        self.assertEqual(result.tolist(), [[0, 1], [1, 0]])
+
+    def test_empty(self):
+        pairs = np.empty((0, 2), dtype=np.intc, order="F")
+        result = self._call_function_under_test(
+            UNIT_SQUARE, UNIT_SQUARE, pairs
+        )
+        self.assertEqual(result.shape, (0, 2))
+
+
+class Test__regions(unittest.TestCase):
+    @staticmethod
+    def _call_function_under_test(intersections):
+        from bezier import mesh_overlay
+
+        return mesh_overlay._regions(intersections)
+
+    def test_it(self):
+        from bezier import triangle
+
+        nodes = np.asfortranarray([[[0.25, 0.5, 0.25], [0.25, 0.25, 0.5]]])
+        intersections = triangle.intersect_triangle_pairs(
+            UNIT_SQUARE,
+            np.concatenate([SHIFTED_SQUARE, nodes]),
+            [[0, 2], [1, 0]],
+        )
+        region_pairs, region_offsets, areas = self._call_function_under_test(
+            intersections
+        )
+        self.assertEqual(region_pairs.tolist(), [0, 1])
+        self.assertEqual(region_offsets.tolist(), [0, 0])
+        self.assertTrue(np.allclose(areas, [0.03125, 0.0625]))
+
+
+class Test_overlay(utils.NumPyTestCase):
+    @staticmethod
+    def _call_function_under_test(mesh_a, mesh_b):
+        from bezier import mesh_overlay
+
+        return mesh_overlay.overlay(mesh_a, mesh_b)
+
+    def test_total_area(self):
+        result = self._call_function_under_test(UNIT_SQUARE, SHIFTED_SQUARE)
+        self.assertAlmostEqual(np.sum(result.areas), 0.5, delta=1e-14)
+
+    def test_triangles(self):
+        import bezier
+
+        mesh_a = [
+            bezier.Triangle(UNIT_SQUARE[index, :, :], degree=1)
+            for index in range(2)
+        ]
+        mesh_b = [
+            bezier.Triangle(SHIFTED_SQUARE[index, :, :], degree=1)
+            for index in range(2)
+        ]
+        result = self._call_function_under_test(mesh_a, mesh_b)
+        self.assertEqual(len(result), 4)
+        self.assertAlmostEqual(np.sum(result.areas), 0.5, delta=1e-14)
+
+    def test_disjoint(self):
+        far_away = UNIT_SQUARE + 10.0
+        result = self._call_function_under_test(UNIT_SQUARE, far_away)
+        self.assertEqual(len(result), 0)
+        self.assertEqual(len(result.intersections), 0)
+        self.assertEqual(result.errors, [])
+
+    def test_non_planar(self):
+        with self.assertRaises(NotImplementedError):
+            self._call_function_under_test(
+                np.zeros((1, 3, 3), order="F"), UNIT_SQUARE
+            )
+
+    def test_empty_mesh(self):
+        empty = np.empty((0, 2, 3), order="F")
+        for mesh_a, mesh_b in ((empty, UNIT_SQUARE), (UNIT_SQUARE, empty)):
+            result = self._call_function_under_test(mesh_a, mesh_b)
+            self.assertEqual(len(result), 0)
+            self.assertEqual(result.pairs.shape, (0, 2))
+            self.assertEqual(result.areas.shape, (0,))
+            self.assertEqual(result.errors, [])
+
+    def test_empty_sequence(self):
+        quadratic = np.concatenate([FAILURE_NODES1, FAILURE_NODES2])
+        for mesh_a, mesh_b in (([], quadratic), (quadratic, []), ([], [])):
+            result = self._call_function_under_test(mesh_a, mesh_b)
+            self.assertEqual(len(result), 0)
+            self.assertEqual(result.pairs.shape, (0, 2))
+            self.assertEqual(result.areas.shape, (0,))
+
+    def test_top_level(self):
+        import bezier
+        from bezier import mesh_overlay
+
+        self.assertIs(bezier.overlay, mesh_overlay.overlay)
@@ -101,6 +101,31 @@ class TestTriangle(utils.NumPyTestCase):
         self.assertTrue(np.all(triangle._nodes == nodes))
         self.assertIsNone(triangle._edges)
 
+    def test_from_buffer_factory(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]])
+        klass = self._get_target_class()
+        triangle = klass.from_buffer(nodes.ravel(order="F"), dimension=2)
+        self.assertIsInstance(triangle, klass)
+        self.assertEqual(triangle._degree, 1)
+        self.assertEqual(triangle._dimension, 2)
+        self.assertEqual(triangle._nodes, nodes)
+        self.assertTrue(np.shares_memory(triangle._nodes, nodes))
+        self.assertFalse(triangle.frozen)
+        triangle = klass.from_buffer(nodes, frozen=True)
+        self.assertTrue(triangle.frozen)
+        self.assertTrue(np.shares_memory(triangle._nodes, nodes))
+        self.assertTrue(nodes.flags.writeable)
+
+    def test_from_buffer_factory_invalid_degree(self):
+        klass = self._get_target_class()
+        with self.assertRaises(ValueError) as exc_info:
+            klass.from_buffer(np.zeros((2, 4), order="F"))
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("A degree 1 triangle should have 3 nodes, not 4.",)
+        )
+
     def test_from_nodes_factory_invalid_degree(self):
         klass = self._get_target_class()
         messages = {
@@ -234,6 +259,22 @@ class TestTriangle(utils.NumPyTestCase):
             np.asfortranarray(np.vstack([p003, p102, p201, p300]).T),
         )
 
+    def test_from_nodes_factory_frozen(self):
+        klass = self._get_target_class()
+        triangle = klass.from_nodes(self.UNIT_TRIANGLE, frozen=True)
+        self.assertTrue(triangle.frozen)
+        self.assertFalse(triangle._nodes.flags.writeable)
+        self.assertEqual(triangle._nodes, self.UNIT_TRIANGLE)
+
+    def test__get_bbox(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        expected = (-3.0, 2.0, 0.0, 3.0)
+        self.assertEqual(triangle._get_bbox(), expected)
+        self.assertIsNone(triangle._bbox)
+        frozen = self._make_one(self.QUADRATIC, 2, frozen=True)
+        self.assertEqual(frozen._get_bbox(), expected)
+        self.assertEqual(frozen._bbox, expected)
+
     def test__get_edges(self):
         triangle = self._make_one_no_slots(self.ZEROS, 1)
         compute_mock = unittest.mock.Mock(
@@ -253,6 +294,12 @@ class TestTriangle(utils.NumPyTestCase):
         self.assertIs(triangle._get_edges(), unittest.mock.sentinel.edges)
         compute_mock.assert_not_called()
 
+    def test__get_edges_frozen(self):
+        triangle = self._make_one(self.UNIT_TRIANGLE, 1, frozen=True)
+        for edge in triangle._get_edges():
+            self.assertTrue(edge._frozen)
+            self.assertFalse(edge._nodes.flags.writeable)
+
     def test_edges_property(self):
         nodes = self.UNIT_TRIANGLE
         triangle = self._make_one(nodes, 1)
@@ -307,6 +354,30 @@ class TestTriangle(utils.NumPyTestCase):
         with self.assertRaises(ValueError):
             klass._verify_barycentric(0.875, 0.25, -0.125)
 
+    def test__verify_barycentric_multi(self):
+        klass = self._get_target_class()
+        # Valid inside and boundary.
+        param_vals = np.asfortranarray(
+            [[0.5, 0.25, 0.25], [0.5, 0.0, 0.5], [0.0, 0.0, 1.0]]
+        )
+        self.assertIsNone(klass._verify_barycentric_multi(param_vals))
+        # Invalid sum.
+        param_vals = np.asfortranarray(
+            [[0.5, 0.25, 0.25], [0.5, 0.5, 0.5], [-0.5, 0.75, 0.75]]
+        )
+        with self.assertRaises(ValueError) as exc_info:
+            klass._verify_barycentric_multi(param_vals)
+        expected_args = ("Weights do not sum to 1", 0.5, 0.5, 0.5)
+        self.assertEqual(exc_info.exception.args, expected_args)
+        # Invalid lambda3.
+        param_vals = np.asfortranarray(
+            [[0.875, 0.25, -0.125], [0.5, 0.5, 0.5]]
+        )
+        with self.assertRaises(ValueError) as exc_info:
+            klass._verify_barycentric_multi(param_vals)
+        expected_args = ("Weights must be positive", 0.875, 0.25, -0.125)
+        self.assertEqual(exc_info.exception.args, expected_args)
+
     def test_evaluate_barycentric(self):
         triangle = self._make_one(self.UNIT_TRIANGLE, 1, copy=False)
         lambda_vals = (0.25, 0.0, 0.75)
@@ -382,6 +453,20 @@ class TestTriangle(utils.NumPyTestCase):
         with self.assertRaises(ValueError):
             klass._verify_cartesian(0.75, 0.75)
 
+    def test__verify_cartesian_multi(self):
+        klass = self._get_target_class()
+        # Valid inside and boundary.
+        param_vals = np.asfortranarray([[0.25, 0.25], [0.0, 1.0], [0.5, 0.5]])
+        self.assertIsNone(klass._verify_cartesian_multi(param_vals))
+        # Invalid (1 - s - t), then invalid s.
+        param_vals = np.asfortranarray(
+            [[0.25, 0.25], [0.75, 0.75], [-0.5, 0.75]]
+        )
+        with self.assertRaises(ValueError) as exc_info:
+            klass._verify_cartesian_multi(param_vals)
+        expected_args = ("Point lies outside reference triangle", 0.75, 0.75)
+        self.assertEqual(exc_info.exception.args, expected_args)
+
     def test_evaluate_cartesian(self):
         s_t_vals = (0.125, 0.125)
         nodes = np.asfortranarray([[1.0, 2.0, 1.0], [1.0, 1.5, 2.75]])
@@ -513,6 +598,24 @@ class TestTriangle(utils.NumPyTestCase):
         expected_d = np.asfortranarray([[0.0, 0.5, 0.0], [0.5, 0.5, 1.0]])
         self.assertEqual(triangle_d._nodes, expected_d)
 
+    def test_subdivide_levels(self):
+        triangle = self._make_one(self.UNIT_TRIANGLE, 1)
+        pieces = triangle.subdivide(levels=2)
+        self.assertEqual(pieces.shape, (16, 2, 3))
+        # The second sub-triangle of sub-triangle D.
+        expected = np.asfortranarray([[0.25, 0.0, 0.25], [0.75, 0.75, 0.5]])
+        self.assertEqual(np.asfortranarray(pieces[13]), expected)
+
+    def test_subdivide_levels_negative(self):
+        triangle = self._make_one(self.UNIT_TRIANGLE, 1)
+        with self.assertRaises(ValueError) as exc_info:
+            triangle.subdivide(levels=-2)
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args, ("Number of levels must be non-negative", -2)
+        )
+
     def test__compute_valid_bad_dimension(self):
         nodes = np.zeros((3, 6), order="F")
         triangle = self._make_one(nodes, 2)
@@ -603,8 +706,10 @@ class TestTriangle(utils.NumPyTestCase):
         expected = {
             "_nodes": self.UNIT_TRIANGLE,
             "_dimension": 2,
+            "_frozen": False,
             "_degree": 1,
             "_edges": None,
+            "_bbox": None,
         }
         self.assertEqual(props_dict, expected)
         # Check that modifying ``props_dict`` won't modify ``triangle``.
@@ -618,6 +723,18 @@ class TestTriangle(utils.NumPyTestCase):
         self.assertEqual(s, 0.5)
         self.assertEqual(t, 0.25)
 
+    def test_locate_frozen(self):
+        triangle = self._make_one(self.QUADRATIC, 2, frozen=True)
+        point = triangle.evaluate_cartesian(0.5, 0.25)
+        self.assertEqual(triangle.locate(point), (0.5, 0.25))
+        patch = unittest.mock.patch(
+            "bezier._triangle_intersection.locate_point"
+        )
+        with patch as locate_point:
+            outside = np.asfortranarray([[0.5], [-0.5]])
+            self.assertIsNone(triangle.locate(outside))
+        locate_point.assert_not_called()
+
     def test_locate_no_verify(self):
         triangle = self._make_one(self.QUADRATIC, 2)
         s = 0.125
@@ -647,13 +764,54 @@ class TestTriangle(utils.NumPyTestCase):
         with self.assertRaises(ValueError):
             triangle.locate(point2)
 
-    def _basic_intersect_helper(self, **kwargs):
+    def test_locate_multi(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        point1 = triangle.evaluate_cartesian(0.5, 0.25)
+        point2 = triangle.evaluate_cartesian(0.125, 0.75)
+        points = np.asfortranarray(
+            np.hstack([point1, [[-1.0], [-1.0]], point2])
+        )
+        st_vals = triangle.locate_multi(points)
+        self.assertEqual(st_vals.shape, (3, 2))
+        self.assertEqual(st_vals[0, 0], 0.5)
+        self.assertEqual(st_vals[0, 1], 0.25)
+        self.assertTrue(np.all(np.isnan(st_vals[1, :])))
+        self.assertEqual(st_vals[2, 0], 0.125)
+        self.assertEqual(st_vals[2, 1], 0.75)
+
+    def test_locate_multi_c_order(self):
+        triangle = self._make_one(self.UNIT_TRIANGLE, 1)
+        points = np.ascontiguousarray([[0.25, 0.5], [0.5, 0.125]])
+        self.assertFalse(points.flags.f_contiguous)
+        st_vals = triangle.locate_multi(points)
+        expected = np.asfortranarray([[0.25, 0.5], [0.5, 0.125]])
+        self.assertEqual(st_vals, expected)
+
+    def test_locate_multi_bad_dimension(self):
+        nodes = np.asfortranarray([[0.0, 1.0, 2.0]])
+        triangle = self._make_one(nodes, 1)
+        with self.assertRaises(NotImplementedError):
+            triangle.locate_multi(None)
+
+    def test_locate_multi_bad_points(self):
+        triangle = self._make_one(self.QUADRATIC, 2)
+        points1 = np.asfortranarray([0.0, 1.0])
+        points2 = np.asfortranarray([[0.0, 1.0, 2.0]])
+        with self.assertRaises(ValueError):
+            triangle.locate_multi(points1)
+        with self.assertRaises(ValueError) as exc_info:
+            triangle.locate_multi(points2)
+        exc_args = exc_info.exception.args
+        self.assertEqual(len(exc_args), 1)
+        self.assertIn("1 x 3", exc_args[0])
+
+    def _basic_intersect_helper(self, frozen=False, **kwargs):
         import bezier
 
-        triangle1 = self._make_one(self.UNIT_TRIANGLE, 1)
+        triangle1 = self._make_one(self.UNIT_TRIANGLE, 1, frozen=frozen)
         # Similar triangle with overlapping square.
         nodes = np.asfortranarray([[0.5, 0.5, -0.5], [0.0, 1.0, 1.0]])
-        triangle2 = self._make_one(nodes, 1)
+        triangle2 = self._make_one(nodes, 1, frozen=frozen)
         intersections = triangle1.intersect(triangle2, **kwargs)
         self.assertEqual(len(intersections), 1)
         intersection = intersections[0]
@@ -704,6 +862,35 @@ class TestTriangle(utils.NumPyTestCase):
         intersections = triangle1.intersect(triangle2)
         self.assertEqual(intersections, [])
 
+    def test_intersect_disjoint_bbox_frozen(self):
+        from bezier import _py_intersection_helpers
+
+        triangle1 = self._make_one(self.UNIT_TRIANGLE, 1, frozen=True)
+        nodes = np.asfortranarray([[4.0, 5.0, 4.0], [0.0, 0.0, 1.0]])
+        triangle2 = self._make_one(nodes, 1)
+        strategies = (
+            _py_intersection_helpers.IntersectionStrategy.GEOMETRIC,
+            _py_intersection_helpers.IntersectionStrategy.ALGEBRAIC,
+        )
+        patch = unittest.mock.patch(
+            "bezier._triangle_intersection.geometric_intersect"
+        )
+        with patch as geometric_intersect:
+            for strategy in strategies:
+                intersections = triangle1.intersect(
+                    triangle2, strategy=strategy
+                )
+                self.assertEqual(intersections, [])
+                intersections = triangle2.intersect(
+                    triangle1, strategy=strategy
+                )
+                self.assertEqual(intersections, [])
+        geometric_intersect.assert_not_called()
+        self.assertEqual(triangle1._bbox, (0.0, 1.0, 0.0, 1.0))
+
+    def test_intersect_frozen(self):
+        self._basic_intersect_helper(frozen=True)
+
     def test_intersect_tangent_bbox(self):
         triangle1 = self._make_one(self.UNIT_TRIANGLE, 1)
         nodes = np.asfortranarray([[0.0, 0.0, -1.0], [0.0, 1.0, 1.0]])
@@ -725,6 +912,37 @@ class TestTriangle(utils.NumPyTestCase):
         intersections = triangle1.intersect(triangle2)
         self.assertEqual(intersections, [triangle2])
 
+    def test_intersect_cached(self):
+        from bezier import _triangle_intersection
+        from bezier import intersection_cache
+
+        intersection_cache.configure(cache_size=4)
+        self.addCleanup(intersection_cache.configure, cache_size=None)
+        patch = unittest.mock.patch(
+            "bezier._triangle_intersection.geometric_intersect",
+            wraps=_triangle_intersection.geometric_intersect,
+        )
+        with patch as geometric_intersect:
+            self._basic_intersect_helper()
+            self._basic_intersect_helper()
+        geometric_intersect.assert_called_once()
+        info = intersection_cache.get_cache().cache_info()
+        self.assertEqual((info.hits, info.misses), (1, 1))
+
+    def test_intersect_cached_contained(self):
+        from bezier import intersection_cache
+
+        intersection_cache.configure(cache_size=4)
+        self.addCleanup(intersection_cache.configure, cache_size=None)
+        nodes = np.asfortranarray([[-1.0, 3.0, -1.0], [-1.0, -1.0, 3.0]])
+        for _ in range(2):
+            # The cached result refers to the current objects.
+            triangle1 = self._make_one(self.UNIT_TRIANGLE, 1)
+            triangle2 = self._make_one(nodes, 1)
+            intersections = triangle1.intersect(triangle2)
+            self.assertEqual(len(intersections), 1)
+            self.assertIs(intersections[0], triangle1)
+
     def test_intersect_non_triangle(self):
         triangle = self._make_one(self.UNIT_TRIANGLE, 1)
         with self.assertRaises(TypeError):
@@ -739,6 +957,67 @@ class TestTriangle(utils.NumPyTestCase):
         with self.assertRaises(NotImplementedError):
             triangle2.intersect(triangle1)
 
+    def test_intersection_area(self):
+        triangle1 = self._make_one(self.UNIT_TRIANGLE, 1)
+        nodes = np.asfortranarray([[0.5, 0.5, -0.5], [0.0, 1.0, 1.0]])
+        triangle2 = self._make_one(nodes, 1)
+        (intersection,) = triangle1.intersect(triangle2)
+        area = triangle1.intersection_area(triangle2)
+        self.assertIsInstance(area, float)
+        self.assertEqual(area, 0.25)
+        self.assertEqual(area, intersection.area)
+
+    def test_intersection_area_frozen(self):
+        triangle1 = self._make_one(self.UNIT_TRIANGLE, 1, frozen=True)
+        nodes = np.asfortranarray([[0.5, 1.5, 0.5], [0.0, 0.0, 1.0]])
+        triangle2 = self._make_one(nodes, 1, frozen=True)
+        self.assertEqual(triangle1.intersection_area(triangle2), 0.125)
+
+    def test_intersection_area_contained(self):
+        nodes = np.asfortranarray([[-1.0, 3.0, -1.0], [-1.0, -1.0, 3.0]])
+        triangle1 = self._make_one(self.UNIT_TRIANGLE, 1)
+        triangle2 = self._make_one(nodes, 1)
+        self.assertEqual(triangle1.intersection_area(triangle2), 0.5)
+        self.assertEqual(triangle2.intersection_area(triangle1), 0.5)
+
+    def test_intersection_area_disjoint(self):
+        triangle1 = self._make_one(self.UNIT_TRIANGLE, 1)
+        nodes = np.asfortranarray([[4.0, 5.0, 4.0], [0.0, 0.0, 1.0]])
+        triangle2 = self._make_one(nodes, 1)
+        self.assertEqual(triangle1.intersection_area(triangle2), 0.0)
+
+    def test_intersection_area_failure(self):
+        nodes1 = np.asfortranarray(
+            [
+                [12.0, -4.0, -4.0, 12.0, 0.0, 10.0],
+                [4.0, -4.0, 4.0, 14.0, 10.0, 20.0],
+            ]
+        )
+        nodes2 = np.asfortranarray(
+            [
+                [6.0, -2.0, -2.0, 6.0, 1.0, 5.0],
+                [1.0, -1.0, 1.0, 8.0, 6.0, 12.0],
+            ]
+        )
+        triangle1 = self._make_one(nodes1, 2)
+        triangle2 = self._make_one(nodes2, 2)
+        with self.assertRaises(NotImplementedError):
+            triangle1.intersection_area(triangle2)
+
+    def test_intersection_area_non_triangle(self):
+        triangle = self._make_one(self.UNIT_TRIANGLE, 1)
+        with self.assertRaises(TypeError):
+            triangle.intersection_area(object())
+
+    def test_intersection_area_unsupported_dimension(self):
+        triangle1 = self._make_one(self.UNIT_TRIANGLE, 1)
+        nodes2 = np.zeros((3, 3), order="F")
+        triangle2 = self._make_one(nodes2, 1)
+        with self.assertRaises(NotImplementedError):
+            triangle1.intersection_area(triangle2)
+        with self.assertRaises(NotImplementedError):
+            triangle2.intersection_area(triangle1)
+
     def test_elevate_linear(self):
         nodes = np.asfortranarray([[0.0, 2.0, -1.0], [0.0, 1.0, 2.0]])
         triangle = self._make_one(nodes, 1)
@@ -835,6 +1114,8 @@ class Test__make_intersection(utils.NumPyTestCase):
         self.assertIsInstance(result, bezier.CurvedPolygon)
         self.assertEqual(result._metadata, edge_info)
         self.assertEqual(result.num_sides, 4)
+        # The edges are only created when first accessed.
+        self.assertIsNone(result._edge_curves)
         # pylint: disable=unbalanced-tuple-unpacking
         edge0, edge1, edge2, edge3 = result._edges
         # pylint: enable=unbalanced-tuple-unpacking
@@ -850,3 +1131,233 @@ class Test__make_intersection(utils.NumPyTestCase):
         # Fourth edge.
         expected = np.asfortranarray([[0.0, 0.0], [0.25, 0.0]])
         self.assertEqual(edge3._nodes, expected)
+
+
+class TestTrianglePairIntersections(utils.NumPyTestCase):
+    NODES_A = np.asfortranarray(
+        [
+            [[0.0, 8.0, 0.0], [0.0, 0.0, 8.0]],
+            [[0.0, 5.0, 0.0], [0.0, 0.0, 5.0]],
+        ]
+    )
+    NODES_B = np.asfortranarray(
+        [
+            [[4.0, -4.0, 4.0], [5.0, 5.0, -3.0]],
+            [[2.0, 3.0, 2.0], [1.0, 1.0, 2.0]],
+            [[10.0, 11.0, 10.0], [10.0, 10.0, 11.0]],
+        ]
+    )
+
+    @staticmethod
+    def _get_target_class():
+        from bezier import triangle
+
+        return triangle.TrianglePairIntersections
+
+    @staticmethod
+    def _intersect(nodes_a, nodes_b, pairs):
+        from bezier import triangle
+
+        return triangle.intersect_triangle_pairs(nodes_a, nodes_b, pairs)
+
+    def _make_default(self):
+        pairs = [[0, 0], [1, 1], [0, 2], [0, 0]]
+        return self._intersect(self.NODES_A, self.NODES_B, pairs)
+
+    def test_constructor(self):
+        result = self._make_default()
+        self.assertIsInstance(result, self._get_target_class())
+        self.assertEqual(len(result), 4)
+        self.assertEqual(result.pairs.dtype, np.intc)
+        self.assertEqual(
+            result.pairs.tolist(), [[0, 0], [1, 1], [0, 2], [0, 0]]
+        )
+        self.assertEqual(result.pair_offsets.tolist(), [0, 1, 1, 1, 2])
+        self.assertEqual(result.polygon_offsets.tolist(), [0, 6, 12])
+        self.assertEqual(result.segments.shape, (12,))
+        self.assertEqual(result.contained.tolist(), [0, 2, 0, 0])
+        self.assertEqual(result.errors, [])
+
+    def test___repr__(self):
+        result = self._make_default()
+        self.assertEqual(
+            repr(result),
+            "<TrianglePairIntersections (num_pairs=4, num_polygons=2)>",
+        )
+
+    def test_intersection(self):
+        import bezier
+
+        result = self._make_default()
+        triangle1 = bezier.Triangle(self.NODES_A[0, :, :], degree=1)
+        triangle2 = bezier.Triangle(self.NODES_B[0, :, :], degree=1)
+        (expected,) = triangle1.intersect(triangle2)
+        (polygon,) = result.intersection(0)
+        self.assertIsInstance(polygon, bezier.CurvedPolygon)
+        self.assertEqual(polygon.num_sides, 6)  # pylint: disable=no-member
+        metadata = polygon._metadata  # pylint: disable=no-member
+        expected_metadata = expected._metadata  # pylint: disable=no-member
+        self.assertEqual(len(metadata), 6)
+        for edge_info, expected_info in zip(metadata, expected_metadata):
+            self.assertEqual(edge_info[0], expected_info[0])
+            self.assertTrue(
+                np.allclose(
+                    edge_info[1:], expected_info[1:], rtol=0.0, atol=1e-14
+                )
+            )
+        for edge, expected_edge in zip(polygon._edges, expected._edges):
+            self.assertTrue(np.allclose(edge._nodes, expected_edge._nodes))
+
+    def test_intersection_contained(self):
+        import bezier
+
+        result = self._make_default()
+        (triangle,) = result.intersection(1)
+        self.assertIsInstance(triangle, bezier.Triangle)
+        self.assertEqual(
+            triangle._nodes, np.asfortranarray(self.NODES_B[1, :, :])
+        )
+        result = self._intersect(self.NODES_B, self.NODES_A, [[1, 1]])
+        self.assertEqual(result.contained.tolist(), [1])
+        (triangle,) = result.intersection(0)
+        self.assertEqual(
+            triangle._nodes, np.asfortranarray(self.NODES_B[1, :, :])
+        )
+
+    def test_intersection_disjoint(self):
+        result = self._make_default()
+        self.assertEqual(result.intersection(2), [])
+
+    def test_intersection_failure(self):
+        nodes_a = [
+            [
+                [12.0, -4.0, -4.0, 12.0, 0.0, 10.0],
+                [4.0, -4.0, 4.0, 14.0, 10.0, 20.0],
+            ]
+        ]
+        nodes_b = [
+            [
+                [6.0, -2.0, -2.0, 6.0, 1.0, 5.0],
+                [1.0, -1.0, 1.0, 8.0, 6.0, 12.0],
+            ]
+        ]
+        result = self._intersect(nodes_a, nodes_b, [[0, 0]])
+        self.assertEqual(len(result.errors), 1)
+        index, exc = result.errors[0]
+        self.assertEqual(index, 0)
+        with self.assertRaises(NotImplementedError) as exc_info:
+            result.intersection(0)
+        self.assertIs(exc_info.exception, exc)
+
+    def test_areas(self):
+        result = self._make_default()
+        # NOTE: The overlap of the first pair is a hexagon with area 19.
+        self.assertTrue(np.allclose(result.areas, [19.0, 0.5, 0.0, 19.0]))
+        self.assertTrue(np.allclose(result.polygon_areas, [19.0, 19.0]))
+        for index in (0, 3):
+            (polygon,) = result.intersection(index)
+            self.assertAlmostEqual(
+                result.areas[index], polygon.area, delta=1e-12
+            )
+
+    def test_areas_cached(self):
+        from bezier import _triangle_intersection
+
+        result = self._make_default()
+        patch = unittest.mock.patch(
+            "bezier._triangle_intersection.intersection_areas",
+            wraps=_triangle_intersection.intersection_areas,
+        )
+        with patch as intersection_areas:
+            areas = result.areas
+            polygon_areas = result.polygon_areas
+            self.assertIs(result.areas, areas)
+            self.assertIs(result.polygon_areas, polygon_areas)
+        intersection_areas.assert_called_once()
+
+    def test_areas_failure(self):
+        nodes_a = [
+            [
+                [12.0, -4.0, -4.0, 12.0, 0.0, 10.0],
+                [4.0, -4.0, 4.0, 14.0, 10.0, 20.0],
+            ]
+        ]
+        nodes_b = [
+            [
+                [6.0, -2.0, -2.0, 6.0, 1.0, 5.0],
+                [1.0, -1.0, 1.0, 8.0, 6.0, 12.0],
+            ],
+            [
+                [6.0, -2.0, -2.0, 6.0, 1.0, 5.0],
+                [31.0, 29.0, 31.0, 38.0, 36.0, 42.0],
+            ],
+        ]
+        result = self._intersect(nodes_a, nodes_b, [[0, 0], [0, 1]])
+        areas = result.areas
+        self.assertTrue(np.isnan(areas[0]))
+        self.assertEqual(areas[1], 0.0)
+        self.assertEqual(result.polygon_areas.shape, (0,))
+
+
+class Test_intersect_triangle_pairs(utils.NumPyTestCase):
+    NODES = np.asfortranarray([[[0.0, 1.0, 0.0], [0.0, 0.0, 1.0]]])
+
+    @staticmethod
+    def _call_function_under_test(nodes_a, nodes_b, pairs):
+        from bezier import triangle
+
+        return triangle.intersect_triangle_pairs(nodes_a, nodes_b, pairs)
+
+    def test_no_pairs(self):
+        result = self._call_function_under_test(self.NODES, self.NODES, [])
+        self.assertEqual(len(result), 0)
+        self.assertEqual(result.pair_offsets.tolist(), [0])
+        self.assertEqual(result.polygon_offsets.tolist(), [0])
+
+    def test_empty_stack(self):
+        empty = np.empty((0, 2, 3), order="F")
+        result = self._call_function_under_test(empty, self.NODES, [])
+        self.assertEqual(len(result), 0)
+        self.assertEqual(result.pair_offsets.tolist(), [0])
+        self.assertEqual(result.segments.shape, (0,))
+        self.assertEqual(result.areas.shape, (0,))
+        self.assertEqual(result.polygon_areas.shape, (0,))
+
+    def test_out_of_range(self):
+        for pairs in ([[0, 1]], [[1, 0]], [[-1, 0]]):
+            with self.assertRaises(ValueError) as exc_info:
+                self._call_function_under_test(self.NODES, self.NODES, pairs)
+
+            exc_args = exc_info.exception.args
+            self.assertEqual(exc_args, ("Pair indices are out of range",))
+
+    def test_bad_shape(self):
+        for pairs in ([[0, 0, 0], [0, 0, 0]], [0, 0, 0, 0], [[[0, 0]]]):
+            with self.assertRaises(ValueError) as exc_info:
+                self._call_function_under_test(self.NODES, self.NODES, pairs)
+
+            exc_args = exc_info.exception.args
+            self.assertEqual(
+                exc_args,
+                ("Pairs must be a P x 2 array, not", np.shape(pairs)),
+            )
+
+    def test_non_integer(self):
+        with self.assertRaises(ValueError) as exc_info:
+            self._call_function_under_test(
+                self.NODES, self.NODES, [[0.7, 0.2]]
+            )
+
+        exc_args = exc_info.exception.args
+        self.assertEqual(
+            exc_args,
+            ("Pair indices must be integers, not", np.dtype(np.float64)),
+        )
+
+    def test_top_level(self):
+        import bezier
+        from bezier import triangle
+
+        self.assertIs(
+            bezier.intersect_triangle_pairs, triangle.intersect_triangle_pairs
+        )